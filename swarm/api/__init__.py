@@ -32,6 +32,7 @@ New API (v2.0) - Modular Routes:
 
     Health:
         GET    /api/health                   - Health check
+        GET    /api/metrics/latency          - Per-route latency histograms
 
 Legacy API (v1.0) - Backward Compatible:
     GET  /api/spec/flows              - List all flows
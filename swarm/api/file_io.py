@@ -0,0 +1,133 @@
+"""
+file_io.py - Bounded thread pool for blocking file I/O in API routes.
+
+Async route handlers must not read or write files on the event loop: one
+slow disk read (a large events.jsonl, a cold page cache) would stall every
+other request served by the worker. This module runs such calls on a
+dedicated, bounded thread pool:
+- run_io(func, *args) awaits a blocking callable on the pool
+- read_json / write_json_atomic cover JSON files the API owns (run state
+  is read through storage.read_run_state_data, which applies the journal)
+
+Design Philosophy:
+    - A separate pool, so file I/O cannot starve (or be starved by) work
+      submitted to the loop's default executor via asyncio.to_thread
+    - Bounded: at most SWARM_API_IO_WORKERS files are touched concurrently;
+      further calls queue instead of spawning threads
+    - Plain functions stay plain; callers wrap existing sync helpers rather
+      than maintaining async twins of them
+
+Usage:
+    from swarm.api.file_io import run_io, read_json
+
+    state = await read_json(run_dir / "meta.json")
+    events, pos = await run_io(read_new_lines, events_file, pos)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default number of I/O threads (override with SWARM_API_IO_WORKERS)
+DEFAULT_IO_WORKERS = 8
+
+
+def _io_workers_from_env() -> int:
+    raw = os.environ.get("SWARM_API_IO_WORKERS", "")
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_IO_WORKERS
+    except ValueError:
+        logger.warning("Invalid SWARM_API_IO_WORKERS %r, using %d", raw, DEFAULT_IO_WORKERS)
+        return DEFAULT_IO_WORKERS
+
+
+# =============================================================================
+# Executor
+# =============================================================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get (or create) the shared file I/O executor."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_io_workers_from_env(), thread_name_prefix="api-io"
+            )
+        return _executor
+
+
+def shutdown_io_executor() -> None:
+    """Shut down the executor (app shutdown); the next run_io() recreates it."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking file I/O callable on the I/O executor and await it.
+
+    Args:
+        func: Blocking callable.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Whatever func returns; exceptions propagate to the awaiting caller.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _read_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+async def read_json(path: Path) -> Any:
+    """Read and parse a JSON file off the event loop.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    return await run_io(_read_json, path)
+
+
+async def write_json_atomic(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON via temp file + rename, off the event loop.
+
+    `data` is serialized before the write is handed to the pool, so later
+    mutations by the caller cannot race with (or tear) the written snapshot.
+    """
+    await run_io(_write_text_atomic, path, json.dumps(data, indent=indent))
@@ -0,0 +1,161 @@
+"""
+latency.py - Per-route request latency histograms for the Flow Studio API.
+
+The request logging middleware records every request's duration against its
+route template (e.g. "/api/runs/{run_id}"), so tail latency can be compared
+across endpoints: a route that blocks the event loop shows up as a p99
+regression on every *other* route served by the same worker.
+
+- Fixed, log-spaced buckets: constant memory per route, cheap to record
+- Percentiles are estimated by interpolating within a bucket, capped at the
+  largest observed value
+- Unmatched paths share one "<unmatched>" series to bound cardinality
+
+Design Philosophy:
+    - In-process and dependency-free, like the rest of the API's health data;
+      exported as JSON from GET /api/metrics/latency
+    - Streaming responses (SSE) are measured to the start of the response,
+      not for the lifetime of the stream
+
+Usage:
+    from swarm.api.latency import get_latency_registry, route_label
+
+    get_latency_registry().record("GET", route_label(request.scope), 0.0021)
+    get_latency_registry().snapshot()  # [{"route": ..., "p99_ms": ...}, ...]
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds of the histogram buckets in milliseconds (plus an overflow bucket)
+BUCKET_BOUNDS_MS: Tuple[float, ...] = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+# Route label for requests that did not match any route
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_label(scope: Dict[str, Any]) -> Optional[str]:
+    """Route template for a handled request, e.g. "/api/runs/{run_id}".
+
+    Rebuilt from the request path and the matched path parameters, since
+    the route object in the scope may only carry the path relative to its
+    router's prefix.
+
+    Returns:
+        The template, or None if no route matched.
+    """
+    if scope.get("route") is None:
+        return None
+    segments = scope.get("path", "").split("/")
+    for name, value in (scope.get("path_params") or {}).items():
+        value = str(value)
+        for i in range(len(segments) - 1, -1, -1):
+            if segments[i] == value:
+                segments[i] = "{" + name + "}"
+                break
+    return "/".join(segments)
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution for one route. Not thread-safe on its own."""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 < q <= 1) in milliseconds."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, n in enumerate(self.counts):
+            if n and cumulative + n >= rank:
+                lower = BUCKET_BOUNDS_MS[i - 1] if i > 0 else 0.0
+                upper = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - cumulative) / n
+                return min(estimate, self.max_ms)
+            cumulative += n
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary plus raw bucket counts (keyed by upper bound, "+Inf" last)."""
+        buckets = {str(bound): n for bound, n in zip(BUCKET_BOUNDS_MS, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms if self.count else None,
+            "buckets": buckets,
+        }
+
+
+class LatencyRegistry:
+    """Thread-safe collection of histograms keyed by (method, route template)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, method: str, route: Optional[str], duration_s: float) -> None:
+        """Record one request.
+
+        Args:
+            method: HTTP method.
+            route: Route template, or None if no route matched.
+            duration_s: Request duration in seconds.
+        """
+        key = (method, route or UNMATCHED_ROUTE)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(duration_s * 1000)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-route summaries, sorted by route then method."""
+        with self._lock:
+            items = sorted(self._histograms.items(), key=lambda kv: (kv[0][1], kv[0][0]))
+            return [
+                {"method": method, "route": route, **histogram.to_dict()}
+                for (method, route), histogram in items
+            ]
+
+    def reset(self) -> None:
+        """Drop all recorded observations."""
+        with self._lock:
+            self._histograms.clear()
+
+
+# =============================================================================
+# Global Registry
+# =============================================================================
+
+_global_registry: Optional[LatencyRegistry] = None
+_global_registry_lock = threading.Lock()
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """Get the process-wide latency registry."""
+    global _global_registry
+    with _global_registry_lock:
+        if _global_registry is None:
+            _global_registry = LatencyRegistry()
+        return _global_registry
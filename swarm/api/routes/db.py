@@ -38,6 +38,9 @@ class DBHealthResponse(BaseModel):
     last_check: Optional[str] = None
     last_rebuild: Optional[str] = None
     db_path: Optional[str] = None
+    rebuild_progress: Optional[Dict[str, Any]] = Field(
+        None, description="Progress of the current (or last) rebuild: runs done, events/sec, ETA."
+    )
 
 
 class DBRebuildRequest(BaseModel):
@@ -105,6 +108,7 @@ async def get_db_health():
             last_check=health.last_check.isoformat() if health.last_check else None,
             last_rebuild=health.last_rebuild.isoformat() if health.last_rebuild else None,
             db_path=health.db_path,
+            rebuild_progress=health.rebuild_progress,
         )
     except Exception as e:
         logger.error("Failed to get DB health: %s", e)
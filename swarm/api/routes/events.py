@@ -18,6 +18,13 @@ from typing import Any, AsyncGenerator, Dict, Optional
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from swarm.runtime import storage as storage_module
+from swarm.runtime.event_bus import get_event_bus
+from swarm.runtime.event_index import resume_offset
+from swarm.runtime.run_state_journal import JOURNAL_FILE
+
+from ..file_io import run_io
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/runs", tags=["events"])
@@ -145,6 +152,12 @@ async def read_events_file(
 ) -> tuple[list[Dict[str, Any]], int]:
     """Read new events from the events file.
 
+    Only complete (newline-terminated) lines are consumed; a partial line
+    being written is left for the next read, as in RunTailer.tail_run.
+
+    The read runs on the API's file I/O executor, so streaming a large
+    events.jsonl never blocks other requests on the event loop.
+
     Args:
         events_file: Path to events.jsonl file.
         last_position: Last read position in file.
@@ -152,35 +165,63 @@ async def read_events_file(
     Returns:
         Tuple of (events list, new position).
     """
+    return await run_io(_read_new_events, events_file, last_position)
+
+
+def _read_new_events(
+    events_file: Path,
+    last_position: int,
+) -> tuple[list[Dict[str, Any]], int]:
+    """Blocking body of read_events_file()."""
     events = []
 
     if not events_file.exists():
         return events, last_position
 
+    new_position = last_position
     try:
-        with open(events_file, "r", encoding="utf-8") as f:
+        with open(events_file, "rb") as f:
             f.seek(last_position)
-            for line in f:
-                line = line.strip()
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                new_position += len(raw)
+                line = raw.strip()
                 if line:
                     try:
                         event = json.loads(line)
                         events.append(event)
-                    except json.JSONDecodeError:
-                        logger.warning("Invalid JSON in events file: %s", line)
-            new_position = f.tell()
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.warning("Invalid JSON in events file: %r", line)
     except Exception as e:
         logger.warning("Error reading events file: %s", e)
-        new_position = last_position
 
     return events, new_position
 
 
+def _read_state(state_file: Path) -> Optional[Dict[str, Any]]:
+    """Read the run's current state (snapshot + journal), or None if the run does not exist."""
+    return storage_module.read_run_state_data(state_file.parent)
+
+
+def _parse_last_event_id(last_event_id: Optional[str]) -> Optional[int]:
+    """Parse a Last-Event-ID header into a seq (None if absent or not a seq)."""
+    if not last_event_id:
+        return None
+    try:
+        seq = int(last_event_id.strip())
+    except ValueError:
+        logger.debug("Ignoring non-numeric Last-Event-ID %r", last_event_id)
+        return None
+    return seq if seq >= 0 else None
+
+
 async def generate_run_events(
     run_id: str,
     runs_root: Path,
-    poll_interval: float = 1.0,
+    poll_interval: float = 5.0,
     heartbeat_interval: float = 15.0,
+    last_event_id: Optional[str] = None,
 ) -> AsyncGenerator[str, None]:
     """Generate SSE events for a run.
 
@@ -190,11 +231,23 @@ async def generate_run_events(
     3. Heartbeat events (every heartbeat_interval seconds)
     4. Completion event when run ends
 
+    Events from events.jsonl use their storage-assigned seq as the SSE id;
+    synthetic events (connected, heartbeat, completion) carry no id, so the
+    client's Last-Event-ID always names the last journal event it received.
+    On reconnect the stream seeks straight past that seq using the sparse
+    offset index next to events.jsonl.
+
+    The stream sleeps on the event bus and only re-reads events.jsonl or the
+    run state (run_state.json or its journal) when they change. All streams of
+    a run share one file watch.
+
     Args:
         run_id: Run identifier.
         runs_root: Root directory for runs.
-        poll_interval: How often to poll for new events.
+        poll_interval: Maximum time to wait for a change notification before
+            re-checking both files anyway (safety net for missed notifications).
         heartbeat_interval: How often to send heartbeat.
+        last_event_id: Last-Event-ID sent by a reconnecting client (a seq).
 
     Yields:
         SSE-formatted event strings.
@@ -202,118 +255,133 @@ async def generate_run_events(
     run_dir = runs_root / run_id
     events_file = run_dir / "events.jsonl"
     state_file = run_dir / "run_state.json"
+    # Either file changing means the run state must be re-read
+    state_names = {state_file.name, JOURNAL_FILE}
 
     # Track file position for incremental reading
     last_position = 0
     last_heartbeat = datetime.now(timezone.utc)
-    event_counter = 0
+    state: Dict[str, Any] = {}
 
-    # Send connection event
-    event_counter += 1
-    yield format_sse_event(
-        EventType.CONNECTED,
-        {"run_id": run_id, "message": "Connected to event stream"},
-        event_id=str(event_counter),
-    )
+    connected: Dict[str, Any] = {"run_id": run_id, "message": "Connected to event stream"}
+    resume_seq = _parse_last_event_id(last_event_id)
+    if resume_seq is not None:
+        last_position = await run_io(resume_offset, events_file, resume_seq)
+        connected["resumed_after_seq"] = resume_seq
 
-    while True:
-        try:
-            # Check if run exists
-            if not state_file.exists():
-                yield format_sse_event(
-                    EventType.ERROR,
-                    {"error": "run_not_found", "message": f"Run '{run_id}' not found"},
-                )
-                break
-
-            # Read current state
-            state = json.loads(state_file.read_text(encoding="utf-8"))
-            status = state.get("status", "pending")
-
-            # Read new events from file
-            events, last_position = await read_events_file(events_file, last_position)
-
-            for event in events:
-                event_counter += 1
-                event_type = event.pop("event", "message")
-
-                # Transform autopilot events to flow boundary events for frontend
-                if event_type == "autopilot_flow_completed":
-                    # Emit flow:completed for individual flow completion in autopilot
-                    yield format_sse_event(
-                        EventType.FLOW_COMPLETED,
-                        event,
-                        event_id=str(event_counter),
-                    )
-                elif event_type == "autopilot_completed":
-                    # Emit plan:completed when entire autopilot run finishes
-                    yield format_sse_event(
-                        EventType.PLAN_COMPLETED,
-                        event,
-                        event_id=str(event_counter),
-                    )
+    # Send connection event
+    yield format_sse_event(EventType.CONNECTED, connected)
+
+    # Names of changed files; everything counts as changed on the first pass
+    # and after a safety timeout
+    everything = {events_file.name} | state_names
+    changed = everything
+
+    with get_event_bus().subscribe(run_dir) as subscription:
+        while True:
+            try:
+                if changed & state_names:
+                    # Read current state (None if the run does not exist)
+                    current = await run_io(_read_state, state_file)
+                    if current is None:
+                        yield format_sse_event(
+                            EventType.ERROR,
+                            {"error": "run_not_found", "message": f"Run '{run_id}' not found"},
+                        )
+                        break
+                    state = current
+                status = state.get("status", "pending")
+
+                # Read new events from file
+                if events_file.name in changed:
+                    events, last_position = await read_events_file(events_file, last_position)
                 else:
+                    events = []
+
+                for event in events:
+                    seq = event.get("seq")
+                    event_id = str(seq) if isinstance(seq, int) else None
+                    event_type = event.pop("event", "message")
+
+                    # Transform autopilot events to flow boundary events for frontend
+                    if event_type == "autopilot_flow_completed":
+                        # Emit flow:completed for individual flow completion in autopilot
+                        yield format_sse_event(
+                            EventType.FLOW_COMPLETED,
+                            event,
+                            event_id=event_id,
+                        )
+                    elif event_type == "autopilot_completed":
+                        # Emit plan:completed when entire autopilot run finishes
+                        yield format_sse_event(
+                            EventType.PLAN_COMPLETED,
+                            event,
+                            event_id=event_id,
+                        )
+                    else:
+                        yield format_sse_event(
+                            event_type,
+                            event,
+                            event_id=event_id,
+                        )
+
+                # Send heartbeat if interval elapsed
+                now = datetime.now(timezone.utc)
+                if (now - last_heartbeat).total_seconds() >= heartbeat_interval:
                     yield format_sse_event(
-                        event_type,
-                        event,
-                        event_id=str(event_counter),
+                        EventType.HEARTBEAT,
+                        {
+                            "run_id": run_id,
+                            "status": status,
+                            "current_step": state.get("current_step"),
+                        },
                     )
+                    last_heartbeat = now
+
+                # Check for terminal states
+                if status in ("succeeded", "failed", "canceled", "stopped"):
+                    # Map status to event type
+                    status_to_event = {
+                        "succeeded": EventType.RUN_COMPLETED,
+                        "failed": EventType.RUN_FAILED,
+                        "canceled": EventType.RUN_CANCELED,
+                        "stopped": EventType.RUN_STOPPED,
+                    }
 
-            # Send heartbeat if interval elapsed
-            now = datetime.now(timezone.utc)
-            if (now - last_heartbeat).total_seconds() >= heartbeat_interval:
-                event_counter += 1
-                yield format_sse_event(
-                    EventType.HEARTBEAT,
-                    {
-                        "run_id": run_id,
-                        "status": status,
-                        "current_step": state.get("current_step"),
-                    },
-                    event_id=str(event_counter),
-                )
-                last_heartbeat = now
-
-            # Check for terminal states
-            if status in ("succeeded", "failed", "canceled", "stopped"):
-                event_counter += 1
-
-                # Map status to event type
-                status_to_event = {
-                    "succeeded": EventType.RUN_COMPLETED,
-                    "failed": EventType.RUN_FAILED,
-                    "canceled": EventType.RUN_CANCELED,
-                    "stopped": EventType.RUN_STOPPED,
-                }
-
+                    yield format_sse_event(
+                        status_to_event[status],
+                        {
+                            "run_id": run_id,
+                            "status": status,
+                            "completed_at": state.get("completed_at"),
+                            "stopped_at": state.get("stopped_at"),
+                            "error": state.get("error"),
+                            "stop_reason": state.get("stop_reason"),
+                        },
+                    )
+                    break
+
+                # Sleep until a file changes, the next heartbeat, or the safety timeout
+                until_heartbeat = heartbeat_interval - (
+                    datetime.now(timezone.utc) - last_heartbeat
+                ).total_seconds()
+                timeout = max(0.0, min(poll_interval, until_heartbeat))
+                changed = {path.name for path in await subscription.wait(timeout=timeout)}
+                if not changed and timeout >= poll_interval:
+                    changed = everything
+
+            except asyncio.CancelledError:
+                # Client disconnected
+                logger.debug("SSE client disconnected for run %s", run_id)
+                break
+            except Exception as e:
+                logger.error("Error in event stream for run %s: %s", run_id, e)
                 yield format_sse_event(
-                    status_to_event[status],
-                    {
-                        "run_id": run_id,
-                        "status": status,
-                        "completed_at": state.get("completed_at"),
-                        "stopped_at": state.get("stopped_at"),
-                        "error": state.get("error"),
-                        "stop_reason": state.get("stop_reason"),
-                    },
-                    event_id=str(event_counter),
+                    EventType.ERROR,
+                    {"error": "stream_error", "message": str(e)},
                 )
-                break
-
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
-
-        except asyncio.CancelledError:
-            # Client disconnected
-            logger.debug("SSE client disconnected for run %s", run_id)
-            break
-        except Exception as e:
-            logger.error("Error in event stream for run %s: %s", run_id, e)
-            yield format_sse_event(
-                EventType.ERROR,
-                {"error": "stream_error", "message": str(e)},
-            )
-            await asyncio.sleep(5)  # Back off on error
+                await asyncio.sleep(5)  # Back off on error
+                changed = everything
 
 
 # =============================================================================
@@ -330,9 +398,12 @@ async def stream_run_events(run_id: str, request: Request):
 
     Performs a health tick on SSE connect to keep database status coherent.
 
+    Reconnecting clients resume after the seq in their Last-Event-ID header
+    instead of replaying the whole run.
+
     Args:
         run_id: Run identifier.
-        request: FastAPI request object for disconnect detection.
+        request: FastAPI request object (disconnect detection, Last-Event-ID).
 
     Returns:
         StreamingResponse with SSE content type.
@@ -341,11 +412,13 @@ async def stream_run_events(run_id: str, request: Request):
         event: connected
         data: {"run_id": "abc123", "message": "Connected to event stream"}
 
+        id: 41
         event: step:started
-        data: {"step_id": "init", "station_id": "repo-operator"}
+        data: {"step_id": "init", "station_id": "repo-operator", "seq": 41}
 
+        id: 42
         event: step:completed
-        data: {"step_id": "init", "status": "VERIFIED"}
+        data: {"step_id": "init", "status": "VERIFIED", "seq": 42}
 
         event: heartbeat
         data: {"run_id": "abc123", "status": "running"}
@@ -369,7 +442,7 @@ async def stream_run_events(run_id: str, request: Request):
 
     # Verify run exists
     run_dir = runs_root / run_id
-    if not run_dir.exists():
+    if not await run_io(run_dir.exists):
         raise HTTPException(
             status_code=404,
             detail={
@@ -379,8 +452,11 @@ async def stream_run_events(run_id: str, request: Request):
             },
         )
 
+    # Browsers send Last-Event-ID automatically when an EventSource reconnects
+    last_event_id = request.headers.get("last-event-id")
+
     async def event_stream():
-        async for event in generate_run_events(run_id, runs_root):
+        async for event in generate_run_events(run_id, runs_root, last_event_id=last_event_id):
             # Check if client disconnected
             if await request.is_disconnected():
                 break
@@ -410,23 +486,16 @@ async def write_event(
 ) -> None:
     """Write an event to a run's events file.
 
+    The event is appended through storage, so it gets a seq (its SSE id)
+    and wakes subscribed streams. The write runs on the file I/O executor.
+
     Args:
         run_id: Run identifier.
         runs_root: Root directory for runs.
         event_type: Event type name.
         data: Event data.
     """
-    events_file = runs_root / run_id / "events.jsonl"
-    events_file.parent.mkdir(parents=True, exist_ok=True)
-
-    event = {
-        "event": event_type,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        **data,
-    }
-
-    with open(events_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
+    await run_io(write_event_sync, run_id, runs_root, event_type, data)
 
 
 def write_event_sync(
@@ -443,14 +512,10 @@ def write_event_sync(
         event_type: Event type name.
         data: Event data.
     """
-    events_file = runs_root / run_id / "events.jsonl"
-    events_file.parent.mkdir(parents=True, exist_ok=True)
-
     event = {
         "event": event_type,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         **data,
     }
 
-    with open(events_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
+    storage_module.append_event_dict(run_id, event, runs_dir=runs_root)
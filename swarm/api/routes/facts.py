@@ -15,6 +15,7 @@ from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from swarm.runtime.fact_cache import FactCache
 from swarm.runtime.fact_extraction import (
     MARKER_TYPES,
     extract_facts_from_run,
@@ -136,7 +137,7 @@ async def get_facts_summary(run_id: str):
         )
 
     # Extract all facts from the run
-    result = extract_facts_from_run(run_base, run_id=run_id)
+    result = extract_facts_from_run(run_base, run_id=run_id, cache=FactCache.for_run(run_base))
 
     # Initialize counters
     by_type: Dict[str, int] = defaultdict(int)
@@ -269,7 +270,7 @@ async def list_facts(
         )
 
     # Extract facts
-    result = extract_facts_from_run(run_base, run_id=run_id)
+    result = extract_facts_from_run(run_base, run_id=run_id, cache=FactCache.for_run(run_base))
 
     # Filter facts
     facts = result.facts
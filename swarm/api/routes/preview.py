@@ -546,17 +546,16 @@ async def validate_flow(flow_id: str):
         # Schema validation
         schema_valid = True
         try:
-            import jsonschema
+            import jsonschema  # noqa: F401
+
+            from swarm.spec.schema_registry import get_schema_registry
 
             repo_root = _get_repo_root()
             schema_path = repo_root / "swarm" / "spec" / "schemas" / "flow_graph.schema.json"
 
             if schema_path.exists():
-                with open(schema_path, "r", encoding="utf-8") as f:
-                    schema = json.load(f)
-
-                validator = jsonschema.Draft7Validator(schema)
-                for error in validator.iter_errors(flow_graph):
+                validator = get_schema_registry().validator(schema_path)
+                for error in validator.errors(flow_graph):
                     schema_valid = False
                     # Format error path
                     path = ".".join(str(p) for p in error.absolute_path)
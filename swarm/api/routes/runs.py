@@ -16,7 +16,6 @@ import asyncio
 import hashlib
 import json
 import logging
-import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,6 +25,11 @@ from fastapi import APIRouter, Header, HTTPException, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from swarm.runtime.event_bus import publish_change
+from swarm.runtime.storage import read_run_state_data
+
+from ..file_io import run_io, write_json_atomic
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/runs", tags=["runs"])
@@ -128,6 +132,8 @@ class RunStateManager:
     """Manages run state in memory and on disk.
 
     In-memory cache for fast access, with disk persistence for durability.
+    Disk reads and writes run on the API's file I/O executor, so a slow disk
+    only delays requests for the run being loaded or saved.
     """
 
     def __init__(self, runs_root: Path):
@@ -178,35 +184,29 @@ class RunStateManager:
             "error": None,
         }
 
-        # Create run directory
-        run_dir = self.runs_root / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save state
+        # Save state (creates the run directory)
         await self._save_state(run_id, state)
 
         return state
 
-    def _get_run_unlocked(self, run_id: str) -> tuple[Dict[str, Any], str]:
+    async def _get_run_unlocked(self, run_id: str) -> tuple[Dict[str, Any], str]:
         """Get run state without locking (internal use only)."""
         # Check cache first
         if run_id in self._cache:
             state = self._cache[run_id]
             return state, self._compute_etag(state)
 
-        # Load from disk
-        state_path = self._state_path(run_id)
-        if not state_path.exists():
+        # Load from disk (snapshot + journal for runtime-written state)
+        state = await run_io(read_run_state_data, self._state_path(run_id).parent)
+        if state is None:
             raise FileNotFoundError(f"Run '{run_id}' not found")
-
-        state = json.loads(state_path.read_text(encoding="utf-8"))
         self._cache[run_id] = state
         return state, self._compute_etag(state)
 
     async def get_run(self, run_id: str) -> tuple[Dict[str, Any], str]:
         """Get run state with ETag."""
         async with self._get_lock(run_id):
-            return self._get_run_unlocked(run_id)
+            return await self._get_run_unlocked(run_id)
 
     async def update_run(
         self,
@@ -216,7 +216,7 @@ class RunStateManager:
     ) -> tuple[Dict[str, Any], str]:
         """Update run state with optional ETag check."""
         async with self._get_lock(run_id):
-            state, current_etag = self._get_run_unlocked(run_id)
+            state, current_etag = await self._get_run_unlocked(run_id)
 
             if expected_etag and expected_etag != current_etag:
                 raise ValueError(f"ETag mismatch: expected {expected_etag}, got {current_etag}")
@@ -231,14 +231,10 @@ class RunStateManager:
     async def _save_state(self, run_id: str, state: Dict[str, Any]) -> None:
         """Save state to disk and cache."""
         state_path = self._state_path(run_id)
-        state_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write atomically
-        tmp_path = state_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
-        os.replace(tmp_path, state_path)
+        await write_json_atomic(state_path, state, indent=2)
 
         self._cache[run_id] = state
+        publish_change(state_path)
 
     def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
         """List recent runs."""
@@ -256,9 +252,10 @@ class RunStateManager:
         run_dirs.sort(key=lambda x: x[0], reverse=True)
 
         for _, run_dir in run_dirs[:limit]:
-            state_path = run_dir / "run_state.json"
             try:
-                state = json.loads(state_path.read_text(encoding="utf-8"))
+                state = read_run_state_data(run_dir)
+                if state is None:
+                    raise ValueError("unreadable run_state.json")
                 runs.append(
                     {
                         "run_id": state.get("run_id", run_dir.name),
@@ -349,7 +346,7 @@ async def list_runs(limit: int = 20):
         List of run summaries.
     """
     state_manager = _get_state_manager()
-    runs = state_manager.list_runs(limit=limit)
+    runs = await run_io(state_manager.list_runs, limit=limit)
     return RunListResponse(runs=[RunSummary(**r) for r in runs])
 
 
@@ -478,10 +475,10 @@ async def pause_run(
         )
 
         # Emit appropriate event for SSE subscribers
-        from .events import EventType, write_event_sync
+        from .events import EventType, write_event
 
         if event_type_to_emit == "pausing":
-            write_event_sync(
+            await write_event(
                 run_id=run_id,
                 runs_root=state_manager.runs_root,
                 event_type=EventType.RUN_PAUSING,
@@ -494,7 +491,7 @@ async def pause_run(
                 },
             )
         else:
-            write_event_sync(
+            await write_event(
                 run_id=run_id,
                 runs_root=state_manager.runs_root,
                 event_type=EventType.RUN_PAUSED,
@@ -625,9 +622,9 @@ async def resume_run(
         )
 
         # Emit resume event for SSE subscribers
-        from .events import EventType, write_event_sync
+        from .events import EventType, write_event
 
-        write_event_sync(
+        await write_event(
             run_id=run_id,
             runs_root=state_manager.runs_root,
             event_type=EventType.RUN_RESUMED,
@@ -1053,9 +1050,9 @@ async def stop_run(
         )
 
         # Emit stopping event for SSE subscribers
-        from .events import EventType, write_event_sync
+        from .events import EventType, write_event
 
-        write_event_sync(
+        await write_event(
             run_id=run_id,
             runs_root=state_manager.runs_root,
             event_type=EventType.RUN_STOPPING,
@@ -1101,7 +1098,7 @@ async def stop_run(
         )
 
         # Emit stopped event
-        write_event_sync(
+        await write_event(
             run_id=run_id,
             runs_root=state_manager.runs_root,
             event_type=EventType.RUN_STOPPED,
@@ -1246,7 +1243,7 @@ async def _write_stop_report(
 
     # Write the report
     report_content = "\n".join(lines)
-    report_path.write_text(report_content, encoding="utf-8")
+    await run_io(report_path.write_text, report_content, encoding="utf-8")
 
     return str(report_path.relative_to(runs_root.parent))
 
@@ -1272,6 +1269,10 @@ class AutopilotStartRequest(BaseModel):
         None,
         description="Patch types to auto-apply (defaults to ['flow_evolution', 'station_tuning'])",
     )
+    background: bool = Field(
+        False,
+        description="Drive the run on the shared autopilot executor instead of via /tick",
+    )
 
 
 class AutopilotStartResponse(BaseModel):
@@ -1321,6 +1322,24 @@ def _get_autopilot_controller():
     return _autopilot_controller
 
 
+def _get_autopilot_executor():
+    """Get the process-wide autopilot executor, sharing the API controller."""
+    from swarm.runtime.autopilot_executor import get_autopilot_executor
+
+    return get_autopilot_executor(_get_autopilot_controller())
+
+
+def _get_autopilot_target(run_id: str):
+    """Executor for background runs, so control actions are persisted and
+    resumed runs are re-queued; the controller for /tick-driven runs."""
+    from swarm.runtime.autopilot_executor import current_autopilot_executor
+
+    executor = current_autopilot_executor()
+    if executor is not None and executor.tracks(run_id):
+        return executor
+    return _get_autopilot_controller()
+
+
 @router.post("/autopilot", response_model=AutopilotStartResponse, status_code=201)
 async def start_autopilot(request: AutopilotStartRequest):
     """Start an autopilot run for end-to-end SDLC execution.
@@ -1345,7 +1364,7 @@ async def start_autopilot(request: AutopilotStartRequest):
     try:
         controller = _get_autopilot_controller()
 
-        run_id = controller.start(
+        start_kwargs = dict(
             issue_ref=request.issue_ref,
             flow_keys=request.flow_keys,
             profile_id=request.profile_id,
@@ -1356,6 +1375,10 @@ async def start_autopilot(request: AutopilotStartRequest):
             auto_apply_policy=request.auto_apply_policy,
             auto_apply_patch_types=request.auto_apply_patch_types,
         )
+        if request.background:
+            run_id = _get_autopilot_executor().submit(**start_kwargs)
+        else:
+            run_id = controller.start(**start_kwargs)
 
         result = controller.get_result(run_id)
 
@@ -1379,6 +1402,35 @@ async def start_autopilot(request: AutopilotStartRequest):
         )
 
 
+class AutopilotExecutorStatsResponse(BaseModel):
+    """Throughput and latency of the autopilot executor."""
+
+    timestamp: str
+    max_workers: int
+    active: int
+    queued: int
+    runs_submitted: int
+    runs_finished: int
+    runs_recovered: int
+    uptime_s: float
+    flows: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+
+
+@router.get("/autopilot/executor/stats", response_model=AutopilotExecutorStatsResponse)
+async def get_autopilot_executor_stats():
+    """Per-flow throughput and latency of background autopilot runs.
+
+    Returns:
+        AutopilotExecutorStatsResponse with pool occupancy and per-flow
+        execution counts, flows/second and latency percentiles.
+    """
+    stats = _get_autopilot_executor().stats()
+    return AutopilotExecutorStatsResponse(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        **stats.to_dict(),
+    )
+
+
 @router.get("/autopilot/{run_id}", response_model=AutopilotStatusResponse)
 async def get_autopilot_status(run_id: str):
     """Get the status of an autopilot run.
@@ -1442,7 +1494,9 @@ async def tick_autopilot(run_id: str):
     """
     try:
         controller = _get_autopilot_controller()
-        controller.tick(run_id)
+        # Background runs are advanced by the executor; ticking here would race it
+        if _get_autopilot_target(run_id) is controller:
+            controller.tick(run_id)
         result = controller.get_result(run_id)
 
         # Convert wisdom apply result if present
@@ -1501,7 +1555,7 @@ async def cancel_autopilot(run_id: str):
         Action response confirming cancellation.
     """
     try:
-        controller = _get_autopilot_controller()
+        controller = _get_autopilot_target(run_id)
         canceled = controller.cancel(run_id)
 
         if not canceled:
@@ -1556,7 +1610,7 @@ async def stop_autopilot(run_id: str, request: AutopilotStopRequest):
         Action response confirming stop initiation.
     """
     try:
-        controller = _get_autopilot_controller()
+        controller = _get_autopilot_target(run_id)
         stopped = controller.stop(run_id, reason=request.reason)
 
         if not stopped:
@@ -1604,7 +1658,7 @@ async def pause_autopilot(run_id: str):
         Action response confirming pause initiation.
     """
     try:
-        controller = _get_autopilot_controller()
+        controller = _get_autopilot_target(run_id)
         paused = controller.pause(run_id)
 
         if not paused:
@@ -1651,7 +1705,7 @@ async def resume_autopilot(run_id: str):
         Action response confirming resume.
     """
     try:
-        controller = _get_autopilot_controller()
+        controller = _get_autopilot_target(run_id)
         resumed = controller.resume(run_id)
 
         if not resumed:
@@ -23,6 +23,8 @@ API Structure:
     /api/runs/{id}/events - SSE streaming (from routes/events.py)
     /api/spec/            - Legacy endpoints (inline, for backward compatibility)
     /api/health           - Health check
+    /api/metrics/latency  - Per-route latency histograms
+    /api/metrics/spec-cache - Shared spec cache hit/miss counters
 """
 
 from __future__ import annotations
@@ -42,6 +44,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+from swarm.runtime.storage import read_run_state_data
+from swarm.spec.cache import get_spec_cache
+
+from .file_io import shutdown_io_executor
+from .latency import get_latency_registry, route_label
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -171,6 +179,41 @@ class HealthResponse(BaseModel):
     tailer: Optional[TailerHealthInfo] = None
 
 
+class RouteLatency(BaseModel):
+    """Latency summary for one (method, route template)."""
+
+    method: str
+    route: str
+    count: int
+    mean_ms: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+    buckets: Dict[str, int] = {}
+
+
+class LatencyMetricsResponse(BaseModel):
+    """Response for the latency metrics endpoint."""
+
+    timestamp: str
+    routes: List[RouteLatency]
+
+
+class SpecCacheStatsResponse(BaseModel):
+    """Response for the spec cache metrics endpoint."""
+
+    timestamp: str
+    max_entries: int
+    entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    invalidations: int
+    entries_by_namespace: Dict[str, int] = {}
+
+
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
@@ -198,8 +241,9 @@ class SpecManager:
         repo_root: Repository root path.
         spec_root: Path to spec directory (swarm/spec).
         runs_root: Path to runs directory (swarm/runs).
-        _flow_cache: Cached flow graphs with ETags.
-        _template_cache: Cached templates with ETags.
+
+    Flow graphs and templates are served from the shared spec cache
+    (swarm/spec/cache.py), so edits on disk are picked up on the next read.
     """
 
     def __init__(self, repo_root: Optional[Path] = None):
@@ -217,8 +261,6 @@ class SpecManager:
         self.runs_root = repo_root / "swarm" / "runs"
         self.flows_config = repo_root / "swarm" / "config" / "flows"
 
-        self._flow_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
-        self._template_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
         self._run_state_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
 
         logger.info("SpecManager initialized with repo_root=%s", repo_root)
@@ -319,24 +361,12 @@ class SpecManager:
         Raises:
             FileNotFoundError: If flow not found.
         """
-        # Check cache
-        if flow_id in self._flow_cache:
-            return self._flow_cache[flow_id]
-
-        # Try spec/flows first
-        flow_file = self.spec_root / "flows" / f"{flow_id}.yaml"
-        if not flow_file.exists():
-            # Try config/flows
-            flow_file = self.flows_config / f"{flow_id}.yaml"
-
-        if not flow_file.exists():
-            raise FileNotFoundError(f"Flow '{flow_id}' not found")
-
-        flow_data = self._load_yaml(flow_file)
-        etag = self._compute_etag(flow_data)
-
-        self._flow_cache[flow_id] = (flow_data, etag)
-        return flow_data, etag
+        # Try spec/flows first, then config/flows
+        candidates = [
+            self.spec_root / "flows" / f"{flow_id}.yaml",
+            self.flows_config / f"{flow_id}.yaml",
+        ]
+        return self._load_cached_yaml("api-flow", f"Flow '{flow_id}' not found", candidates)
 
     def update_flow(
         self,
@@ -393,11 +423,9 @@ class SpecManager:
             flow_file = self.flows_config / f"{flow_id}.yaml"
 
         self._save_yaml(flow_file, updated_data)
+        get_spec_cache().invalidate_path(flow_file)
 
-        # Update cache
         new_etag = self._compute_etag(updated_data)
-        self._flow_cache[flow_id] = (updated_data, new_etag)
-
         return updated_data, new_etag
 
     def validate_flow(self, flow_data: Dict[str, Any]) -> List[str]:
@@ -515,23 +543,14 @@ class SpecManager:
         Raises:
             FileNotFoundError: If template not found.
         """
-        if template_id in self._template_cache:
-            return self._template_cache[template_id]
-
-        # Try templates first
-        template_file = self.spec_root / "templates" / f"{template_id}.yaml"
-        if not template_file.exists():
-            # Try stations
-            template_file = self.spec_root / "stations" / f"{template_id}.yaml"
-
-        if not template_file.exists():
-            raise FileNotFoundError(f"Template '{template_id}' not found")
-
-        template_data = self._load_yaml(template_file)
-        etag = self._compute_etag(template_data)
-
-        self._template_cache[template_id] = (template_data, etag)
-        return template_data, etag
+        # Try templates first, then stations
+        candidates = [
+            self.spec_root / "templates" / f"{template_id}.yaml",
+            self.spec_root / "stations" / f"{template_id}.yaml",
+        ]
+        return self._load_cached_yaml(
+            "api-template", f"Template '{template_id}' not found", candidates
+        )
 
     # -------------------------------------------------------------------------
     # Compilation
@@ -621,12 +640,10 @@ class SpecManager:
             return self._run_state_cache[run_id]
 
         run_dir = self.runs_root / run_id
-        state_file = run_dir / "run_state.json"
-
-        if not state_file.exists():
+        state_data = read_run_state_data(run_dir)
+        if state_data is None:
             raise FileNotFoundError(f"Run '{run_id}' not found")
 
-        state_data = json.loads(state_file.read_text(encoding="utf-8"))
         etag = self._compute_etag(state_data)
 
         self._run_state_cache[run_id] = (state_data, etag)
@@ -650,10 +667,11 @@ class SpecManager:
             if not run_dir.is_dir():
                 continue
 
-            state_file = run_dir / "run_state.json"
-            if state_file.exists():
+            if (run_dir / "run_state.json").exists():
                 try:
-                    state = json.loads(state_file.read_text(encoding="utf-8"))
+                    state = read_run_state_data(run_dir)
+                    if state is None:
+                        raise ValueError("unreadable run_state.json")
                     runs.append(
                         {
                             "run_id": state.get("run_id", run_dir.name),
@@ -727,6 +745,28 @@ class SpecManager:
     # YAML Helpers
     # -------------------------------------------------------------------------
 
+    def _load_cached_yaml(
+        self, namespace: str, not_found: str, candidates: List[Path]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Load the first existing candidate YAML file with its ETag.
+
+        Served from the shared spec cache until any candidate is created,
+        changed or deleted. The returned data is shared and must not be
+        mutated.
+
+        Raises:
+            FileNotFoundError: If no candidate exists.
+        """
+        path = next((c for c in candidates if c.exists()), None)
+        if path is None:
+            raise FileNotFoundError(not_found)
+
+        def load() -> Tuple[Dict[str, Any], str]:
+            data = self._load_yaml(path)
+            return data, self._compute_etag(data)
+
+        return get_spec_cache().get(namespace, str(path), candidates, load)
+
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
         """Load a YAML file.
 
@@ -852,6 +892,7 @@ def create_app(
         On shutdown:
         - Cancel the tailer background task
         - Close the database connection
+        - Stop the file I/O executor
         """
         logger.info("Spec API server starting...")
 
@@ -955,6 +996,8 @@ def create_app(
         except Exception as e:
             logger.warning("Error closing resilient DB: %s", e)
 
+        shutdown_io_executor()
+
     app = FastAPI(
         title="Flow Studio API",
         description="REST API for SpecManager functionality - exposes flows, templates, validation, and compilation to the TypeScript frontend.",
@@ -1012,9 +1055,11 @@ def create_app(
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
+        # Label by route template so /api/runs/{run_id} is one series, not one per run
+        get_latency_registry().record(request.method, route_label(request.scope), duration)
         logger.info(
             "%s %s %s %.3fs",
             request.method,
@@ -1295,6 +1340,38 @@ def create_app(
             tailer=tailer_info,
         )
 
+    @app.get("/api/metrics/latency", response_model=LatencyMetricsResponse)
+    async def latency_metrics(reset: bool = False):
+        """Per-route request latency histograms (p50/p95/p99 and buckets).
+
+        Args:
+            reset: Clear the histograms after taking the snapshot.
+        """
+        registry = get_latency_registry()
+        routes = registry.snapshot()
+        if reset:
+            registry.reset()
+        return LatencyMetricsResponse(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            routes=[RouteLatency(**r) for r in routes],
+        )
+
+    @app.get("/api/metrics/spec-cache", response_model=SpecCacheStatsResponse)
+    async def spec_cache_metrics(reset: bool = False):
+        """Hit/miss counters and occupancy of the shared spec cache.
+
+        Args:
+            reset: Zero the counters after taking the snapshot.
+        """
+        cache = get_spec_cache()
+        stats = cache.stats()
+        if reset:
+            cache.reset_stats()
+        return SpecCacheStatsResponse(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            **stats.to_dict(),
+        )
+
     # -------------------------------------------------------------------------
     # RunTailer Endpoints
     # -------------------------------------------------------------------------
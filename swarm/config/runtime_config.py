@@ -22,15 +22,25 @@ Provider and engine configuration:
     env = get_engine_env("claude-glm")  # Returns {"ANTHROPIC_BASE_URL": "..."}
     url = get_provider_base_url("anthropic_compat")  # Returns base URL or None
     keys = get_engine_required_env_keys("claude")  # Returns ["ANTHROPIC_API_KEY"]
+
+Context budgets:
+    from swarm.config.runtime_config import get_resolved_context_budgets
+
+    # Step > flow > profile > global cascade, precomputed per profile and
+    # rebuilt when runtime.yaml, flows.yaml, flow files or profiles change
+    budgets = get_resolved_context_budgets("build", "implement", profile_id="baseline")
 """
 
 from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass, field
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 
@@ -123,18 +133,19 @@ class ContextBudgetConfig:
     source: str = "default"  # "default" | "profile" | "flow" | "step"
 
 
-def _load_config() -> Dict[str, Any]:
-    """Load runtime.yaml configuration, with caching."""
-    global _cached_config
-    if _cached_config is not None:
-        return _cached_config
-
+def _read_config() -> Dict[str, Any]:
+    """Read runtime.yaml from disk, bypassing the cache."""
     if _CONFIG_PATH.exists():
         with open(_CONFIG_PATH) as f:
-            _cached_config = yaml.safe_load(f)
-    else:
-        _cached_config = _default_config()
+            return yaml.safe_load(f)
+    return _default_config()
 
+
+def _load_config() -> Dict[str, Any]:
+    """Load runtime.yaml configuration, with caching."""
+    global _cached_config
+    if _cached_config is None:
+        _cached_config = _read_config()
     return _cached_config
 
 
@@ -195,6 +206,7 @@ def reset_config() -> None:
     """Reset cached config (for testing)."""
     global _cached_config
     _cached_config = None
+    reset_context_budget_tables()
 
 
 def get_engine_mode(engine: str) -> str:
@@ -439,17 +451,43 @@ class ContextBudgetResolver:
     4. Global defaults (from runtime.yaml defaults section)
     """
 
-    def __init__(self, profile_id: Optional[str] = None):
+    def __init__(
+        self,
+        profile_id: Optional[str] = None,
+        sources: Optional["_BudgetSources"] = None,
+    ):
+        """Create a resolver.
+
+        Args:
+            profile_id: Profile whose overrides apply (optional).
+            sources: Privately loaded config to resolve against. Defaults to
+                the shared runtime config, FlowRegistry and ProfileRegistry.
+        """
         self._profile_id = profile_id
+        self._sources = sources
         self._profile_budgets: Optional["ContextBudgetOverride"] = None
         if profile_id:
             self._profile_budgets = self._load_profile_budgets(profile_id)
 
+    def _flow_registry(self) -> Any:
+        if self._sources is not None:
+            return self._sources.flow_registry
+        from swarm.config.flow_registry import FlowRegistry
+        return FlowRegistry.get_instance()
+
+    def _default(self, key: str, fallback: Any) -> Any:
+        if self._sources is not None:
+            return self._sources.defaults.get(key, fallback)
+        return get_default(key, fallback)
+
     def _load_profile_budgets(self, profile_id: str) -> Optional["ContextBudgetOverride"]:
         """Load context budget overrides from a profile."""
         try:
             from swarm.config.profile_registry import load_profile
-            profile = load_profile(profile_id)
+            if self._sources is not None:
+                profile = self._sources.profile_registry.load_profile(profile_id)
+            else:
+                profile = load_profile(profile_id)
             if profile and hasattr(profile, 'runtime_settings') and profile.runtime_settings:
                 return profile.runtime_settings.context_budgets
         except Exception:
@@ -459,9 +497,7 @@ class ContextBudgetResolver:
     def _load_flow_budgets(self, flow_key: str) -> Optional["ContextBudgetOverride"]:
         """Load context budget overrides from a flow definition."""
         try:
-            from swarm.config.flow_registry import FlowRegistry
-            registry = FlowRegistry.get_instance()
-            flow_def = registry.get_flow(flow_key)
+            flow_def = self._flow_registry().get_flow(flow_key)
             if flow_def and hasattr(flow_def, 'context_budgets'):
                 return flow_def.context_budgets
         except Exception:
@@ -471,13 +507,11 @@ class ContextBudgetResolver:
     def _load_step_budgets(self, flow_key: str, step_id: str) -> Optional["ContextBudgetOverride"]:
         """Load context budget overrides from a step's engine profile."""
         try:
-            from swarm.config.flow_registry import FlowRegistry
-            registry = FlowRegistry.get_instance()
-            flow_def = registry.get_flow(flow_key)
+            flow_def = self._flow_registry().get_flow(flow_key)
             if flow_def:
                 for step in flow_def.steps:
-                    if step.id == step_id and step.engine_profile and hasattr(step.engine_profile, 'context_budgets') and step.engine_profile.context_budgets:
-                        return step.engine_profile.context_budgets
+                    if step.id == step_id and _step_budgets(step):
+                        return _step_budgets(step)
         except Exception:
             pass
         return None
@@ -496,47 +530,55 @@ class ContextBudgetResolver:
         Returns:
             ContextBudgetConfig with resolved values and source indicator
         """
+        flow_budgets = self._load_flow_budgets(flow_key) if flow_key else None
+        step_budgets = self._load_step_budgets(flow_key, step_id) if flow_key and step_id else None
+        return self._cascade(flow_budgets, step_budgets)
+
+    def build_table(self, generation: Tuple[Any, ...] = ()) -> "ContextBudgetTable":
+        """Resolve every flow and step once into a lookup table.
+
+        Steps without their own override are not stored; lookups for them
+        fall back to the flow entry, which resolves identically.
+        """
+        entries: Dict[Tuple[Optional[str], Optional[str]], ContextBudgetConfig] = {
+            (None, None): self._cascade(None, None),
+        }
+        try:
+            flows = self._flow_registry().flows
+        except Exception:
+            flows = []
+
+        for flow_def in flows:
+            flow_budgets = getattr(flow_def, "context_budgets", None)
+            entries[(flow_def.key, None)] = self._cascade(flow_budgets, None)
+            for step in flow_def.steps:
+                step_budgets = _step_budgets(step)
+                if step_budgets and (flow_def.key, step.id) not in entries:
+                    entries[(flow_def.key, step.id)] = self._cascade(flow_budgets, step_budgets)
+
+        return ContextBudgetTable(
+            profile_id=self._profile_id,
+            generation=generation,
+            entries=MappingProxyType(entries),
+        )
+
+    def _cascade(
+        self,
+        flow_budgets: Optional["ContextBudgetOverride"],
+        step_budgets: Optional["ContextBudgetOverride"],
+    ) -> ContextBudgetConfig:
+        """Apply profile, flow and step overrides to the global defaults."""
         # Start with global defaults
         result = ContextBudgetConfig(
-            context_budget_chars=get_default("context_budget_chars", 200000),
-            history_max_recent_chars=get_default("history_max_recent_chars", 60000),
-            history_max_older_chars=get_default("history_max_older_chars", 10000),
+            context_budget_chars=self._default("context_budget_chars", 200000),
+            history_max_recent_chars=self._default("history_max_recent_chars", 60000),
+            history_max_older_chars=self._default("history_max_older_chars", 10000),
             source="default",
         )
 
-        # Apply profile override if available
-        if self._profile_budgets:
-            if self._profile_budgets.context_budget_chars is not None:
-                result.context_budget_chars = self._profile_budgets.context_budget_chars
-            if self._profile_budgets.history_max_recent_chars is not None:
-                result.history_max_recent_chars = self._profile_budgets.history_max_recent_chars
-            if self._profile_budgets.history_max_older_chars is not None:
-                result.history_max_older_chars = self._profile_budgets.history_max_older_chars
-            result.source = "profile"
-
-        # Apply flow override if available
-        if flow_key:
-            flow_budgets = self._load_flow_budgets(flow_key)
-            if flow_budgets:
-                if flow_budgets.context_budget_chars is not None:
-                    result.context_budget_chars = flow_budgets.context_budget_chars
-                if flow_budgets.history_max_recent_chars is not None:
-                    result.history_max_recent_chars = flow_budgets.history_max_recent_chars
-                if flow_budgets.history_max_older_chars is not None:
-                    result.history_max_older_chars = flow_budgets.history_max_older_chars
-                result.source = "flow"
-
-        # Apply step override if available
-        if flow_key and step_id:
-            step_budgets = self._load_step_budgets(flow_key, step_id)
-            if step_budgets:
-                if step_budgets.context_budget_chars is not None:
-                    result.context_budget_chars = step_budgets.context_budget_chars
-                if step_budgets.history_max_recent_chars is not None:
-                    result.history_max_recent_chars = step_budgets.history_max_recent_chars
-                if step_budgets.history_max_older_chars is not None:
-                    result.history_max_older_chars = step_budgets.history_max_older_chars
-                result.source = "step"
+        _apply_override(result, self._profile_budgets, "profile")
+        _apply_override(result, flow_budgets, "flow")
+        _apply_override(result, step_budgets, "step")
 
         # === Guardrails: Validate and clamp resolved values ===
         result.context_budget_chars = _clamp_budget_value(
@@ -575,6 +617,164 @@ class ContextBudgetResolver:
         return result
 
 
+def _step_budgets(step: Any) -> Optional["ContextBudgetOverride"]:
+    """Context budget override from a step's engine profile, if any."""
+    engine_profile = getattr(step, "engine_profile", None)
+    if engine_profile and getattr(engine_profile, "context_budgets", None):
+        return engine_profile.context_budgets
+    return None
+
+
+def _apply_override(
+    result: ContextBudgetConfig,
+    override: Optional["ContextBudgetOverride"],
+    source: str,
+) -> None:
+    """Overlay the non-None values of an override onto result."""
+    if not override:
+        return
+    if override.context_budget_chars is not None:
+        result.context_budget_chars = override.context_budget_chars
+    if override.history_max_recent_chars is not None:
+        result.history_max_recent_chars = override.history_max_recent_chars
+    if override.history_max_older_chars is not None:
+        result.history_max_older_chars = override.history_max_older_chars
+    result.source = source
+
+
+@dataclass(frozen=True)
+class ContextBudgetTable:
+    """Flattened context budgets for one profile and config generation.
+
+    Built once by ContextBudgetResolver.build_table(); lookups are dict hits.
+
+    Attributes:
+        profile_id: Profile the table was built for (None for no profile).
+        generation: File signatures of the config the table was built from.
+        entries: Resolved budgets keyed by (flow_key, step_id); (None, None)
+            holds the profile level and (flow_key, None) the flow level.
+    """
+    profile_id: Optional[str]
+    generation: Tuple[Any, ...]
+    entries: Mapping[Tuple[Optional[str], Optional[str]], ContextBudgetConfig]
+
+    def lookup(
+        self,
+        flow_key: Optional[str] = None,
+        step_id: Optional[str] = None,
+    ) -> ContextBudgetConfig:
+        """Return a copy of the most specific resolved budgets."""
+        budgets = None
+        if flow_key:
+            if step_id:
+                budgets = self.entries.get((flow_key, step_id))
+            if budgets is None:
+                budgets = self.entries.get((flow_key, None))
+        if budgets is None:
+            budgets = self.entries[(None, None)]
+        return replace(budgets)
+
+
+# Seconds between checks of the config files behind the budget tables
+BUDGET_TABLE_CHECK_INTERVAL_S = 1.0
+
+_budget_tables: Dict[Optional[str], ContextBudgetTable] = {}
+_budget_generation: Optional[Tuple[Any, ...]] = None
+_budget_sources: Optional["_BudgetSources"] = None
+_budget_checked_at = 0.0
+_budget_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _budget_config_generation() -> Tuple[Any, ...]:
+    """Signatures of every file the budget cascade reads.
+
+    Covers runtime.yaml, flows.yaml, the per-flow YAML files and the
+    profile files, so a table is rebuilt when any of them change.
+    """
+    from swarm.config.flow_registry import _CONFIG_FILE, _FLOWS_DIR
+    from swarm.config.profile_registry import PROFILE_EXTENSION, ProfileRegistry
+
+    paths = [_CONFIG_PATH, _CONFIG_FILE]
+    paths.extend(sorted(_FLOWS_DIR.glob("*.yaml")))
+    paths.extend(sorted(ProfileRegistry.get_instance().profile_dir.glob(f"*{PROFILE_EXTENSION}")))
+    return tuple((str(path), _file_signature(path)) for path in paths)
+
+
+@dataclass(frozen=True)
+class _BudgetSources:
+    """Runtime defaults, flows and profiles read for the budget tables only.
+
+    Loaded when the config files change, so the tables follow the edit
+    without resetting the shared runtime config, FlowRegistry or
+    ProfileRegistry that running orchestrators read.
+    """
+    defaults: Mapping[str, Any]
+    flow_registry: Any
+    profile_registry: Any
+
+    @classmethod
+    def load(cls) -> "_BudgetSources":
+        from swarm.config.flow_registry import FlowRegistry
+        from swarm.config.profile_registry import ProfileRegistry
+
+        try:
+            flow_registry: Any = FlowRegistry()
+        except Exception as e:
+            logger.debug("Could not load flows for budget tables: %s", e)
+            flow_registry = None
+        return cls(
+            defaults=(_read_config() or {}).get("defaults", {}),
+            flow_registry=flow_registry,
+            profile_registry=ProfileRegistry(ProfileRegistry.get_instance().profile_dir),
+        )
+
+
+def get_context_budget_table(profile_id: Optional[str] = None) -> ContextBudgetTable:
+    """Return the resolved budget table for a profile.
+
+    Tables are built on first use and shared. At most once every
+    BUDGET_TABLE_CHECK_INTERVAL_S the config files are re-stat'ed; if any
+    changed, the runtime, flow and profile config is re-read into a private
+    snapshot and all tables are rebuilt from it on demand. The shared
+    config caches and registries are left untouched.
+    """
+    global _budget_generation, _budget_checked_at, _budget_sources
+    with _budget_lock:
+        now = time.monotonic()
+        if _budget_generation is None or now - _budget_checked_at >= BUDGET_TABLE_CHECK_INTERVAL_S:
+            generation = _budget_config_generation()
+            if _budget_generation is not None and generation != _budget_generation:
+                logger.debug("Context budget config changed; rebuilding budget tables")
+                _budget_sources = _BudgetSources.load()
+                _budget_tables.clear()
+            _budget_generation = generation
+            _budget_checked_at = now
+
+        table = _budget_tables.get(profile_id)
+        if table is None:
+            resolver = ContextBudgetResolver(profile_id, sources=_budget_sources)
+            table = resolver.build_table(_budget_generation)
+            _budget_tables[profile_id] = table
+        return table
+
+
+def reset_context_budget_tables() -> None:
+    """Drop all cached budget tables (for testing)."""
+    global _budget_generation, _budget_sources
+    with _budget_lock:
+        _budget_tables.clear()
+        _budget_generation = None
+        _budget_sources = None
+
+
 def get_resolved_context_budgets(
     flow_key: Optional[str] = None,
     step_id: Optional[str] = None,
@@ -583,9 +783,10 @@ def get_resolved_context_budgets(
     """Convenience function to resolve context budgets.
 
     This is the primary entry point for callers who need resolved budgets.
+    Resolution is a lookup in the cached table for the profile (see
+    get_context_budget_table()); the returned config is a fresh copy.
     """
-    resolver = ContextBudgetResolver(profile_id)
-    return resolver.resolve(flow_key, step_id)
+    return get_context_budget_table(profile_id).lookup(flow_key, step_id)
 
 
 # Default fallback backend when no flow-specific config exists
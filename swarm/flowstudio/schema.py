@@ -139,6 +139,8 @@ class RunInfo(BaseModel):
     title: Optional[str] = Field(None, description="Run title from metadata if available")
     description: Optional[str] = Field(None, description="Run description from metadata")
     tags: List[str] = Field(default_factory=list, description="Tags from metadata")
+    status: Optional[str] = Field(None, description="Run status (pending, running, succeeded, ...)")
+    created_at: Optional[str] = Field(None, description="Run creation time (ISO 8601)")
 
 
 class RunsListResponse(BaseModel):
@@ -148,6 +150,7 @@ class RunsListResponse(BaseModel):
     limit: int = Field(description="Maximum runs returned in this response")
     offset: int = Field(description="Number of runs skipped from the beginning")
     has_more: bool = Field(description="Whether more runs are available beyond this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
 
 
 class ArtifactStatus(str, Enum):
@@ -478,6 +481,7 @@ class RunSpecModel(BaseModel):
 class RunStatusEnum(str, Enum):
     """Status of a run."""
     PENDING = "pending"
+    QUEUED = "queued"
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
@@ -534,6 +538,18 @@ class BackendsListResponse(BaseModel):
     backends: List[BackendCapabilitiesModel] = Field(description="List of available backends")
 
 
+class RunSchedulerStatsResponse(BaseModel):
+    """Response for GET /api/runs/scheduler."""
+    max_workers: Optional[int] = Field(None, description="Global run slot count (null when unbounded)")
+    running: int = Field(description="Runs currently executing")
+    queued: int = Field(description="Runs waiting for a slot")
+    running_by_backend: Dict[str, int] = Field(default_factory=dict, description="Executing runs per backend")
+    queued_by_backend: Dict[str, int] = Field(default_factory=dict, description="Waiting runs per backend")
+    queued_by_priority: Dict[str, int] = Field(default_factory=dict, description="Waiting runs per priority class")
+    backend_limits: Dict[str, int] = Field(default_factory=dict, description="Configured per-backend limits")
+    oldest_queued_s: float = Field(0.0, description="Seconds the longest-waiting run has been queued")
+
+
 class StartRunRequest(BaseModel):
     """Request body for POST /api/run."""
     flows: List[str] = Field(description="List of flow keys to execute")
@@ -5,7 +5,8 @@ This module provides prompt compilation functionality that:
 - Loads prompt templates from swarm/prompts/agentic_steps/
 - Finds and replaces {{fragment_name}} markers with fragment content
 - Handles nested fragments (fragments can reference other fragments)
-- Caches compiled prompts for performance
+- Caches fragments and compiled prompts in the shared spec cache; a compiled
+  prompt is rebuilt when its prompt file or any fragment it used changes
 - Validates prompts for missing fragments
 
 Fragment resolution order:
@@ -29,11 +30,13 @@ import hashlib
 import logging
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from swarm.spec.cache import get_spec_cache
+
 logger = logging.getLogger(__name__)
 
 # Maximum recursion depth for nested fragments
@@ -57,39 +60,6 @@ class CompiledPrompt:
     compiled_at: float  # Unix timestamp
 
 
-@dataclass
-class FragmentCache:
-    """Cache for loaded fragments with TTL."""
-
-    _cache: Dict[str, Tuple[str, float]] = field(default_factory=dict)
-    _ttl_seconds: float = 300.0  # 5 minutes default TTL
-
-    def get(self, key: str) -> Optional[str]:
-        """Get cached fragment content if not expired."""
-        if key in self._cache:
-            content, cached_at = self._cache[key]
-            if time.time() - cached_at < self._ttl_seconds:
-                return content
-            # Expired - remove from cache
-            del self._cache[key]
-        return None
-
-    def set(self, key: str, content: str) -> None:
-        """Cache fragment content with current timestamp."""
-        self._cache[key] = (content, time.time())
-
-    def clear(self) -> None:
-        """Clear all cached fragments."""
-        self._cache.clear()
-
-
-# Global fragment cache instance
-_fragment_cache = FragmentCache()
-
-# Global compiled prompt cache
-_compiled_cache: Dict[str, CompiledPrompt] = {}
-
-
 def get_repo_root() -> Path:
     """Get repository root path by searching for swarm/ directory."""
     cwd = Path.cwd()
@@ -120,6 +90,25 @@ def get_fragment_dirs(repo_root: Optional[Path] = None) -> List[Path]:
     return [d for d in dirs if d.exists()]
 
 
+def _fragment_file_name(fragment_name: str) -> str:
+    """Fragment file name relative to a fragment directory (adds .md)."""
+    return fragment_name if fragment_name.endswith(".md") else f"{fragment_name}.md"
+
+
+def _fragment_candidates(fragment_name: str, repo_root: Path) -> List[Path]:
+    """Every path a fragment may be loaded from, existing or not.
+
+    Used as cache dependencies: creating the fragment in a higher-priority
+    directory must invalidate entries built from a lower-priority copy.
+    """
+    fragment_path = _fragment_file_name(fragment_name)
+    return [
+        repo_root / "swarm" / "prompts" / "fragments" / fragment_path,
+        repo_root / "swarm" / "spec" / "fragments" / fragment_path,
+        repo_root / "swarm" / "specs" / "fragments" / fragment_path,
+    ]
+
+
 def load_fragment(
     fragment_name: str,
     repo_root: Optional[Path] = None,
@@ -143,22 +132,18 @@ def load_fragment(
     Raises:
         FileNotFoundError: If fragment not found in any search directory.
     """
-    # Check cache first
-    cache_key = f"{repo_root or 'default'}:{fragment_name}"
-    if use_cache:
-        cached = _fragment_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
     if repo_root is None:
         repo_root = get_repo_root()
 
-    # Normalize fragment name
-    # Add .md extension if not present
-    if not fragment_name.endswith(".md"):
-        fragment_path = f"{fragment_name}.md"
-    else:
-        fragment_path = fragment_name
+    if use_cache:
+        return get_spec_cache().get(
+            "prompt-fragment",
+            (str(repo_root), fragment_name),
+            _fragment_candidates(fragment_name, repo_root),
+            lambda: load_fragment(fragment_name, repo_root, use_cache=False),
+        )
+
+    fragment_path = _fragment_file_name(fragment_name)
 
     # Search in fragment directories
     searched_paths: List[Path] = []
@@ -168,8 +153,6 @@ def load_fragment(
 
         if full_path.exists():
             content = full_path.read_text(encoding="utf-8")
-            if use_cache:
-                _fragment_cache.set(cache_key, content)
             logger.debug("Loaded fragment %s from %s", fragment_name, full_path)
             return content
 
@@ -285,15 +268,20 @@ def compile_prompt_with_metadata(
     if not prompt_file.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
-    # Check cache
-    cache_key = str(prompt_file)
-    if use_cache and cache_key in _compiled_cache:
-        cached = _compiled_cache[cache_key]
-        # Validate cache - check if source file changed
-        current_mtime = prompt_file.stat().st_mtime
-        if current_mtime <= cached.compiled_at:
-            return cached
+    if use_cache:
+        return get_spec_cache().get_derived(
+            "compiled-prompt",
+            (str(repo_root), str(prompt_file)),
+            lambda: _compile_with_dependencies(prompt_file, repo_root),
+        )
+    return _compile_with_dependencies(prompt_file, repo_root)[0]
+
 
+def _compile_with_dependencies(
+    prompt_file: Path,
+    repo_root: Path,
+) -> Tuple[CompiledPrompt, List[Path]]:
+    """Compile a prompt file, returning the files the result depends on."""
     # Load prompt content
     content = prompt_file.read_text(encoding="utf-8")
 
@@ -311,11 +299,10 @@ def compile_prompt_with_metadata(
         compiled_at=time.time(),
     )
 
-    # Cache result
-    if use_cache:
-        _compiled_cache[cache_key] = result
-
-    return result
+    dependencies = [prompt_file]
+    for fragment_name in result.fragments_used:
+        dependencies.extend(_fragment_candidates(fragment_name, repo_root))
+    return result, dependencies
 
 
 def _inject_fragments(
@@ -497,8 +484,9 @@ def validate_all_prompts(
 
 def clear_cache() -> None:
     """Clear all caches (fragments and compiled prompts)."""
-    _fragment_cache.clear()
-    _compiled_cache.clear()
+    cache = get_spec_cache()
+    cache.clear("prompt-fragment")
+    cache.clear("compiled-prompt")
 
 
 # =============================================================================
@@ -41,6 +41,8 @@ from swarm.runtime.types import (
     RunId,
     RunSpec,
     generate_run_id,
+    run_spec_from_dict,
+    run_spec_to_dict,
 )
 
 logger = logging.getLogger(__name__)
@@ -242,6 +244,70 @@ class AutopilotState:
     wisdom_apply_result: Optional[WisdomApplyResult] = None
 
 
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def autopilot_state_to_dict(state: AutopilotState) -> Dict[str, Any]:
+    """Serialize an AutopilotState for persistence.
+
+    The wisdom apply result is not persisted: it is only produced when a
+    run finalizes, and finished runs are never resumed.
+    """
+    return {
+        "run_id": state.run_id,
+        "spec": run_spec_to_dict(state.spec),
+        "config": {
+            "auto_apply_wisdom": state.config.auto_apply_wisdom,
+            "auto_apply_policy": state.config.auto_apply_policy,
+            "auto_apply_patch_types": list(state.config.auto_apply_patch_types),
+            "evolution_apply_policy": state.config.evolution_apply_policy.value,
+            "evolution_boundary": state.config.evolution_boundary.value,
+        },
+        "status": state.status.value,
+        "current_flow_index": state.current_flow_index,
+        "flows_to_execute": list(state.flows_to_execute),
+        "flows_completed": list(state.flows_completed),
+        "flows_failed": list(state.flows_failed),
+        "flow_transition_history": list(state.flow_transition_history),
+        "started_at": state.started_at.isoformat() if state.started_at else None,
+        "completed_at": state.completed_at.isoformat() if state.completed_at else None,
+        "error": state.error,
+    }
+
+
+def autopilot_state_from_dict(data: Dict[str, Any]) -> AutopilotState:
+    """Rebuild an AutopilotState from autopilot_state_to_dict() output."""
+    config_data = data.get("config", {})
+    config = AutopilotConfig(
+        auto_apply_wisdom=config_data.get("auto_apply_wisdom", False),
+        auto_apply_policy=config_data.get("auto_apply_policy", "safe"),
+        auto_apply_patch_types=config_data.get(
+            "auto_apply_patch_types", ["flow_evolution", "station_tuning"]
+        ),
+        evolution_apply_policy=EvolutionApplyPolicy(
+            config_data.get("evolution_apply_policy", EvolutionApplyPolicy.SUGGEST_ONLY.value)
+        ),
+        evolution_boundary=EvolutionBoundary(
+            config_data.get("evolution_boundary", EvolutionBoundary.RUN_END.value)
+        ),
+    )
+    return AutopilotState(
+        run_id=data["run_id"],
+        spec=run_spec_from_dict(data["spec"]),
+        config=config,
+        status=AutopilotStatus(data.get("status", AutopilotStatus.PENDING.value)),
+        current_flow_index=data.get("current_flow_index", 0),
+        flows_to_execute=list(data.get("flows_to_execute", [])),
+        flows_completed=list(data.get("flows_completed", [])),
+        flows_failed=list(data.get("flows_failed", [])),
+        flow_transition_history=list(data.get("flow_transition_history", [])),
+        started_at=_parse_datetime(data.get("started_at")),
+        completed_at=_parse_datetime(data.get("completed_at")),
+        error=data.get("error"),
+    )
+
+
 class AutopilotController:
     """Controller for autonomous flow chaining.
 
@@ -269,6 +335,7 @@ class AutopilotController:
         repo_root: Optional[Path] = None,
         orchestrator: Optional[Any] = None,
         default_config: Optional[AutopilotConfig] = None,
+        runs_dir: Optional[Path] = None,
     ):
         """Initialize the autopilot controller.
 
@@ -277,24 +344,28 @@ class AutopilotController:
             orchestrator: Optional orchestrator instance to use for flow execution.
                 If not provided, will import and use GeminiStepOrchestrator.
             default_config: Default configuration for autopilot runs.
+            runs_dir: Where run directories and events are written. Defaults
+                to storage.RUNS_DIR.
         """
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
+        self._runs_dir = runs_dir if runs_dir is not None else storage_module.RUNS_DIR
         self._flow_registry = FlowRegistry.get_instance()
         self._orchestrator = orchestrator
         self._states: Dict[RunId, AutopilotState] = {}
         self._default_config = default_config or AutopilotConfig()
 
+    @property
+    def runs_dir(self) -> Path:
+        """Directory holding this controller's run directories."""
+        return self._runs_dir
+
     def _get_orchestrator(self) -> Any:
         """Lazily load the orchestrator to avoid circular imports."""
         if self._orchestrator is None:
-            from swarm.runtime.engines.stub import StubStepEngine
-            from swarm.runtime.orchestrator import GeminiStepOrchestrator
+            from swarm.runtime.stepwise.orchestrator import get_orchestrator
 
-            engine = StubStepEngine()
-            self._orchestrator = GeminiStepOrchestrator(
-                engine=engine,
-                repo_root=self._repo_root,
-            )
+            # GeminiStepEngine, stubbed unless the engine config enables the CLI
+            self._orchestrator = get_orchestrator(repo_root=self._repo_root)
         return self._orchestrator
 
     def _get_sdlc_flows(self) -> List[str]:
@@ -386,8 +457,8 @@ class AutopilotController:
         self._states[run_id] = state
 
         # Create run directory and persist spec
-        storage_module.create_run_dir(run_id)
-        storage_module.write_spec(run_id, spec)
+        storage_module.create_run_dir(run_id, runs_dir=self._runs_dir)
+        storage_module.write_spec(run_id, spec, runs_dir=self._runs_dir)
 
         # Emit autopilot_started event
         now = datetime.now(timezone.utc)
@@ -404,6 +475,7 @@ class AutopilotController:
                     "no_human_mid_flow": True,
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info(
@@ -490,6 +562,7 @@ class AutopilotController:
                         "total_flows": len(state.flows_to_execute),
                     },
                 ),
+                runs_dir=self._runs_dir,
             )
 
             # Execute flow using the orchestrator
@@ -526,6 +599,7 @@ class AutopilotController:
                     flow_key=flow_key,
                     payload={"status": "succeeded"},
                 ),
+                runs_dir=self._runs_dir,
             )
 
             # Advance to next flow
@@ -553,6 +627,7 @@ class AutopilotController:
                     flow_key=flow_key,
                     payload={"error": str(e)},
                 ),
+                runs_dir=self._runs_dir,
             )
 
             self._finalize_run(state, success=False)
@@ -577,6 +652,36 @@ class AutopilotController:
 
         return self.get_result(run_id)
 
+    def get_state(self, run_id: RunId) -> Optional[AutopilotState]:
+        """Return the live state of an autopilot run, if known.
+
+        Args:
+            run_id: The autopilot run to look up.
+
+        Returns:
+            The AutopilotState, or None for unknown runs.
+        """
+        return self._states.get(run_id)
+
+    def restore_state(self, state: AutopilotState) -> None:
+        """Register a previously persisted autopilot run with this controller.
+
+        Used to resume runs after a restart. The run continues from
+        state.current_flow_index on its next tick; a flow that was executing
+        when the process stopped is re-run from its start.
+
+        Args:
+            state: State rebuilt with autopilot_state_from_dict().
+        """
+        self._states[state.run_id] = state
+        logger.info(
+            "Autopilot run %s restored at flow %d/%d (%s)",
+            state.run_id,
+            state.current_flow_index + 1,
+            len(state.flows_to_execute),
+            state.status.value,
+        )
+
     def is_complete(self, run_id: RunId) -> bool:
         """Check if an autopilot run is complete.
 
@@ -653,7 +758,7 @@ class AutopilotController:
         # Collect wisdom artifacts if wisdom flow completed
         wisdom_artifacts = {}
         if "wisdom" in state.flows_completed:
-            wisdom_dir = storage_module.get_run_path(run_id) / "wisdom"
+            wisdom_dir = storage_module.get_run_path(run_id, runs_dir=self._runs_dir) / "wisdom"
             if wisdom_dir.exists():
                 for artifact in wisdom_dir.glob("*.md"):
                     wisdom_artifacts[artifact.stem] = str(artifact)
@@ -710,11 +815,57 @@ class AutopilotController:
                 else "",
                 payload={},
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s canceled", run_id)
         return True
 
+    def fail(self, run_id: RunId, error: str) -> bool:
+        """Mark an autopilot run failed from outside a tick.
+
+        Used when ticking the run itself keeps raising, so the normal
+        failure path in tick() is never reached.
+
+        Args:
+            run_id: The autopilot run to fail.
+            error: Why the run failed.
+
+        Returns:
+            True if the run was failed, False if unknown or already complete.
+        """
+        state = self._states.get(run_id)
+        if state is None or self.is_complete(run_id):
+            return False
+
+        state.status = AutopilotStatus.FAILED
+        state.error = error
+        state.completed_at = datetime.now(timezone.utc)
+
+        # The event path may be what keeps failing, so the event is best-effort
+        try:
+            storage_module.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=datetime.now(timezone.utc),
+                    kind="autopilot_completed",
+                    flow_key=state.flows_completed[-1] if state.flows_completed else "",
+                    payload={
+                        "status": state.status.value,
+                        "flows_completed": state.flows_completed,
+                        "flows_failed": state.flows_failed,
+                        "error": error,
+                    },
+                ),
+                runs_dir=self._runs_dir,
+            )
+        except Exception as e:
+            logger.warning("Failed to record failure of autopilot run %s: %s", run_id, e)
+
+        logger.error("Autopilot run %s failed: %s", run_id, error)
+        return True
+
     def stop(self, run_id: RunId, reason: str = "user_initiated") -> bool:
         """Stop an autopilot run gracefully with savepoint.
 
@@ -756,6 +907,7 @@ class AutopilotController:
                 else "",
                 payload={"reason": reason},
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s stopping: %s", run_id, reason)
@@ -795,6 +947,7 @@ class AutopilotController:
                 else "",
                 payload={},
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s pausing", run_id)
@@ -833,6 +986,7 @@ class AutopilotController:
                 else "",
                 payload={"previous_status": previous_status.value},
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s resumed from %s", run_id, previous_status.value)
@@ -868,6 +1022,7 @@ class AutopilotController:
                     "reason": state.error or "unknown",
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s stopped", state.run_id)
@@ -895,6 +1050,7 @@ class AutopilotController:
                     "flows_remaining": state.flows_to_execute[state.current_flow_index :],
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info("Autopilot run %s paused", state.run_id)
@@ -905,7 +1061,7 @@ class AutopilotController:
         Args:
             state: The autopilot state to report on.
         """
-        run_path = storage_module.get_run_path(state.run_id)
+        run_path = storage_module.get_run_path(state.run_id, runs_dir=self._runs_dir)
         report_path = run_path / "stop_report.md"
 
         now = datetime.now(timezone.utc).isoformat()
@@ -1055,6 +1211,7 @@ class AutopilotController:
                     "wisdom_auto_apply": evolution_summary,
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info(
@@ -1099,7 +1256,7 @@ class AutopilotController:
         config = state.config
         policy = config.evolution_apply_policy
 
-        wisdom_dir = storage_module.get_run_path(run_id) / "wisdom"
+        wisdom_dir = storage_module.get_run_path(run_id, runs_dir=self._runs_dir) / "wisdom"
         if not wisdom_dir.exists():
             logger.warning(
                 "Wisdom directory not found for evolution processing: %s",
@@ -1121,6 +1278,7 @@ class AutopilotController:
                     "patch_types": config.auto_apply_patch_types,
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         # Map patch type strings to PatchType enum
@@ -1221,6 +1379,7 @@ class AutopilotController:
                             "policy": policy.value,
                         },
                     ),
+                    runs_dir=self._runs_dir,
                 )
                 result.suggestions.append(suggestion)
                 continue
@@ -1265,6 +1424,7 @@ class AutopilotController:
                             "boundary": boundary,
                         },
                     ),
+                    runs_dir=self._runs_dir,
                 )
 
                 logger.info(
@@ -1326,6 +1486,7 @@ class AutopilotController:
                                 "boundary": boundary,
                             },
                         ),
+                        runs_dir=self._runs_dir,
                     )
 
                     logger.info(
@@ -1360,6 +1521,7 @@ class AutopilotController:
                                 "policy": policy.value,
                             },
                         ),
+                        runs_dir=self._runs_dir,
                     )
 
                 result.suggestions.append(suggestion)
@@ -1403,6 +1565,7 @@ class AutopilotController:
                     "applied_patch_ids": result.applied_patch_ids,
                 },
             ),
+            runs_dir=self._runs_dir,
         )
 
         logger.info(
@@ -0,0 +1,544 @@
+"""
+autopilot_executor.py - Multiplex many autopilot runs over a fixed worker pool.
+
+AutopilotController advances a run one flow per tick(), and the only drivers
+were run_to_completion() (blocking, one run per thread) and the
+/autopilot/{run_id}/tick endpoint. The executor drives any number of
+autopilot runs with a fixed number of worker threads:
+- Each unit of work is one tick (one flow) of one run
+- Runs wait in a single FIFO ready queue; after a tick the run goes to the
+  back of the queue, so N runs share the workers round-robin at flow
+  granularity and a long run cannot starve short ones
+- A run is never ticked by two workers at once
+- AutopilotState is persisted to RUN_BASE/autopilot_state.json after every
+  tick, and recover() re-registers and re-queues in-flight runs after a
+  restart (an interrupted flow is re-run from its start)
+- Per-flow throughput and latency (tick duration and queue wait) are
+  recorded for observability
+- A run whose tick raises MAX_TICK_ERRORS times in a row is failed rather
+  than re-queued forever
+
+Design Philosophy:
+    - The controller stays the single owner of run semantics (pause, stop,
+      cancel, finalization); the executor only decides which run to tick next
+    - Paused runs leave the queue and come back on resume(); stopped,
+      canceled and finished runs are dropped
+    - Workers are daemon threads that finish their current tick on shutdown
+
+Usage:
+    from swarm.runtime.autopilot_executor import AutopilotExecutor
+
+    executor = AutopilotExecutor(max_workers=4)
+    executor.start()                       # spawns workers, recovers runs
+    run_ids = [executor.submit(issue_ref=ref) for ref in refs]
+    executor.wait_idle(timeout=600)
+    executor.stats().to_dict()             # per-flow throughput/latency
+    executor.shutdown()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from swarm.runtime import storage as storage_module
+from swarm.runtime.autopilot import (
+    AutopilotController,
+    AutopilotResult,
+    AutopilotStatus,
+    autopilot_state_from_dict,
+    autopilot_state_to_dict,
+)
+from swarm.runtime.types import RunId
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+# Latency samples kept per flow for percentiles
+LATENCY_SAMPLES = 1024
+
+# Consecutive raising ticks after which a run is failed instead of re-queued
+MAX_TICK_ERRORS = 3
+
+# Statuses a restarted process should pick back up
+_IN_FLIGHT = (
+    AutopilotStatus.PENDING,
+    AutopilotStatus.RUNNING,
+    AutopilotStatus.PAUSING,
+    AutopilotStatus.STOPPING,
+)
+
+
+def max_workers_from_env() -> int:
+    """Worker count from SWARM_AUTOPILOT_WORKERS (default 4, minimum 1)."""
+    raw = os.environ.get("SWARM_AUTOPILOT_WORKERS", "")
+    if not raw:
+        return DEFAULT_MAX_WORKERS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid SWARM_AUTOPILOT_WORKERS=%r", raw)
+        return DEFAULT_MAX_WORKERS
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _FlowMetrics:
+    """Counters and recent latency samples for one flow key."""
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.total_wait_ms = 0.0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, duration_ms: float, wait_ms: float, succeeded: bool) -> None:
+        if succeeded:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.total_ms += duration_ms
+        self.total_wait_ms += wait_ms
+        self.latencies.append(duration_ms)
+
+    def snapshot(self, elapsed_s: float) -> "FlowStats":
+        count = self.succeeded + self.failed
+        ordered = sorted(self.latencies)
+        return FlowStats(
+            executed=count,
+            succeeded=self.succeeded,
+            failed=self.failed,
+            per_second=count / elapsed_s if elapsed_s > 0 else 0.0,
+            mean_ms=self.total_ms / count if count else 0.0,
+            p50_ms=_percentile(ordered, 50),
+            p95_ms=_percentile(ordered, 95),
+            max_ms=ordered[-1] if ordered else 0.0,
+            mean_wait_ms=self.total_wait_ms / count if count else 0.0,
+        )
+
+
+@dataclass
+class FlowStats:
+    """Throughput and latency for one flow key.
+
+    Attributes:
+        executed: Flow executions finished (succeeded + failed).
+        succeeded: Executions that completed.
+        failed: Executions that raised and failed their run.
+        per_second: Executions per second since the executor started.
+        mean_ms / p50_ms / p95_ms / max_ms: Flow execution time.
+        mean_wait_ms: Time the run waited in the ready queue before the flow.
+    """
+
+    executed: int
+    succeeded: int
+    failed: int
+    per_second: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    mean_wait_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "executed": self.executed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "per_second": round(self.per_second, 3),
+            "mean_ms": round(self.mean_ms, 1),
+            "p50_ms": round(self.p50_ms, 1),
+            "p95_ms": round(self.p95_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "mean_wait_ms": round(self.mean_wait_ms, 1),
+        }
+
+
+@dataclass
+class ExecutorStats:
+    """Point-in-time view of the executor.
+
+    Attributes:
+        max_workers: Size of the worker pool.
+        active: Runs being ticked right now.
+        queued: Runs waiting in the ready queue.
+        runs_submitted: Runs submitted or recovered since start.
+        runs_finished: Runs that reached a terminal status.
+        runs_recovered: Runs re-queued by recover().
+        uptime_s: Seconds since the executor started.
+        flows: Per-flow throughput and latency.
+    """
+
+    max_workers: int
+    active: int
+    queued: int
+    runs_submitted: int
+    runs_finished: int
+    runs_recovered: int
+    uptime_s: float
+    flows: Dict[str, FlowStats] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "runs_submitted": self.runs_submitted,
+            "runs_finished": self.runs_finished,
+            "runs_recovered": self.runs_recovered,
+            "uptime_s": round(self.uptime_s, 3),
+            "flows": {key: stats.to_dict() for key, stats in self.flows.items()},
+        }
+
+
+class AutopilotExecutor:
+    """Drives autopilot runs concurrently over a fixed pool of workers.
+
+    Args:
+        controller: Controller owning the runs. Defaults to a new
+            AutopilotController.
+        max_workers: Worker thread count. Defaults to SWARM_AUTOPILOT_WORKERS.
+        runs_dir: Where autopilot state is persisted and recovered from.
+            Defaults to the controller's runs directory.
+    """
+
+    def __init__(
+        self,
+        controller: Optional[AutopilotController] = None,
+        max_workers: Optional[int] = None,
+        runs_dir: Optional[Path] = None,
+    ):
+        self._controller = controller or AutopilotController()
+        self._max_workers = max_workers if max_workers is not None else max_workers_from_env()
+        if self._max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._runs_dir = runs_dir if runs_dir is not None else self._controller.runs_dir
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._ready: Deque[Tuple[RunId, float]] = deque()
+        self._queued: Set[RunId] = set()
+        self._active: Set[RunId] = set()
+        self._tracked: Set[RunId] = set()
+        self._tick_errors: Dict[RunId, int] = {}
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+        self._started_at = time.monotonic()
+        self._flow_metrics: Dict[str, _FlowMetrics] = {}
+        self._runs_submitted = 0
+        self._runs_finished = 0
+        self._runs_recovered = 0
+
+    @property
+    def controller(self) -> AutopilotController:
+        return self._controller
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self, recover: bool = True) -> "AutopilotExecutor":
+        """Spawn the worker pool, optionally re-queueing in-flight runs first."""
+        with self._lock:
+            if self._workers:
+                return self
+            self._shutdown = False
+            self._started_at = time.monotonic()
+        if recover:
+            self.recover()
+        with self._lock:
+            for i in range(self._max_workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"autopilot-worker-{i}",
+                    daemon=True,
+                )
+                self._workers.append(thread)
+                thread.start()
+        logger.info("Autopilot executor started with %d workers", self._max_workers)
+        return self
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop the workers. Runs stay persisted and are picked up by recover()."""
+        with self._lock:
+            self._shutdown = True
+            workers, self._workers = self._workers, []
+            self._changed.notify_all()
+        if wait:
+            for thread in workers:
+                thread.join(timeout)
+
+    # -------------------------------------------------------------------------
+    # Submission and control
+    # -------------------------------------------------------------------------
+
+    def submit(self, **start_kwargs: Any) -> RunId:
+        """Start a new autopilot run and queue it.
+
+        Args:
+            **start_kwargs: Passed to AutopilotController.start().
+
+        Returns:
+            The run ID.
+        """
+        run_id = self._controller.start(**start_kwargs)
+        self._persist(run_id)
+        with self._lock:
+            self._runs_submitted += 1
+        self.enqueue(run_id)
+        return run_id
+
+    def enqueue(self, run_id: RunId) -> bool:
+        """Queue a run known to the controller. Returns False if already queued."""
+        if self._controller.get_state(run_id) is None:
+            raise ValueError(f"Unknown autopilot run: {run_id}")
+        with self._lock:
+            self._tracked.add(run_id)
+            if run_id in self._queued or run_id in self._active:
+                return False
+            self._ready.append((run_id, time.monotonic()))
+            self._queued.add(run_id)
+            self._changed.notify()
+            return True
+
+    def tracks(self, run_id: RunId) -> bool:
+        """Whether the run was submitted to or recovered by this executor."""
+        with self._lock:
+            return run_id in self._tracked
+
+    def pause(self, run_id: RunId) -> bool:
+        """Pause at the next flow boundary (see AutopilotController.pause)."""
+        return self._control(run_id, self._controller.pause(run_id))
+
+    def stop(self, run_id: RunId, reason: str = "user_initiated") -> bool:
+        """Stop with a savepoint at the next flow boundary."""
+        return self._control(run_id, self._controller.stop(run_id, reason=reason))
+
+    def cancel(self, run_id: RunId) -> bool:
+        """Cancel a run; it leaves the queue before its next flow."""
+        return self._control(run_id, self._controller.cancel(run_id))
+
+    def resume(self, run_id: RunId) -> bool:
+        """Resume a paused or stopped run and queue it again."""
+        if not self._controller.resume(run_id):
+            return False
+        self._persist(run_id)
+        self.enqueue(run_id)
+        return True
+
+    def _control(self, run_id: RunId, accepted: bool) -> bool:
+        if accepted:
+            self._persist(run_id)
+            # A paused run is off the queue; give it a tick to finalize
+            with self._lock:
+                idle = run_id not in self._queued and run_id not in self._active
+            if idle and run_id in self._tracked:
+                self.enqueue(run_id)
+        return accepted
+
+    def recover(self) -> List[RunId]:
+        """Re-register and queue runs that were in flight when the process stopped.
+
+        Returns:
+            The recovered run IDs.
+        """
+        recovered: List[RunId] = []
+        for run_id in storage_module.list_autopilot_runs(self._runs_dir):
+            if self._controller.get_state(run_id) is not None:
+                continue
+            data = storage_module.read_autopilot_state(run_id, self._runs_dir)
+            if data is None:
+                continue
+            try:
+                state = autopilot_state_from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping unreadable autopilot state for %s: %s", run_id, e)
+                continue
+            if state.status not in _IN_FLIGHT:
+                continue
+            self._controller.restore_state(state)
+            self.enqueue(run_id)
+            recovered.append(run_id)
+        with self._lock:
+            self._runs_recovered += len(recovered)
+            self._runs_submitted += len(recovered)
+        if recovered:
+            logger.info("Recovered %d in-flight autopilot runs", len(recovered))
+        return recovered
+
+    # -------------------------------------------------------------------------
+    # Waiting and introspection
+    # -------------------------------------------------------------------------
+
+    def wait(self, run_id: RunId, timeout: Optional[float] = None) -> AutopilotResult:
+        """Block until a run is finished or paused, then return its result."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while not self._settled_locked(run_id):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+        return self._controller.get_result(run_id)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no run is queued or being ticked. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while self._ready or self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+            return True
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                active=len(self._active),
+                queued=len(self._ready),
+                runs_submitted=self._runs_submitted,
+                runs_finished=self._runs_finished,
+                runs_recovered=self._runs_recovered,
+                uptime_s=elapsed,
+                flows={
+                    key: metrics.snapshot(elapsed)
+                    for key, metrics in sorted(self._flow_metrics.items())
+                },
+            )
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _settled_locked(self, run_id: RunId) -> bool:
+        if run_id in self._queued or run_id in self._active:
+            return False
+        return self._controller.is_complete(run_id) or self._controller.is_paused(run_id)
+
+    def _persist(self, run_id: RunId) -> None:
+        state = self._controller.get_state(run_id)
+        if state is None:
+            return
+        try:
+            storage_module.write_autopilot_state(
+                run_id, autopilot_state_to_dict(state), self._runs_dir
+            )
+        except OSError as e:
+            logger.warning("Failed to persist autopilot state for %s: %s", run_id, e)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._changed:
+                while not self._ready and not self._shutdown:
+                    self._changed.wait()
+                if self._shutdown:
+                    return
+                run_id, enqueued_at = self._ready.popleft()
+                self._queued.discard(run_id)
+                self._active.add(run_id)
+            try:
+                self._tick(run_id, enqueued_at)
+            finally:
+                with self._changed:
+                    self._active.discard(run_id)
+                    self._changed.notify_all()
+
+    def _tick(self, run_id: RunId, enqueued_at: float) -> None:
+        state = self._controller.get_state(run_id)
+        if state is None:
+            return
+        flow_key = (
+            state.flows_to_execute[state.current_flow_index]
+            if state.current_flow_index < len(state.flows_to_execute)
+            else None
+        )
+        completed_before = len(state.flows_completed)
+        failed_before = len(state.flows_failed)
+
+        started = time.monotonic()
+        try:
+            self._controller.tick(run_id)
+        except Exception as e:
+            logger.exception("Autopilot tick failed for run %s", run_id)
+            errors = self._tick_errors.get(run_id, 0) + 1
+            self._tick_errors[run_id] = errors
+            if errors >= MAX_TICK_ERRORS:
+                self._controller.fail(run_id, f"Tick failed {errors} times in a row: {e}")
+        else:
+            self._tick_errors.pop(run_id, None)
+        finished = time.monotonic()
+        self._persist(run_id)
+
+        ran_flow = flow_key is not None and (
+            len(state.flows_completed) > completed_before or len(state.flows_failed) > failed_before
+        )
+        done = self._controller.is_complete(run_id)
+        requeue = not done and not self._controller.is_paused(run_id)
+        with self._lock:
+            if ran_flow:
+                metrics = self._flow_metrics.get(flow_key)
+                if metrics is None:
+                    metrics = self._flow_metrics[flow_key] = _FlowMetrics()
+                metrics.record(
+                    (finished - started) * 1000,
+                    (started - enqueued_at) * 1000,
+                    succeeded=len(state.flows_failed) == failed_before,
+                )
+            if done:
+                self._runs_finished += 1
+                self._tick_errors.pop(run_id, None)
+            if requeue and not self._shutdown:
+                self._ready.append((run_id, finished))
+                self._queued.add(run_id)
+                self._changed.notify()
+
+
+_executor: Optional[AutopilotExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_autopilot_executor(
+    controller: Optional[AutopilotController] = None,
+) -> AutopilotExecutor:
+    """Return the process-wide executor, starting it on first use.
+
+    Args:
+        controller: Controller for the executor when it is first created
+            (e.g. the API's shared controller). Ignored afterwards.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = AutopilotExecutor(controller=controller).start()
+        return _executor
+
+
+def current_autopilot_executor() -> Optional[AutopilotExecutor]:
+    """Return the process-wide executor if it has been created, else None."""
+    with _executor_lock:
+        return _executor
+
+
+def reset_autopilot_executor() -> None:
+    """Shut down and drop the process-wide executor (for testing)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
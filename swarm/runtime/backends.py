@@ -22,9 +22,10 @@ import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from . import storage
+from .run_scheduler import RunScheduler, get_run_scheduler, run_priority
 from .types import (
     BackendCapabilities,
     BackendId,
@@ -87,6 +88,97 @@ class RunBackend(ABC):
         """Cancel a running run. Returns True if cancelled."""
         return False  # Default: not supported
 
+    # Scheduler that admits this backend's runs; None uses the process-wide one
+    scheduler: Optional[RunScheduler] = None
+
+    def _get_scheduler(self) -> RunScheduler:
+        return self.scheduler or get_run_scheduler()
+
+    def _launch(
+        self, run_id: RunId, spec: RunSpec, target: Callable[[RunId, RunSpec], None]
+    ) -> bool:
+        """Hand a prepared run to the scheduler for background execution.
+
+        The run starts immediately when a slot is free. Otherwise its summary
+        moves to QUEUED and a run_queued event is logged; on admission the
+        status returns to PENDING before target(run_id, spec) runs.
+
+        Returns:
+            True if the run was queued, False if it started immediately.
+        """
+        flow_key = spec.flow_keys[0] if spec.flow_keys else "unknown"
+        priority = run_priority(spec)
+        queued_at: List[datetime] = []
+
+        def mark_queued(position: int) -> None:
+            now = datetime.now(timezone.utc)
+            queued_at.append(now)
+            storage.update_summary(
+                run_id,
+                {"status": RunStatus.QUEUED.value, "updated_at": now.isoformat()},
+            )
+            storage.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=now,
+                    kind="run_queued",
+                    flow_key=flow_key,
+                    payload={"backend": self.id, "priority": priority, "position": position},
+                ),
+            )
+
+        def execute() -> None:
+            if queued_at:
+                now = datetime.now(timezone.utc)
+                storage.update_summary(
+                    run_id,
+                    {"status": RunStatus.PENDING.value, "updated_at": now.isoformat()},
+                )
+                storage.append_event(
+                    run_id,
+                    RunEvent(
+                        run_id=run_id,
+                        ts=now,
+                        kind="run_admitted",
+                        flow_key=flow_key,
+                        payload={
+                            "backend": self.id,
+                            "waited_ms": int((now - queued_at[0]).total_seconds() * 1000),
+                        },
+                    ),
+                )
+            target(run_id, spec)
+
+        return self._get_scheduler().submit(
+            run_id, self.id, execute, priority=priority, on_queued=mark_queued
+        )
+
+    def cancel_queued(self, run_id: RunId) -> bool:
+        """Cancel a run that is still waiting for a scheduler slot."""
+        if not self._get_scheduler().cancel(run_id):
+            return False
+        now = datetime.now(timezone.utc)
+        storage.update_summary(
+            run_id,
+            {
+                "status": RunStatus.CANCELED.value,
+                "completed_at": now.isoformat(),
+                "updated_at": now.isoformat(),
+            },
+        )
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_canceled",
+                flow_key="unknown",
+                payload={"queued": True},
+            ),
+        )
+        return True
+
 
 class ClaudeHarnessBackend(RunBackend):
     """Backend that wraps existing Claude Code CLI / Make execution.
@@ -151,13 +243,8 @@ class ClaudeHarnessBackend(RunBackend):
             ),
         )
 
-        # Start execution in background thread
-        thread = threading.Thread(
-            target=self._execute_run,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Start execution in background once the scheduler admits the run
+        self._launch(run_id, spec, self._execute_run)
 
         return run_id
 
@@ -483,13 +570,8 @@ class GeminiCliBackend(RunBackend):
             ),
         )
 
-        # Start execution in background thread
-        thread = threading.Thread(
-            target=self._execute_run,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Start execution in background once the scheduler admits the run
+        self._launch(run_id, spec, self._execute_run)
 
         return run_id
 
@@ -990,7 +1072,8 @@ class GeminiStepwiseBackend(RunBackend):
         - run_id: Unique ID generated (format: run-YYYYMMDD-HHMMSS-xxxxxx)
         - run directory: swarm/runs/<run_id>/ created
         - spec.json: RunSpec persisted
-        - meta.json: Initial RunSummary with status=PENDING
+        - meta.json: Initial RunSummary with status=PENDING (QUEUED while
+          waiting for a scheduler slot)
         - events.jsonl: run_created event with stepwise=True
 
         Asynchronous Work (background thread):
@@ -1032,13 +1115,8 @@ class GeminiStepwiseBackend(RunBackend):
             ),
         )
 
-        # Start orchestrator execution in background thread
-        thread = threading.Thread(
-            target=self._execute_stepwise,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Start orchestrator execution once the scheduler admits the run
+        self._launch(run_id, spec, self._execute_stepwise)
 
         return run_id
 
@@ -1202,7 +1280,8 @@ class ClaudeStepwiseBackend(RunBackend):
         - run_id: Unique ID generated (format: run-YYYYMMDD-HHMMSS-xxxxxx)
         - run directory: swarm/runs/<run_id>/ created
         - spec.json: RunSpec persisted
-        - meta.json: Initial RunSummary with status=PENDING
+        - meta.json: Initial RunSummary with status=PENDING (QUEUED while
+          waiting for a scheduler slot)
         - events.jsonl: run_created event with stepwise=True
 
         Asynchronous Work (background thread):
@@ -1248,13 +1327,8 @@ class ClaudeStepwiseBackend(RunBackend):
             ),
         )
 
-        # Start orchestrator execution in background thread
-        thread = threading.Thread(
-            target=self._execute_stepwise,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Start orchestrator execution once the scheduler admits the run
+        self._launch(run_id, spec, self._execute_stepwise)
 
         return run_id
 
@@ -28,13 +28,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from swarm.config.flow_registry import TeachingNotes, get_flow_steps
+from swarm.runtime.envelope_index import get_envelope_index
 from swarm.runtime.navigator import NextStepBrief
-from swarm.runtime.types import HandoffEnvelope, RunState, handoff_envelope_from_dict
+from swarm.runtime.phase_timing import timed_phase
+from swarm.runtime.types import HandoffEnvelope, RunState
 
 if TYPE_CHECKING:
     from swarm.runtime.engines import StepContext
@@ -142,6 +147,7 @@ class ContextPack:
         return self.navigator_brief
 
 
+@timed_phase("hydrate")
 def build_context_pack(
     ctx: "StepContext",
     run_state: Optional[RunState] = None,
@@ -411,17 +417,48 @@ def _scan_common_artifacts(run_base: Path, run_dir: Path) -> Dict[str, Path]:
 
             flow_key = flow_dir.name
             expected_artifacts = common_artifacts.get(flow_key, [])
+            if not expected_artifacts:
+                continue
 
-            for artifact_name in expected_artifacts:
-                artifact_path = flow_dir / artifact_name
-                if artifact_path.exists():
-                    # Use qualified name to avoid collisions
-                    qualified_name = f"{flow_key}/{artifact_name}"
-                    artifacts[qualified_name] = artifact_path
+            for artifact_name in _existing_artifacts(flow_dir, expected_artifacts):
+                # Use qualified name to avoid collisions
+                qualified_name = f"{flow_key}/{artifact_name}"
+                artifacts[qualified_name] = flow_dir / artifact_name
 
     return artifacts
 
 
+# Known-artifact scan results per flow directory, keyed by the directory's
+# mtime: creating or removing a direct child changes it, so an unchanged
+# directory cannot have gained or lost an artifact
+_ARTIFACT_SCAN_CACHE_SIZE = 256
+_artifact_scan_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[int, List[str]]]" = OrderedDict()
+_artifact_scan_lock = threading.Lock()
+
+
+def _existing_artifacts(flow_dir: Path, names: List[str]) -> List[str]:
+    """Names from the list that exist in flow_dir, re-checked only on change."""
+    try:
+        dir_mtime = os.stat(flow_dir).st_mtime_ns
+    except OSError:
+        return []
+
+    key = (str(flow_dir), tuple(names))
+    with _artifact_scan_lock:
+        cached = _artifact_scan_cache.get(key)
+        if cached is not None and cached[0] == dir_mtime:
+            _artifact_scan_cache.move_to_end(key)
+            return cached[1]
+
+    found = [name for name in names if (flow_dir / name).exists()]
+    with _artifact_scan_lock:
+        _artifact_scan_cache[key] = (dir_mtime, found)
+        _artifact_scan_cache.move_to_end(key)
+        while len(_artifact_scan_cache) > _ARTIFACT_SCAN_CACHE_SIZE:
+            _artifact_scan_cache.popitem(last=False)
+    return found
+
+
 def load_previous_envelopes(run_base: Path, flow_key: str) -> List[HandoffEnvelope]:
     """Load previous handoff envelopes from disk.
 
@@ -429,6 +466,9 @@ def load_previous_envelopes(run_base: Path, flow_key: str) -> List[HandoffEnvelo
     them into HandoffEnvelope objects. Returns envelopes in chronological
     order based on their step IDs.
 
+    Envelopes are served from the run's EnvelopeIndex, so only files that
+    changed since the previous call are parsed again.
+
     Args:
         run_base: The RUN_BASE path for the flow
             (e.g., swarm/runs/<run-id>/<flow-key>).
@@ -452,44 +492,8 @@ def load_previous_envelopes(run_base: Path, flow_key: str) -> List[HandoffEnvelo
         logger.debug("Handoff directory does not exist: %s", handoff_dir)
         return []
 
-    envelopes: List[HandoffEnvelope] = []
-    step_order = _get_step_order(flow_key)
-
-    for entry in handoff_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if not entry.name.endswith(".json"):
-            continue
-
-        try:
-            with open(entry, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            envelope = handoff_envelope_from_dict(data)
-            envelopes.append(envelope)
-            logger.debug(
-                "Loaded envelope for step %s from %s",
-                envelope.step_id,
-                entry.name,
-            )
-
-        except json.JSONDecodeError as e:
-            logger.warning(
-                "Failed to parse envelope JSON in %s: %s",
-                entry,
-                e,
-            )
-        except Exception as e:
-            logger.warning(
-                "Failed to load envelope from %s: %s",
-                entry,
-                e,
-            )
-
-    # Sort by step order within the flow
-    envelopes.sort(key=lambda env: step_order.get(env.step_id, 999))
-
-    return envelopes
+    # Sorted by step order within the flow
+    return get_envelope_index(run_base).envelopes(_get_step_order(flow_key))
 
 
 # Directory name for navigator briefs
@@ -661,6 +665,7 @@ def save_envelope(envelope: HandoffEnvelope, run_base: Path) -> Path:
     with open(envelope_path, "w", encoding="utf-8") as f:
         json.dump(handoff_envelope_to_dict(envelope), f, indent=2, default=str)
 
+    get_envelope_index(run_base).record(envelope_path, envelope)
     logger.debug("Saved envelope for step %s to %s", envelope.step_id, envelope_path)
 
     return envelope_path
@@ -24,6 +24,9 @@ Usage:
     # Query for UI
     stats = db.get_run_stats(run_id)
     tool_breakdown = db.get_tool_breakdown(run_id)
+
+    # Rebuild/backfill: set-based ingestion across many runs
+    db.ingest_events_bulk({run_id: events, other_run_id: other_events})
 """
 
 from __future__ import annotations
@@ -31,12 +34,13 @@ from __future__ import annotations
 import json
 import logging
 import os
+import tempfile
 import threading
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -466,6 +470,469 @@ CREATE INDEX IF NOT EXISTS idx_routing_decisions_decision ON routing_decisions(d
 """
 
 
+# =============================================================================
+# Bulk Ingestion (Set-Based Projection)
+# =============================================================================
+# ingest_events_bulk() stages events into temp tables via read_json() and
+# projects them with set-based INSERT ... SELECT statements instead of one
+# round-trip per event. Payload fields are extracted in Python (so defaults
+# match the per-event path exactly); DuckDB does dedup, pairing and upserts.
+#
+# Step pairing: the per-event path closes every 'running' step row for a
+# (run_id, flow_key, step_id) on the next step_end. In set form, each step
+# row (existing running rows at pos -1, new step_start rows at their batch
+# position) is paired with the first later step_end via an ASOF join.
+
+# Column layout of the staged events table. `raw_*` columns feed the events
+# table verbatim; the rest are projection values. Kind-specific columns are
+# reused across kinds (e.g. `status` is the step status for step_end and the
+# run status for run_completed).
+_BULK_EVENT_COLUMNS: Dict[str, str] = {
+    "pos": "BIGINT",
+    "run_id": "VARCHAR",
+    "event_id": "VARCHAR",
+    "seq": "BIGINT",
+    "ts": "VARCHAR",
+    "raw_kind": "VARCHAR",
+    "kind": "VARCHAR",
+    "flow_key": "VARCHAR",
+    "raw_step_id": "VARCHAR",
+    "agent_key": "VARCHAR",
+    "payload": "VARCHAR",
+    "step_id": "VARCHAR",
+    "event_ts": "VARCHAR",
+    "step_index": "BIGINT",
+    "step_agent_key": "VARCHAR",
+    "status": "VARCHAR",
+    "duration_ms": "BIGINT",
+    "prompt_tokens": "BIGINT",
+    "completion_tokens": "BIGINT",
+    "total_tokens": "BIGINT",
+    "handoff_status": "VARCHAR",
+    "routing_decision": "VARCHAR",
+    "routing_next_step": "VARCHAR",
+    "routing_confidence": "DOUBLE",
+    "error_message": "VARCHAR",
+    "tool_name": "VARCHAR",
+    "phase": "VARCHAR",
+    "success": "BOOLEAN",
+    "target_path": "VARCHAR",
+    "diff_lines_added": "BIGINT",
+    "diff_lines_removed": "BIGINT",
+    "exit_code": "BIGINT",
+    "flow_keys": "VARCHAR[]",
+    "profile_id": "VARCHAR",
+    "engine_id": "VARCHAR",
+    "metadata": "VARCHAR",
+    "total_steps": "BIGINT",
+    "completed_steps": "BIGINT",
+    "routing_mode": "VARCHAR",
+    "routing_source": "VARCHAR",
+    "chosen_candidate_id": "VARCHAR",
+    "candidate_count": "BIGINT",
+    "decision": "VARCHAR",
+    "target_node": "VARCHAR",
+    "terminate": "BOOLEAN",
+    "needs_human": "BOOLEAN",
+    "explanation": "VARCHAR",
+}
+
+# One row per file entry of a file_changes event (sub = index within event).
+_BULK_FILE_COLUMNS: Dict[str, str] = {
+    "pos": "BIGINT",
+    "sub": "BIGINT",
+    "run_id": "VARCHAR",
+    "step_id": "VARCHAR",
+    "file_path": "VARCHAR",
+    "change_type": "VARCHAR",
+    "lines_added": "BIGINT",
+    "lines_removed": "BIGINT",
+    "event_ts": "VARCHAR",
+}
+
+# Events that would be rejected by _insert_raw_event are never projected.
+# Among valid duplicates, the first occurrence in the batch wins; anything
+# already in the events table is removed with a single anti-join.
+_BULK_FRESH_SQL = """
+CREATE TEMP TABLE _bulk_fresh AS
+SELECT s.pos
+FROM (
+    SELECT pos, event_id,
+           row_number() OVER (PARTITION BY event_id ORDER BY pos) AS rn
+    FROM _bulk_events
+    WHERE event_id IS NOT NULL
+      AND raw_kind IS NOT NULL
+      AND flow_key IS NOT NULL
+      AND seq IS NOT NULL
+      AND TRY_CAST(ts AS TIMESTAMP) IS NOT NULL
+) s
+ANTI JOIN events e ON e.event_id = s.event_id
+WHERE s.rn = 1
+"""
+
+_BULK_NEW_VIEW_SQL = """
+CREATE TEMP VIEW _bulk_new AS
+SELECT b.*, CAST(CAST(b.event_ts AS TIMESTAMPTZ) AS TIMESTAMP) AS event_at
+FROM _bulk_events b
+JOIN _bulk_fresh f USING (pos)
+"""
+
+_BULK_INSERT_EVENTS_SQL = """
+INSERT INTO events (event_id, seq, run_id, ts, kind, flow_key, step_id, agent_key, payload)
+SELECT event_id, seq, run_id, CAST(ts AS TIMESTAMP), raw_kind, flow_key, raw_step_id, agent_key,
+       payload
+FROM _bulk_new
+ORDER BY pos
+"""
+
+# Mirrors record_run_start (insert, or refresh flow_keys/started_at/status on
+# conflict) followed by record_run_end (update only if the row exists).
+_BULK_PROJECT_RUNS_SQL = """
+INSERT INTO runs (
+    run_id, flow_keys, profile_id, engine_id, started_at, completed_at, status,
+    total_steps, completed_steps, total_tokens, total_duration_ms, metadata
+)
+WITH starts AS (
+    SELECT run_id,
+           min(pos) AS first_pos,
+           max(pos) AS last_pos,
+           first(profile_id ORDER BY pos) AS profile_id,
+           first(engine_id ORDER BY pos) AS engine_id,
+           first(metadata ORDER BY pos) AS metadata,
+           last(flow_keys ORDER BY pos) AS flow_keys,
+           last(event_at ORDER BY pos) AS started_at
+    FROM _bulk_new
+    WHERE kind = 'run_started'
+    GROUP BY run_id
+),
+ends AS (
+    SELECT n.run_id,
+           max(n.pos) AS last_pos,
+           last(n.event_at ORDER BY n.pos) AS completed_at,
+           last(n.status ORDER BY n.pos) AS status,
+           last(n.total_steps ORDER BY n.pos) AS total_steps,
+           last(n.completed_steps ORDER BY n.pos) AS completed_steps,
+           last(n.total_tokens ORDER BY n.pos) AS total_tokens,
+           last(n.duration_ms ORDER BY n.pos) AS total_duration_ms
+    FROM _bulk_new n
+    LEFT JOIN starts s ON s.run_id = n.run_id
+    LEFT JOIN runs r ON r.run_id = n.run_id
+    WHERE n.kind = 'run_completed'
+      AND (r.run_id IS NOT NULL OR n.pos > s.first_pos)
+    GROUP BY n.run_id
+),
+touched AS (
+    SELECT run_id FROM starts
+    UNION
+    SELECT run_id FROM ends
+)
+SELECT
+    t.run_id,
+    CASE WHEN s.run_id IS NOT NULL THEN s.flow_keys ELSE r.flow_keys END,
+    CASE WHEN r.run_id IS NOT NULL THEN r.profile_id ELSE s.profile_id END,
+    CASE WHEN r.run_id IS NOT NULL THEN r.engine_id ELSE s.engine_id END,
+    CASE WHEN s.run_id IS NOT NULL THEN s.started_at ELSE r.started_at END,
+    CASE WHEN e.run_id IS NOT NULL THEN e.completed_at ELSE r.completed_at END,
+    CASE
+        WHEN s.run_id IS NOT NULL AND (e.run_id IS NULL OR s.last_pos > e.last_pos)
+            THEN 'running'
+        WHEN e.run_id IS NOT NULL THEN e.status
+        ELSE r.status
+    END,
+    CASE WHEN e.run_id IS NOT NULL THEN e.total_steps
+         WHEN r.run_id IS NOT NULL THEN r.total_steps ELSE 0 END,
+    CASE WHEN e.run_id IS NOT NULL THEN e.completed_steps
+         WHEN r.run_id IS NOT NULL THEN r.completed_steps ELSE 0 END,
+    CASE WHEN e.run_id IS NOT NULL THEN e.total_tokens
+         WHEN r.run_id IS NOT NULL THEN r.total_tokens ELSE 0 END,
+    CASE WHEN e.run_id IS NOT NULL THEN e.total_duration_ms
+         WHEN r.run_id IS NOT NULL THEN r.total_duration_ms ELSE 0 END,
+    CASE WHEN r.run_id IS NOT NULL THEN r.metadata ELSE s.metadata END
+FROM touched t
+LEFT JOIN starts s ON s.run_id = t.run_id
+LEFT JOIN ends e ON e.run_id = t.run_id
+LEFT JOIN runs r ON r.run_id = t.run_id
+WHERE s.run_id IS NOT NULL OR r.run_id IS NOT NULL
+ON CONFLICT (run_id) DO UPDATE SET
+    flow_keys = EXCLUDED.flow_keys,
+    profile_id = EXCLUDED.profile_id,
+    engine_id = EXCLUDED.engine_id,
+    started_at = EXCLUDED.started_at,
+    completed_at = EXCLUDED.completed_at,
+    status = EXCLUDED.status,
+    total_steps = EXCLUDED.total_steps,
+    completed_steps = EXCLUDED.completed_steps,
+    total_tokens = EXCLUDED.total_tokens,
+    total_duration_ms = EXCLUDED.total_duration_ms,
+    metadata = EXCLUDED.metadata
+"""
+
+# Pairs every open step row with the step_end that closes it. Existing
+# 'running' rows sit at pos -1 (before the batch); new rows carry the batch
+# position of their step_start.
+_BULK_STEP_PAIRS_SQL = """
+CREATE TEMP TABLE _bulk_step_pairs AS
+WITH ends AS (
+    SELECT * FROM _bulk_new WHERE kind = 'step_end'
+),
+open_rows AS (
+    SELECT st.id, st.run_id, st.flow_key, st.step_id, -1 AS pos
+    FROM steps st
+    SEMI JOIN (SELECT DISTINCT run_id, flow_key, step_id FROM ends) k
+        ON k.run_id = st.run_id AND k.flow_key = st.flow_key AND k.step_id = st.step_id
+    WHERE st.status = 'running'
+    UNION ALL
+    SELECT NULL AS id, run_id, flow_key, step_id, pos
+    FROM _bulk_new
+    WHERE kind = 'step_start'
+)
+SELECT
+    o.id,
+    o.pos,
+    e.pos AS end_pos,
+    e.event_at AS completed_at,
+    e.status,
+    e.duration_ms,
+    e.prompt_tokens,
+    e.completion_tokens,
+    e.total_tokens,
+    e.handoff_status,
+    e.routing_decision,
+    e.routing_next_step,
+    e.routing_confidence,
+    e.error_message
+FROM open_rows o
+ASOF LEFT JOIN ends e
+    ON e.run_id = o.run_id
+    AND e.flow_key = o.flow_key
+    AND e.step_id = o.step_id
+    AND e.pos > o.pos
+"""
+
+_BULK_CLOSE_OPEN_STEPS_SQL = """
+UPDATE steps SET
+    completed_at = p.completed_at,
+    status = p.status,
+    duration_ms = p.duration_ms,
+    prompt_tokens = p.prompt_tokens,
+    completion_tokens = p.completion_tokens,
+    total_tokens = p.total_tokens,
+    handoff_status = p.handoff_status,
+    routing_decision = p.routing_decision,
+    routing_next_step = p.routing_next_step,
+    routing_confidence = p.routing_confidence,
+    error_message = p.error_message
+FROM _bulk_step_pairs p
+WHERE steps.id = p.id AND p.end_pos IS NOT NULL
+"""
+
+_BULK_INSERT_STEPS_SQL = """
+INSERT INTO steps (
+    run_id, flow_key, step_id, step_index, agent_key, started_at, completed_at, status,
+    duration_ms, prompt_tokens, completion_tokens, total_tokens, handoff_status,
+    routing_decision, routing_next_step, routing_confidence, error_message
+)
+SELECT
+    n.run_id, n.flow_key, n.step_id, n.step_index, n.step_agent_key, n.event_at,
+    p.completed_at,
+    CASE WHEN p.end_pos IS NULL THEN 'running' ELSE p.status END,
+    CASE WHEN p.end_pos IS NULL THEN 0 ELSE p.duration_ms END,
+    CASE WHEN p.end_pos IS NULL THEN 0 ELSE p.prompt_tokens END,
+    CASE WHEN p.end_pos IS NULL THEN 0 ELSE p.completion_tokens END,
+    CASE WHEN p.end_pos IS NULL THEN 0 ELSE p.total_tokens END,
+    p.handoff_status,
+    p.routing_decision,
+    p.routing_next_step,
+    p.routing_confidence,
+    p.error_message
+FROM _bulk_new n
+JOIN _bulk_step_pairs p ON p.pos = n.pos
+ORDER BY n.pos
+"""
+
+_BULK_INSERT_TOOL_CALLS_SQL = """
+INSERT INTO tool_calls (
+    run_id, step_id, tool_name, phase, started_at, completed_at,
+    duration_ms, success, target_path, diff_lines_added, diff_lines_removed,
+    exit_code, error_message
+)
+SELECT
+    run_id, step_id, tool_name, phase, event_at, event_at,
+    duration_ms, success, target_path, diff_lines_added, diff_lines_removed,
+    exit_code, error_message
+FROM _bulk_new
+WHERE kind = 'tool_end'
+ORDER BY pos
+"""
+
+# Mirrors record_file_change: last change_type wins, line counts accumulate
+# (NULL-propagating, like `a + b`), and the first timestamp is kept.
+_BULK_UPSERT_FILE_CHANGES_SQL = """
+INSERT INTO file_changes (
+    run_id, step_id, file_path, change_type, lines_added, lines_removed, timestamp
+)
+SELECT
+    f.run_id,
+    f.step_id,
+    f.file_path,
+    last(f.change_type ORDER BY f.pos, f.sub),
+    CASE WHEN count(*) = count(f.lines_added) THEN sum(f.lines_added) END,
+    CASE WHEN count(*) = count(f.lines_removed) THEN sum(f.lines_removed) END,
+    first(CAST(CAST(f.event_ts AS TIMESTAMPTZ) AS TIMESTAMP) ORDER BY f.pos, f.sub)
+FROM _bulk_files f
+JOIN _bulk_fresh USING (pos)
+GROUP BY f.run_id, f.step_id, f.file_path
+ON CONFLICT (run_id, step_id, file_path) DO UPDATE SET
+    change_type = EXCLUDED.change_type,
+    lines_added = file_changes.lines_added + EXCLUDED.lines_added,
+    lines_removed = file_changes.lines_removed + EXCLUDED.lines_removed
+"""
+
+# Mirrors record_routing_decision: the last decision per conflict key wins.
+_BULK_UPSERT_ROUTING_SQL = """
+INSERT INTO routing_decisions (
+    run_id, step_seq, flow_id, station_id, routing_mode, routing_source,
+    chosen_candidate_id, candidate_count, decision, target_node,
+    timestamp, terminate, needs_human, explanation
+)
+SELECT
+    run_id, seq, flow_key, step_id, routing_mode, routing_source,
+    chosen_candidate_id, candidate_count, decision, target_node,
+    event_at, terminate, needs_human, explanation
+FROM _bulk_new
+WHERE kind = 'route_decision'
+QUALIFY row_number() OVER (
+    PARTITION BY run_id, seq, step_id, event_at ORDER BY pos DESC
+) = 1
+ON CONFLICT (run_id, step_seq, station_id, timestamp) DO UPDATE SET
+    routing_mode = EXCLUDED.routing_mode,
+    routing_source = EXCLUDED.routing_source,
+    chosen_candidate_id = EXCLUDED.chosen_candidate_id,
+    candidate_count = EXCLUDED.candidate_count,
+    decision = EXCLUDED.decision,
+    target_node = EXCLUDED.target_node,
+    terminate = EXCLUDED.terminate,
+    needs_human = EXCLUDED.needs_human,
+    explanation = EXCLUDED.explanation
+"""
+
+_BULK_CLEANUP_SQL = """
+DROP TABLE IF EXISTS _bulk_step_pairs;
+DROP VIEW IF EXISTS _bulk_new;
+DROP TABLE IF EXISTS _bulk_fresh;
+DROP TABLE IF EXISTS _bulk_files;
+DROP TABLE IF EXISTS _bulk_events;
+"""
+
+# Staged facts for ingest_facts_bulk(); one row per ingest_fact() call.
+_BULK_FACT_COLUMNS: Dict[str, str] = {
+    "pos": "BIGINT",
+    "fact_id": "VARCHAR",
+    "run_id": "VARCHAR",
+    "step_id": "VARCHAR",
+    "flow_key": "VARCHAR",
+    "agent_key": "VARCHAR",
+    "marker_type": "VARCHAR",
+    "marker_id": "VARCHAR",
+    "fact_type": "VARCHAR",
+    "content": "VARCHAR",
+    "priority": "VARCHAR",
+    "status": "VARCHAR",
+    "evidence": "VARCHAR",
+    "created_at": "VARCHAR",
+    "metadata": "VARCHAR",
+}
+
+# Mirrors sequential ingest_fact() upserts: the last row per conflict key wins.
+_BULK_UPSERT_FACTS_SQL = """
+INSERT INTO facts (
+    fact_id, run_id, step_id, flow_key, agent_key,
+    marker_type, marker_id, fact_type, content,
+    priority, status, evidence, created_at, extracted_at, metadata
+)
+SELECT
+    fact_id, run_id, step_id, flow_key, agent_key,
+    marker_type, marker_id, fact_type, content,
+    priority, status, evidence, CAST(created_at AS TIMESTAMP), ?, CAST(metadata AS JSON)
+FROM _bulk_facts
+QUALIFY row_number() OVER (PARTITION BY run_id, step_id, marker_id ORDER BY pos DESC) = 1
+ON CONFLICT (run_id, step_id, marker_id) DO UPDATE SET
+    content = EXCLUDED.content,
+    priority = EXCLUDED.priority,
+    status = EXCLUDED.status,
+    evidence = EXCLUDED.evidence,
+    metadata = EXCLUDED.metadata,
+    extracted_at = EXCLUDED.extracted_at
+"""
+
+# Flush threshold for batched rebuilds (events staged per bulk statement set).
+BULK_INGEST_BATCH_EVENTS = 50_000
+
+
+class _BulkFallback(Exception):
+    """Raised while staging when an event needs the per-event path.
+
+    The set-based projection only handles well-typed events. Anything the
+    per-event path would coerce, reject or crash on in a data-dependent way
+    is routed through _ingest_events_internal instead, so both paths always
+    produce the same tables.
+    """
+
+
+def _bulk_str(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    raise _BulkFallback(f"non-string value {value!r}")
+
+
+def _bulk_int(value: Any) -> Optional[int]:
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    raise _BulkFallback(f"non-integer value {value!r}")
+
+
+def _bulk_float(value: Any) -> Optional[float]:
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return value
+    raise _BulkFallback(f"non-numeric value {value!r}")
+
+
+def _bulk_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise _BulkFallback(f"non-boolean value {value!r}")
+
+
+def _read_events_file(
+    events_file: Path, errors: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """Read events.jsonl, skipping (and logging) malformed lines.
+
+    Args:
+        events_file: Path to the events.jsonl file.
+        errors: If given, a {"file", "line", "error"} dict is appended for
+            each malformed line.
+    """
+    events: List[Dict[str, Any]] = []
+    with events_file.open("r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    "Skipping malformed event at line %d in %s: %s",
+                    line_num,
+                    events_file,
+                    e,
+                )
+                if errors is not None:
+                    errors.append({"file": events_file.name, "line": line_num, "error": str(e)})
+    return events
+
+
 # =============================================================================
 # Data Classes for Type Safety
 # =============================================================================
@@ -1254,6 +1721,76 @@ class StatsDB:
                 logger.warning("Failed to ingest fact %s: %s", marker_id, e)
                 return None
 
+    def ingest_facts_bulk(self, facts: List[Dict[str, Any]]) -> int:
+        """Upsert many facts with one set-based statement.
+
+        Equivalent to calling ingest_fact() for each dict in order (the last
+        fact per (run_id, step_id, marker_id) wins), but staged through a
+        temp table and applied in a single transaction.
+
+        Note: In projection-only mode, this is a no-op unless called from
+        within ingest_events() context.
+
+        Args:
+            facts: Dicts of ingest_fact() keyword arguments. run_id, step_id,
+                flow_key, marker_type, marker_id, fact_type and content are
+                required; the other ingest_fact() fields are optional.
+
+        Returns:
+            Number of facts applied (0 if skipped or the upsert failed).
+        """
+        if self.connection is None or not facts:
+            return 0
+        if not self._projection_guard("ingest_facts_bulk"):
+            return 0
+
+        import uuid
+
+        rows = []
+        for pos, fact in enumerate(facts):
+            created_at = fact.get("created_at")
+            rows.append(
+                {
+                    "pos": pos,
+                    "fact_id": f"fact_{uuid.uuid4().hex[:12]}",
+                    "run_id": fact["run_id"],
+                    "step_id": fact["step_id"],
+                    "flow_key": fact["flow_key"],
+                    "agent_key": fact.get("agent_key"),
+                    "marker_type": fact["marker_type"],
+                    "marker_id": fact["marker_id"],
+                    "fact_type": fact["fact_type"],
+                    "content": fact["content"],
+                    "priority": fact.get("priority"),
+                    "status": fact.get("status"),
+                    "evidence": fact.get("evidence"),
+                    "created_at": created_at.isoformat() if created_at else None,
+                    "metadata": json.dumps(fact.get("metadata") or {}),
+                }
+            )
+
+        extracted_at = datetime.now(timezone.utc)
+        with self._lock:
+            conn = self.connection
+            with tempfile.TemporaryDirectory(prefix="statsdb-facts-") as tmp:
+                facts_path = Path(tmp) / "facts.jsonl"
+                with facts_path.open("w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(row) + "\n" for row in rows)
+
+                conn.execute("DROP TABLE IF EXISTS _bulk_facts")
+                conn.execute("BEGIN TRANSACTION")
+                try:
+                    self._create_bulk_stage_table("_bulk_facts", facts_path, _BULK_FACT_COLUMNS)
+                    conn.execute(_BULK_UPSERT_FACTS_SQL, [extracted_at])
+                    conn.execute("DROP TABLE _bulk_facts")
+                    conn.execute("COMMIT")
+                except Exception as e:
+                    conn.execute("ROLLBACK")
+                    logger.warning("Bulk ingestion of %d facts failed: %s", len(rows), e)
+                    return 0
+
+        return len(rows)
+
     # =========================================================================
     # Batch Operations
     # =========================================================================
@@ -1475,6 +2012,287 @@ class StatsDB:
 
         return newly_ingested
 
+    # =========================================================================
+    # Bulk Ingestion (Set-Based)
+    # =========================================================================
+
+    def ingest_events_bulk(self, events_by_run: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Ingest events for one or more runs with set-based statements.
+
+        Produces the same tables as calling ingest_events() for each run in
+        order, but stages all events into DuckDB temp tables, deduplicates
+        them by event_id with one anti-join, and projects them into runs,
+        steps, tool_calls, file_changes and routing_decisions with one
+        INSERT ... SELECT per table. Intended for rebuilds and backfills.
+
+        Runs containing events the set-based projection cannot reproduce
+        exactly (unexpected payload types, step_end with status 'running')
+        are ingested through the per-event path instead. If the set-based
+        statements fail, the batch is rolled back and re-ingested per event.
+
+        Args:
+            events_by_run: Mapping of run_id -> list of event dicts, in the
+                order the runs should be ingested.
+
+        Returns:
+            Mapping of run_id -> number of newly ingested events.
+        """
+        if self.connection is None:
+            return {}
+
+        counts: Dict[str, int] = {}
+        batch: Dict[str, List[Dict[str, Any]]] = {}
+        event_rows: List[Dict[str, Any]] = []
+        file_rows: List[Dict[str, Any]] = []
+
+        with self._lock:
+            for run_id, events in events_by_run.items():
+                try:
+                    staged_events, staged_files = self._stage_bulk_run(
+                        run_id, events, len(event_rows)
+                    )
+                except _BulkFallback as e:
+                    logger.debug("Run %s needs per-event ingestion: %s", run_id, e)
+                    counts.update(self._flush_bulk(batch, event_rows, file_rows))
+                    batch, event_rows, file_rows = {}, [], []
+                    counts[run_id] = self.ingest_events(events, run_id)
+                    continue
+
+                batch[run_id] = events
+                event_rows.extend(staged_events)
+                file_rows.extend(staged_files)
+
+            counts.update(self._flush_bulk(batch, event_rows, file_rows))
+
+        return counts
+
+    def _stage_bulk_run(
+        self, run_id: str, events: List[Dict[str, Any]], start_pos: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract staged rows for one run, mirroring _ingest_events_internal.
+
+        Raises:
+            _BulkFallback: If any event must go through the per-event path.
+        """
+        event_rows: List[Dict[str, Any]] = []
+        file_rows: List[Dict[str, Any]] = []
+
+        try:
+            for offset, event in enumerate(events):
+                row, files = self._stage_bulk_event(run_id, event, start_pos + offset)
+                event_rows.append(row)
+                file_rows.extend(files)
+        except (TypeError, ValueError, AttributeError) as e:
+            raise _BulkFallback(str(e)) from e
+
+        return event_rows, file_rows
+
+    def _stage_bulk_event(
+        self, run_id: str, event: Dict[str, Any], pos: int
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Build the staged row (and file rows) for a single event."""
+        if not isinstance(event, dict):
+            raise _BulkFallback("event is not a dict")
+
+        ts = event.get("ts")
+        if ts is not None and not isinstance(ts, str):
+            raise _BulkFallback(f"non-string ts {ts!r}")
+        payload = event.get("payload", {})
+        if not isinstance(payload, dict):
+            raise _BulkFallback("payload is not a dict")
+
+        raw_kind = _bulk_str(event.get("kind"))
+        kind = normalize_event_kind(raw_kind) if raw_kind is not None else None
+        flow_key = _bulk_str(event.get("flow_key"))
+        step_id = _bulk_str(event.get("step_id", ""))
+
+        # Same fallback as the per-event path: unparseable ts projects as "now"
+        event_ts = self._parse_event_ts(ts) or datetime.now(timezone.utc)
+
+        row: Dict[str, Any] = {
+            "pos": pos,
+            "run_id": run_id,
+            "event_id": _bulk_str(event.get("event_id")),
+            "seq": _bulk_int(event.get("seq", 0)),
+            "ts": ts,
+            "raw_kind": raw_kind,
+            "kind": kind,
+            "flow_key": flow_key,
+            "raw_step_id": _bulk_str(event.get("step_id")),
+            "agent_key": _bulk_str(event.get("agent_key")),
+            "payload": json.dumps(payload),
+            "step_id": step_id,
+            "event_ts": event_ts.isoformat(),
+        }
+        files: List[Dict[str, Any]] = []
+
+        if kind == "step_start":
+            row["step_index"] = _bulk_int(payload.get("step_index", 0))
+            row["step_agent_key"] = _bulk_str(payload.get("agent_key"))
+
+        elif kind == "step_end":
+            status = _bulk_str(payload.get("status", "succeeded"))
+            if status == "running":
+                # A 'running' step_end leaves rows open for the next step_end
+                raise _BulkFallback("step_end with status 'running'")
+            prompt_tokens = _bulk_int(payload.get("prompt_tokens", 0))
+            completion_tokens = _bulk_int(payload.get("completion_tokens", 0))
+            row.update(
+                status=status,
+                duration_ms=_bulk_int(payload.get("duration_ms", 0)),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+                handoff_status=_bulk_str(payload.get("handoff_status")),
+                routing_decision=_bulk_str(payload.get("routing_decision")),
+                routing_next_step=_bulk_str(payload.get("routing_next_step")),
+                routing_confidence=_bulk_float(payload.get("routing_confidence")),
+                error_message=_bulk_str(payload.get("error")),
+            )
+
+        elif kind == "tool_end":
+            row.update(
+                tool_name=_bulk_str(payload.get("tool", "unknown")),
+                phase=_bulk_str(payload.get("phase", "work")),
+                duration_ms=_bulk_int(payload.get("duration_ms", 0)),
+                success=_bulk_bool(payload.get("success", True)),
+                target_path=_bulk_str(payload.get("target_path")),
+                diff_lines_added=_bulk_int(payload.get("diff_lines_added")),
+                diff_lines_removed=_bulk_int(payload.get("diff_lines_removed")),
+                exit_code=_bulk_int(payload.get("exit_code")),
+                error_message=_bulk_str(payload.get("error")),
+            )
+
+        elif kind == "file_changes":
+            for sub, fc in enumerate(payload.get("files", [])):
+                files.append(
+                    {
+                        "pos": pos,
+                        "sub": sub,
+                        "run_id": run_id,
+                        "step_id": step_id,
+                        "file_path": _bulk_str(fc.get("path", "")),
+                        "change_type": _bulk_str(fc.get("status", "modified")),
+                        "lines_added": _bulk_int(fc.get("insertions", 0)),
+                        "lines_removed": _bulk_int(fc.get("deletions", 0)),
+                        "event_ts": row["event_ts"],
+                    }
+                )
+
+        elif kind == "route_decision":
+            explanation = payload.get("explanation")
+            method = payload.get("method", "")
+            routing_source = None
+            if method == "deterministic":
+                routing_source = "fast_path"
+            elif method == "llm_tiebreak":
+                routing_source = "navigator"
+            elif method == "no_candidates":
+                routing_source = "deterministic_fallback"
+            candidate_count = 0
+            if explanation and isinstance(explanation, dict):
+                candidate_count = explanation.get("candidates_evaluated", 0)
+            terminate = _bulk_bool(payload.get("terminate", False))
+            decision = "terminate" if terminate else "advance"
+            if method == "llm_tiebreak":
+                decision = "advance"
+            row.update(
+                routing_mode=_bulk_str(method if method else None),
+                routing_source=routing_source,
+                chosen_candidate_id=_bulk_str(payload.get("selected_edge")),
+                candidate_count=_bulk_int(candidate_count),
+                decision=decision,
+                target_node=_bulk_str(payload.get("target_node")),
+                terminate=terminate,
+                needs_human=_bulk_bool(payload.get("needs_human", False)),
+                explanation=json.dumps(explanation) if explanation else None,
+            )
+
+        elif kind == "run_started":
+            flow_keys = payload.get("flow_keys", [])
+            if flow_keys is not None:
+                flow_keys = [_bulk_str(k) for k in flow_keys]
+            row.update(
+                flow_keys=flow_keys,
+                profile_id=_bulk_str(payload.get("profile_id")),
+                engine_id=_bulk_str(payload.get("engine")),
+                metadata=json.dumps(payload.get("metadata") or {}),
+            )
+
+        elif kind == "run_completed":
+            row.update(
+                status=_bulk_str(payload.get("status", "completed")),
+                total_steps=_bulk_int(payload.get("total_steps", 0)),
+                completed_steps=_bulk_int(payload.get("steps_completed", 0)),
+                total_tokens=_bulk_int(payload.get("total_tokens", 0)),
+                duration_ms=_bulk_int(payload.get("duration_ms", 0)),
+            )
+
+        return row, files
+
+    def _flush_bulk(
+        self,
+        batch: Dict[str, List[Dict[str, Any]]],
+        event_rows: List[Dict[str, Any]],
+        file_rows: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Run the set-based projection for staged rows (caller holds _lock)."""
+        if not batch:
+            return {}
+
+        conn = self.connection
+        counts = {run_id: 0 for run_id in batch}
+
+        with tempfile.TemporaryDirectory(prefix="statsdb-bulk-") as tmp:
+            events_path = Path(tmp) / "events.jsonl"
+            files_path = Path(tmp) / "files.jsonl"
+            with events_path.open("w", encoding="utf-8") as f:
+                f.writelines(json.dumps(row) + "\n" for row in event_rows)
+            with files_path.open("w", encoding="utf-8") as f:
+                f.writelines(json.dumps(row) + "\n" for row in file_rows)
+
+            conn.execute(_BULK_CLEANUP_SQL)
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                self._create_bulk_stage_table("_bulk_events", events_path, _BULK_EVENT_COLUMNS)
+                self._create_bulk_stage_table("_bulk_files", files_path, _BULK_FILE_COLUMNS)
+                conn.execute(_BULK_FRESH_SQL)
+                conn.execute(_BULK_NEW_VIEW_SQL)
+                conn.execute(_BULK_INSERT_EVENTS_SQL)
+                conn.execute(_BULK_PROJECT_RUNS_SQL)
+                conn.execute(_BULK_STEP_PAIRS_SQL)
+                conn.execute(_BULK_CLOSE_OPEN_STEPS_SQL)
+                conn.execute(_BULK_INSERT_STEPS_SQL)
+                conn.execute(_BULK_INSERT_TOOL_CALLS_SQL)
+                conn.execute(_BULK_UPSERT_FILE_CHANGES_SQL)
+                conn.execute(_BULK_UPSERT_ROUTING_SQL)
+                rows = conn.execute(
+                    "SELECT run_id, COUNT(*) FROM _bulk_new GROUP BY run_id"
+                ).fetchall()
+                conn.execute(_BULK_CLEANUP_SQL)
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                logger.warning(
+                    "Bulk ingestion of %d events failed, falling back to per-event: %s",
+                    len(event_rows),
+                    e,
+                )
+                return {run_id: self.ingest_events(events, run_id) for run_id, events in batch.items()}
+
+        counts.update({run_id: count for run_id, count in rows})
+        return counts
+
+    def _create_bulk_stage_table(self, name: str, path: Path, columns: Dict[str, str]) -> None:
+        """Load a staged NDJSON file into a temp table with explicit column types."""
+        columns_sql = ", ".join(f"'{col}': '{col_type}'" for col, col_type in columns.items())
+        self.connection.execute(
+            f"CREATE TEMP TABLE {name} AS "
+            f"SELECT * FROM read_json(?, format = 'newline_delimited', "
+            f"columns = {{{columns_sql}}})",
+            [str(path)],
+        )
+
     # =========================================================================
     # Query Operations (for TypeScript UI)
     # =========================================================================
@@ -1997,23 +2815,7 @@ class StatsDB:
             return result
 
         try:
-            # Read and parse events
-            events: List[Dict[str, Any]] = []
-            with events_file.open("r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError as e:
-                        logger.warning(
-                            "Skipping malformed event at line %d in %s: %s",
-                            line_num,
-                            events_file,
-                            e,
-                        )
+            events = _read_events_file(events_file)
 
             if events:
                 # Ingest events into DuckDB (idempotent)
@@ -2033,6 +2835,9 @@ class StatsDB:
         self,
         runs_dir: Optional[Path] = None,
         run_ids: Optional[List[str]] = None,
+        bulk: bool = True,
+        workers: int = 1,
+        progress_callback: Optional[Callable[..., None]] = None,
     ) -> Dict[str, Any]:
         """Rebuild projections for all runs from their events.jsonl files.
 
@@ -2044,6 +2849,15 @@ class StatsDB:
             runs_dir: Base directory for runs. Defaults to RUNS_DIR from storage.
             run_ids: Optional list of specific run IDs to rebuild.
                      If None, rebuilds all runs found in runs_dir.
+            bulk: If True (default), runs are batched through
+                ingest_events_bulk(). If False, each run is re-ingested
+                through the per-event path.
+            workers: Worker processes for the bulk path. With more than one
+                worker, runs are projected into shard DBs in parallel and
+                merged (see db_rebuild.ParallelRebuilder).
+            progress_callback: Optional callback receiving a
+                db_rebuild.RebuildProgress snapshot as the bulk rebuild
+                advances.
 
         Returns:
             Dict with rebuild statistics:
@@ -2076,8 +2890,16 @@ class StatsDB:
 
         logger.info("Rebuilding projections for %d runs", len(run_ids))
 
-        for run_id in run_ids:
-            result = self.rebuild_from_events(run_id, runs_dir)
+        if bulk:
+            from .db_rebuild import ParallelRebuilder
+
+            rebuilder = ParallelRebuilder(runs_dir, workers, progress_callback)
+            results = rebuilder.rebuild(self, run_ids)["run_results"]
+        else:
+            results = (self.rebuild_from_events(run_id, runs_dir) for run_id in run_ids)
+
+        for result in results:
+            run_id = result["run_id"]
             stats["runs_processed"] += 1
 
             if result["success"]:
@@ -2183,10 +3005,60 @@ def close_stats_db():
 # =============================================================================
 
 
+def _ingest_envelope_file_changes(
+    db: StatsDB, run_id: str, run_path: Path, stats: Dict[str, Any]
+) -> None:
+    """Record file changes from a run's handoff envelopes (rebuild helper)."""
+    # Set ingestion context to allow record_* calls (projection-only mode)
+    _ingestion_context.active = True
+    try:
+        for flow_dir in run_path.iterdir():
+            if not flow_dir.is_dir() or flow_dir.name.startswith("."):
+                continue
+
+            handoff_dir = flow_dir / "handoff"
+            if not handoff_dir.exists():
+                continue
+
+            for envelope_file in handoff_dir.glob("*.json"):
+                try:
+                    with envelope_file.open("r", encoding="utf-8") as f:
+                        envelope_data = json.load(f)
+
+                    # Record file changes from envelope if present
+                    file_changes = envelope_data.get("file_changes", {})
+                    if file_changes and "files" in file_changes:
+                        step_id = envelope_data.get("step_id", envelope_file.stem)
+                        for fc in file_changes.get("files", []):
+                            db.record_file_change(
+                                run_id=run_id,
+                                step_id=step_id,
+                                file_path=fc.get("path", ""),
+                                change_type=fc.get("status", "modified"),
+                                lines_added=fc.get("insertions", 0),
+                                lines_removed=fc.get("deletions", 0),
+                            )
+
+                    stats["envelopes_processed"] += 1
+
+                except (json.JSONDecodeError, IOError) as e:
+                    stats["errors"].append(
+                        {
+                            "run_id": run_id,
+                            "file": str(envelope_file),
+                            "error": str(e),
+                        }
+                    )
+    finally:
+        _ingestion_context.active = False
+
+
 def rebuild_stats_db(
     runs_dir: Optional[Path] = None,
     db_path: Optional[Path] = None,
     run_ids: Optional[List[str]] = None,
+    bulk: bool = True,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Rebuild the DuckDB stats database from disk artifacts.
 
@@ -2197,7 +3069,8 @@ def rebuild_stats_db(
     The rebuild process:
     1. Scan runs_dir for run directories (or use provided run_ids)
     2. For each run, read events.jsonl
-    3. Parse events and call ingest_events to populate DuckDB
+    3. Parse events and ingest them into DuckDB (batched through
+       ingest_events_bulk, or per event with bulk=False)
     4. Read handoff envelopes for additional routing/status data
 
     Args:
@@ -2205,6 +3078,10 @@ def rebuild_stats_db(
         db_path: Path to the DuckDB file. If None, uses default.
         run_ids: Optional list of specific run IDs to rebuild.
                  If None, rebuilds all runs found in runs_dir.
+        bulk: If True (default), use the set-based bulk ingestion path.
+        workers: Worker processes for the bulk path. Since the database is
+            created fresh, large rebuilds are projected into shard DBs in
+            parallel and merged (see db_rebuild.ParallelRebuilder).
 
     Returns:
         Dict with rebuild statistics:
@@ -2245,6 +3122,34 @@ def rebuild_stats_db(
 
     logger.info("Rebuilding stats DB from %d runs", len(run_ids))
 
+    if bulk:
+        from .db_rebuild import ParallelRebuilder
+
+        with_events = [
+            run_id
+            for run_id in run_ids
+            if (runs_dir / run_id / storage_module.EVENTS_FILE).exists()
+        ]
+        rebuild = ParallelRebuilder(runs_dir, workers).rebuild(db, with_events)
+
+        # Envelopes are applied after the run's events, as in per-event mode
+        for result in rebuild["run_results"]:
+            run_id = result["run_id"]
+            for error in result["malformed"]:
+                stats["errors"].append({"run_id": run_id, **error})
+            if not result["success"]:
+                stats["errors"].append({"run_id": run_id, "error": result["error"]})
+                continue
+            stats["events_ingested"] += result["events_read"]
+            try:
+                _ingest_envelope_file_changes(db, run_id, runs_dir / run_id, stats)
+                stats["runs_processed"] += 1
+            except Exception as e:
+                logger.warning("Error processing run %s: %s", run_id, e)
+                stats["errors"].append({"run_id": run_id, "error": str(e)})
+
+        run_ids = []
+
     for run_id in run_ids:
         try:
             run_path = runs_dir / run_id
@@ -2255,74 +3160,15 @@ def rebuild_stats_db(
                 continue
 
             # Read and parse events
-            events: List[Dict[str, Any]] = []
-            with events_file.open("r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError as e:
-                        stats["errors"].append(
-                            {
-                                "run_id": run_id,
-                                "file": "events.jsonl",
-                                "line": line_num,
-                                "error": str(e),
-                            }
-                        )
+            malformed: List[Dict[str, Any]] = []
+            events = _read_events_file(events_file, errors=malformed)
+            for error in malformed:
+                stats["errors"].append({"run_id": run_id, **error})
 
             if events:
-                # Ingest events into DuckDB
                 db.ingest_events(events, run_id)
                 stats["events_ingested"] += len(events)
-
-            # Also process handoff envelopes for routing info
-            # Set ingestion context to allow record_* calls (projection-only mode)
-            _ingestion_context.active = True
-            try:
-                for flow_dir in run_path.iterdir():
-                    if not flow_dir.is_dir() or flow_dir.name.startswith("."):
-                        continue
-
-                    handoff_dir = flow_dir / "handoff"
-                    if not handoff_dir.exists():
-                        continue
-
-                    for envelope_file in handoff_dir.glob("*.json"):
-                        try:
-                            with envelope_file.open("r", encoding="utf-8") as f:
-                                envelope_data = json.load(f)
-
-                            # Record file changes from envelope if present
-                            file_changes = envelope_data.get("file_changes", {})
-                            if file_changes and "files" in file_changes:
-                                step_id = envelope_data.get("step_id", envelope_file.stem)
-                                for fc in file_changes.get("files", []):
-                                    db.record_file_change(
-                                        run_id=run_id,
-                                        step_id=step_id,
-                                        file_path=fc.get("path", ""),
-                                        change_type=fc.get("status", "modified"),
-                                        lines_added=fc.get("insertions", 0),
-                                        lines_removed=fc.get("deletions", 0),
-                                    )
-
-                            stats["envelopes_processed"] += 1
-
-                        except (json.JSONDecodeError, IOError) as e:
-                            stats["errors"].append(
-                                {
-                                    "run_id": run_id,
-                                    "file": str(envelope_file),
-                                    "error": str(e),
-                                }
-                            )
-            finally:
-                _ingestion_context.active = False
-
+            _ingest_envelope_file_changes(db, run_id, run_path, stats)
             stats["runs_processed"] += 1
 
         except Exception as e:
@@ -2356,7 +3202,8 @@ def main():
     """CLI entry point for stats database operations.
 
     Usage:
-        python -m swarm.runtime.db rebuild [--runs-dir PATH] [--db-path PATH]
+        python -m swarm.runtime.db rebuild [--runs-dir PATH] [--db-path PATH] [--per-event]
+                                           [--workers N]
         python -m swarm.runtime.db stats <run_id>
         python -m swarm.runtime.db doctor <run_id> [--strict] [--from-disk]
     """
@@ -2397,6 +3244,17 @@ def main():
         dest="run_ids",
         help="Specific run ID to rebuild (can be repeated)",
     )
+    rebuild_parser.add_argument(
+        "--per-event",
+        action="store_true",
+        help="Ingest one event at a time instead of the set-based bulk path",
+    )
+    rebuild_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for the bulk path (default: CPU count, max 8)",
+    )
 
     # Stats command
     stats_parser = subparsers.add_parser(
@@ -2431,11 +3289,15 @@ def main():
     args = parser.parse_args()
 
     if args.command == "rebuild":
+        from .db_rebuild import default_rebuild_workers
+
         print("Rebuilding stats database...")
         result = rebuild_stats_db(
             runs_dir=args.runs_dir,
             db_path=args.db_path,
             run_ids=args.run_ids,
+            bulk=not args.per_event,
+            workers=args.workers or default_rebuild_workers(),
         )
         print("\nRebuild complete:")
         print(f"  Runs processed: {result['runs_processed']}")
@@ -0,0 +1,512 @@
+"""
+db_rebuild.py - Parallel, sharded rebuild of the DuckDB projection.
+
+Rebuilding the stats DB after a PROJECTION_VERSION bump means re-reading every
+run's events.jsonl. Doing that serially on one connection leaves the API
+degraded for the whole rebuild. This module splits the work:
+
+1. Runs are bin-packed by events.jsonl size into shards
+2. A process pool parses each shard and projects it into its own DuckDB file
+   (via StatsDB.ingest_events_bulk)
+3. The shard files are attached to the main DB and merged in one transaction
+
+Progress (runs done, events/sec, ETA) is reported through a callback so
+ResilientStatsDB can expose it in db_health_response() while the rebuild runs.
+
+Merging is only valid into a projection that holds no data for the runs being
+rebuilt (the normal case after a version bump renames the old DB). Otherwise,
+or when shards would collide on event_id, the rebuild runs in-process through
+the bulk path so results always match StatsDB.rebuild_all_from_events().
+
+Usage:
+    from swarm.runtime.db_rebuild import ParallelRebuilder
+
+    rebuilder = ParallelRebuilder(runs_dir, workers=8, progress_callback=print)
+    stats = rebuilder.rebuild(stats_db)
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .db import BULK_INGEST_BATCH_EVENTS, StatsDB, _read_events_file
+
+logger = logging.getLogger(__name__)
+
+# Projection tables copied from shards, in merge order. Surrogate `id` columns
+# are left to the main DB's sequences.
+MERGE_TABLES = ("events", "runs", "steps", "tool_calls", "file_changes", "routing_decisions")
+
+# More shards than workers keeps the pool busy and progress fine-grained.
+SHARDS_PER_WORKER = 4
+
+# Below this many runs, process start-up costs more than it saves.
+MIN_PARALLEL_RUNS = 32
+
+# RebuildProgress phases during which the rebuild is still running.
+ACTIVE_PHASES = ("pending", "parsing", "merging")
+
+
+def default_rebuild_workers() -> int:
+    """Default worker count: available CPUs, capped at 8."""
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+@dataclass
+class RebuildProgress:
+    """Progress snapshot of a running (or finished) rebuild."""
+
+    phase: str = "pending"  # pending, parsing, merging, complete, failed
+    total_runs: int = 0
+    runs_done: int = 0
+    events_done: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    workers: int = 1
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        """True while the rebuild is still running."""
+        return self.phase in ACTIVE_PHASES
+
+    @property
+    def elapsed_sec(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.updated_at if not self.active and self.updated_at else datetime.now(timezone.utc)
+        return max((end - self.started_at).total_seconds(), 0.0)
+
+    @property
+    def events_per_sec(self) -> float:
+        elapsed = self.elapsed_sec
+        return self.events_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_sec(self) -> Optional[float]:
+        """Estimated seconds remaining, from bytes (or runs) processed so far."""
+        if not self.active:
+            return 0.0
+        elapsed = self.elapsed_sec
+        if self.bytes_total > 0 and self.bytes_done > 0:
+            return elapsed * (self.bytes_total - self.bytes_done) / self.bytes_done
+        if self.total_runs > 0 and self.runs_done > 0:
+            return elapsed * (self.total_runs - self.runs_done) / self.runs_done
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict for API responses."""
+        eta = self.eta_sec
+        return {
+            "phase": self.phase,
+            "total_runs": self.total_runs,
+            "runs_done": self.runs_done,
+            "events_done": self.events_done,
+            "bytes_total": self.bytes_total,
+            "bytes_done": self.bytes_done,
+            "workers": self.workers,
+            "events_per_sec": round(self.events_per_sec, 1),
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "eta_sec": round(eta, 1) if eta is not None else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _Shard:
+    """A group of runs rebuilt together into one shard DB."""
+
+    index: int
+    run_ids: List[str] = field(default_factory=list)
+    size: int = 0
+
+
+def _read_run(runs_dir: Path, run_id: str) -> Dict[str, Any]:
+    """Read one run's events, returning a rebuild_from_events-style result.
+
+    The result carries the parsed `events` (removed again once ingested),
+    `malformed` line errors and the events.jsonl size for progress reporting.
+    """
+    from . import storage as storage_module
+
+    result: Dict[str, Any] = {
+        "run_id": run_id,
+        "events_read": 0,
+        "events_ingested": 0,
+        "bytes": 0,
+        "success": True,
+        "error": None,
+        "malformed": [],
+        "events": [],
+    }
+    events_file = runs_dir / run_id / storage_module.EVENTS_FILE
+    if not events_file.exists():
+        return result
+    try:
+        result["bytes"] = events_file.stat().st_size
+        result["events"] = _read_events_file(events_file, errors=result["malformed"])
+        result["events_read"] = len(result["events"])
+    except Exception as e:
+        result["success"] = False
+        result["error"] = str(e)
+        logger.warning("Failed to read events for run %s: %s", run_id, e)
+    return result
+
+
+def _ingest_runs(
+    db: StatsDB,
+    runs_dir: Path,
+    run_ids: List[str],
+    on_chunk: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Read runs in order and ingest them in bulk chunks of bounded size.
+
+    Args:
+        db: Target StatsDB.
+        runs_dir: Base directory for runs.
+        run_ids: Runs to ingest, in ingestion order.
+        on_chunk: Called with the per-run results of each flushed chunk.
+
+    Returns:
+        Per-run results (see _read_run), in run_ids order.
+    """
+    results: List[Dict[str, Any]] = []
+    chunk: List[Dict[str, Any]] = []
+    chunk_events = 0
+
+    def flush() -> None:
+        nonlocal chunk, chunk_events
+        batch = {}
+        for r in chunk:
+            events = r.pop("events")
+            if events:
+                batch[r["run_id"]] = events
+        try:
+            counts = db.ingest_events_bulk(batch) if batch else {}
+            for r in chunk:
+                r["events_ingested"] = counts.get(r["run_id"], 0)
+        except Exception as e:
+            logger.warning("Bulk rebuild chunk failed: %s", e)
+            for r in chunk:
+                if r["run_id"] in batch:
+                    r["success"] = False
+                    r["error"] = str(e)
+        results.extend(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk)
+        chunk, chunk_events = [], 0
+
+    for run_id in run_ids:
+        result = _read_run(runs_dir, run_id)
+        chunk.append(result)
+        chunk_events += result["events_read"]
+        if chunk_events >= BULK_INGEST_BATCH_EVENTS:
+            flush()
+    if chunk:
+        flush()
+    return results
+
+
+def _build_shard_db(shard_path: str, runs_dir: str, run_ids: List[str]) -> Dict[str, Any]:
+    """Process-pool worker: project a shard of runs into its own DuckDB file."""
+    db = StatsDB(Path(shard_path), projection_only=True)
+    try:
+        results = _ingest_runs(db, Path(runs_dir), run_ids)
+    finally:
+        db.close()
+    return {"shard_path": shard_path, "runs": results}
+
+
+class ParallelRebuilder:
+    """Rebuilds the DuckDB projection from events.jsonl using a process pool.
+
+    Attributes:
+        runs_dir: Base directory containing run directories.
+        workers: Maximum number of worker processes.
+        min_parallel_runs: Minimum run count before a process pool is used.
+        progress: Latest progress snapshot (also passed to progress_callback).
+    """
+
+    def __init__(
+        self,
+        runs_dir: Path,
+        workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[RebuildProgress], None]] = None,
+        min_parallel_runs: int = MIN_PARALLEL_RUNS,
+    ):
+        """Initialize the rebuilder.
+
+        Args:
+            runs_dir: Base directory for runs.
+            workers: Worker process count. Defaults to default_rebuild_workers().
+                With 1 worker everything runs in-process.
+            progress_callback: Called with a RebuildProgress snapshot on phase
+                changes and whenever a chunk or shard finishes.
+            min_parallel_runs: Rebuilds of fewer runs stay in-process.
+        """
+        self.runs_dir = runs_dir
+        self.workers = workers if workers is not None else default_rebuild_workers()
+        self.min_parallel_runs = min_parallel_runs
+        self.progress = RebuildProgress()
+        self._progress_callback = progress_callback
+        self._progress_lock = threading.Lock()
+
+    def rebuild(self, db: StatsDB, run_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Rebuild projections for runs into `db`.
+
+        Args:
+            db: Target StatsDB.
+            run_ids: Specific run IDs to rebuild. If None, rebuilds all runs
+                found in runs_dir.
+
+        Returns:
+            Dict in the same shape as StatsDB.rebuild_all_from_events(), plus
+            `run_results` (per-run dicts with events_read, events_ingested and
+            malformed line errors) and `parallel` (whether shards were merged).
+        """
+        stats: Dict[str, Any] = {
+            "runs_processed": 0,
+            "runs_succeeded": 0,
+            "events_ingested": 0,
+            "errors": [],
+            "run_results": [],
+            "parallel": False,
+        }
+
+        if run_ids is None:
+            if not self.runs_dir.exists():
+                logger.warning("Runs directory does not exist: %s", self.runs_dir)
+                return stats
+            run_ids = [
+                d.name
+                for d in self.runs_dir.iterdir()
+                if d.is_dir() and not d.name.startswith(".")
+            ]
+
+        sizes = self._events_file_sizes(run_ids)
+        use_pool = (
+            self.workers > 1
+            and len(run_ids) >= self.min_parallel_runs
+            and not self._has_existing_rows(db, run_ids)
+        )
+        self._report(
+            phase="parsing",
+            total_runs=len(run_ids),
+            bytes_total=sum(sizes.values()),
+            workers=self.workers if use_pool else 1,
+            started_at=datetime.now(timezone.utc),
+        )
+
+        try:
+            results: Optional[List[Dict[str, Any]]] = None
+            if use_pool:
+                results = self._rebuild_parallel(db, run_ids, sizes)
+                stats["parallel"] = results is not None
+            if results is None:
+                results = _ingest_runs(db, self.runs_dir, run_ids, on_chunk=self._runs_done)
+        except Exception as e:
+            self._report(phase="failed", error=str(e))
+            raise
+
+        # Report runs in caller order regardless of shard completion order
+        order = {run_id: i for i, run_id in enumerate(run_ids)}
+        results.sort(key=lambda r: order[r["run_id"]])
+
+        for result in results:
+            stats["runs_processed"] += 1
+            if result["success"]:
+                stats["runs_succeeded"] += 1
+                stats["events_ingested"] += result["events_ingested"]
+            else:
+                stats["errors"].append(
+                    {"run_id": result["run_id"], "error": result.get("error", "Unknown error")}
+                )
+        stats["run_results"] = results
+
+        self._report(phase="complete")
+        logger.info(
+            "Rebuild complete: %d/%d runs, %d events, %d errors (%s, %.1fs)",
+            stats["runs_succeeded"],
+            stats["runs_processed"],
+            stats["events_ingested"],
+            len(stats["errors"]),
+            "parallel" if stats["parallel"] else "in-process",
+            self.progress.elapsed_sec,
+        )
+        return stats
+
+    # =========================================================================
+    # Progress
+    # =========================================================================
+
+    def _report(self, **changes: Any) -> None:
+        with self._progress_lock:
+            for key, value in changes.items():
+                setattr(self.progress, key, value)
+            self.progress.updated_at = datetime.now(timezone.utc)
+            snapshot = RebuildProgress(**vars(self.progress))
+        if self._progress_callback is not None:
+            try:
+                self._progress_callback(snapshot)
+            except Exception as e:
+                logger.debug("Rebuild progress callback failed: %s", e)
+
+    def _runs_done(self, results: List[Dict[str, Any]]) -> None:
+        with self._progress_lock:
+            runs_done = self.progress.runs_done + len(results)
+            events_done = self.progress.events_done + sum(r["events_read"] for r in results)
+            bytes_done = self.progress.bytes_done + sum(r["bytes"] for r in results)
+        self._report(runs_done=runs_done, events_done=events_done, bytes_done=bytes_done)
+
+    # =========================================================================
+    # Parallel Path
+    # =========================================================================
+
+    def _events_file_sizes(self, run_ids: List[str]) -> Dict[str, int]:
+        from . import storage as storage_module
+
+        sizes: Dict[str, int] = {}
+        for run_id in run_ids:
+            try:
+                sizes[run_id] = (self.runs_dir / run_id / storage_module.EVENTS_FILE).stat().st_size
+            except OSError:
+                sizes[run_id] = 0
+        return sizes
+
+    def _plan_shards(self, run_ids: List[str], sizes: Dict[str, int]) -> List[_Shard]:
+        """Bin-pack runs into shards by events.jsonl size (largest first)."""
+        shards = [_Shard(index=i) for i in range(self.workers * SHARDS_PER_WORKER)]
+        for run_id in sorted(run_ids, key=lambda r: sizes[r], reverse=True):
+            shard = min(shards, key=lambda s: s.size)
+            shard.run_ids.append(run_id)
+            shard.size += sizes[run_id]
+
+        order = {run_id: i for i, run_id in enumerate(run_ids)}
+        for shard in shards:
+            shard.run_ids.sort(key=order.__getitem__)
+        return [s for s in shards if s.run_ids]
+
+    def _has_existing_rows(self, db: StatsDB, run_ids: List[str]) -> bool:
+        """Check whether the target DB already holds data for any of the runs."""
+        if db.connection is None:
+            return True
+        with db._lock:
+            row = db.connection.execute(
+                """
+                SELECT
+                    EXISTS (SELECT 1 FROM events WHERE run_id IN (SELECT unnest(?)))
+                    OR EXISTS (SELECT 1 FROM runs WHERE run_id IN (SELECT unnest(?)))
+                    OR EXISTS (SELECT 1 FROM steps WHERE run_id IN (SELECT unnest(?)))
+                """,
+                [run_ids, run_ids, run_ids],
+            ).fetchone()
+        return bool(row[0])
+
+    def _rebuild_parallel(
+        self, db: StatsDB, run_ids: List[str], sizes: Dict[str, int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Build shard DBs in a process pool and merge them into `db`.
+
+        Returns None if the shards cannot be merged losslessly; the caller
+        then falls back to the in-process path.
+        """
+        shards = self._plan_shards(run_ids, sizes)
+        tmp_parent = db.db_path.parent if db.db_path else None
+        if tmp_parent is not None:
+            tmp_parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(prefix=".rebuild-shards-", dir=tmp_parent) as tmp:
+            results: List[Dict[str, Any]] = []
+            shard_paths: List[str] = []
+
+            # spawn: DuckDB connections held by the parent are not fork-safe
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(shards)), mp_context=ctx
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _build_shard_db,
+                        str(Path(tmp) / f"shard-{shard.index}.duckdb"),
+                        str(self.runs_dir),
+                        shard.run_ids,
+                    )
+                    for shard in shards
+                ]
+                for future in as_completed(futures):
+                    shard_result = future.result()
+                    shard_paths.append(shard_result["shard_path"])
+                    results.extend(shard_result["runs"])
+                    self._runs_done(shard_result["runs"])
+
+            self._report(phase="merging")
+            if not self._merge_shards(db, sorted(shard_paths)):
+                self._report(phase="parsing", runs_done=0, events_done=0, bytes_done=0, workers=1)
+                return None
+
+        return results
+
+    def _merge_shards(self, db: StatsDB, shard_paths: List[str]) -> bool:
+        """Attach shard DBs and copy every projection table in one transaction.
+
+        Returns False (without writing) if two shards share an event_id, since
+        the per-event path would have projected only the first occurrence.
+        """
+        conn = db.connection
+        aliases = [f"_rebuild_shard_{i}" for i in range(len(shard_paths))]
+
+        with db._lock:
+            for alias, path in zip(aliases, shard_paths):
+                quoted = path.replace("'", "''")
+                conn.execute(f"ATTACH '{quoted}' AS {alias} (READ_ONLY)")
+            try:
+                all_events = " UNION ALL ".join(f"SELECT event_id FROM {a}.events" for a in aliases)
+                duplicate = conn.execute(
+                    f"SELECT event_id FROM ({all_events}) GROUP BY event_id "
+                    "HAVING COUNT(*) > 1 LIMIT 1"
+                ).fetchone()
+                if duplicate is not None:
+                    logger.info(
+                        "Event %s appears in several shards; rebuilding in-process",
+                        duplicate[0],
+                    )
+                    return False
+
+                conn.execute("BEGIN TRANSACTION")
+                try:
+                    for table in MERGE_TABLES:
+                        columns = [
+                            row[0]
+                            for row in conn.execute(
+                                "SELECT column_name FROM information_schema.columns "
+                                "WHERE table_name = ? AND table_catalog = current_database() "
+                                "AND column_name != 'id' ORDER BY ordinal_position",
+                                [table],
+                            ).fetchall()
+                        ]
+                        column_sql = ", ".join(columns)
+                        source = " UNION ALL ".join(
+                            f"SELECT {column_sql} FROM {a}.{table}" for a in aliases
+                        )
+                        conn.execute(f"INSERT INTO {table} ({column_sql}) {source}")
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                for alias in aliases:
+                    conn.execute(f"DETACH {alias}")
+        return True
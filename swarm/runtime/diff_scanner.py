@@ -12,6 +12,22 @@ Design Philosophy:
     - Post-step scanning is authoritative; agent narrative is supplementary
     - Results go into HandoffEnvelope.file_changes for durability
 
+Scanner Reuse:
+    Scans go through one DiffScanner per repo root. The scanner verifies the
+    repository once, resolves HEAD through a long-lived ``git cat-file
+    --batch-check`` process, and runs ``git status`` with the untracked cache
+    enabled (and fsmonitor when SWARM_DIFF_SCAN_FSMONITOR=1). Given a baseline
+    WorktreeSnapshot from step start, a scan reports only the paths whose
+    status or stat signature changed since the baseline; ``git diff --numstat``
+    only runs when a tracked path is among them.
+
+    Every scan also records the worktree state it saw. A step-start snapshot
+    taken with ``reuse_last_scan=True`` returns that state instead of running
+    ``git status`` again while HEAD is unchanged, so back-to-back steps pay
+    for one status walk each. Changes made between the two steps are then
+    attributed to the later step, which still reports no more than a full
+    scan would.
+
 Usage:
     from swarm.runtime.diff_scanner import scan_file_changes, FileChanges
 
@@ -21,6 +37,11 @@ Usage:
     # Or synchronously
     changes = scan_file_changes_sync(repo_root)
 
+    # Report only paths touched during the step
+    baseline = take_worktree_snapshot(repo_root, reuse_last_scan=True)  # at step start
+    ...
+    changes = scan_file_changes_sync(repo_root, baseline=baseline)
+
     # Include in envelope
     envelope.file_changes = file_changes_to_dict(changes)
 """
@@ -28,12 +49,17 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import os
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .phase_timing import timed_phase
+
 # Module logger
 logger = logging.getLogger(__name__)
 
@@ -170,6 +196,7 @@ def _run_git_command(
     args: List[str],
     cwd: Path,
     timeout: float = 30.0,
+    env: Optional[Dict[str, str]] = None,
 ) -> Tuple[bool, str, str]:
     """Run a git command and return (success, stdout, stderr).
 
@@ -177,6 +204,7 @@ def _run_git_command(
         args: Git command arguments (without 'git' prefix).
         cwd: Working directory for the command.
         timeout: Command timeout in seconds.
+        env: Extra environment variables layered over os.environ.
 
     Returns:
         Tuple of (success, stdout, stderr).
@@ -188,6 +216,7 @@ def _run_git_command(
             capture_output=True,
             text=True,
             timeout=timeout,
+            env={**os.environ, **env} if env else None,
         )
         return result.returncode == 0, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
@@ -263,77 +292,292 @@ def _parse_status_line(line: str) -> Optional[Tuple[str, str, Optional[str]]]:
     return status, rest, None
 
 
-def scan_file_changes_sync(
-    repo_root: Path,
-    include_untracked: bool = True,
-    include_staged: bool = True,
-) -> FileChanges:
-    """Synchronously scan for file changes in a git repository.
+# Stat signature of a worktree path: (mtime_ns, size, inode), None if missing.
+_StatSignature = Optional[Tuple[int, int, int]]
 
-    This function captures all file mutations since the last commit,
-    including unstaged changes, staged changes, and untracked files.
 
-    Args:
-        repo_root: Path to the repository root.
-        include_untracked: Whether to include untracked files.
-        include_staged: Whether to include staged files separately.
+@dataclass
+class WorktreeSnapshot:
+    """Baseline worktree state taken at step start.
 
-    Returns:
-        FileChanges with complete mutation information.
+    Attributes:
+        head: HEAD commit id ("" for an unborn branch, None if unknown).
+        entries: Dirty paths from ``git status`` mapped to their raw XY code
+            and stat signature.
     """
-    result = FileChanges()
 
-    # Verify we're in a git repo
-    success, _, stderr = _run_git_command(["rev-parse", "--git-dir"], repo_root)
-    if not success:
-        result.scan_error = f"Not a git repository: {stderr.strip()}"
-        return result
+    head: Optional[str]
+    entries: Dict[str, Tuple[str, _StatSignature]] = field(default_factory=dict)
 
-    # Get file changes with numstat (insertions/deletions)
-    # This shows both staged and unstaged changes
-    success, stdout, stderr = _run_git_command(
-        ["diff", "HEAD", "--numstat", "--find-renames"],
-        repo_root,
-    )
 
-    if not success:
-        # HEAD might not exist (empty repo), try without HEAD
-        success, stdout, stderr = _run_git_command(
-            ["diff", "--numstat", "--find-renames"],
-            repo_root,
-        )
+@dataclass
+class _StatusEntry:
+    """One parsed ``git status --porcelain`` line."""
 
-    numstat_map: Dict[str, Tuple[int, int]] = {}
-    if success and stdout.strip():
-        for line in stdout.strip().split("\n"):
-            parsed = _parse_numstat_line(line)
-            if parsed:
-                ins, dels, path = parsed
-                numstat_map[path] = (ins, dels)
+    xy: str
+    status: str
+    path: str
+    old_path: Optional[str]
 
-    # Get porcelain status for comprehensive file list
-    success, stdout, stderr = _run_git_command(
-        ["status", "--porcelain", "-uall"],  # -uall shows all untracked
-        repo_root,
-    )
 
-    if not success:
-        result.scan_error = f"Failed to get git status: {stderr.strip()}"
-        return result
+def _status_env() -> Dict[str, str]:
+    """Git config for status scans, passed via GIT_CONFIG_* variables.
+
+    Keeping the config out of argv leaves the command itself as a plain
+    ``git status`` invocation.
+    """
+    config = [("core.untrackedCache", "true"), ("core.quotePath", "false")]
+    if os.environ.get("SWARM_DIFF_SCAN_FSMONITOR", "").lower() in ("1", "true"):
+        config.append(("core.fsmonitor", "true"))
+
+    try:
+        base = int(os.environ.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        base = 0
+    env = {"GIT_CONFIG_COUNT": str(base + len(config))}
+    for offset, (key, value) in enumerate(config):
+        env[f"GIT_CONFIG_KEY_{base + offset}"] = key
+        env[f"GIT_CONFIG_VALUE_{base + offset}"] = value
+    return env
+
+
+def _stat_signature(path: Path) -> _StatSignature:
+    """Return the stat signature of a path, or None if it does not exist."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class _CatFileBatch:
+    """Long-lived ``git cat-file --batch-check`` process for revision lookups.
+
+    Resolving HEAD through one persistent process avoids a ``git rev-parse``
+    spawn per scan. The process is restarted once if it has died.
+    """
+
+    def __init__(self, repo_root: Path):
+        self._repo_root = repo_root
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            cwd=str(self._repo_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a revision to an object id.
+
+        Returns:
+            The object id, "" if the revision does not exist, or None if the
+            lookup failed.
+        """
+        with self._lock:
+            for _ in range(2):
+                try:
+                    if self._proc is None or self._proc.poll() is not None:
+                        self._proc = self._start()
+                    assert self._proc.stdin is not None and self._proc.stdout is not None
+                    self._proc.stdin.write(rev + "\n")
+                    self._proc.stdin.flush()
+                    line = self._proc.stdout.readline()
+                except (OSError, ValueError) as e:
+                    logger.debug("cat-file --batch-check failed in %s: %s", self._repo_root, e)
+                    self._kill()
+                    continue
+                if not line:
+                    self._kill()
+                    continue
+                line = line.rstrip("\n")
+                if line.endswith(" missing"):
+                    return ""
+                return line.split(" ", 1)[0]
+            return None
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+    def close(self) -> None:
+        """Terminate the batch process."""
+        with self._lock:
+            self._kill()
+
+
+class DiffScanner:
+    """Persistent file change scanner for one repository root.
+
+    Use get_diff_scanner() to obtain the shared instance for a repo root.
+    """
 
-    tracked_files: List[FileDiff] = []
-    untracked_files: List[str] = []
-    staged_files: List[str] = []
-    total_ins = 0
-    total_dels = 0
+    def __init__(self, repo_root: Path):
+        self.repo_root = Path(repo_root)
+        self._verified = False
+        self._batch = _CatFileBatch(self.repo_root)
+        self._last_scan: Optional[WorktreeSnapshot] = None
+
+    def _verify(self) -> Tuple[bool, str]:
+        """Check the root is a git repository (success is cached)."""
+        if self._verified:
+            return True, ""
+        success, _, stderr = _run_git_command(["rev-parse", "--git-dir"], self.repo_root)
+        if success:
+            self._verified = True
+        return success, stderr
+
+    def head(self) -> Optional[str]:
+        """Current HEAD commit id ("" if unborn, None if unknown)."""
+        return self._batch.resolve("HEAD")
+
+    def _read_status(self) -> Tuple[bool, List[_StatusEntry], str]:
+        """Run ``git status --porcelain -uall`` and parse its entries."""
+        success, stdout, stderr = _run_git_command(
+            ["status", "--porcelain", "-uall"],  # -uall shows all untracked
+            self.repo_root,
+            env=_status_env(),
+        )
+        if not success:
+            return False, [], stderr
 
-    if stdout.strip():
-        for line in stdout.strip().split("\n"):
+        entries: List[_StatusEntry] = []
+        for line in stdout.strip("\n").split("\n") if stdout.strip() else []:
             parsed = _parse_status_line(line)
-            if not parsed:
-                continue
+            if parsed:
+                status, path, old_path = parsed
+                entries.append(_StatusEntry(line[:2], status, path, old_path))
+        return True, entries, ""
+
+    def _snapshot_of(
+        self, head: Optional[str], entries: List[_StatusEntry]
+    ) -> WorktreeSnapshot:
+        return WorktreeSnapshot(
+            head=head,
+            entries={
+                e.path: (e.xy, _stat_signature(self.repo_root / e.path)) for e in entries
+            },
+        )
+
+    def snapshot(self, reuse_last_scan: bool = False) -> Optional[WorktreeSnapshot]:
+        """Capture the baseline worktree state.
+
+        Args:
+            reuse_last_scan: Return the state recorded by the previous scan
+                when HEAD has not moved since, instead of running git status.
+
+        Returns:
+            A WorktreeSnapshot, or None if the root is not a git repository
+            or git status failed.
+        """
+        success, _ = self._verify()
+        if not success:
+            return None
+        head = self.head()
+        last_scan = self._last_scan
+        if reuse_last_scan and last_scan is not None and head is not None:
+            if last_scan.head == head:
+                return last_scan
+        success, entries, stderr = self._read_status()
+        if not success:
+            logger.debug("Baseline snapshot failed for %s: %s", self.repo_root, stderr.strip())
+            return None
+        return self._snapshot_of(head, entries)
+
+    def _numstat(self) -> Dict[str, Tuple[int, int]]:
+        """Collect insertions/deletions per changed tracked path."""
+        # No pathspec here: limiting the diff to a few paths makes git walk
+        # the HEAD tree without the cache-tree shortcut, which is slower than
+        # diffing every dirty path on large repositories.
+        # Same config as status, so non-ASCII paths are not quoted
+        # differently and still match the status entries
+        env = _status_env()
+        success, stdout, _ = _run_git_command(
+            ["diff", "HEAD", "--numstat", "--find-renames"],
+            self.repo_root,
+            env=env,
+        )
+        if not success:
+            # HEAD might not exist (empty repo), try without HEAD
+            success, stdout, _ = _run_git_command(
+                ["diff", "--numstat", "--find-renames"],
+                self.repo_root,
+                env=env,
+            )
 
-            status, path, old_path = parsed
+        numstat_map: Dict[str, Tuple[int, int]] = {}
+        if success and stdout.strip():
+            for line in stdout.strip().split("\n"):
+                parsed = _parse_numstat_line(line)
+                if parsed:
+                    ins, dels, path = parsed
+                    numstat_map[path] = (ins, dels)
+        return numstat_map
+
+    def scan(
+        self,
+        include_untracked: bool = True,
+        include_staged: bool = True,
+        baseline: Optional[WorktreeSnapshot] = None,
+    ) -> FileChanges:
+        """Scan for file changes, optionally relative to a baseline.
+
+        With a baseline, only paths whose status or stat signature changed
+        since the snapshot are reported. If HEAD moved (or cannot be
+        resolved) the scan falls back to all changes since HEAD.
+        """
+        result = FileChanges()
+
+        success, stderr = self._verify()
+        if not success:
+            result.scan_error = f"Not a git repository: {stderr.strip()}"
+            return result
+
+        success, entries, stderr = self._read_status()
+        if not success:
+            result.scan_error = f"Failed to get git status: {stderr.strip()}"
+            return result
+
+        current = self._snapshot_of(self.head(), entries)
+        self._last_scan = current
+
+        if baseline is not None and baseline.head is not None:
+            if current.head == baseline.head:
+                entries = [
+                    e
+                    for e in entries
+                    if baseline.entries.get(e.path) != current.entries[e.path]
+                ]
+
+        # Steps that only write untracked files (artifacts) skip the diff
+        numstat_map: Dict[str, Tuple[int, int]] = {}
+        if any(e.status != "??" for e in entries):
+            numstat_map = self._numstat()
+
+        tracked_files: List[FileDiff] = []
+        untracked_files: List[str] = []
+        staged_files: List[str] = []
+        total_ins = 0
+        total_dels = 0
+
+        for entry in entries:
+            status, path, old_path = entry.status, entry.path, entry.old_path
 
             # Untracked files have "??" status
             if status == "??":
@@ -371,19 +615,100 @@ def scan_file_changes_sync(
                 )
             )
 
-    result.files = tracked_files
-    result.total_insertions = total_ins
-    result.total_deletions = total_dels
-    result.untracked = untracked_files
-    result.staged = staged_files
+        result.files = tracked_files
+        result.total_insertions = total_ins
+        result.total_deletions = total_dels
+        result.untracked = untracked_files
+        result.staged = staged_files
 
-    return result
+        return result
+
+    def close(self) -> None:
+        """Release the long-lived git process."""
+        self._batch.close()
+
+
+_scanners: Dict[Path, DiffScanner] = {}
+_scanners_lock = threading.Lock()
+
+
+def get_diff_scanner(repo_root: Path) -> DiffScanner:
+    """Return the shared DiffScanner for a repository root."""
+    key = Path(repo_root).resolve()
+    with _scanners_lock:
+        scanner = _scanners.get(key)
+        if scanner is None:
+            scanner = DiffScanner(key)
+            _scanners[key] = scanner
+        return scanner
+
+
+def close_diff_scanners() -> None:
+    """Close and forget all shared scanners."""
+    with _scanners_lock:
+        scanners = list(_scanners.values())
+        _scanners.clear()
+    for scanner in scanners:
+        scanner.close()
+
+
+atexit.register(close_diff_scanners)
+
+
+@timed_phase("diff_scan")
+def take_worktree_snapshot(
+    repo_root: Path, reuse_last_scan: bool = False
+) -> Optional[WorktreeSnapshot]:
+    """Capture a baseline snapshot at step start.
+
+    Pass the result as ``baseline`` to scan_file_changes_sync() or
+    scan_file_changes() to report only paths touched during the step.
+
+    Args:
+        repo_root: Path to the repository root.
+        reuse_last_scan: Reuse the worktree state seen by the previous scan
+            of this repo while HEAD is unchanged (see module docstring).
+
+    Returns:
+        The snapshot, or None if the root is not a usable git repository.
+    """
+    return get_diff_scanner(repo_root).snapshot(reuse_last_scan=reuse_last_scan)
+
+
+@timed_phase("diff_scan")
+def scan_file_changes_sync(
+    repo_root: Path,
+    include_untracked: bool = True,
+    include_staged: bool = True,
+    baseline: Optional[WorktreeSnapshot] = None,
+) -> FileChanges:
+    """Synchronously scan for file changes in a git repository.
+
+    This function captures all file mutations since the last commit,
+    including unstaged changes, staged changes, and untracked files.
+
+    Args:
+        repo_root: Path to the repository root.
+        include_untracked: Whether to include untracked files.
+        include_staged: Whether to include staged files separately.
+        baseline: Snapshot from take_worktree_snapshot(); when given, only
+            paths touched since the snapshot are reported.
+
+    Returns:
+        FileChanges with complete mutation information.
+    """
+    return get_diff_scanner(repo_root).scan(
+        include_untracked=include_untracked,
+        include_staged=include_staged,
+        baseline=baseline,
+    )
 
 
 async def scan_file_changes(
     repo_root: Path,
     include_untracked: bool = True,
     include_staged: bool = True,
+    baseline: Optional[WorktreeSnapshot] = None,
 ) -> FileChanges:
     """Asynchronously scan for file changes in a git repository.
 
@@ -394,6 +719,7 @@ async def scan_file_changes(
         repo_root: Path to the repository root.
         include_untracked: Whether to include untracked files.
         include_staged: Whether to include staged files separately.
+        baseline: Snapshot from take_worktree_snapshot() (optional).
 
     Returns:
         FileChanges with complete mutation information.
@@ -401,7 +727,7 @@ async def scan_file_changes(
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(
         None,  # Use default executor
-        lambda: scan_file_changes_sync(repo_root, include_untracked, include_staged),
+        lambda: scan_file_changes_sync(repo_root, include_untracked, include_staged, baseline),
     )
 
 
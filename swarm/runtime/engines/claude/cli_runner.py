@@ -24,6 +24,7 @@ from swarm.runtime.path_helpers import (
 from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
+from swarm.runtime.transcript_io import write_transcript
 from swarm.runtime.types import RunEvent
 
 from ..models import (
@@ -192,11 +193,10 @@ def run_step_cli(
         status = "succeeded"
         error = None
 
-    with t_path.open("w", encoding="utf-8") as f:
-        for event in raw_events:
-            if "timestamp" not in event:
-                event["timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
-            f.write(json.dumps(event) + "\n")
+    for event in raw_events:
+        if "timestamp" not in event:
+            event["timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
+    write_transcript(t_path, raw_events)
 
     receipt = {
         "engine": engine_id,
@@ -36,6 +36,7 @@ from swarm.runtime.claude_sdk import check_sdk_available as check_claude_sdk_ava
 
 # ContextPack support for hydration phase
 from swarm.runtime.context_pack import build_context_pack
+from swarm.runtime.handoff_io import update_envelope_routing
 from swarm.runtime.path_helpers import (
     handoff_envelope_path as make_handoff_envelope_path,
 )
@@ -43,6 +44,7 @@ from swarm.runtime.receipt_io import make_receipt_data, write_step_receipt
 from swarm.runtime.types import (
     RoutingSignal,
     RunEvent,
+    routing_signal_to_dict,
 )
 
 from ..async_utils import run_async_safely
@@ -693,8 +695,13 @@ class ClaudeStepEngine(LifecycleCapableEngine):
                 ctx, finalization.handoff_data, spec_model=spec_model
             )
             if routing_signal and finalization.envelope:
-                # Update envelope with routing signal
+                # Update envelope with routing signal, in memory and on disk
                 finalization.envelope.routing_signal = routing_signal
+                update_envelope_routing(
+                    run_base=ctx.run_base,
+                    step_id=ctx.step_id,
+                    routing_signal=routing_signal_to_dict(routing_signal),
+                )
 
         # Update result with finalization artifacts
         if step_result.artifacts is None:
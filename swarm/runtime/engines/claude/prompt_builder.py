@@ -31,6 +31,7 @@ from swarm.runtime.history_priority import (
     get_priority_label,
     prioritize_history,
 )
+from swarm.runtime.phase_timing import timed_phase
 
 from ..models import HistoryTruncationInfo, StepContext
 
@@ -460,6 +461,7 @@ def build_prompt_auto(
     return prompt, truncation_info, persona, None
 
 
+@timed_phase("prompt_build")
 def build_prompt(
     ctx: StepContext,
     repo_root: Optional[Path],
@@ -644,6 +644,7 @@ def route_step_stub(
     # No next step - terminate flow
     return _create_deterministic_routing_signal(
         decision=RoutingDecision.TERMINATE,
+        next_step_id=None,
         reason="stub_flow_complete",
         confidence=1.0,
         needs_human=False,
@@ -38,6 +38,7 @@ from swarm.runtime.resolvers import (
 from swarm.runtime.resolvers import (
     load_envelope_writer_prompt,
 )
+from swarm.runtime.transcript_io import write_transcript
 from swarm.runtime.types import (
     HandoffEnvelope,
     RoutingSignal,
@@ -479,9 +480,7 @@ async def run_worker_async(
         output_text = f"Step {ctx.step_id} work phase completed. Events: {len(raw_events)}"
 
     t_path = make_transcript_path(ctx.run_base, ctx.step_id, agent_key, "claude")
-    with t_path.open("w", encoding="utf-8") as f:
-        for event in raw_events:
-            f.write(json.dumps(event) + "\n")
+    write_transcript(t_path, raw_events)
 
     # Build artifacts dict with optional spec traceability
     artifacts: Dict[str, Any] = {
@@ -499,6 +498,8 @@ async def run_worker_async(
         artifacts["station_version"] = plan.station_version
         artifacts["flow_id"] = plan.flow_id
         artifacts["flow_version"] = plan.flow_version
+        artifacts["compile_ms"] = plan.compile_ms
+        artifacts["compile_cache"] = plan.compile_cache
         # Include handoff path from spec for envelope validation
         if plan.handoff.path:
             artifacts["spec_handoff_path"] = plan.handoff.path
@@ -46,6 +46,7 @@ from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
 from swarm.runtime.routing_utils import parse_routing_decision
+from swarm.runtime.transcript_io import write_transcript
 from swarm.runtime.types import (
     RoutingSignal,
     RunEvent,
@@ -286,9 +287,7 @@ async def _execute_step_session_sdk(
 
     # Write transcript
     t_path = make_transcript_path(ctx.run_base, ctx.step_id, agent_key, "claude")
-    with t_path.open("w", encoding="utf-8") as f:
-        for evt in work_result.events:
-            f.write(json.dumps(evt) + "\n")
+    write_transcript(t_path, work_result.events)
 
     # Write receipt
     r_path = make_receipt_path(ctx.run_base, ctx.step_id, agent_key)
@@ -28,6 +28,7 @@ from swarm.runtime.path_helpers import (
 from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
+from swarm.runtime.transcript_io import write_transcript
 from swarm.runtime.types import (
     HandoffEnvelope,
     RoutingDecision,
@@ -78,9 +79,7 @@ def run_worker_stub(
             "content": f"[STUB] Completed step {ctx.step_id}. Work phase done.",
         },
     ]
-    with t_path.open("w", encoding="utf-8") as f:
-        for msg in transcript_messages:
-            f.write(json.dumps(msg) + "\n")
+    write_transcript(t_path, transcript_messages)
 
     end_time = datetime.now(timezone.utc)
     duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -293,6 +292,7 @@ def finalize_from_existing_handoff(
         )
     )
 
+    # Routing is decided by route_step(), which patches the signal in afterwards
     envelope: Optional[HandoffEnvelope] = None
     if handoff_data:
         status_str = handoff_data.get("status", "UNVERIFIED")
@@ -307,7 +307,7 @@ def finalize_from_existing_handoff(
             error=step_result.error,
             duration_ms=step_result.duration_ms,
             timestamp=datetime.now(timezone.utc),
-            artifacts=handoff_data.get("artifacts"),
+            artifacts=handoff_data.get("artifacts") or {},
             file_changes=file_changes_dict,
         )
     else:
@@ -406,9 +406,7 @@ def run_step_stub(
             f"In production, this would contain the actual Claude response.",
         },
     ]
-    with t_path.open("w", encoding="utf-8") as f:
-        for msg in transcript_messages:
-            f.write(json.dumps(msg) + "\n")
+    write_transcript(t_path, transcript_messages)
 
     end_time = datetime.now(timezone.utc)
     duration_ms = int((end_time - start_time).total_seconds() * 1000)
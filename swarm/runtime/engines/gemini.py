@@ -39,6 +39,7 @@ from swarm.runtime.path_helpers import (
 from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
+from swarm.runtime.transcript_io import write_transcript
 from swarm.runtime.types import RunEvent
 
 from .base import StepEngine
@@ -543,12 +544,11 @@ class GeminiStepEngine(StepEngine):
         ensure_llm_dir(ctx.run_base)
 
         t_path = make_transcript_path(ctx.run_base, ctx.step_id, agent_key, "gemini")
-        with t_path.open("w", encoding="utf-8") as f:
-            for event in raw_events:
-                # Add timestamp if not present
-                if "timestamp" not in event:
-                    event["timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
-                f.write(json.dumps(event) + "\n")
+        for event in raw_events:
+            # Add timestamp if not present
+            if "timestamp" not in event:
+                event["timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
+        write_transcript(t_path, raw_events)
 
         logger.debug("Wrote transcript to %s", t_path)
         return t_path
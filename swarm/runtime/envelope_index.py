@@ -0,0 +1,293 @@
+"""
+envelope_index.py - Incremental per-run index of handoff envelopes.
+
+ContextPack hydration used to list handoff/, open and parse every envelope
+JSON and sort the result for every step, so hydration cost grew with the
+number of steps already run. The index keeps the parsed envelopes of a
+handoff/ directory in memory and only re-reads what changed:
+- The directory is re-listed only when its mtime changes (a file was
+  created, renamed or removed)
+- Each known envelope file is validated by its (mtime_ns, size) signature;
+  only changed files are re-parsed
+- write_envelope()/save_envelope() record the envelope they just wrote, so
+  the next hydration does not parse it back
+- A compact manifest (handoff/.index.jsonl, one record per parsed or written
+  envelope) lets a restarted process rebuild the index from one file instead
+  of opening every envelope
+
+Design Philosophy:
+    - Validation is by stat, not trust: handoff_io and agents also edit
+      envelopes in place (routing patches, assumptions, drafts), so an entry
+      is only served while its file signature is unchanged
+    - The manifest is a hint: records whose signature no longer matches the
+      file are ignored, and a missing or corrupt manifest just means a full
+      scan
+    - Envelopes are shared between callers and must be treated as read-only
+    - The manifest is not a ``*.json`` file, so existing handoff/ scanners
+      never mistake it for an envelope
+
+Usage:
+    from swarm.runtime.envelope_index import get_envelope_index
+
+    index = get_envelope_index(run_base)
+    envelopes = index.envelopes(step_order)   # ordered by step order
+    recent = index.latest(5, step_order)
+    index.record(envelope_path, envelope)     # after writing an envelope
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from swarm.runtime.types import (
+    HandoffEnvelope,
+    handoff_envelope_from_dict,
+    handoff_envelope_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+# Directory name for handoff envelopes (relative to RUN_BASE)
+HANDOFF_DIR = "handoff"
+
+# Manifest file name inside handoff/
+MANIFEST_NAME = ".index.jsonl"
+
+# Number of handoff directories kept in memory
+DEFAULT_MAX_INDEXES = 64
+
+# (mtime_ns, size), or None when the file does not exist
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: Path) -> Signature:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _IndexEntry:
+    signature: Signature
+    envelope: Optional[HandoffEnvelope]  # None if the file failed to parse
+
+
+class EnvelopeIndex:
+    """In-memory index of the envelopes in one handoff/ directory.
+
+    Thread-safe. Lookups stat each indexed file but only parse files whose
+    signature changed since they were last seen.
+
+    Args:
+        handoff_dir: The RUN_BASE/handoff directory.
+    """
+
+    def __init__(self, handoff_dir: Path):
+        self.handoff_dir = handoff_dir
+        self.manifest_path = handoff_dir / MANIFEST_NAME
+        self._entries: Dict[str, _IndexEntry] = {}
+        self._dir_signature: Signature = None
+        self._manifest_loaded = False
+        self._manifest_records = 0
+        self._lock = threading.Lock()
+        # Counters for observability and tests
+        self.parses = 0
+        self.listings = 0
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def envelopes(self, step_order: Optional[Dict[str, int]] = None) -> List[HandoffEnvelope]:
+        """All envelopes, ordered by step_order (unknown steps last)."""
+        with self._lock:
+            self._refresh_locked()
+            found = [e.envelope for e in self._entries.values() if e.envelope is not None]
+        order = step_order or {}
+        found.sort(key=lambda env: order.get(env.step_id, 999))
+        return found
+
+    def latest(self, n: int, step_order: Optional[Dict[str, int]] = None) -> List[HandoffEnvelope]:
+        """The last n envelopes in step order."""
+        return self.envelopes(step_order)[-n:] if n > 0 else []
+
+    def get(self, step_id: str) -> Optional[HandoffEnvelope]:
+        """The committed envelope for a step, if present."""
+        with self._lock:
+            self._refresh_locked()
+            entry = self._entries.get(f"{step_id}.json")
+        return entry.envelope if entry else None
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def record(self, path: Path, envelope: HandoffEnvelope) -> None:
+        """Record an envelope that was just written to path.
+
+        Saves the next lookup from parsing the file back. The entry is still
+        validated by signature, so a later in-place edit is picked up.
+        """
+        signature = file_signature(path)
+        if signature is None:
+            return
+        with self._lock:
+            self._entries[path.name] = _IndexEntry(signature, envelope)
+            self._append_manifest_locked(path.name, signature, envelope)
+
+    def clear(self) -> None:
+        """Forget all entries (the manifest is re-read on the next lookup)."""
+        with self._lock:
+            self._entries.clear()
+            self._dir_signature = None
+            self._manifest_loaded = False
+            self._manifest_records = 0
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _refresh_locked(self) -> None:
+        dir_signature = file_signature(self.handoff_dir)
+        if dir_signature is None:
+            self._entries.clear()
+            self._dir_signature = None
+            return
+
+        if not self._manifest_loaded:
+            self._load_manifest_locked()
+
+        if dir_signature != self._dir_signature:
+            # Entries were added, renamed or removed: re-list the directory
+            self.listings += 1
+            names = {
+                entry.name
+                for entry in os.scandir(self.handoff_dir)
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+            for name in list(self._entries):
+                if name not in names:
+                    del self._entries[name]
+            for name in names:
+                self._entries.setdefault(name, _IndexEntry(None, None))
+            self._dir_signature = dir_signature
+
+        for name, entry in list(self._entries.items()):
+            path = self.handoff_dir / name
+            signature = file_signature(path)
+            if signature is None:
+                del self._entries[name]
+            elif signature != entry.signature:
+                self._entries[name] = _IndexEntry(signature, self._parse(path))
+                self._append_manifest_locked(name, signature, self._entries[name].envelope)
+
+    def _parse(self, path: Path) -> Optional[HandoffEnvelope]:
+        self.parses += 1
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            envelope = handoff_envelope_from_dict(data)
+            logger.debug("Loaded envelope for step %s from %s", envelope.step_id, path.name)
+            return envelope
+        except json.JSONDecodeError as e:
+            logger.warning("Failed to parse envelope JSON in %s: %s", path, e)
+        except Exception as e:
+            logger.warning("Failed to load envelope from %s: %s", path, e)
+        return None
+
+    def _load_manifest_locked(self) -> None:
+        self._manifest_loaded = True
+        try:
+            lines = self.manifest_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+
+        records: Dict[str, Tuple[Signature, Optional[Dict[str, Any]]]] = {}
+        for line in lines:
+            try:
+                record = json.loads(line)
+                records[record["file"]] = (tuple(record["sig"]), record.get("envelope"))
+            except (ValueError, KeyError, TypeError):
+                continue  # torn or foreign line
+        self._manifest_records = len(lines)
+
+        for name, (signature, data) in records.items():
+            if name in self._entries or file_signature(self.handoff_dir / name) != signature:
+                continue
+            try:
+                envelope = handoff_envelope_from_dict(data) if data is not None else None
+            except Exception:
+                continue
+            self._entries[name] = _IndexEntry(signature, envelope)
+
+    def _append_manifest_locked(
+        self, name: str, signature: Signature, envelope: Optional[HandoffEnvelope]
+    ) -> None:
+        if self._manifest_records > 2 * len(self._entries) + 8:
+            self._compact_manifest_locked()
+            return
+        line = _manifest_line(name, signature, envelope)
+        try:
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._manifest_records += 1
+        except OSError as e:
+            logger.debug("Could not append to envelope manifest %s: %s", self.manifest_path, e)
+
+    def _compact_manifest_locked(self) -> None:
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for name, entry in self._entries.items():
+                    if entry.signature is not None:
+                        f.write(_manifest_line(name, entry.signature, entry.envelope))
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest_records = len(self._entries)
+        except OSError as e:
+            logger.debug("Could not compact envelope manifest %s: %s", self.manifest_path, e)
+
+
+def _manifest_line(name: str, signature: Signature, envelope: Optional[HandoffEnvelope]) -> str:
+    record = {
+        "file": name,
+        "sig": list(signature) if signature else None,
+        "envelope": handoff_envelope_to_dict(envelope) if envelope is not None else None,
+    }
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+# Process-wide indexes, one per handoff directory, least recently used first
+_indexes: "OrderedDict[str, EnvelopeIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_envelope_index(run_base: Path) -> EnvelopeIndex:
+    """Return the shared index for RUN_BASE/handoff."""
+    handoff_dir = Path(run_base) / HANDOFF_DIR
+    key = str(handoff_dir.resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = EnvelopeIndex(handoff_dir)
+            _indexes[key] = index
+            while len(_indexes) > DEFAULT_MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
+
+
+def reset_envelope_indexes() -> None:
+    """Drop all in-memory indexes (manifests on disk are kept)."""
+    with _indexes_lock:
+        _indexes.clear()
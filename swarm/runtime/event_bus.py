@@ -0,0 +1,431 @@
+"""
+event_bus.py - Push-based change notification for run directories
+
+This module lets readers (RunTailer, the SSE stream) sleep until a run's
+events.jsonl or run state (run_state.json and its journal) actually changes
+instead of polling them:
+- In-process writers (EventWriter, run state writes) publish directly
+- Out-of-process writers are picked up by one shared file watcher:
+  inotify on Linux, or a single stat-polling thread elsewhere
+- Each run directory is watched once, however many subscribers it has
+
+Design Philosophy:
+    - Notifications are hints, not data: subscribers re-read the files,
+      so a duplicate or coalesced notification is always harmless
+    - Subscribers still re-check on a (long) timeout as a safety net
+    - No third-party dependency: inotify is used through ctypes
+
+Usage:
+    from swarm.runtime.event_bus import get_event_bus
+
+    bus = get_event_bus()
+    with bus.subscribe(run_dir) as sub:
+        changed = await sub.wait(timeout=15.0)  # set of changed file paths
+
+    # Writers
+    bus.publish(run_dir / "events.jsonl")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from .run_state_journal import JOURNAL_FILE
+
+logger = logging.getLogger(__name__)
+
+# Files whose changes are published by the file watchers. Run state lives in
+# the run_state.json snapshot plus the journal appended between compactions.
+WATCHED_FILES = frozenset({"events.jsonl", "run_state.json", JOURNAL_FILE})
+
+# Interval of the stat-polling fallback watcher
+DEFAULT_POLL_INTERVAL_SEC = 0.5
+
+
+class Subscription:
+    """Change notifications for one run directory (or for all of them).
+
+    Use as a context manager so the shared file watch is released.
+    """
+
+    def __init__(self, bus: "EventBus", key: Optional[str]):
+        self._bus = bus
+        self.key = key
+        self._lock = threading.Lock()
+        self._changes: Set[Path] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+        self._closed = False
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop receiving notifications."""
+        if not self._closed:
+            self._closed = True
+            self._bus._unsubscribe(self)
+
+    def _notify(self, path: Path) -> None:
+        """Record a change (callable from any thread) and wake the waiter."""
+        with self._lock:
+            self._changes.add(path)
+            loop, event = self._loop, self._event
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop closed; nobody is waiting any more
+
+    def _take(self) -> Set[Path]:
+        changes, self._changes = self._changes, set()
+        return changes
+
+    async def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Wait until something changes or timeout elapses.
+
+        Args:
+            timeout: Seconds to wait. None waits indefinitely.
+
+        Returns:
+            Paths changed since the previous wait(); empty on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                self._loop, self._event = loop, asyncio.Event()
+            if self._changes:
+                return self._take()
+            event = self._event
+            event.clear()
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        with self._lock:
+            return self._take()
+
+
+class EventBus:
+    """In-process pub/sub of run file changes, backed by a shared file watcher.
+
+    Thread-safe. publish() may be called from any thread; subscribers wait
+    in their own event loops.
+
+    Attributes:
+        watcher_kind: "inotify", "poll" or "off" (in-process notifications only).
+    """
+
+    def __init__(self, watcher: str = "auto", poll_interval: float = DEFAULT_POLL_INTERVAL_SEC):
+        """Initialize the bus.
+
+        Args:
+            watcher: "auto" (inotify if available, else polling), "inotify",
+                "poll" or "off".
+            poll_interval: Interval of the polling watcher in seconds.
+        """
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Optional[str], Set[Subscription]] = {}
+        self._watched: Dict[str, "_Watcher"] = {}
+        self._poll_interval = poll_interval
+        self._poller: Optional[_PollingWatcher] = None
+        self._inotify: Optional[_InotifyWatcher] = None
+        self.watcher_kind = "off"
+
+        if watcher in ("auto", "inotify"):
+            self._inotify = _InotifyWatcher.create(self)
+            if self._inotify is not None:
+                self.watcher_kind = "inotify"
+            elif watcher == "inotify":
+                logger.warning("inotify is not available, falling back to polling")
+        if self.watcher_kind == "off" and watcher != "off":
+            self.watcher_kind = "poll"
+
+    def publish(self, path: Path) -> None:
+        """Notify subscribers of the file's run directory (and wildcard subscribers)."""
+        path = Path(path)
+        key = os.path.abspath(path.parent)
+        with self._lock:
+            subscribers = list(self._subscribers.get(key, ())) + list(
+                self._subscribers.get(None, ())
+            )
+        for subscription in subscribers:
+            subscription._notify(path)
+
+    def subscribe(self, run_dir: Optional[Path] = None) -> Subscription:
+        """Subscribe to changes in a run directory.
+
+        Args:
+            run_dir: Run directory to watch. None subscribes to every
+                in-process publication, without starting a file watch.
+
+        Returns:
+            A Subscription; close it (or use it as a context manager) when done.
+        """
+        key = os.path.abspath(run_dir) if run_dir is not None else None
+        subscription = Subscription(self, key)
+        with self._lock:
+            subscribers = self._subscribers.setdefault(key, set())
+            first = not subscribers
+            subscribers.add(subscription)
+            if first and key is not None:
+                self._start_watch(key)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.key)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.key]
+                watcher = self._watched.pop(subscription.key, None)
+                if watcher is not None:
+                    watcher.remove(subscription.key)
+
+    def _start_watch(self, key: str) -> None:
+        """Start the shared file watch for a run directory (lock held)."""
+        if self.watcher_kind == "off":
+            return
+        if self._inotify is not None and self._inotify.add(key):
+            self._watched[key] = self._inotify
+            return
+        # No inotify, or the directory can't be watched (yet): poll it
+        if self._poller is None:
+            self._poller = _PollingWatcher(self, self._poll_interval)
+        self._poller.add(key)
+        self._watched[key] = self._poller
+
+    def watched_dirs(self) -> Set[str]:
+        """Run directories with an active file watch."""
+        with self._lock:
+            return set(self._watched)
+
+    def close(self) -> None:
+        """Stop the file watchers."""
+        if self._inotify is not None:
+            self._inotify.close()
+        if self._poller is not None:
+            self._poller.close()
+
+
+# =============================================================================
+# File Watchers
+# =============================================================================
+
+
+class _Watcher(ABC):
+    """Publishes changes of WATCHED_FILES in a set of directories."""
+
+    @abstractmethod
+    def add(self, key: str) -> bool:
+        """Start watching a directory. Returns False if it cannot be watched."""
+        ...
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """Stop watching a directory."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop the watcher and release its resources."""
+        ...
+
+
+class _InotifyWatcher(_Watcher):
+    """Linux inotify watcher (via ctypes) with one reader thread."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_IGNORED = 0x00008000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    @classmethod
+    def create(cls, bus: EventBus) -> Optional["_InotifyWatcher"]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logger.debug("inotify unavailable: %s", e)
+            return None
+        if fd < 0:
+            logger.debug("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+            return None
+        return cls(bus, libc, fd)
+
+    def __init__(self, bus: EventBus, libc: ctypes.CDLL, fd: int):
+        self._bus = bus
+        self._libc = libc
+        self._fd = fd
+        self._lock = threading.Lock()
+        self._wd_to_dir: Dict[int, str] = {}
+        self._dir_to_wd: Dict[str, int] = {}
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="event-bus-inotify", daemon=True)
+        self._thread.start()
+
+    def add(self, key: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(key), self.MASK)
+        if wd < 0:
+            logger.debug("inotify_add_watch(%s) failed: %s", key, os.strerror(ctypes.get_errno()))
+            return False
+        with self._lock:
+            self._wd_to_dir[wd] = key
+            self._dir_to_wd[key] = wd
+        return True
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            wd = self._dir_to_wd.pop(key, None)
+            if wd is not None:
+                self._wd_to_dir.pop(wd, None)
+        if wd is not None:
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        os.write(self._wake_w, b"x")
+        self._thread.join(timeout=1.0)
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _run(self) -> None:
+        header = self._EVENT_HEADER
+        while not self._closed:
+            try:
+                readable, _, _ = select.select([self._fd, self._wake_r], [], [])
+                if self._closed or self._fd not in readable:
+                    continue
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                if not self._closed:
+                    logger.warning("inotify watcher stopped: %s", e)
+                return
+
+            changed: Set[Tuple[str, str]] = set()
+            offset = 0
+            while offset + header.size <= len(data):
+                wd, mask, _cookie, length = header.unpack_from(data, offset)
+                name = data[offset + header.size : offset + header.size + length]
+                offset += header.size + length
+                if mask & self.IN_IGNORED:
+                    continue
+                filename = os.fsdecode(name.rstrip(b"\0"))
+                if filename not in WATCHED_FILES:
+                    continue
+                with self._lock:
+                    key = self._wd_to_dir.get(wd)
+                if key is not None:
+                    changed.add((key, filename))
+
+            # One notification per file per read, however many writes it covered
+            for key, filename in changed:
+                self._bus.publish(Path(key) / filename)
+
+
+class _PollingWatcher(_Watcher):
+    """Fallback watcher: one thread stats WATCHED_FILES of every watched dir."""
+
+    def __init__(self, bus: EventBus, interval: float):
+        self._bus = bus
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, Dict[str, Optional[Tuple[int, int]]]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="event-bus-poller", daemon=True)
+        self._thread.start()
+
+    def add(self, key: str) -> bool:
+        with self._lock:
+            self._dirs[key] = {name: self._stat(key, name) for name in WATCHED_FILES}
+        return True
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._dirs.pop(key, None)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+    @staticmethod
+    def _stat(key: str, name: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(os.path.join(key, name))
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            with self._lock:
+                snapshot = {key: dict(files) for key, files in self._dirs.items()}
+            for key, files in snapshot.items():
+                for name, previous in files.items():
+                    current = self._stat(key, name)
+                    if current == previous:
+                        continue
+                    with self._lock:
+                        if key in self._dirs:
+                            self._dirs[key][name] = current
+                    self._bus.publish(Path(key) / name)
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+_global_bus: Optional[EventBus] = None
+_global_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide EventBus.
+
+    The file watcher is chosen by SWARM_EVENT_WATCHER (auto, inotify, poll, off).
+    """
+    global _global_bus
+    with _global_bus_lock:
+        if _global_bus is None:
+            watcher = os.environ.get("SWARM_EVENT_WATCHER", "auto").strip().lower()
+            _global_bus = EventBus(watcher=watcher)
+        return _global_bus
+
+
+def publish_change(path: Path) -> None:
+    """Publish a change to a run file on the global bus (never raises)."""
+    try:
+        get_event_bus().publish(path)
+    except Exception as e:
+        logger.debug("Failed to publish change for %s: %s", path, e)
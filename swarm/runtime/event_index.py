@@ -0,0 +1,144 @@
+"""
+event_index.py - Sparse seq -> byte offset index for events.jsonl
+
+EventWriter records the byte offset of every Nth event (by storage-assigned
+seq) in a sidecar file next to events.jsonl:
+
+    swarm/runs/<run_id>/
+      events.jsonl
+      events.jsonl.idx     # "<seq> <offset>\\n" per indexed event
+
+Readers that need to resume after a known seq (SSE Last-Event-ID) seek to the
+nearest indexed event at or before it and scan at most one index interval
+forward, instead of re-reading the file from the start.
+
+Design Philosophy:
+    - The index is a hint: every entry is verified against events.jsonl before
+      it is used, and a missing, stale or corrupt index only costs a scan
+    - Append-only, like the journal it indexes; a torn last line is ignored
+
+Usage:
+    from swarm.runtime.event_index import resume_offset
+
+    offset = resume_offset(run_dir / "events.jsonl", after_seq=1234)
+    with open(run_dir / "events.jsonl", "rb") as f:
+        f.seek(offset)  # first line not yet seen by the client
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the index file, appended to the events file name
+INDEX_SUFFIX = ".idx"
+
+# Index one event in this many; resume scans at most this many lines
+INDEX_INTERVAL_EVENTS = 128
+
+# How many earlier entries to try when the closest one fails verification
+_MAX_FALLBACK_ENTRIES = 4
+
+
+def index_path_for(events_path: Path) -> Path:
+    """Path of the index sidecar for an events.jsonl file."""
+    return events_path.with_name(events_path.name + INDEX_SUFFIX)
+
+
+def append_index_entries(index_path: Path, entries: Iterable[Tuple[int, int]]) -> None:
+    """Append (seq, offset) entries to an index file."""
+    data = "".join(f"{seq} {offset}\n" for seq, offset in entries)
+    if data:
+        with open(index_path, "a", encoding="ascii") as f:
+            f.write(data)
+
+
+def read_index(index_path: Path) -> List[Tuple[int, int]]:
+    """Read (seq, offset) entries, skipping malformed and out-of-order lines."""
+    entries: List[Tuple[int, int]] = []
+    try:
+        with open(index_path, "r", encoding="ascii", errors="replace") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 2 or not line.endswith("\n"):
+                    continue
+                try:
+                    seq, offset = int(parts[0]), int(parts[1])
+                except ValueError:
+                    continue
+                if entries and (seq <= entries[-1][0] or offset <= entries[-1][1]):
+                    continue
+                entries.append((seq, offset))
+    except OSError:
+        pass
+    return entries
+
+
+def _line_seq(line: bytes) -> Optional[int]:
+    try:
+        seq = json.loads(line).get("seq")
+    except (ValueError, AttributeError):
+        return None
+    return seq if isinstance(seq, int) else None
+
+
+def _verify_entry(f: BinaryIO, seq: int, offset: int) -> bool:
+    """Check that `offset` starts a complete line holding event `seq`."""
+    if offset > 0:
+        f.seek(offset - 1)
+        if f.read(1) != b"\n":
+            return False
+    else:
+        f.seek(0)
+    line = f.readline()
+    return line.endswith(b"\n") and _line_seq(line) == seq
+
+
+def resume_offset(events_path: Path, after_seq: int) -> int:
+    """Byte offset of the first line a client that has seen `after_seq` still needs.
+
+    That is the offset just past the last complete line whose seq is
+    <= after_seq. Lines without a seq (legacy writers) are never skipped.
+
+    Args:
+        events_path: Path to events.jsonl.
+        after_seq: Last seq the client received.
+
+    Returns:
+        Offset to resume reading from (0 if nothing can be skipped).
+    """
+    entries = read_index(index_path_for(events_path))
+    try:
+        f = open(events_path, "rb")
+    except OSError:
+        return 0
+
+    with f:
+        # Start from the closest verified index entry at or before after_seq
+        start = 0
+        pos = bisect.bisect_right(entries, (after_seq, float("inf")))
+        for seq, offset in reversed(entries[max(0, pos - _MAX_FALLBACK_ENTRIES) : pos]):
+            if _verify_entry(f, seq, offset):
+                start = offset
+                break
+            logger.debug("Ignoring stale index entry %d@%d for %s", seq, offset, events_path)
+
+        f.seek(start)
+        resume = start
+        position = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # Partial line (mid-write); never skip past it
+            position += len(line)
+            seq = _line_seq(line)
+            if seq is None:
+                continue
+            if seq > after_seq:
+                break
+            resume = position
+        return resume
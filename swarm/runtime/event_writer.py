@@ -0,0 +1,361 @@
+"""
+event_writer.py - Buffered, group-committed writer for events.jsonl
+
+This module keeps one open append handle per events.jsonl file and commits
+buffered lines in groups instead of reopening and flushing the file for every
+event:
+- Lines are buffered and committed when a count, size or age threshold is hit
+- Each commit is a single write() of complete, newline-terminated lines
+- Durability is configurable: flush to the OS, fsync every N ms, or fsync
+  on every commit
+
+Design Philosophy:
+    - events.jsonl stays the append-only journal; only the I/O pattern changes
+    - Crash safety matches RunTailer.tail_run: a crash can at worst leave a
+      partial trailing line, which readers never advance past
+    - The default (one event per commit, flush only) keeps events visible to
+      other readers as soon as append_event() returns, like the old path
+
+Configuration (environment, read once by EventWriterConfig.from_env()):
+    SWARM_EVENT_DURABILITY         flush | fsync_interval | fsync_each
+    SWARM_EVENT_BATCH_EVENTS       events per group commit (default 1)
+    SWARM_EVENT_BATCH_DELAY_MS     max age of a buffered event (default 50)
+    SWARM_EVENT_FSYNC_INTERVAL_MS  fsync period for fsync_interval (default 100)
+
+Usage:
+    from swarm.runtime.event_writer import EventWriter, EventWriterConfig
+
+    writer = EventWriter(run_path / "events.jsonl", EventWriterConfig(max_batch_events=64))
+    writer.write(json.dumps(event_dict))
+    writer.close()  # commits anything still buffered
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from .event_index import INDEX_INTERVAL_EVENTS, append_index_entries, read_index
+
+logger = logging.getLogger(__name__)
+
+
+class Durability(str, Enum):
+    """How far committed event lines are pushed towards stable storage."""
+
+    FLUSH = "flush"  # write + flush to the OS page cache (survives process crash)
+    FSYNC_INTERVAL = "fsync_interval"  # plus fsync at most every fsync_interval_ms
+    FSYNC_EACH = "fsync_each"  # plus fsync on every commit (survives power loss)
+
+
+@dataclass(frozen=True)
+class EventWriterConfig:
+    """Group-commit thresholds and durability level for EventWriter.
+
+    Attributes:
+        durability: Durability level applied on each commit.
+        max_batch_events: Commit once this many lines are buffered.
+        max_batch_bytes: Commit once buffered lines reach this size.
+        max_delay_ms: Commit buffered lines at most this long after the
+            oldest was written (enforced by a background flusher).
+        fsync_interval_ms: fsync period for Durability.FSYNC_INTERVAL.
+    """
+
+    durability: Durability = Durability.FLUSH
+    max_batch_events: int = 1
+    max_batch_bytes: int = 64 * 1024
+    max_delay_ms: int = 50
+    fsync_interval_ms: int = 100
+
+    @property
+    def needs_flusher(self) -> bool:
+        """True if buffered lines or pending fsyncs can outlive a write() call."""
+        return self.max_batch_events > 1 or self.durability == Durability.FSYNC_INTERVAL
+
+    @classmethod
+    def from_env(cls) -> "EventWriterConfig":
+        """Build a config from SWARM_EVENT_* environment variables."""
+        defaults = cls()
+        durability = os.environ.get("SWARM_EVENT_DURABILITY", defaults.durability.value)
+        try:
+            parsed = Durability(durability.strip().lower())
+        except ValueError:
+            logger.warning("Unknown SWARM_EVENT_DURABILITY %r, using 'flush'", durability)
+            parsed = Durability.FLUSH
+
+        def _int(name: str, default: int) -> int:
+            try:
+                return max(1, int(os.environ.get(name, default)))
+            except ValueError:
+                logger.warning("Invalid %s, using %d", name, default)
+                return default
+
+        return cls(
+            durability=parsed,
+            max_batch_events=_int("SWARM_EVENT_BATCH_EVENTS", defaults.max_batch_events),
+            max_delay_ms=_int("SWARM_EVENT_BATCH_DELAY_MS", defaults.max_delay_ms),
+            fsync_interval_ms=_int("SWARM_EVENT_FSYNC_INTERVAL_MS", defaults.fsync_interval_ms),
+        )
+
+
+class EventWriter:
+    """Append-only JSONL writer with an open handle and group commit.
+
+    Thread-safe. Callers that need lines in a specific order (e.g. by seq)
+    must serialize their write() calls themselves.
+
+    If the file is deleted, replaced or moved while open (runs_gc, test
+    cleanup), the next commit reopens it at the original path.
+
+    Attributes:
+        path: The events.jsonl file being appended to.
+        config: Commit thresholds and durability level.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: Optional[EventWriterConfig] = None,
+        on_commit: Optional[Callable[[Path], None]] = None,
+        index_path: Optional[Path] = None,
+        index_interval: int = INDEX_INTERVAL_EVENTS,
+    ):
+        """Initialize the writer. The file is opened lazily on first commit.
+
+        Args:
+            path: File to append to. Parent directories are created as needed.
+            config: Thresholds and durability. Defaults to EventWriterConfig().
+            on_commit: Called with `path` after each commit (e.g. to notify
+                readers through the event bus).
+            index_path: If set, a sparse seq -> offset index (see event_index)
+                is maintained here for lines written with a seq.
+            index_interval: Index one event in this many seqs.
+        """
+        self.path = path
+        self.config = config or EventWriterConfig()
+        self._on_commit = on_commit
+        self._index_path = index_path
+        self._index_interval = index_interval
+        self._last_indexed_seq: Optional[int] = None
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._pending: List[Tuple[bytes, Optional[int]]] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+        self._closed = False
+
+        if self.config.needs_flusher:
+            _Flusher.register(self)
+
+    @property
+    def pending_events(self) -> int:
+        """Number of buffered lines not yet committed."""
+        return len(self._pending)
+
+    def write(self, line: str, seq: Optional[int] = None) -> None:
+        """Buffer one JSON line (without trailing newline), committing if due.
+
+        Args:
+            line: Serialized event.
+            seq: The event's seq, used for the offset index.
+
+        Raises:
+            OSError: If a commit triggered by this write fails. The buffered
+                lines are dropped, since retrying could reorder them.
+        """
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append((data, seq))
+            self._pending_bytes += len(data)
+            if self._closed:
+                # Late write through a reference held across close(): commit
+                # synchronously so it cannot be reordered behind a newer writer
+                try:
+                    self._commit_locked()
+                finally:
+                    self._release_locked()
+            elif (
+                len(self._pending) >= self.config.max_batch_events
+                or self._pending_bytes >= self.config.max_batch_bytes
+            ):
+                self._commit_locked()
+
+    def flush(self, sync: bool = False) -> None:
+        """Commit all buffered lines now.
+
+        Args:
+            sync: Also fsync, regardless of the durability level.
+        """
+        with self._lock:
+            self._commit_locked()
+            if sync and self._file is not None and self._unsynced:
+                self._fsync_locked()
+
+    def close(self) -> None:
+        """Commit buffered lines, fsync if the durability level asks for it, and close.
+
+        A closed writer still accepts write() calls (from references obtained
+        before close), committing each one immediately.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._commit_locked()
+            finally:
+                self._release_locked()
+
+    def _flush_due(self, now: float) -> None:
+        """Background flusher hook: enforce max_delay_ms and fsync_interval_ms."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                if self._pending and (now - self._pending_since) * 1000 >= self.config.max_delay_ms:
+                    self._commit_locked()
+                if (
+                    self._unsynced
+                    and self.config.durability == Durability.FSYNC_INTERVAL
+                    and (now - self._last_fsync) * 1000 >= self.config.fsync_interval_ms
+                ):
+                    self._fsync_locked()
+            except OSError as e:
+                logger.warning("Background commit failed for %s: %s", self.path, e)
+
+    def _commit_locked(self) -> None:
+        if not self._pending:
+            return
+        pending = self._pending
+        batch = b"".join(data for data, _ in pending)
+        self._pending = []
+        self._pending_bytes = 0
+
+        f = self._open_locked()
+        entries = self._index_entries(pending, os.fstat(f.fileno()).st_size)
+        # One write() of complete lines: a crash mid-write can only leave a
+        # partial trailing line, which RunTailer and readers skip.
+        f.write(batch)
+        f.flush()
+        self._unsynced = True
+        if entries:
+            try:
+                append_index_entries(self._index_path, entries)
+            except OSError as e:
+                logger.debug("Failed to update event index %s: %s", self._index_path, e)
+        if self._on_commit is not None:
+            self._on_commit(self.path)
+
+        durability = self.config.durability
+        if durability == Durability.FSYNC_EACH or (
+            durability == Durability.FSYNC_INTERVAL
+            and (time.monotonic() - self._last_fsync) * 1000 >= self.config.fsync_interval_ms
+        ):
+            self._fsync_locked()
+
+    def _release_locked(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if self._unsynced and self.config.durability != Durability.FLUSH:
+                self._fsync_locked()
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _fsync_locked(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def _open_locked(self) -> BinaryIO:
+        if self._file is not None:
+            try:
+                # Deleted, replaced or moved (e.g. runs_gc) since we opened it?
+                opened = os.fstat(self._file.fileno())
+                current = os.stat(self.path)
+                if (opened.st_ino, opened.st_dev) == (current.st_ino, current.st_dev):
+                    return self._file
+            except OSError:
+                pass
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._index_path is not None:
+            self._load_index_state()
+        return self._file
+
+    def _load_index_state(self) -> None:
+        """Resume indexing after the last entry, or drop an index for a new file."""
+        self._last_indexed_seq = None
+        if os.fstat(self._file.fileno()).st_size == 0:
+            try:
+                self._index_path.unlink()
+            except OSError:
+                pass
+            return
+        entries = read_index(self._index_path)
+        if entries:
+            self._last_indexed_seq = entries[-1][0]
+
+    def _index_entries(
+        self, pending: List[Tuple[bytes, Optional[int]]], offset: int
+    ) -> List[Tuple[int, int]]:
+        """Pick the (seq, offset) index entries for a batch starting at `offset`."""
+        if self._index_path is None:
+            return []
+        entries = []
+        for data, seq in pending:
+            if seq is not None and (
+                self._last_indexed_seq is None
+                or seq >= self._last_indexed_seq + self._index_interval
+            ):
+                entries.append((seq, offset))
+                self._last_indexed_seq = seq
+            offset += len(data)
+        return entries
+
+
+class _Flusher:
+    """Single daemon thread enforcing time thresholds for all live writers."""
+
+    _writers: "weakref.WeakSet[EventWriter]" = weakref.WeakSet()
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    _tick_sec = 0.01
+
+    @classmethod
+    def register(cls, writer: EventWriter) -> None:
+        with cls._lock:
+            cls._writers.add(writer)
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._thread = threading.Thread(
+                    target=cls._run, name="event-writer-flusher", daemon=True
+                )
+                cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            time.sleep(cls._tick_sec)
+            with cls._lock:
+                writers = list(cls._writers)
+            now = time.monotonic()
+            for writer in writers:
+                writer._flush_due(now)
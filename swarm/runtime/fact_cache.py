@@ -0,0 +1,292 @@
+"""
+fact_cache.py - Content-addressed cache of per-file fact extraction results.
+
+Fact extraction re-reads every markdown artifact of a flow after each step,
+although most of them have not changed since the previous step. This cache
+stores the markers extracted from each file version so that re-extraction
+only scans changed artifacts:
+- Results are stored once per content hash (sha256) under objects/, so
+  identical artifacts are shared across steps and runs
+- Each run has an index mapping path -> (size, mtime_ns, sha256); a file
+  whose size and mtime match its entry is served without being read
+- A changed stat triggers a re-hash; only new content is scanned
+
+Layout (<runs_dir>/.fact_cache/, see fact_cache_root()):
+    objects/<sha256>.json   {"version": 1, "records": [...]}
+    runs/<run_id>.json      {"version": 1, "files": {path: entry}}
+
+A run's cache sits in the runs directory that holds the run. Example runs
+are committed, so theirs goes to the default runs directory instead.
+
+Design Philosophy:
+    - The cache only ever saves work: a missing, corrupt or foreign entry is
+      a miss, never an error
+    - Stat matches are not trusted for files modified within
+      RACY_WINDOW_NS of being recorded (like git's "racily clean" entries),
+      since a same-size rewrite inside one mtime tick would go unnoticed
+    - Stale entries go with their run: runs_gc calls prune_fact_cache() with
+      the surviving run IDs for every cache root, which drops other runs'
+      indexes and any objects no remaining index references
+
+Usage:
+    from swarm.runtime.fact_cache import FactCache
+
+    cache = FactCache.for_run(run_base)
+    records = cache.load(path, scan_records)  # scan_records(path) on miss
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Name of the cache directory inside a runs directory
+FACT_CACHE_DIR = ".fact_cache"
+
+# Bump when the extraction output for the same content changes
+CACHE_VERSION = 1
+
+# Stat matches are not trusted for files modified this close to being recorded
+RACY_WINDOW_NS = 2_000_000_000
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def fact_cache_root(run_base: Path) -> Path:
+    """Cache directory for a run directory.
+
+    Args:
+        run_base: The run directory (<runs_dir>/<run_id>).
+
+    Returns:
+        <runs_dir>/.fact_cache, or the default runs directory's cache for
+        runs under examples/.
+    """
+    from . import storage
+
+    runs_dir = Path(run_base).parent
+    if runs_dir.resolve() == storage.EXAMPLES_DIR.resolve():
+        runs_dir = storage.RUNS_DIR
+    return runs_dir / FACT_CACHE_DIR
+
+
+def file_sha256(path: Path) -> str:
+    """Hex sha256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    return data
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class FactCache:
+    """Per-run view of the extraction cache. Thread-safe.
+
+    Attributes:
+        cache_root: The cache directory (shared by all runs).
+        run_key: Run whose index this instance reads and updates.
+        hits: Files served without scanning (including after a re-hash).
+        misses: Files that had to be scanned.
+    """
+
+    def __init__(self, cache_root: Path, run_key: str):
+        """Initialize the cache view. The run's index is loaded lazily.
+
+        Args:
+            cache_root: Cache directory, e.g. <runs_dir>/.fact_cache.
+            run_key: Run identifier the index is stored under.
+        """
+        self.cache_root = cache_root
+        self.run_key = run_key
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    @classmethod
+    def for_run(cls, run_base: Path, cache_root: Optional[Path] = None) -> "FactCache":
+        """Cache view for a run directory.
+
+        Args:
+            run_base: The run directory (<runs_dir>/<run_id>).
+            cache_root: Cache directory. Defaults to fact_cache_root(run_base).
+        """
+        return cls(cache_root or fact_cache_root(run_base), run_base.name)
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_root / "runs" / f"{self.run_key}.json"
+
+    def object_path(self, sha256: str) -> Path:
+        return self.cache_root / "objects" / f"{sha256}.json"
+
+    def load(self, path: Path, compute: Callable[[Path], List[Any]]) -> List[Any]:
+        """Records extracted from `path`, computing and storing them on a miss.
+
+        Args:
+            path: The file.
+            compute: Extracts JSON-serializable records from the file.
+                Exceptions (e.g. OSError) propagate and nothing is stored.
+
+        Returns:
+            The records for the file's current contents.
+        """
+        st = path.stat()
+        key = str(path)
+        entry = self._entries().get(key)
+
+        if (
+            entry is not None
+            and entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and st.st_mtime_ns < entry["recorded_ns"] - RACY_WINDOW_NS
+        ):
+            records = self._read_object(entry["sha256"])
+            if records is not None:
+                self._count(hit=True)
+                return records
+
+        sha256 = file_sha256(path)
+        records = self._read_object(sha256)
+        if records is None:
+            self._count(hit=False)
+            records = compute(path)
+            after = path.stat()
+            if (after.st_size, after.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+                return records  # Changed while scanning: don't cache under sha256
+            try:
+                _write_json_atomic(
+                    self.object_path(sha256), {"version": CACHE_VERSION, "records": records}
+                )
+            except OSError as e:
+                logger.debug("Failed to write fact cache object for %s: %s", path, e)
+                return records
+        else:
+            self._count(hit=True)
+
+        with self._lock:
+            self._files[key] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": sha256,
+                "recorded_ns": time.time_ns(),
+            }
+            self._dirty = True
+        return records
+
+    def save(self) -> None:
+        """Persist the run's index, dropping entries for files that no longer exist."""
+        with self._lock:
+            if not self._dirty or self._files is None:
+                return
+            files = {path: entry for path, entry in self._files.items() if os.path.exists(path)}
+            self._dirty = False
+        try:
+            _write_json_atomic(self.index_path, {"version": CACHE_VERSION, "files": files})
+        except OSError as e:
+            logger.debug("Failed to write fact cache index %s: %s", self.index_path, e)
+
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            if self._files is None:
+                data = _read_json(self.index_path)
+                files = data.get("files") if data else None
+                self._files = files if isinstance(files, dict) else {}
+            return self._files
+
+    def _read_object(self, sha256: str) -> Optional[List[Any]]:
+        data = _read_json(self.object_path(sha256))
+        records = data.get("records") if data else None
+        return records if isinstance(records, list) else None
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+def prune_fact_cache(cache_root: Path, live_run_ids: Iterable[str]) -> Dict[str, int]:
+    """Evict cache entries of runs that no longer exist.
+
+    Removes the index of every run not in `live_run_ids`, then every object
+    no remaining index references. Safe to call while other processes use
+    the cache: an object written concurrently is at worst re-scanned later.
+
+    Args:
+        cache_root: The cache directory.
+        live_run_ids: IDs of runs whose entries are kept.
+
+    Returns:
+        Counts of removed "runs" and "objects".
+    """
+    removed = {"runs": 0, "objects": 0}
+    runs_dir = cache_root / "runs"
+    objects_dir = cache_root / "objects"
+    if not cache_root.exists():
+        return removed
+
+    live = set(live_run_ids)
+    referenced: set = set()
+    if runs_dir.exists():
+        for index_file in runs_dir.glob("*.json"):
+            if index_file.stem not in live:
+                try:
+                    index_file.unlink()
+                    removed["runs"] += 1
+                except OSError as e:
+                    logger.debug("Failed to remove fact cache index %s: %s", index_file, e)
+                continue
+            data = _read_json(index_file)
+            for entry in (data or {}).get("files", {}).values():
+                if isinstance(entry, dict) and "sha256" in entry:
+                    referenced.add(entry["sha256"])
+
+    if objects_dir.exists():
+        for object_file in objects_dir.iterdir():
+            if object_file.stem in referenced:
+                continue
+            try:
+                object_file.unlink()
+                removed["objects"] += 1
+            except OSError as e:
+                logger.debug("Failed to remove fact cache object %s: %s", object_file, e)
+
+    return removed
@@ -12,6 +12,14 @@ Supported marker types:
 - ASM_NNN: Assumptions made during processing
 - DEC_NNN: Decisions (architectural, design)
 
+Scanning is a single pass per document: one pattern finds where markers of
+every type start, each is matched as its per-type pattern would match it, line
+numbers come from a newline offset table, and files above
+STREAM_THRESHOLD_BYTES are scanned chunk by chunk. extract_facts_from_run()
+reads a run's artifacts on a thread pool, and ingest_facts_to_db() writes all
+facts with one set-based upsert. With a FactCache (used by the post-step
+hooks), artifacts unchanged since an earlier extraction are not scanned again.
+
 Usage:
     from swarm.runtime.fact_extraction import (
         ExtractedFact,
@@ -24,6 +32,9 @@ Usage:
     # Extract from text
     facts = extract_facts_from_text("REQ_001: User can login\nSOL_001: Use OAuth2")
 
+    # Extract from a whole run (artifacts scanned on a thread pool)
+    result = extract_facts_from_run(run_base, run_id, workers=8)
+
     # Extract from a file
     facts = extract_facts_from_file(Path("/runs/abc/signal/requirements.md"))
 
@@ -36,12 +47,19 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, TextIO, Tuple
+
+from .fact_cache import FactCache
 
 logger = logging.getLogger(__name__)
 
@@ -92,9 +110,47 @@ MARKER_PATTERNS: Dict[str, Pattern[str]] = {
 # Simple pattern to find any marker (for line number detection)
 ANY_MARKER_PATTERN = re.compile(r"\b(REQ|SOL|TRC|ASM|DEC)_(\d{3})\b", re.IGNORECASE)
 
+# All of MARKER_PATTERNS as one alternation. At a given position it matches
+# exactly what that position's per-type pattern would.
+# Captures: (1) prefix (any case), (2) numeric ID, (3) content.
+COMBINED_MARKER_PATTERN: Pattern[str] = re.compile(
+    r"\b(" + "|".join(MARKER_TYPES) + r")_(\d{3})(?:\s*[:.-]\s*|\s+)(.+?)"
+    r"(?=\n|" + "|".join(rf"\b{prefix}_" for prefix in MARKER_TYPES) + r"|$)",
+    re.IGNORECASE,
+)
+
+# Where a marker of any type may start. Each type's matches are taken as its
+# own per-type scan would take them, so a marker inside another type's content
+# (e.g. "TRC_001: REQ_001 -> SOL_001") is still found.
+MARKER_START_PATTERN: Pattern[str] = re.compile(
+    r"\b(" + "|".join(MARKER_TYPES) + r")_\d{3}", re.IGNORECASE
+)
+
+# Length of a marker token, e.g. "REQ_001"
+MARKER_TOKEN_CHARS = 7
+
+# Separator characters besides whitespace (see MARKER_PATTERNS)
+_SEPARATOR_PUNCTUATION = ":.-"
+
+_NON_SPACE = re.compile(r"\S")
+
 # Context window: number of characters before/after marker to capture
 CONTEXT_WINDOW = 100
 
+# Files larger than this are scanned in chunks instead of read whole
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Characters read per chunk when streaming
+STREAM_CHUNK_CHARS = 1024 * 1024
+
+# Known flow keys, in extraction order
+FLOW_KEYS = ["signal", "plan", "build", "gate", "deploy", "wisdom"]
+
+
+def default_extraction_workers() -> int:
+    """Default thread count for extract_facts_from_run()."""
+    return min(8, os.cpu_count() or 1)
+
 
 # =============================================================================
 # Data Classes
@@ -194,19 +250,38 @@ class ExtractionResult:
 # =============================================================================
 
 
-def _get_line_number(text: str, position: int) -> int:
-    """Get 1-indexed line number for a character position in text."""
-    return text[:position].count("\n") + 1
+class LineIndex:
+    """Newline offset table: position -> 1-indexed line number in O(log n)."""
 
+    def __init__(self, text: str):
+        newlines = []
+        find = text.find
+        pos = find("\n")
+        while pos != -1:
+            newlines.append(pos)
+            pos = find("\n", pos + 1)
+        self._newlines = newlines
 
-def _get_context(text: str, start: int, end: int, window: int = CONTEXT_WINDOW) -> str:
+    def line_number(self, position: int) -> int:
+        """1-indexed line of the character at `position`."""
+        return bisect.bisect_left(self._newlines, position) + 1
+
+
+def _get_context(
+    text: str,
+    start: int,
+    end: int,
+    window: int = CONTEXT_WINDOW,
+    offset: int = 0,
+) -> str:
     """Get surrounding context for a match.
 
     Args:
-        text: Full text.
+        text: Full text (or, when streaming, the buffered part of it).
         start: Start position of match.
         end: End position of match.
         window: Number of characters to include before/after.
+        offset: Position of text[0] in the document (streaming).
 
     Returns:
         Context string with ellipsis if truncated.
@@ -220,12 +295,189 @@ def _get_context(text: str, start: int, end: int, window: int = CONTEXT_WINDOW)
     context = " ".join(context.split())
 
     # Add ellipsis if truncated
-    prefix = "..." if context_start > 0 else ""
+    prefix = "..." if offset + context_start > 0 else ""
     suffix = "..." if context_end < len(text) else ""
 
     return f"{prefix}{context}{suffix}"
 
 
+# A scanned marker: (match, 1-indexed line, context)
+_MarkerHit = Tuple["re.Match[str]", int, str]
+
+
+def _scan_text(text: str) -> Iterator[_MarkerHit]:
+    """Yield every marker in text, in order of position, in one pass.
+
+    Finds the union of the per-type MARKER_PATTERNS scans: a candidate is
+    skipped only if it lies inside an earlier match of its own type.
+    """
+    lines: Optional[LineIndex] = None
+    type_end: Dict[str, int] = {}  # End of the last match per marker type
+    for start in MARKER_START_PATTERN.finditer(text):
+        marker_type = start.group(1).upper()
+        if start.start() < type_end.get(marker_type, 0):
+            continue
+        match = COMBINED_MARKER_PATTERN.match(text, start.start())
+        if match is None:
+            continue
+        type_end[marker_type] = match.end()
+        if lines is None:
+            lines = LineIndex(text)  # Only pay for the table if there are markers
+        yield (
+            match,
+            lines.line_number(match.start()),
+            _get_context(text, match.start(), match.end()),
+        )
+
+
+def _match_is_final(buffer: str, start: int, match: Optional["re.Match[str]"]) -> bool:
+    """Whether matching at `start` gives the same result however the text continues.
+
+    The separator may span newlines and the content ends at the next newline,
+    marker or end of text, so a match (or failure) is only settled once
+    non-whitespace text follows it.
+    """
+    if match is None:
+        # Settled if the character after the token can never begin a separator
+        after = start + MARKER_TOKEN_CHARS
+        return after < len(buffer) and not (
+            buffer[after].isspace() or buffer[after] in _SEPARATOR_PUNCTUATION
+        )
+    end = match.end()
+    # Room for the lookahead (e.g. "\bREQ_"), and the separator and content
+    # did not stop at the buffer end
+    return end + MARKER_TOKEN_CHARS <= len(buffer) and _NON_SPACE.search(buffer, end) is not None
+
+
+def _scan_stream(stream: TextIO, chunk_size: int = STREAM_CHUNK_CHARS) -> Iterator[_MarkerHit]:
+    """Yield every marker in a text stream, in order, reading it chunk by chunk.
+
+    Produces the same hits as _scan_text(stream.read()) while buffering only
+    the unscanned tail plus CONTEXT_WINDOW characters. A candidate is only
+    decided once the text after it settles the match (see _match_is_final) and
+    the context after it has been read, so markers split across chunks are
+    handled. A match whose separator or content is longer than the chunk size
+    is buffered whole.
+    """
+    window = CONTEXT_WINDOW
+    buffer = ""
+    base = 0  # Document position of buffer[0]
+    pos = 0  # Scan position in buffer
+    line = 1  # Line number at buffer[counted]
+    counted = 0
+    type_end: Dict[str, int] = {}  # Document end of the last match per type
+    eof = False
+
+    while not eof:
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+        while True:
+            start = MARKER_START_PATTERN.search(buffer, pos)
+            if start is None:
+                # A token cut off at the buffer end may still complete
+                if not eof:
+                    pos = max(pos, len(buffer) - MARKER_TOKEN_CHARS + 1)
+                break
+            marker_type = start.group(1).upper()
+            if base + start.start() < type_end.get(marker_type, 0):
+                pos = start.start() + 1
+                continue
+            match = COMBINED_MARKER_PATTERN.match(buffer, start.start())
+            if not eof and not _match_is_final(buffer, start.start(), match):
+                pos = start.start()
+                break
+            if match is None:
+                pos = start.start() + 1
+                continue
+            if not eof and match.end() + window >= len(buffer):
+                pos = start.start()
+                break  # Need more text for the trailing context
+            type_end[marker_type] = base + match.end()
+            line += buffer.count("\n", counted, match.start())
+            counted = match.start()
+            yield match, line, _get_context(buffer, match.start(), match.end(), offset=base)
+            pos = start.start() + 1
+
+        # Keep CONTEXT_WINDOW characters before the scan position
+        cut = max(0, pos - window)
+        if cut > counted:
+            line += buffer.count("\n", counted, cut)
+            counted = cut
+        buffer = buffer[cut:]
+        base += cut
+        pos -= cut
+        counted -= cut
+
+
+# A file's markers without attribution, as cached by FactCache:
+# [marker_type, marker_id, content, source_line, context]
+_MarkerRecord = List[Any]
+
+
+def _records_from_hits(hits: Iterator[_MarkerHit]) -> List[_MarkerRecord]:
+    """Deduplicate scanned markers (first occurrence wins), in document order."""
+    records: List[_MarkerRecord] = []
+    seen_markers: set = set()  # Deduplicate markers
+
+    for match, line_number, context in hits:
+        marker_type = match.group(1).upper()
+        marker_id = f"{marker_type}_{match.group(2)}"
+
+        # Skip duplicates
+        if marker_id in seen_markers:
+            continue
+        seen_markers.add(marker_id)
+        records.append([marker_type, marker_id, match.group(3).strip(), line_number, context])
+
+    return records
+
+
+def _facts_from_records(
+    records: List[_MarkerRecord],
+    source_file: str,
+    step_id: Optional[str],
+    flow_key: Optional[str],
+    run_id: Optional[str],
+    agent_key: Optional[str],
+) -> List[ExtractedFact]:
+    """Build sorted, attributed facts from a file's marker records."""
+    extracted_at = datetime.now(timezone.utc).isoformat() + "Z"
+    facts = [
+        ExtractedFact(
+            marker_type=marker_type,
+            marker_id=marker_id,
+            content=content,
+            source_file=source_file,
+            source_line=source_line,
+            context=context,
+            step_id=step_id,
+            flow_key=flow_key,
+            run_id=run_id,
+            agent_key=agent_key,
+            extracted_at=extracted_at,
+        )
+        for marker_type, marker_id, content, source_line, context in records
+    ]
+
+    # Sort by marker type, then by numeric ID
+    facts.sort(key=lambda f: (f.marker_type, f.marker_id))
+    return facts
+
+
+def _scan_file_records(path: Path) -> List[_MarkerRecord]:
+    """Marker records of a file, streaming files above STREAM_THRESHOLD_BYTES.
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read.
+    """
+    if path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        with open(path, "r", encoding="utf-8") as f:
+            return _records_from_hits(_scan_stream(f))
+    return _records_from_hits(_scan_text(path.read_text(encoding="utf-8")))
+
+
 def extract_facts_from_text(
     text: str,
     source_file: str = "<text>",
@@ -255,46 +507,44 @@ def extract_facts_from_text(
         >>> facts[0].marker_id
         'REQ_001'
     """
-    facts: List[ExtractedFact] = []
-    seen_markers: set = set()  # Deduplicate markers
+    return _facts_from_records(
+        _records_from_hits(_scan_text(text)), source_file, step_id, flow_key, run_id, agent_key
+    )
 
-    from datetime import datetime, timezone
 
-    extracted_at = datetime.now(timezone.utc).isoformat() + "Z"
+def extract_facts_from_stream(
+    stream: TextIO,
+    source_file: str = "<stream>",
+    step_id: Optional[str] = None,
+    flow_key: Optional[str] = None,
+    run_id: Optional[str] = None,
+    agent_key: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_CHARS,
+) -> List[ExtractedFact]:
+    """Extract all inventory markers from a text stream without reading it whole.
 
-    for marker_type, pattern in MARKER_PATTERNS.items():
-        for match in pattern.finditer(text):
-            numeric_id = match.group(1)
-            content = match.group(2).strip()
-            marker_id = f"{marker_type}_{numeric_id}"
+    Same result as extract_facts_from_text(stream.read(), ...).
 
-            # Skip duplicates
-            if marker_id in seen_markers:
-                continue
-            seen_markers.add(marker_id)
-
-            # Get line number and context
-            line_number = _get_line_number(text, match.start())
-            context = _get_context(text, match.start(), match.end())
-
-            fact = ExtractedFact(
-                marker_type=marker_type,
-                marker_id=marker_id,
-                content=content,
-                source_file=source_file,
-                source_line=line_number,
-                context=context,
-                step_id=step_id,
-                flow_key=flow_key,
-                run_id=run_id,
-                agent_key=agent_key,
-                extracted_at=extracted_at,
-            )
-            facts.append(fact)
+    Args:
+        stream: Text stream to read (e.g. an open file).
+        source_file: Source file path for attribution.
+        step_id: Optional step identifier.
+        flow_key: Optional flow key.
+        run_id: Optional run identifier.
+        agent_key: Optional agent key.
+        chunk_size: Characters read per chunk.
 
-    # Sort by marker type, then by numeric ID
-    facts.sort(key=lambda f: (f.marker_type, f.marker_id))
-    return facts
+    Returns:
+        List of ExtractedFact objects found in the stream.
+    """
+    return _facts_from_records(
+        _records_from_hits(_scan_stream(stream, chunk_size)),
+        source_file,
+        step_id,
+        flow_key,
+        run_id,
+        agent_key,
+    )
 
 
 def extract_facts_from_file(
@@ -303,6 +553,7 @@ def extract_facts_from_file(
     flow_key: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_key: Optional[str] = None,
+    cache: Optional[FactCache] = None,
 ) -> List[ExtractedFact]:
     """Extract all inventory markers from a file.
 
@@ -312,11 +563,14 @@ def extract_facts_from_file(
         flow_key: Optional flow key.
         run_id: Optional run identifier.
         agent_key: Optional agent key.
+        cache: Optional FactCache; an unchanged file is not scanned again.
 
     Returns:
         List of ExtractedFact objects found in the file.
         Returns empty list if file doesn't exist or can't be read.
 
+    Files larger than STREAM_THRESHOLD_BYTES are scanned chunk by chunk.
+
     Example:
         >>> facts = extract_facts_from_file(Path("requirements.md"))
     """
@@ -329,19 +583,58 @@ def extract_facts_from_file(
         return []
 
     try:
-        text = path.read_text(encoding="utf-8")
+        if cache is not None:
+            records = cache.load(path, _scan_file_records)
+        else:
+            records = _scan_file_records(path)
     except (OSError, UnicodeDecodeError) as e:
         logger.warning("Failed to read file for fact extraction: %s - %s", path, e)
         return []
 
-    return extract_facts_from_text(
-        text=text,
-        source_file=str(path),
-        step_id=step_id,
-        flow_key=flow_key,
-        run_id=run_id,
-        agent_key=agent_key,
-    )
+    return _facts_from_records(records, str(path), step_id, flow_key, run_id, agent_key)
+
+
+def _step_agent_key(flow_path: Path, step_id: str) -> Optional[str]:
+    """Agent key of a step, from its first readable receipt."""
+    receipts_dir = flow_path / "receipts"
+    if receipts_dir.exists():
+        for receipt_file in receipts_dir.glob(f"{step_id}-*.json"):
+            try:
+                receipt_data = json.loads(receipt_file.read_text(encoding="utf-8"))
+                return receipt_data.get("agent_key")
+            except (OSError, json.JSONDecodeError):
+                pass
+    return None
+
+
+def _scan_envelope(
+    flow_path: Path,
+    flow_key: str,
+    step_id: str,
+    run_id: Optional[str],
+    agent_key: Optional[str],
+) -> ExtractionResult:
+    """Extract facts from the summary of a step's handoff envelope, if any."""
+    result = ExtractionResult()
+    envelope_file = flow_path / "handoff" / f"{step_id}.json"
+    if not envelope_file.exists():
+        return result
+    try:
+        envelope_data = json.loads(envelope_file.read_text(encoding="utf-8"))
+        summary = envelope_data.get("summary", "")
+        if summary:
+            result.facts = extract_facts_from_text(
+                text=summary,
+                source_file=str(envelope_file) + "#summary",
+                step_id=step_id,
+                flow_key=flow_key,
+                run_id=run_id,
+                agent_key=agent_key,
+            )
+            result.source_files.append(str(envelope_file))
+    except (OSError, json.JSONDecodeError) as e:
+        result.errors.append(f"Error reading envelope {envelope_file}: {e}")
+    return result
 
 
 def extract_facts_from_step(
@@ -349,6 +642,7 @@ def extract_facts_from_step(
     flow_key: str,
     step_id: str,
     run_id: Optional[str] = None,
+    cache: Optional[FactCache] = None,
 ) -> ExtractionResult:
     """Extract facts from all artifacts of a step.
 
@@ -360,6 +654,8 @@ def extract_facts_from_step(
         flow_key: The flow key (signal, plan, build, etc.).
         step_id: The step identifier.
         run_id: Optional run identifier.
+        cache: Optional FactCache; only changed .md files are scanned. Its
+            index is saved before returning.
 
     Returns:
         ExtractionResult containing all facts and metadata.
@@ -380,17 +676,7 @@ def extract_facts_from_step(
         result.errors.append(f"Flow directory not found: {flow_path}")
         return result
 
-    # Agent key extraction from receipts
-    agent_key = None
-    receipts_dir = flow_path / "receipts"
-    if receipts_dir.exists():
-        for receipt_file in receipts_dir.glob(f"{step_id}-*.json"):
-            try:
-                receipt_data = json.loads(receipt_file.read_text(encoding="utf-8"))
-                agent_key = receipt_data.get("agent_key")
-                break
-            except (OSError, json.JSONDecodeError):
-                pass
+    agent_key = _step_agent_key(flow_path, step_id)
 
     # Scan .md files in flow directory
     for md_file in flow_path.glob("*.md"):
@@ -401,33 +687,20 @@ def extract_facts_from_step(
                 flow_key=flow_key,
                 run_id=run_id,
                 agent_key=agent_key,
+                cache=cache,
             )
             result.facts.extend(facts)
             result.source_files.append(str(md_file))
         except Exception as e:
             result.errors.append(f"Error scanning {md_file}: {e}")
+    if cache is not None:
+        cache.save()
 
     # Scan handoff envelopes
-    handoff_dir = flow_path / "handoff"
-    if handoff_dir.exists():
-        envelope_file = handoff_dir / f"{step_id}.json"
-        if envelope_file.exists():
-            try:
-                envelope_data = json.loads(envelope_file.read_text(encoding="utf-8"))
-                summary = envelope_data.get("summary", "")
-                if summary:
-                    facts = extract_facts_from_text(
-                        text=summary,
-                        source_file=str(envelope_file) + "#summary",
-                        step_id=step_id,
-                        flow_key=flow_key,
-                        run_id=run_id,
-                        agent_key=agent_key,
-                    )
-                    result.facts.extend(facts)
-                    result.source_files.append(str(envelope_file))
-            except (OSError, json.JSONDecodeError) as e:
-                result.errors.append(f"Error reading envelope {envelope_file}: {e}")
+    envelope = _scan_envelope(flow_path, flow_key, step_id, run_id, agent_key)
+    result.facts.extend(envelope.facts)
+    result.source_files.extend(envelope.source_files)
+    result.errors.extend(envelope.errors)
 
     # Deduplicate facts (same marker_id from multiple sources)
     seen: Dict[str, ExtractedFact] = {}
@@ -440,15 +713,75 @@ def extract_facts_from_step(
     return result
 
 
+def _flow_step_ids(flow_path: Path) -> List[str]:
+    """Step IDs of a flow, from handoff envelopes and receipts, sorted."""
+    step_ids: set = set()
+
+    # From handoff directory
+    handoff_dir = flow_path / "handoff"
+    if handoff_dir.exists():
+        for f in handoff_dir.glob("*.json"):
+            step_ids.add(f.stem)
+
+    # From receipts directory
+    receipts_dir = flow_path / "receipts"
+    if receipts_dir.exists():
+        for f in receipts_dir.glob("*.json"):
+            # Receipt filenames are step_id-agent_key.json
+            name = f.stem
+            if "-" in name:
+                step_ids.add(name.split("-")[0])
+
+    return sorted(step_ids)
+
+
+def _scan_artifact(
+    md_file: Path,
+    flow_key: str,
+    step_id: Optional[str],
+    run_id: Optional[str],
+    agent_key: Optional[str],
+    cache: Optional[FactCache] = None,
+) -> ExtractionResult:
+    """Extract facts from one .md artifact (thread pool task)."""
+    result = ExtractionResult()
+    try:
+        result.facts = extract_facts_from_file(
+            path=md_file,
+            step_id=step_id,
+            flow_key=flow_key,
+            run_id=run_id,
+            agent_key=agent_key,
+            cache=cache,
+        )
+        result.source_files.append(str(md_file))
+    except Exception as e:
+        result.errors.append(f"Error scanning {md_file}: {e}")
+    return result
+
+
 def extract_facts_from_run(
     run_base: Path,
     run_id: Optional[str] = None,
+    workers: Optional[int] = None,
+    cache: Optional[FactCache] = None,
 ) -> ExtractionResult:
     """Extract facts from all flows in a run.
 
+    Each artifact is scanned once, on a thread pool. The result matches
+    running extract_facts_from_step() for every step of every flow and
+    merging: a flow's .md files are attributed to its first step (sorted by
+    step ID), a marker is taken from the first .md file containing it, and
+    envelope summaries only contribute markers no .md file has. Flows
+    without steps have their .md files scanned without step attribution.
+
     Args:
         run_base: The run base directory.
         run_id: Optional run identifier.
+        workers: Scanner threads (default: default_extraction_workers()).
+            1 scans inline.
+        cache: Optional FactCache; only changed .md files are scanned. Its
+            index is saved before returning.
 
     Returns:
         ExtractionResult containing all facts from all flows.
@@ -459,67 +792,75 @@ def extract_facts_from_run(
         result.errors.append(f"Run directory not found: {run_base}")
         return result
 
-    # Known flow keys
-    flow_keys = ["signal", "plan", "build", "gate", "deploy", "wisdom"]
-
-    for flow_key in flow_keys:
+    # Plan one task per artifact: (flow_key, role, task). Roles: "step" for
+    # .md files of a flow with steps, "loose" for a flow without steps,
+    # "envelope" for handoff envelope summaries.
+    tasks: List[Tuple[str, str, Callable[[], ExtractionResult]]] = []
+    for flow_key in FLOW_KEYS:
         flow_path = run_base / flow_key
         if not flow_path.exists():
             continue
 
-        # Find all step IDs from handoff or receipts
-        step_ids: set = set()
-
-        # From handoff directory
-        handoff_dir = flow_path / "handoff"
-        if handoff_dir.exists():
-            for f in handoff_dir.glob("*.json"):
-                step_ids.add(f.stem)
-
-        # From receipts directory
-        receipts_dir = flow_path / "receipts"
-        if receipts_dir.exists():
-            for f in receipts_dir.glob("*.json"):
-                # Receipt filenames are step_id-agent_key.json
-                name = f.stem
-                if "-" in name:
-                    step_ids.add(name.split("-")[0])
-
-        # If no step IDs found, scan all .md files without step attribution
-        if not step_ids:
-            for md_file in flow_path.glob("*.md"):
-                try:
-                    facts = extract_facts_from_file(
-                        path=md_file,
-                        flow_key=flow_key,
-                        run_id=run_id,
-                    )
-                    result.facts.extend(facts)
-                    result.source_files.append(str(md_file))
-                except Exception as e:
-                    result.errors.append(f"Error scanning {md_file}: {e}")
+        step_ids = _flow_step_ids(flow_path)
+        if step_ids:
+            role, md_step = "step", step_ids[0]
+            md_agent = _step_agent_key(flow_path, md_step)
         else:
-            # Extract per step
-            for step_id in sorted(step_ids):
-                step_result = extract_facts_from_step(
-                    run_base=run_base,
-                    flow_key=flow_key,
-                    step_id=step_id,
-                    run_id=run_id,
-                )
-                result.facts.extend(step_result.facts)
-                result.source_files.extend(step_result.source_files)
-                result.errors.extend(step_result.errors)
+            role, md_step, md_agent = "loose", None, None
+
+        for md_file in flow_path.glob("*.md"):
+            task = functools.partial(
+                _scan_artifact, md_file, flow_key, md_step, run_id, md_agent, cache
+            )
+            tasks.append((flow_key, role, task))
+        for step_id in step_ids:
+            task = functools.partial(
+                _scan_envelope,
+                flow_path,
+                flow_key,
+                step_id,
+                run_id,
+                _step_agent_key(flow_path, step_id),
+            )
+            tasks.append((flow_key, "envelope", task))
+
+    workers = workers or default_extraction_workers()
+    if workers > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(tasks)), thread_name_prefix="fact-scan"
+        ) as pool:
+            scanned = list(pool.map(lambda task: task[2](), tasks))
+    else:
+        scanned = [task[2]() for task in tasks]
+    if cache is not None:
+        cache.save()
+
+    # Merge in plan order: per flow with steps, .md markers (first file
+    # wins), then envelope markers not found in any .md file
+    md_markers: Dict[str, set] = {}
+    for (flow_key, role, _), part in zip(tasks, scanned):
+        seen = md_markers.setdefault(flow_key, set())
+        for fact in part.facts:
+            if role == "loose":
+                result.facts.append(fact)
+                continue
+            if fact.marker_id in seen:
+                continue
+            if role == "step":
+                seen.add(fact.marker_id)
+            result.facts.append(fact)
+        result.source_files.extend(part.source_files)
+        result.errors.extend(part.errors)
 
     # Deduplicate facts
-    seen: Dict[str, ExtractedFact] = {}
+    seen_facts: Dict[str, ExtractedFact] = {}
     for fact in result.facts:
         key = f"{fact.marker_id}:{fact.source_file}"
-        if key not in seen:
-            seen[key] = fact
+        if key not in seen_facts:
+            seen_facts[key] = fact
 
     result.facts = sorted(
-        seen.values(), key=lambda f: (f.flow_key or "", f.marker_type, f.marker_id)
+        seen_facts.values(), key=lambda f: (f.flow_key or "", f.marker_type, f.marker_id)
     )
     result.source_files = sorted(set(result.source_files))
 
@@ -550,12 +891,22 @@ except ImportError:
     StatsDB = None  # type: ignore
 
 
+# Map marker type to human-readable fact_type
+FACT_TYPES: Dict[str, str] = {
+    "REQ": "requirement",
+    "SOL": "solution",
+    "TRC": "trace",
+    "ASM": "assumption",
+    "DEC": "decision",
+}
+
+
 def ingest_facts_to_db(
     facts: List[ExtractedFact],
     run_id: str,
     db: "StatsDB",
 ) -> int:
-    """Ingest extracted facts into DuckDB using StatsDB.ingest_fact().
+    """Ingest extracted facts into DuckDB with one StatsDB.ingest_facts_bulk() upsert.
 
     This function adapts ExtractedFact objects to the StatsDB facts table
     schema, storing source_file/source_line/context in the metadata field.
@@ -571,46 +922,28 @@ def ingest_facts_to_db(
     if db is None or db.connection is None:
         return 0
 
-    ingested = 0
-    for fact in facts:
-        # Map marker type to human-readable fact_type
-        fact_type_map = {
-            "REQ": "requirement",
-            "SOL": "solution",
-            "TRC": "trace",
-            "ASM": "assumption",
-            "DEC": "decision",
-        }
-        fact_type = fact_type_map.get(fact.marker_type, fact.marker_type.lower())
-
-        # Store source location info in metadata
-        metadata = {
-            "source_file": fact.source_file,
-            "source_line": fact.source_line,
-            "context": fact.context,
+    rows = [
+        {
+            "run_id": run_id,
+            "step_id": fact.step_id or "",
+            "flow_key": fact.flow_key or "",
+            "marker_type": fact.marker_type,
+            "marker_id": fact.marker_id,
+            "fact_type": FACT_TYPES.get(fact.marker_type, fact.marker_type.lower()),
+            "content": fact.content,
+            "agent_key": fact.agent_key,
+            "priority": None,  # Could be extracted from content in future
+            "status": "verified",
+            # Store source location info in metadata
+            "metadata": {
+                "source_file": fact.source_file,
+                "source_line": fact.source_line,
+                "context": fact.context,
+            },
         }
-
-        # Use StatsDB's ingest_fact method
-        result = db.ingest_fact(
-            run_id=run_id,
-            step_id=fact.step_id or "",
-            flow_key=fact.flow_key or "",
-            marker_type=fact.marker_type,
-            marker_id=fact.marker_id,
-            fact_type=fact_type,
-            content=fact.content,
-            agent_key=fact.agent_key,
-            priority=None,  # Could be extracted from content in future
-            status="verified",
-            evidence=None,
-            created_at=None,
-            metadata=metadata,
-        )
-
-        if result:
-            ingested += 1
-
-    return ingested
+        for fact in facts
+    ]
+    return db.ingest_facts_bulk(rows)
 
 
 def query_facts(
@@ -741,6 +1074,7 @@ def extract_and_ingest_step_facts(
     step_id: str,
     run_id: str,
     db: Optional["StatsDB"] = None,
+    use_cache: bool = True,
 ) -> ExtractionResult:
     """Post-step hook to extract and optionally ingest facts.
 
@@ -754,6 +1088,8 @@ def extract_and_ingest_step_facts(
         step_id: The step identifier.
         run_id: The run identifier.
         db: Optional StatsDB instance for ingestion.
+        use_cache: Reuse results for artifacts unchanged since an earlier
+            extraction (see FactCache.for_run()).
 
     Returns:
         ExtractionResult with extracted facts.
@@ -763,6 +1099,7 @@ def extract_and_ingest_step_facts(
         flow_key=flow_key,
         step_id=step_id,
         run_id=run_id,
+        cache=FactCache.for_run(run_base) if use_cache else None,
     )
 
     if db is not None and result.facts:
@@ -785,6 +1122,46 @@ def extract_and_ingest_step_facts(
     return result
 
 
+def extract_and_ingest_run_facts(
+    run_base: Path,
+    run_id: str,
+    db: Optional["StatsDB"] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> ExtractionResult:
+    """Extract facts from a whole run in parallel and bulk-ingest them.
+
+    Args:
+        run_base: The run base directory.
+        run_id: The run identifier.
+        db: Optional StatsDB instance for ingestion.
+        workers: Scanner threads (see extract_facts_from_run()).
+        use_cache: Reuse results for artifacts unchanged since an earlier
+            extraction (see FactCache.for_run()).
+
+    Returns:
+        ExtractionResult with extracted facts.
+    """
+    result = extract_facts_from_run(
+        run_base=run_base,
+        run_id=run_id,
+        workers=workers,
+        cache=FactCache.for_run(run_base) if use_cache else None,
+    )
+
+    if db is not None and result.facts:
+        ingested = ingest_facts_to_db(result.facts, run_id, db)
+        logger.info(
+            "Extracted %d facts from %d files of run %s, ingested %d to DB",
+            len(result.facts),
+            len(result.source_files),
+            run_id,
+            ingested,
+        )
+
+    return result
+
+
 # =============================================================================
 # CLI Entry Point
 # =============================================================================
@@ -798,6 +1175,7 @@ def main():
         python -m swarm.runtime.fact_extraction <run_id> --flow signal
         python -m swarm.runtime.fact_extraction <run_id> --ingest
         python -m swarm.runtime.fact_extraction <run_id> --json
+        python -m swarm.runtime.fact_extraction <run_id> --no-cache
     """
     import argparse
     import sys
@@ -850,6 +1228,18 @@ def main():
         default=None,
         help="Path to runs directory (default: swarm/runs/)",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Threads for scanning a whole run (default: min(8, CPU count))",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every artifact instead of reusing the extraction cache",
+    )
 
     args = parser.parse_args()
 
@@ -864,6 +1254,7 @@ def main():
         if run_base is None:
             print(f"Run not found: {args.run_id}")
             sys.exit(1)
+    cache = None if args.no_cache else FactCache.for_run(run_base)
 
     # Extract facts
     if args.flow and args.step:
@@ -872,6 +1263,7 @@ def main():
             flow_key=args.flow,
             step_id=args.step,
             run_id=args.run_id,
+            cache=cache,
         )
     elif args.flow:
         # Extract from entire flow
@@ -883,13 +1275,18 @@ def main():
                     path=md_file,
                     flow_key=args.flow,
                     run_id=args.run_id,
+                    cache=cache,
                 )
                 result.facts.extend(facts)
                 result.source_files.append(str(md_file))
+        if cache is not None:
+            cache.save()
     else:
         result = extract_facts_from_run(
             run_base=run_base,
             run_id=args.run_id,
+            workers=args.workers,
+            cache=cache,
         )
 
     # Filter by marker type if specified
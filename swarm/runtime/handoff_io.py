@@ -29,6 +29,8 @@ from swarm.runtime.path_helpers import (
     file_changes_path as make_file_changes_path,
     handoff_envelope_path as make_handoff_envelope_path,
 )
+from swarm.runtime.phase_timing import timed_phase
+from swarm.spec.schema_registry import JSONSCHEMA_AVAILABLE, get_schema_registry
 
 logger = logging.getLogger(__name__)
 
@@ -36,141 +38,28 @@ logger = logging.getLogger(__name__)
 # If serialized file_changes exceeds this size, it's moved to forensics directory
 FILE_CHANGES_EXTRACTION_THRESHOLD = 1000
 
-# Cached schemas to avoid repeated file reads
-_HANDOFF_SCHEMA: Optional[Dict[str, Any]] = None
-_ROUTING_SIGNAL_SCHEMA: Optional[Dict[str, Any]] = None
-_ASSUMPTION_RECORD_SCHEMA: Optional[Dict[str, Any]] = None
-_DECISION_RECORD_SCHEMA: Optional[Dict[str, Any]] = None
-
-# Try to import jsonschema, graceful fallback if not available
-try:
+# Schemas are compiled once by the shared registry (see swarm.spec.schema_registry)
+if JSONSCHEMA_AVAILABLE:
     import jsonschema
-
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:
-    JSONSCHEMA_AVAILABLE = False
+else:
     jsonschema = None  # type: ignore[assignment]
 
 
-def _load_handoff_schema() -> Optional[Dict[str, Any]]:
-    """Load handoff envelope schema, caching result."""
-    global _HANDOFF_SCHEMA
-    if _HANDOFF_SCHEMA is not None:
-        return _HANDOFF_SCHEMA
-
+def _handoff_schema_path() -> Optional[Path]:
+    """Locate the handoff envelope schema (its $ref targets live alongside)."""
     schema_paths = [
         Path(__file__).parent.parent / "schemas" / "handoff_envelope.schema.json",
         Path("swarm/schemas/handoff_envelope.schema.json"),
     ]
-
-    for path in schema_paths:
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    _HANDOFF_SCHEMA = json.load(f)
-                return _HANDOFF_SCHEMA
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load handoff schema from %s: %s", path, e)
-                continue
-
-    return None
-
-
-def _load_routing_signal_schema() -> Optional[Dict[str, Any]]:
-    """Load routing signal schema, caching result."""
-    global _ROUTING_SIGNAL_SCHEMA
-    if _ROUTING_SIGNAL_SCHEMA is not None:
-        return _ROUTING_SIGNAL_SCHEMA
-
-    schema_paths = [
-        Path(__file__).parent.parent / "schemas" / "routing_signal.schema.json",
-        Path("swarm/schemas/routing_signal.schema.json"),
-    ]
-
     for path in schema_paths:
         if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    _ROUTING_SIGNAL_SCHEMA = json.load(f)
-                return _ROUTING_SIGNAL_SCHEMA
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load routing signal schema from %s: %s", path, e)
-                continue
-
+            return path
     return None
 
 
-def _load_assumption_record_schema() -> Optional[Dict[str, Any]]:
-    """Load assumption record schema, caching result."""
-    global _ASSUMPTION_RECORD_SCHEMA
-    if _ASSUMPTION_RECORD_SCHEMA is not None:
-        return _ASSUMPTION_RECORD_SCHEMA
-
-    schema_paths = [
-        Path(__file__).parent.parent / "schemas" / "assumption_record.schema.json",
-        Path("swarm/schemas/assumption_record.schema.json"),
-    ]
-
-    for path in schema_paths:
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    _ASSUMPTION_RECORD_SCHEMA = json.load(f)
-                return _ASSUMPTION_RECORD_SCHEMA
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load assumption record schema from %s: %s", path, e)
-                continue
-
-    return None
-
-
-def _load_decision_record_schema() -> Optional[Dict[str, Any]]:
-    """Load decision record schema, caching result."""
-    global _DECISION_RECORD_SCHEMA
-    if _DECISION_RECORD_SCHEMA is not None:
-        return _DECISION_RECORD_SCHEMA
-
-    schema_paths = [
-        Path(__file__).parent.parent / "schemas" / "decision_record.schema.json",
-        Path("swarm/schemas/decision_record.schema.json"),
-    ]
-
-    for path in schema_paths:
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    _DECISION_RECORD_SCHEMA = json.load(f)
-                return _DECISION_RECORD_SCHEMA
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to load decision record schema from %s: %s", path, e)
-                continue
-
-    return None
-
-
-def _create_schema_resolver() -> Optional[Any]:
-    """Create a JSON schema resolver that handles $ref to all related schemas."""
-    if not JSONSCHEMA_AVAILABLE:
-        return None
-
-    handoff_schema = _load_handoff_schema()
-    routing_schema = _load_routing_signal_schema()
-    assumption_schema = _load_assumption_record_schema()
-    decision_schema = _load_decision_record_schema()
-
-    if handoff_schema is None:
-        return None
-
-    store: Dict[str, Any] = {}
-    if routing_schema is not None:
-        store["https://swarm.dev/schemas/routing_signal.schema.json"] = routing_schema
-    if assumption_schema is not None:
-        store["https://swarm.dev/schemas/assumption_record.schema.json"] = assumption_schema
-    if decision_schema is not None:
-        store["https://swarm.dev/schemas/decision_record.schema.json"] = decision_schema
-
-    resolver = jsonschema.RefResolver.from_schema(handoff_schema, store=store)
-    return resolver
+def _format_validation_error(error: "jsonschema.ValidationError") -> str:
+    json_path = error.json_path if hasattr(error, "json_path") else str(list(error.absolute_path))
+    return f"Validation error at {json_path}: {error.message}"
 
 
 def validate_envelope(envelope_dict: Dict[str, Any]) -> List[str]:
@@ -183,31 +72,46 @@ def validate_envelope(envelope_dict: Dict[str, Any]) -> List[str]:
         List of validation error messages (empty if valid or
         validation could not be performed).
     """
+    return validate_envelopes([envelope_dict])[0]
+
+
+def validate_envelopes(envelope_dicts: List[Dict[str, Any]]) -> List[List[str]]:
+    """Validate a batch of envelope dicts against the JSON schema.
+
+    Uses one compiled validator for the whole batch, so validating
+    thousands of envelopes (rebuilds, selftests) costs one compilation.
+
+    Args:
+        envelope_dicts: The envelope dictionaries to validate.
+
+    Returns:
+        One list of validation error messages per envelope (empty if valid
+        or validation could not be performed).
+    """
     if not JSONSCHEMA_AVAILABLE:
         logger.debug("jsonschema not available, skipping envelope validation")
-        return []
+        return [[] for _ in envelope_dicts]
 
-    schema = _load_handoff_schema()
-    if schema is None:
+    schema_path = _handoff_schema_path()
+    if schema_path is None:
         logger.debug("Handoff envelope schema not found, skipping validation")
-        return []
+        return [[] for _ in envelope_dicts]
 
-    errors: List[str] = []
     try:
-        resolver = _create_schema_resolver()
-        if resolver is not None:
-            jsonschema.validate(envelope_dict, schema, resolver=resolver)
-        else:
-            jsonschema.validate(envelope_dict, schema)
-    except jsonschema.ValidationError as e:
-        json_path = e.json_path if hasattr(e, "json_path") else str(list(e.absolute_path))
-        errors.append(f"Validation error at {json_path}: {e.message}")
+        validator = get_schema_registry().validator(schema_path)
     except jsonschema.SchemaError as e:
-        errors.append(f"Schema error: {e.message}")
+        return [[f"Schema error: {e.message}"] for _ in envelope_dicts]
     except Exception as e:
-        errors.append(f"Unexpected validation error: {str(e)}")
+        return [[f"Unexpected validation error: {str(e)}"] for _ in envelope_dicts]
 
-    return errors
+    results: List[List[str]] = []
+    for envelope_dict in envelope_dicts:
+        try:
+            error = validator.best_error(envelope_dict)
+            results.append([_format_validation_error(error)] if error is not None else [])
+        except Exception as e:
+            results.append([f"Unexpected validation error: {str(e)}"])
+    return results
 
 
 def is_strict_validation_enabled() -> bool:
@@ -228,6 +132,7 @@ class EnvelopeValidationError(Exception):
         super().__init__(f"Envelope validation failed: {'; '.join(errors)}")
 
 
+@timed_phase("envelope_write")
 def write_handoff_envelope(
     run_base: Path,
     step_id: str,
@@ -328,6 +233,7 @@ def write_handoff_envelope(
     return envelope_data
 
 
+@timed_phase("envelope_write")
 def update_envelope_routing(
     run_base: Path,
     step_id: str,
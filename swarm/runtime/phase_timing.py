@@ -0,0 +1,172 @@
+"""
+phase_timing.py - Opt-in per-phase timing for orchestrator step execution.
+
+Step wall time is spread across many subsystems (context hydration, prompt
+building, the engine itself, diff scanning, envelope writes, routing, event
+persistence). This module lets a profiler attribute that time without the
+subsystems knowing about each other:
+- Call sites mark phases with ``with phase("routing"):`` or the
+  ``@timed_phase("event_append")`` decorator
+- Nothing is recorded unless a PhaseRecorder is installed; the disabled cost
+  is one global read per marked call
+- Times are exclusive: a nested phase (e.g., an event append inside the
+  engine) is subtracted from its parent, so phase totals add up to no more
+  than wall time and the remainder is orchestrator bookkeeping
+
+Design Philosophy:
+    - Instrumentation stays at existing phase boundaries; no new plumbing
+      through function signatures
+    - One recorder per process, installed by the profiler (benchmarks,
+      diagnostics), never by production code paths
+    - Each thread keeps its own phase stack, so concurrent runs attribute
+      nested time correctly
+
+Usage:
+    from swarm.runtime.phase_timing import PhaseRecorder, phase, recording
+
+    with recording() as recorder:
+        orchestrator.run_stepwise_flow("build", spec)
+    recorder.snapshot()   # {"routing": {"seconds": ..., "calls": ...}, ...}
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+# Phases marked by the runtime, in step-execution order
+PHASES = (
+    "hydrate",
+    "prompt_build",
+    "engine",
+    "diff_scan",
+    "envelope_write",
+    "routing",
+    "event_append",
+    "db_ingest",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class PhaseRecorder:
+    """Accumulates exclusive time and call counts per phase."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._local = threading.local()
+
+    def _stack(self) -> List[List[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enter(self) -> None:
+        # Frame: [start, time spent in nested phases]
+        self._stack().append([time.perf_counter(), 0.0])
+
+    def exit(self, name: str) -> None:
+        stack = self._stack()
+        start, nested = stack.pop()
+        elapsed = time.perf_counter() - start
+        if stack:
+            stack[-1][1] += elapsed
+        with self._lock:
+            self._seconds[name] = self._seconds.get(name, 0.0) + elapsed - nested
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Exclusive seconds and call count per recorded phase."""
+        with self._lock:
+            return {
+                name: {"seconds": self._seconds[name], "calls": self._calls[name]}
+                for name in self._seconds
+            }
+
+    def reset(self) -> None:
+        """Clear accumulated totals."""
+        with self._lock:
+            self._seconds.clear()
+            self._calls.clear()
+
+
+_recorder: Optional[PhaseRecorder] = None
+
+
+class _Phase:
+    __slots__ = ("name", "recorder")
+
+    def __init__(self, name: str, recorder: PhaseRecorder):
+        self.name = name
+        self.recorder = recorder
+
+    def __enter__(self) -> None:
+        self.recorder.enter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.recorder.exit(self.name)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str) -> Any:
+    """Context manager attributing the enclosed block to a phase."""
+    recorder = _recorder
+    if recorder is None:
+        return _NO_PHASE
+    return _Phase(name, recorder)
+
+
+def timed_phase(name: str) -> Callable[[F], F]:
+    """Decorator attributing every call of a function to a phase."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            recorder.enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.exit(name)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def install_recorder(recorder: Optional[PhaseRecorder]) -> Optional[PhaseRecorder]:
+    """Install (or, with None, remove) the process recorder; returns the previous one."""
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
+
+
+@contextmanager
+def recording(recorder: Optional[PhaseRecorder] = None) -> Iterator[PhaseRecorder]:
+    """Record phases for the duration of the block."""
+    recorder = recorder or PhaseRecorder()
+    previous = install_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        install_recorder(previous)
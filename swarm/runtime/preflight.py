@@ -22,6 +22,14 @@ Usage:
     # Full orchestrator access
     orchestrator = PreflightOrchestrator(repo_root=Path("/path/to/repo"))
     result = orchestrator.run_all_checks(run_spec, backend="gemini-step-orchestrator")
+
+Checks run concurrently on a small thread pool. The run-independent checks
+(harness, repo, backend) are cached per (repo_root, backend) for
+SWARM_PREFLIGHT_CACHE_TTL seconds (default 60, 0 disables). A cached entry is
+dropped early when .git/HEAD or .git/index changes, so a batch of runs against
+the same checkout pays for those checks once. Credentials and paths are always
+re-checked: they depend on the environment and the run ID. Failed results are
+never cached.
 """
 
 from __future__ import annotations
@@ -30,7 +38,10 @@ import logging
 import os
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -38,6 +49,12 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached check result stays valid (override with SWARM_PREFLIGHT_CACHE_TTL)
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+# Checks whose result depends only on (repo_root, backend) and may be cached
+CACHEABLE_CHECKS = frozenset({"harness", "repo", "backend"})
+
 
 class CheckStatus(str, Enum):
     """Status of an individual preflight check."""
@@ -59,6 +76,7 @@ class CheckResult:
         duration_ms: Time taken to run the check in milliseconds.
         details: Additional structured details about the check.
         fix_hint: Suggested fix if the check failed.
+        cached: True if the result was reused from the preflight cache.
     """
 
     name: str
@@ -67,6 +85,7 @@ class CheckResult:
     duration_ms: int = 0
     details: Dict[str, Any] = field(default_factory=dict)
     fix_hint: Optional[str] = None
+    cached: bool = False
 
 
 @dataclass
@@ -105,6 +124,7 @@ class PreflightResult:
                     "duration_ms": c.duration_ms,
                     "details": c.details,
                     "fix_hint": c.fix_hint,
+                    "cached": c.cached,
                 }
                 for c in self.checks
             ],
@@ -117,6 +137,72 @@ class PreflightResult:
         }
 
 
+def cache_ttl_from_env() -> float:
+    """Preflight cache TTL in seconds, from SWARM_PREFLIGHT_CACHE_TTL."""
+    raw = os.environ.get("SWARM_PREFLIGHT_CACHE_TTL", "")
+    try:
+        return max(0.0, float(raw)) if raw else DEFAULT_CACHE_TTL_SECONDS
+    except ValueError:
+        logger.warning(
+            "Invalid SWARM_PREFLIGHT_CACHE_TTL %r, using %s", raw, DEFAULT_CACHE_TTL_SECONDS
+        )
+        return DEFAULT_CACHE_TTL_SECONDS
+
+
+def _git_dir(repo_root: Path) -> Path:
+    """Resolve the git directory, following a worktree's ``.git`` file."""
+    dot_git = repo_root / ".git"
+    if dot_git.is_file():
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return dot_git
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[len("gitdir:") :].strip())
+            return git_dir if git_dir.is_absolute() else repo_root / git_dir
+    return dot_git
+
+
+def _git_fingerprint(repo_root: Path) -> Tuple[Optional[int], Optional[int]]:
+    """mtimes of .git/HEAD and .git/index; a change invalidates cached checks."""
+    git_dir = _git_dir(repo_root)
+    stamps: List[Optional[int]] = []
+    for name in ("HEAD", "index"):
+        try:
+            stamps.append((git_dir / name).stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return (stamps[0], stamps[1])
+
+
+@dataclass
+class _CacheEntry:
+    """Cached check results for one (repo_root, backend) key."""
+
+    fingerprint: Tuple[Optional[int], Optional[int]]
+    results: Dict[str, Tuple[float, CheckResult]] = field(default_factory=dict)
+
+
+_cache: Dict[Tuple[str, str], _CacheEntry] = {}
+_cache_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_cache_guard = threading.Lock()
+
+
+def _cache_lock(key: Tuple[str, str]) -> threading.Lock:
+    """Per-key lock so concurrent runs against one repo share a single preflight."""
+    with _cache_guard:
+        lock = _cache_locks.get(key)
+        if lock is None:
+            lock = _cache_locks[key] = threading.Lock()
+        return lock
+
+
+def clear_preflight_cache() -> None:
+    """Drop all cached preflight results (tests, or after fixing the environment)."""
+    with _cache_guard:
+        _cache.clear()
+
+
 class PreflightOrchestrator:
     """Unified preflight orchestrator for environment validation.
 
@@ -127,24 +213,32 @@ class PreflightOrchestrator:
     4. check_paths() - RUN_BASE directories exist and writable
     5. check_backend_availability() - SDK/CLI available for selected backend
 
+    The checks are independent and run concurrently. Results of the
+    CACHEABLE_CHECKS are shared across orchestrators through a module-level
+    cache keyed by (repo_root, backend).
+
     Attributes:
         repo_root: Repository root path.
         skip_checks: Set of check names to skip.
+        use_cache: Whether to reuse and store cached check results.
     """
 
     def __init__(
         self,
         repo_root: Optional[Path] = None,
         skip_checks: Optional[List[str]] = None,
+        use_cache: bool = True,
     ):
         """Initialize the preflight orchestrator.
 
         Args:
             repo_root: Repository root path. Defaults to auto-detection.
             skip_checks: List of check names to skip (e.g., ["credentials"]).
+            use_cache: Reuse cached results for run-independent checks.
         """
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
         self._skip_checks = set(skip_checks or [])
+        self._use_cache = use_cache
 
     def _time_check(self, check_fn: Callable[[], CheckResult]) -> CheckResult:
         """Run a check function and measure duration.
@@ -155,8 +249,6 @@ class PreflightOrchestrator:
         Returns:
             CheckResult with duration_ms populated.
         """
-        import time
-
         start = time.perf_counter()
         try:
             result = check_fn()
@@ -626,8 +718,6 @@ class PreflightOrchestrator:
         Returns:
             PreflightResult with aggregate status.
         """
-        import time
-
         start_time = time.perf_counter()
 
         # Determine backend
@@ -641,7 +731,6 @@ class PreflightOrchestrator:
         blocking_issues: List[str] = []
         warnings: List[str] = []
 
-        # Run checks in sequence
         # Note: Using default args to capture variables in lambdas correctly
         check_functions: List[Tuple[str, Callable[[], CheckResult]]] = [
             ("harness", lambda: self.check_harness_health()),
@@ -650,8 +739,18 @@ class PreflightOrchestrator:
             ("paths", lambda r=run_id: self.check_paths(r)),
             ("backend", lambda b=backend: self.check_backend_availability(b)),
         ]
-
-        for check_name, check_fn in check_functions:
+        active = [(name, fn) for name, fn in check_functions if name not in self._skip_checks]
+
+        ttl = cache_ttl_from_env() if self._use_cache else 0.0
+        if ttl > 0:
+            key = (str(self._repo_root.resolve()), backend)
+            # Held across the run so concurrent callers wait for, then reuse, one result
+            with _cache_lock(key):
+                results = self._run_cached(key, ttl, active)
+        else:
+            results = self._run_concurrently(active)
+
+        for check_name, _ in check_functions:
             if check_name in self._skip_checks:
                 checks.append(
                     CheckResult(
@@ -662,7 +761,7 @@ class PreflightOrchestrator:
                 )
                 continue
 
-            result = self._time_check(check_fn)
+            result = results[check_name]
             checks.append(result)
 
             if result.status == CheckStatus.FAILED:
@@ -685,6 +784,63 @@ class PreflightOrchestrator:
             backend=backend,
         )
 
+    def _run_concurrently(
+        self, check_functions: List[Tuple[str, Callable[[], CheckResult]]]
+    ) -> Dict[str, CheckResult]:
+        """Run independent checks on a thread pool, keyed by check name."""
+        if not check_functions:
+            return {}
+        if len(check_functions) == 1:
+            name, fn = check_functions[0]
+            return {name: self._time_check(fn)}
+        with ThreadPoolExecutor(
+            max_workers=len(check_functions), thread_name_prefix="preflight"
+        ) as pool:
+            futures = {name: pool.submit(self._time_check, fn) for name, fn in check_functions}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _run_cached(
+        self,
+        key: Tuple[str, str],
+        ttl: float,
+        check_functions: List[Tuple[str, Callable[[], CheckResult]]],
+    ) -> Dict[str, CheckResult]:
+        """Run checks, reusing fresh cached results for CACHEABLE_CHECKS.
+
+        Must be called with the key's cache lock held.
+        """
+        now = time.monotonic()
+        fingerprint = _git_fingerprint(self._repo_root)
+        with _cache_guard:
+            entry = _cache.get(key)
+        if entry is not None and entry.fingerprint != fingerprint:
+            entry = None
+
+        results: Dict[str, CheckResult] = {}
+        pending: List[Tuple[str, Callable[[], CheckResult]]] = []
+        for name, fn in check_functions:
+            cached = entry.results.get(name) if entry is not None else None
+            if cached is not None and now - cached[0] < ttl:
+                results[name] = replace(cached[1], details=dict(cached[1].details), cached=True)
+            else:
+                pending.append((name, fn))
+
+        fresh = self._run_concurrently(pending)
+        results.update(fresh)
+
+        # git status may refresh the index, so fingerprint after the checks ran
+        fingerprint = _git_fingerprint(self._repo_root)
+        if entry is None or entry.fingerprint != fingerprint:
+            entry = _CacheEntry(fingerprint=fingerprint)
+        stored_at = time.monotonic()
+        for name, result in fresh.items():
+            if name in CACHEABLE_CHECKS and result.status != CheckStatus.FAILED:
+                entry.results[name] = (stored_at, result)
+        with _cache_guard:
+            _cache[key] = entry
+
+        return results
+
 
 def run_preflight(
     run_spec: Optional[Any] = None,
@@ -693,6 +849,7 @@ def run_preflight(
     repo_root: Optional[Path] = None,
     skip_preflight: bool = False,
     skip_checks: Optional[List[str]] = None,
+    use_cache: bool = True,
 ) -> PreflightResult:
     """Convenience entry point for running preflight checks.
 
@@ -703,6 +860,7 @@ def run_preflight(
         repo_root: Optional repository root path.
         skip_preflight: If True, skip all checks and return a passing result.
         skip_checks: List of specific check names to skip.
+        use_cache: Reuse cached results for run-independent checks.
 
     Returns:
         PreflightResult with aggregate status.
@@ -732,7 +890,9 @@ def run_preflight(
             backend=backend,
         )
 
-    orchestrator = PreflightOrchestrator(repo_root=repo_root, skip_checks=skip_checks)
+    orchestrator = PreflightOrchestrator(
+        repo_root=repo_root, skip_checks=skip_checks, use_cache=use_cache
+    )
     return orchestrator.run_all_checks(run_spec, backend, run_id)
 
 
@@ -804,5 +964,6 @@ __all__ = [
     "PreflightResult",
     "PreflightOrchestrator",
     "run_preflight",
+    "clear_preflight_cache",
     "inject_env_doctor_sidequest",
 ]
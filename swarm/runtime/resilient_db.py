@@ -40,6 +40,7 @@ from .db import (
     ToolBreakdown,
     close_stats_db,
 )
+from .db_rebuild import ACTIVE_PHASES, RebuildProgress, default_rebuild_workers
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,7 @@ class DBHealthStatus:
     db_path: Optional[str] = None
     db_exists: bool = False
     needs_rebuild: bool = False
+    rebuild_progress: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -72,6 +74,7 @@ class ResilientDBConfig:
     max_consecutive_errors: int = 5
     rebuild_on_error: bool = True
     runs_dir: Optional[Path] = None
+    rebuild_workers: Optional[int] = None  # None = default_rebuild_workers()
 
 
 class ResilientStatsDB:
@@ -190,7 +193,12 @@ class ResilientStatsDB:
                 }
 
             logger.info("Starting DB rebuild from events.jsonl...")
-            stats = self._db.rebuild_all_from_events(runs_dir=self.config.runs_dir)
+            workers = self.config.rebuild_workers or default_rebuild_workers()
+            stats = self._db.rebuild_all_from_events(
+                runs_dir=self.config.runs_dir,
+                workers=workers,
+                progress_callback=self._on_rebuild_progress,
+            )
 
             self._health.rebuild_count += 1
             self._health.last_rebuild = datetime.now(timezone.utc)
@@ -227,6 +235,16 @@ class ResilientStatsDB:
                 "errors": [{"error": str(e)}],
             }
 
+    def _on_rebuild_progress(self, progress: RebuildProgress) -> None:
+        """Record rebuild progress so health checks can report it."""
+        self._health.rebuild_progress = progress.to_dict()
+
+    @property
+    def rebuild_in_progress(self) -> bool:
+        """True while a rebuild from events.jsonl is running."""
+        progress = self._health.rebuild_progress
+        return progress is not None and progress["phase"] in ACTIVE_PHASES
+
     def check_health(self) -> DBHealthStatus:
         """Check database health and trigger rebuild if needed.
 
@@ -235,9 +253,15 @@ class ResilientStatsDB:
         2. If deleted, triggers auto-rebuild
         3. Updates health status
 
+        While a rebuild is running the current status (including rebuild
+        progress) is returned without waiting for the rebuild to finish.
+
         Returns:
             Current health status.
         """
+        if self.rebuild_in_progress:
+            return self._health
+
         with self._lock:
             try:
                 # Check if DB file was deleted
@@ -552,7 +576,11 @@ def check_db_health() -> DBHealthStatus:
     Returns:
         Current health status.
     """
-    db = get_resilient_db()
+    # During a startup rebuild the global instance exists but initialize()
+    # still holds the global lock; report its progress instead of blocking.
+    db = _global_resilient_db
+    if db is None or not db.rebuild_in_progress:
+        db = get_resilient_db()
     return db.check_health()
 
 
@@ -577,4 +605,7 @@ def db_health_response() -> Dict[str, Any]:
         "last_error": health.last_error,
         "last_check": health.last_check.isoformat() if health.last_check else None,
         "last_rebuild": health.last_rebuild.isoformat() if health.last_rebuild else None,
+        "rebuild_in_progress": health.rebuild_progress is not None
+        and health.rebuild_progress["phase"] in ACTIVE_PHASES,
+        "rebuild_progress": health.rebuild_progress,
     }
@@ -67,7 +67,9 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator as op
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -208,6 +210,11 @@ class EdgeCondition:
     value: Any = None
     expression: Optional[str] = None  # CEL or simple expression
 
+    # Compiled predicate and the (expression, field, operator, value) it was
+    # compiled from, set by CELEvaluator.compile_condition(). Deliberately
+    # unannotated: not a dataclass field, so it stays out of repr/eq.
+    _compiled = None
+
 
 @dataclass
 class Edge:
@@ -270,10 +277,27 @@ class NodeConfig:
         )
 
 
+class _GraphIndex:
+    """Outgoing adjacency for one version of a FlowGraph's edge list."""
+
+    def __init__(self, edges: List[Edge]):
+        self.edges_ref = edges
+        self.edge_count = len(edges)
+        self.outgoing: Dict[str, List[Edge]] = {}
+        for edge in edges:
+            self.outgoing.setdefault(edge.from_node, []).append(edge)
+        self.by_priority: Dict[str, List[Edge]] = {}
+
+
 @dataclass
 class FlowGraph:
     """A flow graph for routing decisions.
 
+    Outgoing adjacency is indexed on first use, so per-step edge lookups do
+    not scan the edge list. Appending to `edges` (e.g. injected edges) is
+    detected and triggers a reindex; any other in-place change needs
+    reindex().
+
     Attributes:
         graph_id: Unique identifier for the graph.
         nodes: Map of node_id to NodeConfig.
@@ -286,9 +310,40 @@ class FlowGraph:
     edges: List[Edge]
     policy: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self._index: Optional[_GraphIndex] = None
+
+    def _get_index(self) -> _GraphIndex:
+        index = self._index
+        if (
+            index is None
+            or index.edges_ref is not self.edges
+            or index.edge_count != len(self.edges)
+        ):
+            index = self._index = _GraphIndex(self.edges)
+        return index
+
+    def reindex(self) -> None:
+        """Rebuild the adjacency index after modifying `edges` in place."""
+        self._index = None
+
     def get_outgoing_edges(self, node_id: str) -> List[Edge]:
         """Get all edges originating from a node."""
-        return [e for e in self.edges if e.from_node == node_id]
+        return list(self._get_index().outgoing.get(node_id, ()))
+
+    def get_outgoing_edges_by_priority(self, node_id: str) -> List[Edge]:
+        """Outgoing edges sorted by priority (higher first), then edge ID."""
+        index = self._get_index()
+        ordered = index.by_priority.get(node_id)
+        if ordered is None:
+            ordered = index.by_priority[node_id] = sorted(
+                index.outgoing.get(node_id, ()), key=lambda e: (-e.priority, e.edge_id)
+            )
+        return list(ordered)
+
+    def has_loop_edges(self, node_id: str) -> bool:
+        """True if any outgoing edge of the node is a loop edge."""
+        return any(e.edge_type == "loop" for e in self._get_index().outgoing.get(node_id, ()))
 
     def get_node(self, node_id: str) -> Optional[NodeConfig]:
         """Get a node by ID."""
@@ -316,6 +371,245 @@ class FlowGraph:
         )
 
 
+# =============================================================================
+# Expression Compiler
+# =============================================================================
+
+# A compiled condition: context -> value. Evaluation errors (e.g. comparing
+# None with a number) raise; CELEvaluator maps them to (False, error).
+Predicate = Callable[[Dict[str, Any]], Any]
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<string>'[^']*'|"[^"]*")
+      | (?P<number>-?\d+(?:\.\d+)?(?![\w.]))
+      | (?P<op>\|\||&&|==|!=|>=|<=|>|<|!|\(|\)|,)
+      | (?P<name>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)
+    )""",
+    re.VERBOSE,
+)
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": op.eq,
+    "!=": op.ne,
+    ">=": op.ge,
+    "<=": op.le,
+    ">": op.gt,
+    "<": op.lt,
+}
+
+_STRING_METHODS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": lambda s, x: x in s,
+    "startsWith": lambda s, x: s.startswith(x),
+    "endsWith": lambda s, x: s.endswith(x),
+    "matches": lambda s, x: _compile_regex(x).search(s) is not None,
+}
+
+_LITERALS: Dict[str, Any] = {"true": True, "false": False, "null": None}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> "re.Pattern[str]":
+    return re.compile(pattern)
+
+
+def _resolve_path(value: Any, parts: Tuple[str, ...]) -> Any:
+    """Walk a dotted field path through dicts and objects (None if missing)."""
+    for part in parts:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif hasattr(value, part):
+            value = getattr(value, part)
+        elif hasattr(value, "get"):
+            value = value.get(part)
+        else:
+            return None
+
+        if value is None:
+            return None
+
+    return value
+
+
+class ExpressionSyntaxError(ValueError):
+    """An edge condition expression could not be parsed."""
+
+
+class _ExpressionParser:
+    """Recursive-descent parser producing closures.
+
+    Grammar (lowest to highest precedence):
+        or         := and ("||" and)*
+        and        := comparison ("&&" comparison)*
+        comparison := unary (("==" | "!=" | ">=" | "<=" | ">" | "<") unary)?
+        unary      := "!" unary | primary
+        primary    := "(" or ")" | literal | path | path "(" args ")"
+    where path "(" args ")" is a string method: contains, startsWith,
+    endsWith or matches (e.g. output.summary.contains('TODO')).
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens: List[Tuple[str, str]] = []
+        pos = 0
+        text = expression.rstrip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if match is None or match.end() == pos:
+                raise ExpressionSyntaxError(f"Unexpected character at {pos}: {text[pos:]!r}")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        self.pos = 0
+
+    def parse(self) -> Predicate:
+        predicate = self._or()
+        if self.pos != len(self.tokens):
+            raise ExpressionSyntaxError(f"Unexpected token {self.tokens[self.pos][1]!r}")
+        return predicate
+
+    def _peek(self) -> Optional[str]:
+        if self.pos < len(self.tokens):
+            kind, text = self.tokens[self.pos]
+            return text if kind == "op" else None
+        return None
+
+    def _take(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ExpressionSyntaxError("Unexpected end of expression")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        if self._peek() != text:
+            raise ExpressionSyntaxError(f"Expected {text!r}")
+        self.pos += 1
+
+    def _or(self) -> Predicate:
+        operands = [self._and()]
+        while self._peek() == "||":
+            self.pos += 1
+            operands.append(self._and())
+        if len(operands) == 1:
+            return operands[0]
+
+        def evaluate_or(ctx: Dict[str, Any]) -> bool:
+            # CEL semantics: a true operand wins over an erroring one
+            error: Optional[Exception] = None
+            for operand in operands:
+                try:
+                    if operand(ctx):
+                        return True
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                raise error
+            return False
+
+        return evaluate_or
+
+    def _and(self) -> Predicate:
+        operands = [self._comparison()]
+        while self._peek() == "&&":
+            self.pos += 1
+            operands.append(self._comparison())
+        if len(operands) == 1:
+            return operands[0]
+
+        def evaluate_and(ctx: Dict[str, Any]) -> bool:
+            # CEL semantics: a false operand wins over an erroring one
+            error: Optional[Exception] = None
+            for operand in operands:
+                try:
+                    if not operand(ctx):
+                        return False
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                raise error
+            return True
+
+        return evaluate_and
+
+    def _comparison(self) -> Predicate:
+        left = self._unary()
+        compare = _COMPARISONS.get(self._peek() or "")
+        if compare is None:
+            return left
+        self.pos += 1
+        right = self._unary()
+        return lambda ctx: compare(left(ctx), right(ctx))
+
+    def _unary(self) -> Predicate:
+        if self._peek() == "!":
+            self.pos += 1
+            operand = self._unary()
+            return lambda ctx: not operand(ctx)
+        return self._primary()
+
+    def _primary(self) -> Predicate:
+        kind, text = self._take()
+        if kind == "op":
+            if text != "(":
+                raise ExpressionSyntaxError(f"Unexpected token {text!r}")
+            inner = self._or()
+            self._expect(")")
+            return inner
+        if kind == "string":
+            literal: Any = text[1:-1]
+            return lambda ctx: literal
+        if kind == "number":
+            literal = float(text) if "." in text else int(text)
+            return lambda ctx: literal
+        if text.lower() in _LITERALS:
+            literal = _LITERALS[text.lower()]
+            return lambda ctx: literal
+
+        parts = tuple(text.split("."))
+        if self._peek() == "(":
+            return self._method_call(parts)
+        return lambda ctx: _resolve_path(ctx, parts)
+
+    def _method_call(self, parts: Tuple[str, ...]) -> Predicate:
+        method = _STRING_METHODS.get(parts[-1])
+        if method is None or len(parts) < 2:
+            raise ExpressionSyntaxError(f"Unknown function {'.'.join(parts)!r}")
+        receiver = parts[:-1]
+        self._expect("(")
+        argument = self._or()
+        self._expect(")")
+
+        def call(ctx: Dict[str, Any]) -> bool:
+            value = _resolve_path(ctx, receiver)
+            return method(value, argument(ctx)) if isinstance(value, str) else False
+
+        return call
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Predicate:
+    """Compile a CEL-like edge condition expression into a predicate.
+
+    Supports comparisons (==, !=, <, >, <=, >=), boolean logic (&&, ||, !)
+    with CEL precedence and parentheses, string/number/boolean/null
+    literals, dotted field access and string methods (contains,
+    startsWith, endsWith, matches). Compiled predicates are cached per
+    expression string.
+
+    Args:
+        expression: e.g. "status == 'VERIFIED' || can_further_iteration_help == false"
+
+    Returns:
+        A predicate taking the evaluation context.
+
+    Raises:
+        ExpressionSyntaxError: If the expression cannot be parsed.
+    """
+    if not expression.strip():
+        raise ExpressionSyntaxError("Empty expression")
+    return _ExpressionParser(expression).parse()
+
+
 # =============================================================================
 # CEL Expression Evaluator (Simple Implementation)
 # =============================================================================
@@ -326,10 +620,14 @@ class CELEvaluator:
 
     Supports a subset of CEL for edge condition evaluation:
     - Comparisons: ==, !=, <, >, <=, >=
-    - Boolean logic: &&, ||, !
-    - String operations: contains, startsWith, endsWith
+    - Boolean logic: &&, ||, ! (with parentheses)
+    - String operations: contains, startsWith, endsWith, matches
     - Field access: status, iteration_count, context.field
 
+    Conditions are compiled once (see compile_expression()) and the
+    predicate is cached on the EdgeCondition, so routing decisions only
+    evaluate closures.
+
     For production use, consider using cel-python or similar library.
     """
 
@@ -344,7 +642,9 @@ class CELEvaluator:
             "lt": lambda a, b: a < b if a is not None and b is not None else False,
             "gte": lambda a, b: a >= b if a is not None and b is not None else False,
             "lte": lambda a, b: a <= b if a is not None and b is not None else False,
-            "matches": lambda a, b: bool(re.search(b, a)) if isinstance(a, str) else False,
+            "matches": lambda a, b: (
+                _compile_regex(b).search(a) is not None if isinstance(a, str) else False
+            ),
         }
 
     def evaluate_condition(
@@ -362,158 +662,63 @@ class CELEvaluator:
             Tuple of (result, error_message or None).
         """
         try:
-            # If there's a CEL expression, evaluate it
-            if condition.expression:
-                return self._evaluate_expression(condition.expression, context)
-
-            # Otherwise, use simple field comparison
-            if condition.field is None:
-                # No condition means always true (unconditional edge)
-                return True, None
-
-            field_value = self._resolve_field(condition.field, context)
-            operator = condition.operator
-            expected_value = condition.value
-
-            if operator not in self._operators:
-                return False, f"Unknown operator: {operator}"
-
-            op_func = self._operators[operator]
-            result = op_func(field_value, expected_value)
-            return result, None
-
+            return bool(self.compile_condition(condition)(context)), None
         except Exception as e:
             logger.debug("Condition evaluation error: %s", e)
             return False, str(e)
 
-    def _resolve_field(self, field_path: str, context: Dict[str, Any]) -> Any:
-        """Resolve a field path in the context.
+    def compile_condition(self, condition: EdgeCondition) -> Predicate:
+        """Get the condition's compiled predicate, compiling it on first use.
 
-        Supports dot notation: 'context.has_errors', 'output.severity'
+        An expression that fails to compile yields a predicate raising the
+        syntax error, so the failure is reported on every evaluation.
         """
-        parts = field_path.split(".")
-        value = context
-
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            elif hasattr(value, part):
-                value = getattr(value, part)
-            elif hasattr(value, "get"):
-                value = value.get(part)
-            else:
-                return None
+        key = (condition.expression, condition.field, condition.operator, condition.value)
+        compiled = condition._compiled
+        if compiled is not None and compiled[0] == key:
+            return compiled[1]
+
+        predicate = self._compile(condition)
+        condition._compiled = (key, predicate)
+        return predicate
+
+    def _compile(self, condition: EdgeCondition) -> Predicate:
+        # If there's a CEL expression, compile it
+        if condition.expression:
+            try:
+                return compile_expression(condition.expression)
+            except ExpressionSyntaxError as e:
+                message = f"Invalid expression: {condition.expression} ({e})"
 
-            if value is None:
-                return None
+                def invalid(ctx: Dict[str, Any]) -> bool:
+                    raise ExpressionSyntaxError(message)
 
-        return value
+                return invalid
 
-    def _evaluate_expression(
-        self,
-        expression: str,
-        context: Dict[str, Any],
-    ) -> Tuple[bool, Optional[str]]:
-        """Evaluate a CEL-like expression.
+        # Otherwise, use simple field comparison
+        if condition.field is None:
+            # No condition means always true (unconditional edge)
+            return lambda ctx: True
 
-        Supports simple expressions like:
-        - status == 'VERIFIED'
-        - iteration_count >= 3
-        - status == 'VERIFIED' || can_further_iteration_help == false
-        """
-        try:
-            # Normalize the expression
-            expr = expression.strip()
-
-            # Handle || (OR) - check if any sub-expression is true
-            if "||" in expr:
-                parts = [p.strip() for p in expr.split("||")]
-                for part in parts:
-                    result, err = self._evaluate_simple_expression(part, context)
-                    if err is None and result:
-                        return True, None
-                return False, None
-
-            # Handle && (AND) - check if all sub-expressions are true
-            if "&&" in expr:
-                parts = [p.strip() for p in expr.split("&&")]
-                for part in parts:
-                    result, err = self._evaluate_simple_expression(part, context)
-                    if err is not None or not result:
-                        return False, err
-                return True, None
-
-            # Simple expression
-            return self._evaluate_simple_expression(expr, context)
+        op_func = self._operators.get(condition.operator)
+        if op_func is None:
+            message = f"Unknown operator: {condition.operator}"
 
-        except Exception as e:
-            return False, str(e)
+            def unknown_operator(ctx: Dict[str, Any]) -> bool:
+                raise ValueError(message)
 
-    def _evaluate_simple_expression(
-        self,
-        expr: str,
-        context: Dict[str, Any],
-    ) -> Tuple[bool, Optional[str]]:
-        """Evaluate a simple comparison expression."""
-        # Supported operators: ==, !=, >=, <=, >, <
-        operators_re = r"(==|!=|>=|<=|>|<)"
-        match = re.split(operators_re, expr)
-
-        if len(match) != 3:
-            return False, f"Invalid expression: {expr}"
-
-        left = match[0].strip()
-        operator = match[1]
-        right = match[2].strip()
-
-        # Resolve left side
-        left_value = self._resolve_value(left, context)
-
-        # Resolve right side
-        right_value = self._resolve_value(right, context)
-
-        # Compare
-        if operator == "==":
-            return left_value == right_value, None
-        elif operator == "!=":
-            return left_value != right_value, None
-        elif operator == ">=":
-            return left_value >= right_value, None
-        elif operator == "<=":
-            return left_value <= right_value, None
-        elif operator == ">":
-            return left_value > right_value, None
-        elif operator == "<":
-            return left_value < right_value, None
-
-        return False, f"Unknown operator: {operator}"
-
-    def _resolve_value(self, value_str: str, context: Dict[str, Any]) -> Any:
-        """Resolve a value from string representation or context."""
-        value_str = value_str.strip()
-
-        # String literal
-        if (value_str.startswith("'") and value_str.endswith("'")) or (
-            value_str.startswith('"') and value_str.endswith('"')
-        ):
-            return value_str[1:-1]
+            return unknown_operator
 
-        # Boolean
-        if value_str.lower() == "true":
-            return True
-        if value_str.lower() == "false":
-            return False
+        parts = tuple(condition.field.split("."))
+        expected_value = condition.value
+        return lambda ctx: op_func(_resolve_path(ctx, parts), expected_value)
 
-        # Numeric
-        try:
-            if "." in value_str:
-                return float(value_str)
-            return int(value_str)
-        except ValueError:
-            pass
+    def _resolve_field(self, field_path: str, context: Dict[str, Any]) -> Any:
+        """Resolve a field path in the context.
 
-        # Context field
-        return self._resolve_field(value_str, context)
+        Supports dot notation: 'context.has_errors', 'output.severity'
+        """
+        return _resolve_path(context, tuple(field_path.split(".")))
 
 
 # =============================================================================
@@ -829,8 +1034,7 @@ class SmartRouter:
                 )
 
         # Increment iteration count for loop edges
-        loop_edges = [e for e in edges if e.edge_type == "loop"]
-        if loop_edges:
+        if graph.has_loop_edges(current_node):
             context.increment_iteration(current_node)
 
         return None
@@ -1225,9 +1429,8 @@ class StepRouter:
         Returns:
             List of edges originating from the node, sorted by priority.
         """
-        edges = flow_graph.get_outgoing_edges(node_id)
-        # Sort by priority (higher first) for deterministic ordering
-        return sorted(edges, key=lambda e: (-e.priority, e.edge_id))
+        # Sorted by priority (higher first) for deterministic ordering
+        return flow_graph.get_outgoing_edges_by_priority(node_id)
 
     def filter_exit_conditions(
         self,
@@ -0,0 +1,627 @@
+"""
+run_catalog.py - Indexed catalog of runs for listing without directory scans.
+
+Listing runs used to walk runs/ and examples/ and parse every meta.json on
+each request. The catalog keeps one row per run in a SQLite database next
+to the runs, so listings become an indexed query:
+- storage.write_summary() (and update_summary(), which calls it) upserts the
+  run's row with the summary it just wrote
+- reconcile() stats every run directory and re-reads only those whose
+  directory or metadata mtime differs from the stored row; rows for removed
+  directories are dropped. It runs on first use, whenever the runs/ or
+  examples/ directory mtime changes (a run directory was created or deleted)
+  and after a failed upsert
+- query() filters by status, flow key and tags, sorts by created_at, status
+  or flow_key, and pages with an opaque keyset cursor (or a plain offset)
+
+Layout (default: <runs_dir>/.run_catalog.db):
+    runs(kind, run_id, ...)      one row per run; kind is "run" or "example"
+    run_tags(kind, run_id, tag)  tag index for filtering
+    run_flows(kind, run_id, flow_key)
+
+Design Philosophy:
+    - The directories stay the source of truth; the database can be deleted
+      at any time and is rebuilt by the next reconcile()
+    - Ordering matches RunService.list_runs(): examples first, then the
+      requested sort. An example shadows an active run with the same ID
+    - Catalog upkeep never fails a storage write: hook errors are logged
+
+Usage:
+    from swarm.runtime.run_catalog import get_run_catalog
+
+    catalog = get_run_catalog(runs_dir, examples_dir)
+    page = catalog.query(status="failed", tags=["nightly"], limit=50)
+    next_page = catalog.query(status="failed", tags=["nightly"], limit=50,
+                              cursor=page.next_cursor)
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .types import (
+    RunId,
+    RunSpec,
+    RunStatus,
+    RunSummary,
+    SDLCStatus,
+    run_summary_from_dict,
+    run_summary_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+# Catalog database file inside a runs directory
+CATALOG_FILE = ".run_catalog.db"
+
+# Bump when the row layout changes; older databases are rebuilt
+CATALOG_VERSION = 1
+
+# Mtimes this close to "now" are not trusted to catch a later change in the
+# same timestamp tick; such rows and roots are re-checked on the next pass
+RACY_WINDOW_NS = 2_000_000_000
+
+# Known flow keys that mark a directory as a run without meta.json
+LEGACY_FLOW_KEYS = ("signal", "plan", "build", "gate", "deploy", "wisdom")
+
+# query() sort keys mapped to their column
+SORT_COLUMNS = {
+    "created_at": "created_ts",
+    "status": "status",
+    "flow_key": "flow_key",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    kind TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    grp INTEGER NOT NULL,
+    has_meta INTEGER NOT NULL,
+    created_ts REAL NOT NULL,
+    status TEXT NOT NULL,
+    flow_key TEXT NOT NULL,
+    dir_mtime_ns INTEGER NOT NULL,
+    meta_mtime_ns INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (kind, run_id)
+);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (grp, created_ts, run_id);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, grp, created_ts);
+CREATE INDEX IF NOT EXISTS runs_flow ON runs (grp, flow_key, run_id);
+CREATE TABLE IF NOT EXISTS run_tags (
+    kind TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (kind, run_id, tag)
+);
+CREATE INDEX IF NOT EXISTS run_tags_tag ON run_tags (tag);
+CREATE TABLE IF NOT EXISTS run_flows (
+    kind TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    flow_key TEXT NOT NULL,
+    PRIMARY KEY (kind, run_id, flow_key)
+);
+CREATE INDEX IF NOT EXISTS run_flows_flow ON run_flows (flow_key);
+"""
+
+
+@dataclass
+class RunPage:
+    """One page of a catalog query.
+
+    Attributes:
+        runs: Summaries on this page, in query order.
+        total: Number of runs matching the filters (all pages).
+        next_cursor: Cursor for the following page, None on the last page.
+    """
+
+    runs: List[RunSummary] = field(default_factory=list)
+    total: int = 0
+    next_cursor: Optional[str] = None
+
+
+# -----------------------------------------------------------------------------
+# Summaries from disk
+# -----------------------------------------------------------------------------
+
+
+def build_legacy_summary(
+    run_id: RunId,
+    run_path: Path,
+    is_example: bool = False,
+) -> Optional[RunSummary]:
+    """Create a summary for a run directory without meta.json.
+
+    Flow keys come from the flow subdirectories present, timestamps from the
+    directory mtime, and title/description/extra tags from an optional
+    old-style run.json.
+
+    Args:
+        run_id: The run identifier.
+        run_path: The run directory.
+        is_example: Whether this is a curated example run.
+
+    Returns:
+        RunSummary if the directory has flow artifacts, None otherwise.
+    """
+    if not run_path.exists():
+        return None
+
+    flow_keys = [key for key in LEGACY_FLOW_KEYS if (run_path / key).exists()]
+    if not flow_keys:
+        return None
+
+    # Use directory mtime as creation time
+    try:
+        created_at = datetime.fromtimestamp(run_path.stat().st_mtime, tz=timezone.utc)
+    except Exception:
+        created_at = datetime.now(timezone.utc)
+
+    # Build tags based on run type
+    tags = ["example"] if is_example else ["legacy"]
+
+    # Check for run.json metadata (old-style)
+    run_json_path = run_path / "run.json"
+    title = None
+    description = None
+    if run_json_path.exists():
+        try:
+            with open(run_json_path) as f:
+                meta = json.load(f)
+            title = meta.get("title")
+            description = meta.get("description")
+            tags.extend(meta.get("tags", []))
+        except Exception as e:
+            logger.warning("Failed to read legacy run metadata for %s: %s", run_id, e)
+
+    return RunSummary(
+        id=run_id,
+        spec=RunSpec(
+            flow_keys=flow_keys,
+            profile_id=None,
+            backend="claude-harness",
+            initiator="example" if is_example else "legacy",
+        ),
+        status=RunStatus.SUCCEEDED,  # Assume completed
+        sdlc_status=SDLCStatus.UNKNOWN,
+        created_at=created_at,
+        updated_at=created_at,
+        completed_at=created_at,
+        tags=tags,
+        title=title,
+        path=str(run_path),
+        description=description,
+    )
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _meta_mtime_ns(run_path: Path) -> int:
+    """Latest mtime of the run's metadata files (meta.json, run.json)."""
+    return max(_mtime_ns(run_path / "meta.json"), _mtime_ns(run_path / "run.json"))
+
+
+def _is_racy(*mtimes_ns: int) -> bool:
+    return time.time_ns() - max(mtimes_ns) < RACY_WINDOW_NS
+
+
+def catalog_enabled() -> bool:
+    """Whether the run catalog is in use (SWARM_RUN_CATALOG, default on)."""
+    return os.environ.get("SWARM_RUN_CATALOG", "1").lower() not in ("0", "false", "off")
+
+
+# -----------------------------------------------------------------------------
+# Connections
+# -----------------------------------------------------------------------------
+
+
+class _Database:
+    """A SQLite connection shared by all threads, guarded by a lock."""
+
+    def __init__(self, db_path: Path):
+        self.path = db_path
+        self.lock = threading.RLock()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=10.0, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            row = self.conn.execute(
+                "SELECT value FROM catalog_meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or int(row[0]) != CATALOG_VERSION:
+                for table in ("runs", "run_tags", "run_flows"):
+                    self.conn.execute(f"DELETE FROM {table}")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('version', ?)",
+                    (str(CATALOG_VERSION),),
+                )
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+_databases: Dict[Path, _Database] = {}
+_databases_lock = threading.Lock()
+
+
+def _get_database(runs_dir: Path) -> _Database:
+    db_path = Path(runs_dir).resolve() / CATALOG_FILE
+    with _databases_lock:
+        db = _databases.get(db_path)
+        if db is None:
+            db = _Database(db_path)
+            _databases[db_path] = db
+        return db
+
+
+def _upsert(
+    conn: sqlite3.Connection,
+    kind: str,
+    summary: RunSummary,
+    has_meta: bool,
+    dir_mtime_ns: int,
+    meta_mtime_ns: int,
+) -> None:
+    key = (kind, summary.id)
+    conn.execute(
+        "INSERT OR REPLACE INTO runs (kind, run_id, grp, has_meta, created_ts, status, "
+        "flow_key, dir_mtime_ns, meta_mtime_ns, summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            kind,
+            summary.id,
+            0 if "example" in summary.tags else 1,
+            int(has_meta),
+            summary.created_at.timestamp(),
+            summary.status.value,
+            summary.spec.flow_keys[0] if summary.spec.flow_keys else "",
+            dir_mtime_ns,
+            meta_mtime_ns,
+            json.dumps(run_summary_to_dict(summary)),
+        ),
+    )
+    conn.execute("DELETE FROM run_tags WHERE kind = ? AND run_id = ?", key)
+    conn.execute("DELETE FROM run_flows WHERE kind = ? AND run_id = ?", key)
+    conn.executemany(
+        "INSERT OR IGNORE INTO run_tags (kind, run_id, tag) VALUES (?, ?, ?)",
+        [(*key, tag) for tag in summary.tags],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO run_flows (kind, run_id, flow_key) VALUES (?, ?, ?)",
+        [(*key, flow_key) for flow_key in summary.spec.flow_keys],
+    )
+
+
+def _row_mtimes(run_path: Path, dir_mtime_ns: Optional[int] = None) -> Tuple[int, int]:
+    """(dir, metadata) mtimes to store for a row; 0 forces a re-read if racy."""
+    if dir_mtime_ns is None:
+        dir_mtime_ns = _mtime_ns(run_path)
+    mtimes = (dir_mtime_ns, _meta_mtime_ns(run_path))
+    return (0, 0) if _is_racy(*mtimes) else mtimes
+
+
+def _delete(conn: sqlite3.Connection, keys: Iterable[Tuple[str, str]]) -> None:
+    keys = list(keys)
+    for table in ("runs", "run_tags", "run_flows"):
+        conn.executemany(f"DELETE FROM {table} WHERE kind = ? AND run_id = ?", keys)
+
+
+def record_summary(run_id: RunId, summary: RunSummary, runs_dir: Path) -> None:
+    """Upsert a run's row after its meta.json was written.
+
+    Called by storage.write_summary(). Errors are logged, not raised: the
+    catalogs of runs_dir are invalidated so the next query reconciles, and
+    that reconcile repairs the row because its stored mtimes no longer
+    match the directory.
+    """
+    run_path = Path(runs_dir) / run_id
+    try:
+        db = _get_database(runs_dir)
+        with db.lock, db.conn:
+            _upsert(db.conn, "run", summary, True, *_row_mtimes(run_path))
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Run catalog update failed for %s: %s", run_id, e)
+        _invalidate_catalogs(runs_dir)
+
+
+# -----------------------------------------------------------------------------
+# Cursor encoding
+# -----------------------------------------------------------------------------
+
+
+def _encode_cursor(sort_by: str, descending: bool, row: Sequence[Any]) -> str:
+    grp, value, run_id = row
+    raw = json.dumps([sort_by, descending, grp, value, run_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, descending: bool) -> Tuple[int, Any, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        c_sort, c_desc, grp, value, run_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if c_sort != sort_by or c_desc != descending:
+        raise ValueError("Cursor was issued for a different sort order")
+    return int(grp), value, str(run_id)
+
+
+# -----------------------------------------------------------------------------
+# Catalog
+# -----------------------------------------------------------------------------
+
+
+class RunCatalog:
+    """Catalog of the runs in one runs directory plus an examples directory.
+
+    Use get_run_catalog() to obtain the shared instance. Thread-safe.
+    """
+
+    def __init__(self, runs_dir: Path, examples_dir: Optional[Path] = None):
+        """Initialize the catalog. The database is opened lazily.
+
+        Args:
+            runs_dir: Directory holding run directories (and the database).
+            examples_dir: Directory of curated example runs (optional).
+        """
+        self.runs_dir = Path(runs_dir)
+        self.examples_dir = Path(examples_dir) if examples_dir else None
+        self._lock = threading.Lock()
+        self._reconciled_at: Optional[Tuple[int, int]] = None
+
+    def invalidate(self) -> None:
+        """Make the next query reconcile even if no root mtime changed."""
+        with self._lock:
+            self._reconciled_at = None
+
+    def _roots(self) -> List[Tuple[str, Path]]:
+        roots = [("run", self.runs_dir)]
+        if self.examples_dir is not None:
+            roots.append(("example", self.examples_dir))
+        return roots
+
+    def _root_mtimes(self) -> Tuple[int, int]:
+        return _mtime_ns(self.runs_dir), (
+            _mtime_ns(self.examples_dir) if self.examples_dir else 0
+        )
+
+    def reconcile(self, force: bool = False) -> int:
+        """Bring the catalog in line with the run directories.
+
+        Skipped when the runs/ and examples/ directory mtimes are unchanged
+        since the last reconcile, unless force is set.
+
+        Returns:
+            Number of rows inserted, updated or removed.
+        """
+        with self._lock:
+            root_mtimes = self._root_mtimes()
+            if not force and self._reconciled_at == root_mtimes:
+                return 0
+
+            db = _get_database(self.runs_dir)
+            with db.lock:
+                stored = {
+                    (kind, run_id): (dir_ns, meta_ns)
+                    for kind, run_id, dir_ns, meta_ns in db.conn.execute(
+                        "SELECT kind, run_id, dir_mtime_ns, meta_mtime_ns FROM runs"
+                    )
+                }
+
+            changed = 0
+            seen: set[Tuple[str, str]] = set()
+            scanned: set[str] = set()
+            with db.lock, db.conn:
+                for kind, root in self._roots():
+                    # The database is shared by every catalog of runs_dir;
+                    # rows of a kind this catalog does not scan are kept
+                    scanned.add(kind)
+                    if not root.is_dir():
+                        continue
+                    for entry in os.scandir(root):
+                        if entry.name.startswith(".") or not entry.is_dir():
+                            continue
+                        key = (kind, entry.name)
+                        run_path = Path(entry.path)
+                        mtimes = (entry.stat().st_mtime_ns, _meta_mtime_ns(run_path))
+                        if stored.get(key) == mtimes:
+                            seen.add(key)
+                            continue
+                        summary, has_meta = self._load_summary(kind, entry.name, run_path)
+                        if summary is None:
+                            continue
+                        _upsert(
+                            db.conn,
+                            kind,
+                            summary,
+                            has_meta,
+                            *_row_mtimes(run_path, dir_mtime_ns=mtimes[0]),
+                        )
+                        seen.add(key)
+                        changed += 1
+
+                removed = [key for key in stored if key[0] in scanned and key not in seen]
+                _delete(db.conn, removed)
+                changed += len(removed)
+
+            # A root changed in the current tick could change again unnoticed
+            self._reconciled_at = None if _is_racy(*root_mtimes) else root_mtimes
+            if changed:
+                logger.debug("Run catalog reconciled %d rows in %s", changed, self.runs_dir)
+            return changed
+
+    def _load_summary(
+        self, kind: str, run_id: RunId, run_path: Path
+    ) -> Tuple[Optional[RunSummary], bool]:
+        """Read a run's summary from disk: meta.json, else legacy detection."""
+        if kind == "run" and (run_path / "meta.json").exists():
+            from .storage import read_summary
+
+            return read_summary(run_id, self.runs_dir), True
+        return build_legacy_summary(run_id, run_path, is_example=(kind == "example")), False
+
+    def query(
+        self,
+        flow_key: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[Sequence[str]] = None,
+        include_legacy: bool = True,
+        include_examples: bool = True,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> RunPage:
+        """List runs matching the filters, one page at a time.
+
+        Examples always come first, then runs in the requested order, with
+        the run ID as a tie-breaker.
+
+        Args:
+            flow_key: Only runs that include this flow.
+            status: Only runs with this RunStatus value.
+            tags: Only runs carrying all of these tags.
+            include_legacy: Include runs without meta.json.
+            include_examples: Include curated example runs.
+            sort_by: "created_at", "status" or "flow_key" (first flow).
+            descending: Sort direction for sort_by.
+            limit: Page size (None for all matching runs).
+            offset: Rows to skip; ignored when a cursor is given.
+            cursor: next_cursor from the previous page.
+
+        Returns:
+            RunPage with the summaries, total match count and next cursor.
+
+        Raises:
+            ValueError: If sort_by is unknown or the cursor is invalid.
+        """
+        column = SORT_COLUMNS.get(sort_by)
+        if column is None:
+            raise ValueError(f"Unknown sort key {sort_by!r}; expected one of {sorted(SORT_COLUMNS)}")
+
+        self.reconcile()
+
+        where: List[str] = []
+        params: List[Any] = []
+        if include_examples:
+            # An example shadows an active run with the same ID
+            where.append(
+                "(kind = 'example' OR run_id NOT IN (SELECT run_id FROM runs WHERE kind = 'example'))"
+            )
+        else:
+            where.append("kind = 'run'")
+        if not include_legacy:
+            where.append("(has_meta = 1 OR kind = 'example')")
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if flow_key is not None:
+            where.append(
+                "EXISTS (SELECT 1 FROM run_flows f WHERE f.kind = runs.kind "
+                "AND f.run_id = runs.run_id AND f.flow_key = ?)"
+            )
+            params.append(flow_key)
+        for tag in tags or ():
+            where.append(
+                "EXISTS (SELECT 1 FROM run_tags t WHERE t.kind = runs.kind "
+                "AND t.run_id = runs.run_id AND t.tag = ?)"
+            )
+            params.append(tag)
+
+        filters = " AND ".join(where)
+        page_where = filters
+        page_params = list(params)
+        if cursor is not None:
+            grp, value, run_id = _decode_cursor(cursor, sort_by, descending)
+            op = "<" if descending else ">"
+            page_where += (
+                f" AND (grp > ? OR (grp = ? AND ({column} {op} ? "
+                f"OR ({column} = ? AND run_id {op} ?))))"
+            )
+            page_params += [grp, grp, value, value, run_id]
+
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT grp, {column}, run_id, summary FROM runs WHERE {page_where} "
+            f"ORDER BY grp ASC, {column} {direction}, run_id {direction}"
+        )
+        if limit is not None:
+            # One extra row tells whether there is a next page
+            sql += " LIMIT ?"
+            page_params.append(limit + 1)
+            if cursor is None and offset:
+                sql += " OFFSET ?"
+                page_params.append(offset)
+
+        db = _get_database(self.runs_dir)
+        with db.lock:
+            total = db.conn.execute(f"SELECT COUNT(*) FROM runs WHERE {filters}", params).fetchone()[0]
+            rows = db.conn.execute(sql, page_params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(sort_by, descending, rows[-1][:3])
+
+        return RunPage(
+            runs=[run_summary_from_dict(json.loads(row[3])) for row in rows],
+            total=total,
+            next_cursor=next_cursor,
+        )
+
+
+_catalogs: Dict[Tuple[Path, Optional[Path]], RunCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_run_catalog(runs_dir: Path, examples_dir: Optional[Path] = None) -> RunCatalog:
+    """Return the shared RunCatalog for a runs directory and examples directory."""
+    key = (Path(runs_dir).resolve(), Path(examples_dir).resolve() if examples_dir else None)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = RunCatalog(*key)
+            _catalogs[key] = catalog
+        return catalog
+
+
+def _invalidate_catalogs(runs_dir: Path) -> None:
+    """Invalidate every shared catalog of a runs directory."""
+    resolved = Path(runs_dir).resolve()
+    with _catalogs_lock:
+        catalogs = [c for (root, _), c in _catalogs.items() if root == resolved]
+    for catalog in catalogs:
+        catalog.invalidate()
+
+
+def close_run_catalogs() -> None:
+    """Close all catalog connections and forget cached catalogs (for tests)."""
+    with _catalogs_lock:
+        _catalogs.clear()
+    with _databases_lock:
+        databases = list(_databases.values())
+        _databases.clear()
+    for db in databases:
+        db.close()
@@ -0,0 +1,370 @@
+"""
+run_scheduler.py - Bounded admission scheduler for backend runs.
+
+Backends used to start one daemon thread per run with no global limit, so a
+burst of /api/run calls could fork dozens of concurrent CLI processes. The
+scheduler admits runs into a bounded number of execution slots:
+- At most max_workers runs execute at once (SWARM_RUN_WORKERS, default 4;
+  0 disables the bound and restores thread-per-run behaviour)
+- Each backend may have its own, lower limit
+  (SWARM_RUN_BACKEND_LIMITS="claude-harness=2,gemini-cli=1")
+- Runs that cannot be admitted wait in a priority queue. Interactive runs are
+  admitted before autopilot runs; within a class, first come first served
+- A run whose backend is at its limit does not block queued runs for other
+  backends
+
+Design Philosophy:
+    - Storage-agnostic: the scheduler only runs callables. Backends write the
+      queued status through the on_queued callback, which is invoked under
+      the scheduler lock so the run cannot start before it is recorded
+    - One scheduler per process: get_backend() builds fresh backend
+      instances, so limits must live outside them
+    - A failing run never leaks its slot: the slot is released in a finally
+      block and the next queued run is admitted
+
+Usage:
+    from swarm.runtime.run_scheduler import get_run_scheduler
+
+    scheduler = get_run_scheduler()
+    queued = scheduler.submit(run_id, "claude-harness", execute,
+                              priority="interactive")
+    scheduler.stats().queued          # observable queue depth
+    scheduler.cancel(run_id)          # drop a run that has not started
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .types import RunId, RunSpec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_AUTOPILOT = "autopilot"
+
+# Lower rank is admitted first
+PRIORITY_RANKS: Dict[str, int] = {
+    PRIORITY_INTERACTIVE: 0,
+    PRIORITY_AUTOPILOT: 1,
+}
+
+
+def max_workers_from_env() -> Optional[int]:
+    """Global slot count from SWARM_RUN_WORKERS (None means unbounded)."""
+    raw = os.environ.get("SWARM_RUN_WORKERS", "")
+    if not raw:
+        return DEFAULT_MAX_WORKERS
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid SWARM_RUN_WORKERS=%r", raw)
+        return DEFAULT_MAX_WORKERS
+    return value if value > 0 else None
+
+
+def backend_limits_from_env() -> Dict[str, int]:
+    """Per-backend limits from SWARM_RUN_BACKEND_LIMITS ("id=n,id=n")."""
+    limits: Dict[str, int] = {}
+    raw = os.environ.get("SWARM_RUN_BACKEND_LIMITS", "")
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        backend_id, _, value = item.partition("=")
+        try:
+            limits[backend_id.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid backend limit %r", item)
+    return limits
+
+
+def run_priority(spec: RunSpec) -> str:
+    """Priority class for a run spec.
+
+    Autopilot runs (no human waiting on the result) yield to interactive
+    ones. An explicit params["priority"] wins over the inferred class.
+    """
+    explicit = spec.params.get("priority") if spec.params else None
+    if explicit in PRIORITY_RANKS:
+        return explicit
+    if spec.no_human_mid_flow or (spec.params or {}).get("autopilot"):
+        return PRIORITY_AUTOPILOT
+    return PRIORITY_INTERACTIVE
+
+
+@dataclass
+class SchedulerStats:
+    """Point-in-time view of the scheduler.
+
+    Attributes:
+        max_workers: Global slot count (None when unbounded).
+        running: Number of runs currently executing.
+        queued: Number of runs waiting for a slot.
+        running_by_backend: Executing runs per backend ID.
+        queued_by_backend: Waiting runs per backend ID.
+        queued_by_priority: Waiting runs per priority class.
+        backend_limits: Configured per-backend limits.
+        oldest_queued_s: Seconds the longest-waiting run has been queued.
+    """
+
+    max_workers: Optional[int]
+    running: int
+    queued: int
+    running_by_backend: Dict[str, int] = field(default_factory=dict)
+    queued_by_backend: Dict[str, int] = field(default_factory=dict)
+    queued_by_priority: Dict[str, int] = field(default_factory=dict)
+    backend_limits: Dict[str, int] = field(default_factory=dict)
+    oldest_queued_s: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "running": self.running,
+            "queued": self.queued,
+            "running_by_backend": dict(self.running_by_backend),
+            "queued_by_backend": dict(self.queued_by_backend),
+            "queued_by_priority": dict(self.queued_by_priority),
+            "backend_limits": dict(self.backend_limits),
+            "oldest_queued_s": round(self.oldest_queued_s, 3),
+        }
+
+
+@dataclass
+class _QueuedRun:
+    run_id: RunId
+    backend_id: str
+    priority: str
+    target: Callable[[], None]
+    enqueued_at: float
+
+
+class RunScheduler:
+    """Admits runs into a bounded set of execution slots.
+
+    Args:
+        max_workers: Maximum concurrently executing runs; None is unbounded.
+        backend_limits: Optional per-backend maximums.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = DEFAULT_MAX_WORKERS,
+        backend_limits: Optional[Dict[str, int]] = None,
+    ):
+        self._max_workers = max_workers
+        self._backend_limits = dict(backend_limits or {})
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._seq = itertools.count()
+        self._heap: List[Tuple[int, int, RunId]] = []
+        self._queued: Dict[RunId, _QueuedRun] = {}
+        self._running: Dict[RunId, str] = {}
+        self._running_by_backend: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "RunScheduler":
+        return cls(max_workers_from_env(), backend_limits_from_env())
+
+    # -------------------------------------------------------------------------
+    # Submission
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        run_id: RunId,
+        backend_id: str,
+        target: Callable[[], None],
+        priority: str = PRIORITY_INTERACTIVE,
+        on_queued: Optional[Callable[[int], None]] = None,
+    ) -> bool:
+        """Start target now if a slot is free, otherwise queue it.
+
+        Args:
+            run_id: Run being submitted.
+            backend_id: Backend that executes the run (for per-backend limits).
+            target: Callable that executes the run to completion.
+            priority: Priority class ("interactive" or "autopilot").
+            on_queued: Called with the 1-based queue position when the run
+                has to wait. It runs under the scheduler lock, before the run
+                can possibly be admitted.
+
+        Returns:
+            True if the run was queued, False if it started immediately.
+        """
+        if priority not in PRIORITY_RANKS:
+            raise ValueError(
+                f"Unknown priority {priority!r}; expected one of {sorted(PRIORITY_RANKS)}"
+            )
+
+        with self._lock:
+            if run_id in self._queued or run_id in self._running:
+                raise ValueError(f"Run {run_id} is already scheduled")
+
+            # Queued runs are all blocked on a limit (every release dispatches),
+            # so a free slot for this backend means nothing eligible waits ahead
+            if self._has_slot(backend_id):
+                self._start_locked(run_id, backend_id, target)
+                return False
+
+            entry = _QueuedRun(run_id, backend_id, priority, target, time.monotonic())
+            self._queued[run_id] = entry
+            heapq.heappush(self._heap, (PRIORITY_RANKS[priority], next(self._seq), run_id))
+            if on_queued is not None:
+                try:
+                    on_queued(self._position_locked(run_id))
+                except Exception:
+                    logger.exception("on_queued callback failed for run %s", run_id)
+            logger.info(
+                "Run %s queued (%s, backend=%s, depth=%d)",
+                run_id, priority, backend_id, len(self._queued),
+            )
+            return True
+
+    def cancel(self, run_id: RunId) -> bool:
+        """Remove a run that is still waiting. Returns True if it was queued."""
+        with self._lock:
+            entry = self._queued.pop(run_id, None)
+            if entry is None:
+                return False
+            # The heap entry is skipped lazily at dispatch time
+            self._idle.notify_all()
+            return True
+
+    # -------------------------------------------------------------------------
+    # Introspection
+    # -------------------------------------------------------------------------
+
+    def is_queued(self, run_id: RunId) -> bool:
+        with self._lock:
+            return run_id in self._queued
+
+    def is_running(self, run_id: RunId) -> bool:
+        with self._lock:
+            return run_id in self._running
+
+    def queue_position(self, run_id: RunId) -> Optional[int]:
+        """1-based admission order among queued runs, or None."""
+        with self._lock:
+            if run_id not in self._queued:
+                return None
+            return self._position_locked(run_id)
+
+    def stats(self) -> SchedulerStats:
+        with self._lock:
+            queued_by_backend: Dict[str, int] = {}
+            queued_by_priority: Dict[str, int] = {p: 0 for p in PRIORITY_RANKS}
+            now = time.monotonic()
+            oldest = 0.0
+            for entry in self._queued.values():
+                queued_by_backend[entry.backend_id] = queued_by_backend.get(entry.backend_id, 0) + 1
+                queued_by_priority[entry.priority] += 1
+                oldest = max(oldest, now - entry.enqueued_at)
+            return SchedulerStats(
+                max_workers=self._max_workers,
+                running=len(self._running),
+                queued=len(self._queued),
+                running_by_backend={k: v for k, v in self._running_by_backend.items() if v},
+                queued_by_backend=queued_by_backend,
+                queued_by_priority=queued_by_priority,
+                backend_limits=dict(self._backend_limits),
+                oldest_queued_s=oldest,
+            )
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is running or queued. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._running or self._queued:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
+
+    # -------------------------------------------------------------------------
+    # Internals (call with self._lock held)
+    # -------------------------------------------------------------------------
+
+    def _has_slot(self, backend_id: str) -> bool:
+        if self._max_workers is not None and len(self._running) >= self._max_workers:
+            return False
+        limit = self._backend_limits.get(backend_id)
+        return limit is None or self._running_by_backend.get(backend_id, 0) < limit
+
+    def _position_locked(self, run_id: RunId) -> int:
+        order = sorted(item for item in self._heap if item[2] in self._queued)
+        return next(i for i, item in enumerate(order, 1) if item[2] == run_id)
+
+    def _start_locked(self, run_id: RunId, backend_id: str, target: Callable[[], None]) -> None:
+        self._running[run_id] = backend_id
+        self._running_by_backend[backend_id] = self._running_by_backend.get(backend_id, 0) + 1
+        thread = threading.Thread(
+            target=self._run_slot,
+            args=(run_id, backend_id, target),
+            name=f"run-{run_id}",
+            daemon=True,
+        )
+        thread.start()
+
+    def _dispatch_locked(self) -> None:
+        skipped: List[Tuple[int, int, RunId]] = []
+        while self._heap:
+            if self._max_workers is not None and len(self._running) >= self._max_workers:
+                break
+            item = heapq.heappop(self._heap)
+            entry = self._queued.get(item[2])
+            if entry is None:
+                continue  # canceled while queued
+            if not self._has_slot(entry.backend_id):
+                skipped.append(item)
+                continue
+            del self._queued[entry.run_id]
+            self._start_locked(entry.run_id, entry.backend_id, entry.target)
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+
+    def _run_slot(self, run_id: RunId, backend_id: str, target: Callable[[], None]) -> None:
+        try:
+            target()
+        except Exception:
+            logger.exception("Run %s failed in scheduler slot", run_id)
+        finally:
+            with self._lock:
+                self._running.pop(run_id, None)
+                self._running_by_backend[backend_id] -= 1
+                self._dispatch_locked()
+                self._idle.notify_all()
+
+
+# Process-wide scheduler shared by every backend instance
+_scheduler: Optional[RunScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_run_scheduler() -> RunScheduler:
+    """Return the process-wide scheduler, configured from the environment."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RunScheduler.from_env()
+        return _scheduler
+
+
+def reset_run_scheduler() -> None:
+    """Drop the process-wide scheduler so the next call re-reads the environment.
+
+    Runs already admitted keep executing; queued runs are abandoned.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
@@ -0,0 +1,376 @@
+"""
+run_state_journal.py - Snapshot + append-only journal for run_state.json.
+
+Rewriting the whole of run_state.json (including every handoff envelope)
+on each completed step makes per-step write cost grow with run length.
+This module splits the durable run state into two files:
+- run_state.json: a compacted snapshot. Envelopes that live in their own
+  <flow>/handoff/<step_id>.json file are stored by reference
+  ({"$ref": "build/handoff/3.json"}) instead of inline
+- run_state.journal.jsonl: one small delta record per update, appended
+  and fsync'd; replayed on top of the snapshot when reading
+
+Every COMPACT_EVERY records (or when the run status changes) the
+materialized state is written as a new snapshot and the journal truncated.
+Between compactions run_state.json alone is stale and holds envelope
+references, so it is internal to this module: readers go through
+storage.read_run_state() or storage.read_run_state_data().
+
+Design Philosophy:
+    - Each snapshot carries a generation number and every journal record
+      the generation it applies to. A new snapshot bumps the generation, so
+      a crash between writing the snapshot and truncating the journal
+      leaves only stale records, which replay ignores
+    - A crash mid-append leaves at most a partial trailing line. Replay
+      never consumes it and the next append truncates it first
+    - Step completion still writes the envelope file before the journal
+      record that references it, so the envelope-first recovery of
+      read_run_state() keeps working
+    - The materialized state is cached and only the journal tail written
+      since the last read is replayed; stat changes (another process
+      compacting or rewriting) trigger a full reload
+
+Configuration:
+    SWARM_RUN_STATE_COMPACT_EVERY  journal records between snapshots (default 64)
+
+Usage:
+    from swarm.runtime.run_state_journal import RunStateJournal
+
+    journal = RunStateJournal(run_path)
+    journal.append({"updates": {"step_index": 3}})
+    data = journal.load()  # run_state_to_dict()-shaped dict, or None
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .types import (
+    handoff_envelope_from_dict,
+    handoff_envelope_to_dict,
+    run_state_from_dict,
+    run_state_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+RUN_STATE_FILE = "run_state.json"
+JOURNAL_FILE = "run_state.journal.jsonl"
+
+# Key of an envelope stored by reference in the snapshot
+ENVELOPE_REF_KEY = "$ref"
+
+# Snapshot key holding journal bookkeeping (ignored by run_state_from_dict)
+JOURNAL_META_KEY = "_journal"
+
+# Journal records between compactions (override with SWARM_RUN_STATE_COMPACT_EVERY)
+DEFAULT_COMPACT_EVERY = 64
+
+
+def compact_every_from_env() -> int:
+    """Journal records between snapshots, from SWARM_RUN_STATE_COMPACT_EVERY."""
+    raw = os.environ.get("SWARM_RUN_STATE_COMPACT_EVERY", "")
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_COMPACT_EVERY
+    except ValueError:
+        logger.warning(
+            "Invalid SWARM_RUN_STATE_COMPACT_EVERY %r, using %d", raw, DEFAULT_COMPACT_EVERY
+        )
+        return DEFAULT_COMPACT_EVERY
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _normalize_envelope(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Round-trip an envelope dict so it compares equal to run_state_to_dict() output."""
+    return handoff_envelope_to_dict(handoff_envelope_from_dict(data))
+
+
+class RunStateJournal:
+    """Snapshot + journal of one run's RunState. Thread-safe.
+
+    Callers that read-modify-write (append records derived from a load())
+    must serialize those sequences themselves, e.g. with the storage run lock.
+
+    Attributes:
+        run_path: The run directory.
+        compact_every: Journal records between snapshots.
+    """
+
+    def __init__(self, run_path: Path, compact_every: Optional[int] = None):
+        self.run_path = run_path
+        self.compact_every = compact_every or compact_every_from_env()
+        self._lock = threading.Lock()
+        # Materialized state, valid while the snapshot signature is unchanged
+        self._snapshot_sig: Optional[Tuple[int, int, int]] = None
+        self._data: Optional[Dict[str, Any]] = None
+        self._refs: Dict[str, str] = {}
+        self._generation = 0
+        self._offset = 0  # Bytes of the journal replayed into _data
+        self._pending = 0  # Records of the current generation in the journal
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.run_path / RUN_STATE_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.run_path / JOURNAL_FILE
+
+    @property
+    def pending(self) -> int:
+        """Journal records not yet folded into the snapshot."""
+        with self._lock:
+            self._refresh()
+            return self._pending
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """The materialized state (snapshot + journal), or None.
+
+        Returns:
+            A deep copy of the run_state_to_dict()-shaped state with envelopes
+            inline, or None if the snapshot is missing or corrupt.
+        """
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._data) if self._data is not None else None
+
+    def _refresh(self) -> None:
+        """Bring the cached state up to date with the files on disk."""
+        sig = _stat_signature(self.snapshot_path)
+        if sig is None:
+            self._reset(None)
+            return
+        if sig != self._snapshot_sig or self._data is None:
+            self._load_snapshot(sig)
+        self._replay_tail()
+
+    def _reset(self, sig: Optional[Tuple[int, int, int]]) -> None:
+        self._snapshot_sig = sig
+        self._data = None
+        self._refs = {}
+        self._generation = 0
+        self._offset = 0
+        self._pending = 0
+
+    def _load_snapshot(self, sig: Tuple[int, int, int]) -> None:
+        self._reset(sig)
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.warning("Corrupt run_state at %s: %s", self.snapshot_path, e)
+            return
+        except OSError as e:
+            logger.warning("Failed to read run_state at %s: %s", self.snapshot_path, e)
+            return
+        if not isinstance(data, dict):
+            logger.warning("Invalid run_state at %s: not an object", self.snapshot_path)
+            return
+
+        meta = data.pop(JOURNAL_META_KEY, None) or {}
+        envelopes = data.get("handoff_envelopes") or {}
+        for step_id, env_data in list(envelopes.items()):
+            if isinstance(env_data, dict) and ENVELOPE_REF_KEY in env_data:
+                ref = env_data[ENVELOPE_REF_KEY]
+                resolved = self._read_envelope_ref(ref)
+                if resolved is None:
+                    del envelopes[step_id]
+                    continue
+                envelopes[step_id] = resolved
+                self._refs[step_id] = ref
+        if "handoff_envelopes" in data:
+            data["handoff_envelopes"] = envelopes
+        self._data = data
+        self._generation = int(meta.get("generation", 0))
+
+    def _read_envelope_ref(self, ref: str) -> Optional[Dict[str, Any]]:
+        path = self.run_path / ref
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Unresolvable envelope reference %s in %s: %s", ref, self.run_path, e)
+            return None
+
+    def _replay_tail(self) -> None:
+        """Apply complete journal lines written since the last replay."""
+        try:
+            size = self.journal_path.stat().st_size
+        except OSError:
+            size = 0
+        if size < self._offset:
+            # Truncated by another writer's compaction: start over from the snapshot
+            self._load_snapshot(self._snapshot_sig)
+        if size <= self._offset or self._data is None:
+            return
+
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+        end = chunk.rfind(b"\n") + 1  # Never consume a partial trailing line
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                logger.warning("Skipping corrupt journal record in %s: %s", self.journal_path, e)
+                continue
+            if record.get("gen") == self._generation:
+                self._apply(record)
+        self._offset += end
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        data = self._data
+        envelope = record.get("envelope")
+        if envelope:
+            step_id = envelope["step_id"]
+            env_data = envelope.get("data")
+            if env_data is None:
+                env_data = self._read_envelope_ref(envelope["ref"])
+            if env_data is not None:
+                data.setdefault("handoff_envelopes", {})[step_id] = env_data
+                self._refs[step_id] = envelope["ref"]
+        for key, value in (record.get("updates") or {}).items():
+            if key in data:
+                data[key] = value
+        if "timestamp" in record:
+            data["timestamp"] = record["timestamp"]
+        self._pending += 1
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def append(
+        self, record: Dict[str, Any], envelope_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Append a delta record and fsync it.
+
+        Args:
+            record: {"updates": {...}, "envelope": {"step_id", "ref"}, "timestamp"}.
+                Every key is optional. Updates to fields the state doesn't
+                have are ignored, as in update_run_state().
+            envelope_data: The referenced envelope's dict, so the cached
+                state doesn't have to re-read the file just written.
+
+        Raises:
+            FileNotFoundError: If the run has no (valid) snapshot.
+        """
+        with self._lock:
+            self._refresh()
+            if self._data is None:
+                raise FileNotFoundError(f"Run state not found: {self.snapshot_path}")
+
+            record = dict(record, gen=self._generation)
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            with open(self.journal_path, "ab") as f:
+                if f.tell() > self._offset:
+                    f.truncate(self._offset)  # Drop a torn line left by a crash
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if record.get("envelope") and envelope_data is not None:
+                record["envelope"] = dict(record["envelope"], data=envelope_data)
+            self._apply(record)
+            self._offset += len(line)
+
+    def status(self) -> Optional[str]:
+        """Current status of the materialized state (cheap when cached)."""
+        with self._lock:
+            self._refresh()
+            return self._data.get("status") if self._data is not None else None
+
+    def write_snapshot(self, data: Dict[str, Any]) -> None:
+        """Replace the state with `data` (run_state_to_dict() output).
+
+        Envelopes identical to ones already stored by reference stay
+        references; others are stored inline.
+        """
+        with self._lock:
+            self._refresh()
+            if self._data is not None:
+                known = self._data.get("handoff_envelopes") or {}
+                refs = {
+                    step_id: ref
+                    for step_id, ref in self._refs.items()
+                    if step_id in known
+                    and (data.get("handoff_envelopes") or {}).get(step_id)
+                    == _normalize_envelope(known[step_id])
+                }
+            else:
+                refs = {}
+            self._write_snapshot(data, refs)
+
+    def compact(self) -> bool:
+        """Fold the journal into a new snapshot.
+
+        Returns:
+            True if a snapshot was written, False if there was nothing to fold.
+        """
+        with self._lock:
+            self._refresh()
+            if self._data is None or self._pending == 0:
+                return False
+            state = run_state_to_dict(run_state_from_dict(self._data))
+            self._write_snapshot(state, dict(self._refs))
+            return True
+
+    def _write_snapshot(self, data: Dict[str, Any], refs: Dict[str, str]) -> None:
+        generation = self._generation + 1
+        snapshot = dict(data)
+        envelopes = dict(snapshot.get("handoff_envelopes") or {})
+        for step_id, ref in refs.items():
+            if step_id in envelopes:
+                envelopes[step_id] = {ENVELOPE_REF_KEY: ref}
+        snapshot["handoff_envelopes"] = envelopes
+        snapshot[JOURNAL_META_KEY] = {"generation": generation}
+
+        self.run_path.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            suffix=".tmp", prefix=RUN_STATE_FILE + ".", dir=self.run_path
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self.snapshot_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        # Records of the previous generation are now ignored; drop them
+        try:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(0)
+        except FileNotFoundError:
+            pass
+
+        self._reset(_stat_signature(self.snapshot_path))
+        self._data = copy.deepcopy(data)
+        self._data.pop(JOURNAL_META_KEY, None)
+        self._refs = {step_id: ref for step_id, ref in refs.items() if step_id in envelopes}
+        self._generation = generation
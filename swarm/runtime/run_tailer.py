@@ -5,7 +5,7 @@ This module provides crash-safe incremental ingestion that:
 - Reads events.jsonl from last known byte offset
 - Ingests idempotently (skips existing event_ids)
 - Only advances offset after successful ingest
-- Supports async watching for live updates
+- Supports async watching for live updates (woken by the event bus)
 
 Design Philosophy:
     - Disk (events.jsonl) is the source of truth
@@ -27,16 +27,18 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
+import os
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 
 if TYPE_CHECKING:
     from .db import StatsDB
 
-from .storage import RUNS_DIR, list_runs
+from .event_bus import get_event_bus
+from .storage import EVENTS_FILE, RUNS_DIR, list_runs
 
 logger = logging.getLogger(__name__)
 
@@ -214,39 +216,43 @@ class RunTailer:
     ) -> AsyncIterator[int]:
         """Async generator that yields new event counts as they arrive.
 
-        Polls events.jsonl at the specified interval and yields the
-        count of newly ingested events each time new data is found.
+        Sleeps on the event bus until events.jsonl changes (in-process
+        writers publish directly; other processes are caught by the shared
+        file watcher) and yields the count of newly ingested events each
+        time new data is found.
 
         Args:
             run_id: The run identifier.
-            poll_interval_ms: Polling interval in milliseconds.
+            poll_interval_ms: Maximum time to wait for a change notification
+                before re-checking anyway (safety net for missed notifications).
             stop_on_complete: If True, stop when run reaches terminal status.
 
         Yields:
             Count of newly ingested events (only when > 0).
         """
-        while True:
-            try:
-                count = self.tail_run(run_id)
-                if count > 0:
-                    yield count
-            except TailerError:
-                pass  # Continue watching despite errors
-
-            if stop_on_complete:
-                # Check if run is complete
-                stats = self._db.get_run_stats(run_id)
-                if stats and stats.status in ("succeeded", "failed", "canceled"):
-                    # Do one final tail to catch any remaining events
-                    try:
-                        final_count = self.tail_run(run_id)
-                        if final_count > 0:
-                            yield final_count
-                    except TailerError:
-                        pass
-                    return
-
-            await asyncio.sleep(poll_interval_ms / 1000)
+        with get_event_bus().subscribe(self._runs_dir / run_id) as subscription:
+            while True:
+                try:
+                    count = self.tail_run(run_id)
+                    if count > 0:
+                        yield count
+                except TailerError:
+                    pass  # Continue watching despite errors
+
+                if stop_on_complete:
+                    # Check if run is complete
+                    stats = self._db.get_run_stats(run_id)
+                    if stats and stats.status in ("succeeded", "failed", "canceled"):
+                        # Do one final tail to catch any remaining events
+                        try:
+                            final_count = self.tail_run(run_id)
+                            if final_count > 0:
+                                yield final_count
+                        except TailerError:
+                            pass
+                        return
+
+                await subscription.wait(timeout=poll_interval_ms / 1000)
 
     async def watch_active_runs(
         self,
@@ -255,19 +261,47 @@ class RunTailer:
         """Watch all active runs for new events.
 
         An active run is one that exists and may still be producing events.
-        This method polls all runs at the specified interval.
+        Runs written by this process are tailed as soon as the event bus
+        reports a change; all runs are re-scanned at the specified interval
+        to pick up writers in other processes.
 
         Args:
-            poll_interval_ms: Polling interval in milliseconds.
+            poll_interval_ms: Interval between full scans, in milliseconds.
 
         Yields:
             Dict of run_id -> new event count (only runs with new events).
         """
-        while True:
+        runs_dir = os.path.abspath(self._runs_dir)
+        interval = poll_interval_ms / 1000
+        with get_event_bus().subscribe() as subscription:
             results = self.tail_all_runs()
-            if results:
-                yield results
-            await asyncio.sleep(poll_interval_ms / 1000)
+            last_scan = time.monotonic()
+            while True:
+                if results:
+                    yield results
+
+                remaining = max(0.0, interval - (time.monotonic() - last_scan))
+                changed = await subscription.wait(timeout=remaining)
+
+                if time.monotonic() - last_scan >= interval:
+                    results = self.tail_all_runs()
+                    last_scan = time.monotonic()
+                    continue
+
+                results = {}
+                run_ids = {
+                    path.parent.name
+                    for path in changed
+                    if path.name == EVENTS_FILE
+                    and os.path.dirname(os.path.abspath(path.parent)) == runs_dir
+                }
+                for run_id in sorted(run_ids):
+                    try:
+                        count = self.tail_run(run_id)
+                        if count > 0:
+                            results[run_id] = count
+                    except TailerError:
+                        pass  # Already logged
 
 
 def get_tailer(
@@ -15,13 +15,15 @@ Usage:
     run_id = service.start_run(spec)
     summary = service.get_run(run_id)
     runs = service.list_runs()
+    page = service.query_runs(status="failed", limit=50)
+    depth = service.scheduler_stats().queued
 """
 
 from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from . import storage
 from .backends import (
@@ -29,6 +31,8 @@ from .backends import (
     GeminiCliBackend,
     RunBackend,
 )
+from .run_catalog import RunPage, build_legacy_summary, catalog_enabled, get_run_catalog
+from .run_scheduler import RunScheduler, SchedulerStats, get_run_scheduler
 from .storage import EXAMPLES_DIR
 from .types import (
     BackendCapabilities,
@@ -36,9 +40,7 @@ from .types import (
     RunEvent,
     RunId,
     RunSpec,
-    RunStatus,
     RunSummary,
-    SDLCStatus,
 )
 
 # Module logger
@@ -53,6 +55,7 @@ class RunService:
     - Querying run status and history
     - Listing available backends
     - Managing run lifecycle
+    - Admitting runs through the bounded run scheduler
 
     Flow Studio, CLI, and other consumers should use this service
     rather than accessing backends or storage directly.
@@ -60,18 +63,27 @@ class RunService:
 
     _instance: Optional["RunService"] = None
 
-    def __init__(self, repo_root: Optional[Path] = None):
+    def __init__(
+        self,
+        repo_root: Optional[Path] = None,
+        scheduler: Optional[RunScheduler] = None,
+    ):
         """Initialize the service.
 
         Args:
             repo_root: Repository root path. Defaults to auto-detection.
+            scheduler: Run scheduler shared by this service's backends.
+                Defaults to the process-wide scheduler.
         """
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
+        self._scheduler = scheduler or get_run_scheduler()
         self._backends: dict[BackendId, RunBackend] = {
             "claude-harness": ClaudeHarnessBackend(self._repo_root),
             "gemini-cli": GeminiCliBackend(self._repo_root),
             # Agent SDK backend will be added when implemented
         }
+        for backend in self._backends.values():
+            backend.scheduler = self._scheduler
 
     @classmethod
     def get_instance(cls, repo_root: Optional[Path] = None) -> "RunService":
@@ -104,6 +116,11 @@ class RunService:
     def start_run(self, spec: RunSpec) -> RunId:
         """Start a new run.
 
+        The run is admitted by the run scheduler: it starts at once when a
+        slot is free, otherwise its summary shows status "queued" until one
+        opens up. Autopilot runs (no_human_mid_flow) yield to interactive
+        ones.
+
         Args:
             spec: Run specification including flows, backend, and params.
 
@@ -123,19 +140,28 @@ class RunService:
         return backend.start(spec)
 
     def cancel_run(self, run_id: RunId) -> bool:
-        """Cancel a running run.
+        """Cancel a queued or running run.
 
-        Attempts to cancel across all backends that support cancellation.
+        A run still waiting for a scheduler slot is dropped from the queue.
+        Otherwise cancellation is attempted across all backends that support
+        it.
 
         Returns:
             True if the run was cancelled, False otherwise.
         """
+        for backend in self._backends.values():
+            if backend.cancel_queued(run_id):
+                return True
         for backend in self._backends.values():
             if backend.capabilities().supports_cancel:
                 if backend.cancel(run_id):
                     return True
         return False
 
+    def scheduler_stats(self) -> SchedulerStats:
+        """Queue depth and slot usage of the run scheduler."""
+        return self._scheduler.stats()
+
     # =========================================================================
     # Run Queries
     # =========================================================================
@@ -175,6 +201,61 @@ class RunService:
             List of run summaries, sorted by creation time (newest first),
             with examples sorted first.
         """
+        if not catalog_enabled():
+            return self._list_runs_scan(flow_key, include_legacy, include_examples)
+        return self.query_runs(
+            flow_key=flow_key,
+            include_legacy=include_legacy,
+            include_examples=include_examples,
+        ).runs
+
+    def query_runs(
+        self,
+        flow_key: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[Sequence[str]] = None,
+        include_legacy: bool = True,
+        include_examples: bool = True,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> RunPage:
+        """Filter, sort and page runs through the run catalog.
+
+        See RunCatalog.query() for the arguments. Examples always come first.
+
+        Returns:
+            RunPage with the page of summaries, the total match count and the
+            cursor for the next page.
+
+        Raises:
+            ValueError: If sort_by is unknown or the cursor is invalid.
+        """
+        # One catalog per runs directory; include_examples filters rows
+        catalog = get_run_catalog(storage.RUNS_DIR, EXAMPLES_DIR)
+        return catalog.query(
+            flow_key=flow_key,
+            status=status,
+            tags=tags,
+            include_legacy=include_legacy,
+            include_examples=include_examples,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    def _list_runs_scan(
+        self,
+        flow_key: Optional[str] = None,
+        include_legacy: bool = True,
+        include_examples: bool = True,
+    ) -> List[RunSummary]:
+        """List runs by scanning directories (used when the catalog is disabled)."""
+        runs_dir = storage.RUNS_DIR
         summaries: List[RunSummary] = []
         seen_ids: set[str] = set()
 
@@ -190,10 +271,10 @@ class RunService:
                         seen_ids.add(rid)
 
         # Get runs from storage (new-style with meta.json)
-        for rid in storage.list_runs():
+        for rid in storage.list_runs(runs_dir):
             if rid in seen_ids:
                 continue
-            summary = storage.read_summary(rid)
+            summary = storage.read_summary(rid, runs_dir)
             if summary:
                 if flow_key is None or flow_key in summary.spec.flow_keys:
                     summaries.append(summary)
@@ -201,7 +282,7 @@ class RunService:
 
         # Include legacy runs if requested
         if include_legacy:
-            for rid in storage.discover_legacy_runs():
+            for rid in storage.discover_legacy_runs(runs_dir):
                 if rid in seen_ids:
                     continue
                 # Create minimal summary for legacy runs
@@ -233,71 +314,13 @@ class RunService:
         Returns:
             RunSummary if valid run found, None otherwise.
         """
-        from datetime import datetime, timezone
-
         # Determine correct path based on type
         if is_example:
             run_path = EXAMPLES_DIR / run_id
         else:
-            run_path = storage.get_run_path(run_id)
-
-        if not run_path.exists():
-            return None
-
-        # Detect which flows have artifacts
-        flow_keys = []
-        for flow_dir in ["signal", "plan", "build", "gate", "deploy", "wisdom"]:
-            if (run_path / flow_dir).exists():
-                flow_keys.append(flow_dir)
-
-        if not flow_keys:
-            return None
-
-        # Use directory mtime as creation time
-        try:
-            mtime = run_path.stat().st_mtime
-            created_at = datetime.fromtimestamp(mtime, tz=timezone.utc)
-        except Exception:
-            created_at = datetime.now(timezone.utc)
-
-        # Build tags based on run type
-        tags = ["example"] if is_example else ["legacy"]
-
-        # Check for run.json metadata (old-style)
-        run_json_path = run_path / "run.json"
-        title = None
-        description = None
-        if run_json_path.exists():
-            try:
-                import json
-
-                with open(run_json_path) as f:
-                    meta = json.load(f)
-                title = meta.get("title")
-                description = meta.get("description")
-                extra_tags = meta.get("tags", [])
-                tags.extend(extra_tags)
-            except Exception as e:
-                logger.warning("Failed to read legacy run metadata for %s: %s", run_id, e)
-
-        return RunSummary(
-            id=run_id,
-            spec=RunSpec(
-                flow_keys=flow_keys,
-                profile_id=None,
-                backend="claude-harness",
-                initiator="example" if is_example else "legacy",
-            ),
-            status=RunStatus.SUCCEEDED,  # Assume completed
-            sdlc_status=SDLCStatus.UNKNOWN,
-            created_at=created_at,
-            updated_at=created_at,
-            completed_at=created_at,
-            tags=tags,
-            title=title,
-            path=str(run_path),
-            description=description,
-        )
+            run_path = storage.get_run_path(run_id, storage.RUNS_DIR)
+
+        return build_legacy_summary(run_id, run_path, is_example=is_example)
 
     def get_events(self, run_id: RunId) -> List[RunEvent]:
         """Get all events for a run."""
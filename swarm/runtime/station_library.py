@@ -1154,6 +1154,8 @@ class StationLibrary:
             else:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
+        self._invalidate_spec_cache(path)
+
     def _remove_station_from_file(self, spec: StationSpec) -> None:
         """Remove a station from its source file.
 
@@ -1206,6 +1208,15 @@ class StationLibrary:
             # Single station file - just delete it
             path.unlink()
 
+        self._invalidate_spec_cache(path)
+
+    @staticmethod
+    def _invalidate_spec_cache(path: Path) -> None:
+        """Drop spec cache entries built from a station file we just changed."""
+        from swarm.spec.cache import get_spec_cache
+
+        get_spec_cache().invalidate_path(path)
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize library state.
 
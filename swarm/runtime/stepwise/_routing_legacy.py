@@ -999,8 +999,8 @@ def route_step(
     """
     routing = current_step.routing
 
-    # Use handoff envelope if available
-    if handoff_envelope is not None:
+    # Use handoff envelope if available (its signal is None until routed)
+    if handoff_envelope is not None and handoff_envelope.routing_signal is not None:
         signal = handoff_envelope.routing_signal
         if signal.decision == RoutingDecision.TERMINATE:
             return None, signal.reason or "flow_complete_via_signal"
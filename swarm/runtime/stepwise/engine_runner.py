@@ -31,9 +31,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from swarm.runtime.diff_scanner import scan_file_changes_sync
+from swarm.runtime.diff_scanner import (
+    WorktreeSnapshot,
+    scan_file_changes_sync,
+    take_worktree_snapshot,
+)
 from swarm.runtime.engines import StepContext, StepEngine
 from swarm.runtime.engines.base import LifecycleCapableEngine
+from swarm.runtime.phase_timing import phase
 from swarm.runtime.types import RunEvent, RoutingSignal
 
 if TYPE_CHECKING:
@@ -123,6 +128,12 @@ def run_step(
     routing_signal: Optional[RoutingSignal] = None
     is_lifecycle = False
 
+    # Baseline so progress evidence covers only paths touched by this step;
+    # the previous step's post-scan serves as the baseline while HEAD is unchanged
+    baseline = (
+        take_worktree_snapshot(repo_root, reuse_last_scan=True) if capture_progress else None
+    )
+
     if isinstance(engine, LifecycleCapableEngine):
         is_lifecycle = True
 
@@ -131,14 +142,15 @@ def run_step(
 
         # Capture progress evidence after work, before finalize
         if capture_progress:
-            progress_evidence = _capture_progress_evidence(repo_root)
+            progress_evidence = _capture_progress_evidence(repo_root, baseline)
 
         # Phase 2: Finalize (JIT extraction while context is hot)
         fin_result = engine.finalize_step(ctx, step_result, work_summary)
 
         # Phase 3: Route (fresh session for routing decision)
         handoff_data = fin_result.handoff_data or {}
-        routing_signal = engine.route_step(ctx, handoff_data)
+        with phase("routing"):
+            routing_signal = engine.route_step(ctx, handoff_data)
 
         # Combine events from work and finalization phases
         events = list(work_events) + fin_result.events
@@ -148,7 +160,7 @@ def run_step(
 
         # Capture progress evidence after execution
         if capture_progress:
-            progress_evidence = _capture_progress_evidence(repo_root)
+            progress_evidence = _capture_progress_evidence(repo_root, baseline)
 
     # Calculate step duration
     duration_ms = int((time.monotonic() - step_start) * 1000)
@@ -166,16 +178,20 @@ def run_step(
     )
 
 
-def _capture_progress_evidence(repo_root: Path) -> ProgressEvidence:
+def _capture_progress_evidence(
+    repo_root: Path,
+    baseline: Optional[WorktreeSnapshot] = None,
+) -> ProgressEvidence:
     """Capture file change evidence for stall detection.
 
     Args:
         repo_root: Repository root path.
+        baseline: Worktree snapshot from step start (optional).
 
     Returns:
         ProgressEvidence with file change summary.
     """
-    file_changes = scan_file_changes_sync(repo_root)
+    file_changes = scan_file_changes_sync(repo_root, baseline=baseline)
     return ProgressEvidence(
         file_count=file_changes.file_count,
         line_count=file_changes.total_insertions + file_changes.total_deletions,
@@ -251,6 +267,18 @@ def emit_step_execution_events(
         )
 
     # Step timing event
+    timing_payload: Dict[str, Any] = {
+        "duration_ms": result.duration_ms,
+        "started_at": result.started_at.isoformat() if result.started_at else None,
+        "step_index": step_index,
+        "iteration": iteration,
+    }
+    # Prompt compilation time and memo outcome, when the step was spec-based
+    artifacts = getattr(result.step_result, "artifacts", None) or {}
+    if "compile_ms" in artifacts:
+        timing_payload["compile_ms"] = artifacts["compile_ms"]
+        timing_payload["compile_cache"] = artifacts.get("compile_cache", "")
+
     events.append(
         RunEvent(
             run_id=run_id,
@@ -258,12 +286,7 @@ def emit_step_execution_events(
             kind="step_timing",
             flow_key=flow_key,
             step_id=step_id,
-            payload={
-                "duration_ms": result.duration_ms,
-                "started_at": result.started_at.isoformat() if result.started_at else None,
-                "step_index": step_index,
-                "iteration": iteration,
-            },
+            payload=timing_payload,
         )
     )
 
@@ -59,6 +59,7 @@ from swarm.runtime.macro_navigator import (
     MacroNavigator,
     extract_flow_result,
 )
+from swarm.runtime.phase_timing import phase, timed_phase
 from swarm.runtime.router import Edge, FlowGraph, NodeConfig  # For Navigator integration
 from swarm.runtime.routing_utils import parse_routing_decision
 
@@ -1039,11 +1040,12 @@ class StepwiseOrchestrator:
             )
 
             # Execute step via engine runner (handles lifecycle vs single-phase)
-            engine_result = run_step_via_engine(
-                ctx=ctx,
-                engine=self._engine,
-                repo_root=self._repo_root,
-            )
+            with phase("engine"):
+                engine_result = run_step_via_engine(
+                    ctx=ctx,
+                    engine=self._engine,
+                    repo_root=self._repo_root,
+                )
 
             # Extract results for downstream use
             step_result = engine_result.step_result
@@ -1314,6 +1316,8 @@ class StepwiseOrchestrator:
                 payload={"steps_completed": len(history)},
             ),
         )
+        # Commit any group-buffered events so the finished run is fully on disk
+        storage_module.flush_events(run_id)
 
         return FlowStepwiseSummary(
             run_id=run_id,
@@ -1327,6 +1331,7 @@ class StepwiseOrchestrator:
     # Note: _build_flow_graph_from_definition, _resolve_node, _get_next_node_id
     # have been extracted to graph_bridge.py and node_resolver.py
 
+    @timed_phase("routing")
     def _route_via_navigator(
         self,
         run_id: RunId,
@@ -1605,6 +1610,7 @@ class StepwiseOrchestrator:
 
         return next_step_id, reason, routing_source, routing_candidates
 
+    @timed_phase("routing")
     def _route_via_config_fallback(
         self,
         step: StepDefinition,
@@ -1783,6 +1789,7 @@ class StepwiseOrchestrator:
         )
         return (None, reason, routing_source, signal)
 
+    @timed_phase("routing")
     def _route_via_envelope_fallback(
         self,
         run_id: RunId,
@@ -1914,6 +1921,7 @@ class StepwiseOrchestrator:
 
         return next_step_id, reason, routing_source
 
+    @timed_phase("routing")
     def _try_fast_path_routing(
         self,
         step: StepDefinition,
@@ -255,9 +255,7 @@ class ParallelExecutor:
             ForkResult with aggregated results.
         """
         # Use asyncio.run() to execute the async version
-        return asyncio.get_event_loop().run_until_complete(
-            self.execute_fork(run_id, fork_config, contexts, join_config)
-        )
+        return asyncio.run(self.execute_fork(run_id, fork_config, contexts, join_config))
 
     async def execute_fork(
         self,
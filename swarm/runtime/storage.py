@@ -9,36 +9,50 @@ The storage layout is:
         meta.json          # RunSummary serialized
         spec.json          # RunSpec serialized
         events.jsonl       # newline-delimited RunEvent objects
-        run_state.json     # RunState serialized (durable program counter)
+        run_state.json     # RunState snapshot (durable program counter; read it
+                           # via read_run_state*(), never directly)
+        run_state.journal.jsonl  # RunState deltas appended since the snapshot
+        autopilot_state.json  # AutopilotState snapshot (autopilot runs only)
         <flow_key>/        # existing artifact directories (signal/, plan/, etc.)
           handoff/        # HandoffEnvelope JSON files for each step
             <step_id>.json
+            .index.jsonl  # envelope index manifest (see envelope_index.py)
 
 Usage:
     from swarm.runtime.storage import (
         RUNS_DIR,
-        get_run_path, run_exists, create_run_dir,
+        get_run_path, run_exists, create_run_dir, init_run,
         write_spec, read_spec,
         write_summary, read_summary, update_summary, finalize_run_success,
-        append_event, read_events,
+        append_event, append_event_dict, read_events, flush_events, close_event_writers,
         query_navigator_events, summarize_navigator_events,  # For Wisdom analysis
-        write_run_state, read_run_state, update_run_state,
+        write_run_state, read_run_state, read_run_state_data, update_run_state,
         write_envelope, read_envelope, list_envelopes,
         commit_step_completion,
+        write_autopilot_state, read_autopilot_state, list_autopilot_runs,
         list_runs, discover_legacy_runs,
     )
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
 import tempfile
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .envelope_index import get_envelope_index
+from .event_bus import publish_change
+from .event_index import index_path_for
+from .event_writer import EventWriter, EventWriterConfig
+from .phase_timing import timed_phase
+from .run_catalog import catalog_enabled, record_summary
+from .run_state_journal import JOURNAL_FILE, RunStateJournal
 from .types import (
     HandoffEnvelope,
     RunEvent,
@@ -70,6 +84,8 @@ META_FILE = "meta.json"
 SPEC_FILE = "spec.json"
 EVENTS_FILE = "events.jsonl"
 RUN_STATE_FILE = "run_state.json"
+RUN_STATE_JOURNAL_FILE = JOURNAL_FILE
+AUTOPILOT_STATE_FILE = "autopilot_state.json"
 LEGACY_META_FILE = "run.json"  # Old-style optional metadata
 
 # -----------------------------------------------------------------------------
@@ -329,7 +345,9 @@ def create_run_dir(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Path:
     flow subdirectories (those are created by agents as needed).
 
     Also initializes the sequence counter from existing events.jsonl if
-    present, enabling recovery after restarts.
+    present, enabling recovery after restarts. A new directory changes the
+    runs directory mtime, which makes the run catalog reconcile on its next
+    query.
 
     Args:
         run_id: The unique run identifier.
@@ -352,6 +370,29 @@ def create_run_dir(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Path:
     return run_path
 
 
+def init_run(run_id: RunId, flow_key: str, spec: RunSpec, runs_dir: Path = RUNS_DIR) -> Path:
+    """Prepare a run directory before a flow executes in it.
+
+    Idempotent: a run that spans several flows calls this once per flow.
+    The spec is only written when the run does not have one yet, so the
+    spec of a run created by a backend or autopilot is preserved.
+
+    Args:
+        run_id: The unique run identifier.
+        flow_key: The flow about to execute.
+        spec: The run specification.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+
+    Returns:
+        Path to the run directory.
+    """
+    run_path = create_run_dir(run_id, runs_dir)
+    if not (run_path / SPEC_FILE).exists():
+        write_spec(run_id, spec, runs_dir)
+    logger.debug("Initialized run %s for flow %s", run_id, flow_key)
+    return run_path
+
+
 # -----------------------------------------------------------------------------
 # RunSpec I/O
 # -----------------------------------------------------------------------------
@@ -411,7 +452,8 @@ def read_spec(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunSpec]:
 def write_summary(run_id: RunId, summary: RunSummary, runs_dir: Path = RUNS_DIR) -> Path:
     """Write RunSummary to meta.json atomically.
 
-    Uses atomic write (temp file + rename) to prevent partial writes.
+    Uses atomic write (temp file + rename) to prevent partial writes, then
+    updates the run's row in the run catalog.
 
     Args:
         run_id: The unique run identifier.
@@ -427,6 +469,9 @@ def write_summary(run_id: RunId, summary: RunSummary, runs_dir: Path = RUNS_DIR)
     data = run_summary_to_dict(summary)
     _atomic_write_json(meta_path, data)
 
+    if catalog_enabled():
+        record_summary(run_id, summary, runs_dir)
+
     return meta_path
 
 
@@ -588,6 +633,121 @@ def finalize_run_success(
 # -----------------------------------------------------------------------------
 
 
+# Open EventWriters keyed by events.jsonl path. Bounded so long-lived servers
+# don't accumulate file handles; the least recently used writer is closed.
+MAX_OPEN_EVENT_WRITERS = 128
+
+_event_writers: "OrderedDict[Path, EventWriter]" = OrderedDict()
+_event_writers_lock = threading.Lock()
+_event_writer_config: Optional[EventWriterConfig] = None
+
+
+def configure_event_writers(config: Optional[EventWriterConfig]) -> None:
+    """Set the EventWriter config used by append_event().
+
+    Open writers are flushed and closed so the new config applies to the
+    next event of every run.
+
+    Args:
+        config: New config, or None to re-read SWARM_EVENT_* from the environment.
+    """
+    global _event_writer_config
+    close_event_writers()
+    with _event_writers_lock:
+        _event_writer_config = config
+
+
+def _get_event_writer(run_id: RunId, runs_dir: Path) -> EventWriter:
+    """Get (or open) the EventWriter for a run's events.jsonl.
+
+    Must be called with the run lock held, so the sequence counter is
+    recovered from disk before the first event is appended.
+    """
+    global _event_writer_config
+    events_path = get_run_path(run_id, runs_dir) / EVENTS_FILE
+    with _event_writers_lock:
+        writer = _event_writers.get(events_path)
+        if writer is not None:
+            _event_writers.move_to_end(events_path)
+            return writer
+
+    create_run_dir(run_id, runs_dir)
+
+    with _event_writers_lock:
+        if _event_writer_config is None:
+            _event_writer_config = EventWriterConfig.from_env()
+        writer = EventWriter(
+            events_path,
+            _event_writer_config,
+            on_commit=publish_change,
+            index_path=index_path_for(events_path),
+        )
+        _event_writers[events_path] = writer
+        evicted = []
+        while len(_event_writers) > MAX_OPEN_EVENT_WRITERS:
+            evicted.append(_event_writers.popitem(last=False)[1])
+
+    for old in evicted:
+        try:
+            old.close()
+        except OSError as e:
+            logger.warning("Failed to close event writer for %s: %s", old.path, e)
+    return writer
+
+
+def _run_event_writers(run_id: Optional[RunId], runs_dir: Path) -> List[EventWriter]:
+    with _event_writers_lock:
+        if run_id is None:
+            return list(_event_writers.values())
+        writer = _event_writers.get(get_run_path(run_id, runs_dir) / EVENTS_FILE)
+        return [writer] if writer is not None else []
+
+
+def flush_events(
+    run_id: Optional[RunId] = None, runs_dir: Path = RUNS_DIR, sync: bool = False
+) -> None:
+    """Commit events buffered by append_event() to events.jsonl.
+
+    Args:
+        run_id: Run to flush. If None, flushes every open writer.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+        sync: Also fsync the file(s).
+    """
+    for writer in _run_event_writers(run_id, runs_dir):
+        try:
+            writer.flush(sync=sync)
+        except (OSError, IOError) as e:
+            logger.warning("Failed to flush events to %s: %s", writer.path, e)
+
+
+def close_event_writers(run_id: Optional[RunId] = None, runs_dir: Path = RUNS_DIR) -> None:
+    """Commit buffered events and close the open events.jsonl handle(s).
+
+    Call when a run finishes or before deleting/moving a run directory.
+
+    Args:
+        run_id: Run whose writer to close. If None, closes every open writer.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+    """
+    with _event_writers_lock:
+        if run_id is None:
+            writers = list(_event_writers.values())
+            _event_writers.clear()
+        else:
+            writer = _event_writers.pop(get_run_path(run_id, runs_dir) / EVENTS_FILE, None)
+            writers = [writer] if writer is not None else []
+
+    for writer in writers:
+        try:
+            writer.close()
+        except (OSError, IOError) as e:
+            logger.warning("Failed to close event writer for %s: %s", writer.path, e)
+
+
+atexit.register(close_event_writers)
+
+
+@timed_phase("event_append")
 def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> None:
     """Append a RunEvent to events.jsonl.
 
@@ -601,6 +761,10 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
     each event before writing. This ensures reliable ordering even when
     timestamps have limited precision.
 
+    Lines go through a per-run EventWriter that keeps events.jsonl open and
+    group-commits according to EventWriterConfig (SWARM_EVENT_* env vars).
+    With the default config every event is committed before returning.
+
     Args:
         run_id: The unique run identifier.
         event: The RunEvent to append.
@@ -608,19 +772,18 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
     """
     lock = _get_run_lock(run_id)
     with lock:
-        run_path = create_run_dir(run_id, runs_dir)
-        events_path = run_path / EVENTS_FILE
+        events_path = get_run_path(run_id, runs_dir) / EVENTS_FILE
 
         try:
+            writer = _get_event_writer(run_id, runs_dir)
+
             # Assign monotonic sequence number before serialization
             event.seq = _next_seq(run_id)
 
             data = run_event_to_dict(event)
             line = json.dumps(data, ensure_ascii=False)
 
-            with open(events_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-                f.flush()  # Ensure data reaches OS buffer
+            writer.write(line, seq=event.seq)
         except (OSError, IOError) as e:
             logger.warning(
                 "Failed to append event for run '%s' at %s: %s",
@@ -638,6 +801,31 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
             # Don't re-raise - malformed events shouldn't crash the run
 
 
+def append_event_dict(run_id: RunId, data: Dict[str, Any], runs_dir: Path = RUNS_DIR) -> int:
+    """Append a raw event dict (e.g. an SSE-style UI event) to events.jsonl.
+
+    Goes through the same per-run lock, sequence counter and EventWriter as
+    append_event(), so every line in events.jsonl carries a seq in file order.
+
+    Args:
+        run_id: The unique run identifier.
+        data: JSON-serializable event; a "seq" key is added.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+
+    Returns:
+        The assigned seq.
+
+    Raises:
+        OSError: If the event could not be written.
+        TypeError: If the event is not JSON-serializable.
+    """
+    with _get_run_lock(run_id):
+        writer = _get_event_writer(run_id, runs_dir)
+        seq = _next_seq(run_id)
+        writer.write(json.dumps({**data, "seq": seq}, ensure_ascii=False), seq=seq)
+        return seq
+
+
 def read_events(run_id: RunId, runs_dir: Path = RUNS_DIR) -> List[RunEvent]:
     """Read all events from events.jsonl.
 
@@ -649,6 +837,9 @@ def read_events(run_id: RunId, runs_dir: Path = RUNS_DIR) -> List[RunEvent]:
         List of RunEvent objects in chronological order.
         Returns empty list if file doesn't exist or is empty.
     """
+    # Make events still buffered by this process visible
+    flush_events(run_id, runs_dir)
+
     run_path = get_run_path(run_id, runs_dir)
     events_path = run_path / EVENTS_FILE
 
@@ -963,10 +1154,59 @@ def list_all_runs(include_examples: bool = True) -> List[Dict[str, Any]]:
 # -----------------------------------------------------------------------------
 
 
+# RunStateJournals keyed by run directory. Each caches its run's materialized
+# state, so the cache is bounded; an evicted run is reloaded from disk.
+MAX_CACHED_RUN_STATES = 64
+
+_run_state_journals: "OrderedDict[Path, RunStateJournal]" = OrderedDict()
+_run_state_journals_lock = threading.Lock()
+
+
+def _get_run_state_journal(run_path: Path) -> RunStateJournal:
+    """Get (or create) the RunStateJournal for a run directory."""
+    with _run_state_journals_lock:
+        journal = _run_state_journals.get(run_path)
+        if journal is None:
+            journal = RunStateJournal(run_path)
+            _run_state_journals[run_path] = journal
+            while len(_run_state_journals) > MAX_CACHED_RUN_STATES:
+                _run_state_journals.popitem(last=False)
+        else:
+            _run_state_journals.move_to_end(run_path)
+        return journal
+
+
+def _append_run_state_record(
+    run_id: RunId,
+    record: Dict[str, Any],
+    runs_dir: Path,
+    envelope_data: Optional[Dict[str, Any]] = None,
+) -> RunStateJournal:
+    """Append a delta to the run-state journal, compacting when due.
+
+    The journal is folded into a new run_state.json snapshot every
+    compact_every records, and whenever the update changes the run status
+    so that readers of the snapshot alone still see status transitions.
+    Must be called with the run lock held.
+    """
+    run_path = get_run_path(run_id, runs_dir)
+    journal = _get_run_state_journal(run_path)
+    new_status = (record.get("updates") or {}).get("status")
+    status_changed = new_status is not None and new_status != journal.status()
+
+    journal.append(record, envelope_data=envelope_data)
+    if status_changed or journal.pending >= journal.compact_every:
+        journal.compact()
+    publish_change(run_path / RUN_STATE_FILE)
+    return journal
+
+
 def write_run_state(run_id: RunId, state: RunState, runs_dir: Path = RUNS_DIR) -> Path:
-    """Write RunState to run_state.json atomically.
+    """Write RunState as a new run_state.json snapshot.
 
-    Uses atomic write (temp file + rename) to prevent partial writes.
+    Uses atomic write (temp file + rename) to prevent partial writes, and
+    supersedes any journal records appended since the previous snapshot.
+    Envelopes already stored by reference stay references.
 
     Args:
         run_id: The unique run identifier.
@@ -980,18 +1220,41 @@ def write_run_state(run_id: RunId, state: RunState, runs_dir: Path = RUNS_DIR) -
     state_path = run_path / RUN_STATE_FILE
 
     data = run_state_to_dict(state)
-    _atomic_write_json(state_path, data)
+    _get_run_state_journal(run_path).write_snapshot(data)
+    publish_change(state_path)
 
     return state_path
 
 
+def read_run_state_data(run_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a run directory's materialized run state as a plain dict.
+
+    run_state.json alone is only the last snapshot: it lags the journal
+    between compactions and stores envelopes as {"$ref": ...} stubs. Callers
+    that want the raw dict rather than a RunState (API routes, SSE streams)
+    use this instead of opening the file, so they see the same state as
+    read_run_state(). Files without a journal are returned as written.
+
+    Args:
+        run_path: The run directory.
+
+    Returns:
+        The state dict, or None if run_state.json is missing or corrupt.
+    """
+    return _get_run_state_journal(Path(run_path)).load()
+
+
 def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunState]:
-    """Read RunState from run_state.json with graceful error handling.
+    """Read RunState from run_state.json plus its journal, with graceful error handling.
+
+    The snapshot is materialized with referenced envelopes resolved, then
+    journal records appended since the snapshot are replayed on top. Only
+    the part of the journal written since the previous read is parsed.
 
     Includes crash recovery logic: if handoff_envelopes is empty but envelope
     files exist on disk, reconstructs the envelope map from the files. This
     handles the case where the process crashed after writing envelope files
-    but before updating run_state.json.
+    but before recording them in the run state.
 
     Args:
         run_id: The unique run identifier.
@@ -1003,7 +1266,7 @@ def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunStat
     run_path = get_run_path(run_id, runs_dir)
     state_path = run_path / RUN_STATE_FILE
 
-    data = _load_json_safe(state_path, run_id, "run_state")
+    data = _get_run_state_journal(run_path).load()
     if data is None:
         return None
 
@@ -1031,8 +1294,8 @@ def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunStat
 def update_run_state(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RUNS_DIR) -> RunState:
     """Partial update of RunState fields.
 
-    Reads the existing state, applies updates, and writes back.
-    Only updates fields that are present in the updates dict.
+    Appends the updates to the run-state journal instead of rewriting
+    run_state.json. Only fields the state already has are updated.
 
     This function is thread-safe via per-run locking to prevent lost updates
     when multiple threads update the same run concurrently.
@@ -1051,20 +1314,11 @@ def update_run_state(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RU
     """
     lock = _get_run_lock(run_id)
     with lock:
-        state = read_run_state(run_id, runs_dir)
-        if state is None:
-            raise FileNotFoundError(f"Run state not found: {run_id}")
-
-        # Convert to dict, apply updates, convert back
-        data = run_state_to_dict(state)
-
-        for key, value in updates.items():
-            if key in data:
-                data[key] = value
-
-        updated_state = run_state_from_dict(data)
-        write_run_state(run_id, updated_state, runs_dir)
+        _append_run_state_record(run_id, {"updates": updates}, runs_dir)
 
+        updated_state = read_run_state(run_id, runs_dir)
+        if updated_state is None:
+            raise FileNotFoundError(f"Run state not found: {run_id}")
         return updated_state
 
 
@@ -1106,6 +1360,9 @@ def write_envelope(
     data = handoff_envelope_to_dict(envelope)
     _atomic_write_json(envelope_path, data)
 
+    # Let ContextPack hydration reuse the envelope instead of re-parsing it
+    get_envelope_index(flow_path).record(envelope_path, envelope)
+
     return envelope_path
 
 
@@ -1201,12 +1458,15 @@ def commit_step_completion(
     specific order of operations:
 
     1. Write envelope to <flow>/handoff/<step_id>.json (immutable once written)
-    2. Update run_state.json with envelope reference + step_index bump
+    2. Append a journal record with the envelope reference + step_index bump
 
     This ordering ensures that if the process crashes between steps, we can
     recover by reading envelopes from disk and reconstructing the
     run_state.handoff_envelopes map. The envelope files serve as the
-    durable source of truth.
+    durable source of truth, and the snapshot stores them by reference.
+
+    The journal record is small and fixed-size per step, so the write cost
+    no longer grows with the number of envelopes already in the run state.
 
     Thread-safe via per-run locking.
 
@@ -1238,32 +1498,74 @@ def commit_step_completion(
     with lock:
         # Step 1: Write envelope to disk (immutable artifact)
         step_id = envelope.step_id
-        write_envelope(run_id, flow_key, step_id, envelope, runs_dir)
+        envelope_path = write_envelope(run_id, flow_key, step_id, envelope, runs_dir)
 
-        # Step 2: Read current run_state
-        state = read_run_state(run_id, runs_dir)
-        if state is None:
-            raise FileNotFoundError(f"Run state not found: {run_id}")
+        # Step 2: Append the envelope reference and updates to the journal
+        from datetime import datetime as dt
+        from datetime import timezone as tz
 
-        # Step 3: Build updated state with envelope reference
-        data = run_state_to_dict(state)
+        run_path = get_run_path(run_id, runs_dir)
+        record = {
+            "envelope": {
+                "step_id": step_id,
+                "ref": envelope_path.relative_to(run_path).as_posix(),
+            },
+            "updates": run_state_updates,
+            "timestamp": dt.now(tz.utc).isoformat() + "Z",
+        }
+        _append_run_state_record(
+            run_id, record, runs_dir, envelope_data=handoff_envelope_to_dict(envelope)
+        )
 
-        # Add envelope to handoff_envelopes map
-        if "handoff_envelopes" not in data:
-            data["handoff_envelopes"] = {}
-        data["handoff_envelopes"][step_id] = handoff_envelope_to_dict(envelope)
 
-        # Apply caller-provided updates
-        for key, value in run_state_updates.items():
-            if key in data:
-                data[key] = value
+# -----------------------------------------------------------------------------
+# AutopilotState I/O
+# -----------------------------------------------------------------------------
 
-        # Update timestamp (using datetime from .types module via run_state_from_dict)
-        from datetime import datetime as dt
-        from datetime import timezone as tz
 
-        data["timestamp"] = dt.now(tz.utc).isoformat() + "Z"
+def write_autopilot_state(
+    run_id: RunId, data: Dict[str, Any], runs_dir: Path = RUNS_DIR
+) -> Path:
+    """Write an autopilot state snapshot to autopilot_state.json atomically.
+
+    The state is passed as a dict (see autopilot.autopilot_state_to_dict) so
+    storage stays independent of the autopilot module.
+
+    Args:
+        run_id: The unique run identifier.
+        data: Serialized AutopilotState.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
 
-        # Step 4: Write updated run_state atomically
-        updated_state = run_state_from_dict(data)
-        write_run_state(run_id, updated_state, runs_dir)
+    Returns:
+        Path to the written autopilot_state.json file.
+    """
+    run_path = create_run_dir(run_id, runs_dir)
+    state_path = run_path / AUTOPILOT_STATE_FILE
+    with _get_run_lock(run_id):
+        _atomic_write_json(state_path, data)
+    return state_path
+
+
+def read_autopilot_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[Dict[str, Any]]:
+    """Read the autopilot state snapshot for a run.
+
+    Args:
+        run_id: The unique run identifier.
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+
+    Returns:
+        The serialized AutopilotState, or None if missing or unreadable.
+    """
+    state_path = get_run_path(run_id, runs_dir) / AUTOPILOT_STATE_FILE
+    return _load_json_safe(state_path, run_id, "autopilot state")
+
+
+def list_autopilot_runs(runs_dir: Path = RUNS_DIR) -> List[RunId]:
+    """List run IDs that have an autopilot state snapshot, sorted.
+
+    Args:
+        runs_dir: Base directory for runs. Defaults to RUNS_DIR.
+    """
+    if not runs_dir.exists():
+        return []
+    return sorted(path.parent.name for path in runs_dir.glob(f"*/{AUTOPILOT_STATE_FILE}"))
@@ -0,0 +1,403 @@
+"""
+transcript_io.py - Transcript JSONL writing and indexed, paginated reading.
+
+Every engine writes one transcript per step at
+RUN_BASE/llm/<step_id>-<agent_key>-<engine>.jsonl. Long sessions produce
+transcripts of tens of MB, so readers should never load one whole. When a
+transcript is written, a line index is written next to it:
+
+    RUN_BASE/llm/
+      build_step-code-implementer-claude.jsonl
+      build_step-code-implementer-claude.jsonl.idx
+
+The index records, for every message line, its byte offset, length and
+message kind ("assistant", "user", "system", "tool_call", "tool_result",
+"error", ...). Readers use it to:
+- Page through messages by cursor (after=N, limit=M) with one seek per page
+- Filter by kind without reading, let alone parsing, skipped lines
+- Stream the raw NDJSON lines straight from disk
+
+Design Philosophy:
+    - The index is a hint: it carries the transcript size it was built for,
+      and a missing or stale index is rebuilt with a single scan (transcripts
+      from before the index existed keep working)
+    - Message numbers (n) are 1-based positions in the whole transcript, so a
+      cursor stays valid whatever filter is applied
+    - Every line that parses as JSON is a message, whatever its type; blank
+      and malformed lines are skipped, as before. A final line without a
+      newline is a message too once it parses (until then it is taken to be
+      mid-write)
+
+Usage:
+    from swarm.runtime.transcript_io import read_transcript_page, write_transcript
+
+    write_transcript(t_path, messages)
+    page = read_transcript_page(t_path, after=0, limit=200, kinds={"tool_call"})
+    page.messages, page.next_after, page.has_more
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the index file, appended to the transcript file name
+INDEX_SUFFIX = ".idx"
+
+# First token of the index header; bump the version when the format changes
+INDEX_MAGIC = "transcript-index-v1"
+
+# Raw transcript types that are tool invocations
+TOOL_CALL_TYPES = frozenset({"tool_use", "tool_call", "function_call"})
+
+# Parsed indexes kept in memory, keyed by transcript path
+INDEX_CACHE_SIZE = 64
+
+# Read size when streaming a transcript without a filter
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def index_path_for(transcript_path: Path) -> Path:
+    """Path of the index sidecar for a transcript file."""
+    return transcript_path.with_name(transcript_path.name + INDEX_SUFFIX)
+
+
+def message_kind(message: Any) -> str:
+    """Normalized kind of a transcript message, used for filtering.
+
+    Engines record either chat messages ({"role": ...}, or {"type": "message",
+    "role": ...}) or raw stream events ({"type": "tool_use", ...}). Chat
+    messages are classified by role, tool invocations as "tool_call", and
+    anything else by its type. Lines that are not JSON objects are "other".
+    Kinds never contain whitespace (the index is whitespace-separated).
+    """
+    if not isinstance(message, dict):
+        return "other"
+    msg_type = message.get("type")
+    if msg_type is None or msg_type == "message":
+        role = message.get("role")
+        kind = str(role) if role else "message"
+    elif msg_type in TOOL_CALL_TYPES:
+        kind = "tool_call"
+    else:
+        kind = str(msg_type)
+    return "_".join(kind.split()) or "message"
+
+
+@dataclass(frozen=True)
+class TranscriptIndex:
+    """Line index for one transcript.
+
+    Attributes:
+        size: Transcript size in bytes the index was built for.
+        offsets: Byte offset of each message line.
+        lengths: Byte length of each message line, including the newline.
+        kinds: message_kind() of each message.
+    """
+
+    size: int
+    offsets: Tuple[int, ...] = ()
+    lengths: Tuple[int, ...] = ()
+    kinds: Tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def select(
+        self,
+        after: int = 0,
+        limit: Optional[int] = None,
+        kinds: Optional[Set[str]] = None,
+    ) -> Tuple[List[int], bool]:
+        """Message numbers after `after`, up to `limit`, optionally filtered.
+
+        Returns:
+            (message numbers, whether more matching messages follow).
+        """
+        selected: List[int] = []
+        for position in range(max(after, 0), len(self.offsets)):
+            if kinds is not None and self.kinds[position] not in kinds:
+                continue
+            if limit is not None and len(selected) >= limit:
+                return selected, True
+            selected.append(position + 1)
+        return selected, False
+
+
+def _write_index(transcript_path: Path, index: TranscriptIndex) -> None:
+    """Atomically write the index sidecar (best effort)."""
+    lines = [f"{INDEX_MAGIC} {index.size}\n"]
+    lines.extend(
+        f"{offset} {length} {kind}\n"
+        for offset, length, kind in zip(index.offsets, index.lengths, index.kinds)
+    )
+    target = index_path_for(transcript_path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(target.parent), prefix=".tmp_", suffix=INDEX_SUFFIX
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp_path, target)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write transcript index %s: %s", target, e)
+
+
+def write_transcript(transcript_path: Path, messages: Iterable[Any]) -> Path:
+    """Write messages as transcript JSONL, along with its line index.
+
+    Args:
+        transcript_path: Destination (see path_helpers.transcript_path()).
+        messages: JSON-serializable message dicts, one per line.
+
+    Returns:
+        The transcript path.
+    """
+    transcript_path.parent.mkdir(parents=True, exist_ok=True)
+    offsets: List[int] = []
+    lengths: List[int] = []
+    kinds: List[str] = []
+    offset = 0
+    with transcript_path.open("wb") as f:
+        for message in messages:
+            line = (json.dumps(message) + "\n").encode("utf-8")
+            f.write(line)
+            offsets.append(offset)
+            lengths.append(len(line))
+            kinds.append(message_kind(message))
+            offset += len(line)
+    index = TranscriptIndex(offset, tuple(offsets), tuple(lengths), tuple(kinds))
+    _write_index(transcript_path, index)
+    _remember(transcript_path, index)
+    return transcript_path
+
+
+def _read_index_file(transcript_path: Path, size: int) -> Optional[TranscriptIndex]:
+    """The sidecar index, or None if missing, stale or corrupt."""
+    try:
+        with open(index_path_for(transcript_path), "r", encoding="utf-8") as f:
+            header = f.readline().split()
+            if len(header) != 2 or header[0] != INDEX_MAGIC or int(header[1]) != size:
+                return None
+            offsets: List[int] = []
+            lengths: List[int] = []
+            kinds: List[str] = []
+            for line in f:
+                offset, length, kind = line.split()
+                offsets.append(int(offset))
+                lengths.append(int(length))
+                kinds.append(kind)
+    except (OSError, ValueError):
+        return None
+    if offsets and offsets[-1] + lengths[-1] > size:
+        return None
+    return TranscriptIndex(size, tuple(offsets), tuple(lengths), tuple(kinds))
+
+
+# Marks a line that is not a message
+_SKIP = object()
+
+
+def build_index(transcript_path: Path) -> TranscriptIndex:
+    """Index an existing transcript with one scan and store the sidecar.
+
+    Blank and malformed lines are not indexed. A final line without a newline
+    is indexed if it parses; otherwise it is taken to be mid-write.
+    """
+    offsets: List[int] = []
+    lengths: List[int] = []
+    kinds: List[str] = []
+    offset = 0
+    with transcript_path.open("rb") as f:
+        for line in f:
+            try:
+                message = json.loads(line) if line.strip() else _SKIP
+            except ValueError:
+                if not line.endswith(b"\n"):
+                    break  # Partial last line, still being written
+                message = _SKIP
+            if message is not _SKIP:
+                offsets.append(offset)
+                lengths.append(len(line))
+                kinds.append(message_kind(message))
+            offset += len(line)
+    index = TranscriptIndex(offset, tuple(offsets), tuple(lengths), tuple(kinds))
+    # A partially written transcript is indexed but not persisted
+    if offset == transcript_path.stat().st_size:
+        _write_index(transcript_path, index)
+    return index
+
+
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], TranscriptIndex]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _remember(transcript_path: Path, index: TranscriptIndex) -> None:
+    try:
+        st = transcript_path.stat()
+    except OSError:
+        return
+    with _cache_lock:
+        _cache[str(transcript_path)] = ((st.st_size, st.st_mtime_ns), index)
+        _cache.move_to_end(str(transcript_path))
+        while len(_cache) > INDEX_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def load_index(transcript_path: Path) -> TranscriptIndex:
+    """Index for a transcript: cached, from the sidecar, or rebuilt.
+
+    Raises:
+        FileNotFoundError: If the transcript does not exist.
+    """
+    st = transcript_path.stat()
+    key = str(transcript_path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == (st.st_size, st.st_mtime_ns):
+            _cache.move_to_end(key)
+            return cached[1]
+
+    index = _read_index_file(transcript_path, st.st_size) or build_index(transcript_path)
+    _remember(transcript_path, index)
+    return index
+
+
+def reset_transcript_index_cache() -> None:
+    """Drop all cached transcript indexes."""
+    with _cache_lock:
+        _cache.clear()
+
+
+@dataclass
+class TranscriptPage:
+    """One page of transcript messages.
+
+    Attributes:
+        messages: Parsed messages on this page (normally dicts; any JSON value
+            a line holds is returned as is).
+        numbers: Message number (1-based line position) of each message.
+        total: Messages in the whole transcript.
+        next_after: Cursor for the next page (last message number returned,
+            or the request cursor when the page is empty).
+        has_more: Whether further matching messages exist.
+    """
+
+    messages: List[Any] = field(default_factory=list)
+    numbers: List[int] = field(default_factory=list)
+    total: int = 0
+    next_after: int = 0
+    has_more: bool = False
+
+
+def _read_ranges(
+    transcript_path: Path, index: TranscriptIndex, numbers: List[int]
+) -> Iterator[bytes]:
+    """Raw lines for message numbers, coalescing adjacent reads."""
+    if not numbers:
+        return
+    with transcript_path.open("rb") as f:
+        run_start = 0
+        while run_start < len(numbers):
+            # Extend the run while the next message starts where this one ends
+            run_end = run_start
+            while run_end + 1 < len(numbers):
+                prev, nxt = numbers[run_end] - 1, numbers[run_end + 1] - 1
+                if index.offsets[prev] + index.lengths[prev] != index.offsets[nxt]:
+                    break
+                run_end += 1
+            first, last = numbers[run_start] - 1, numbers[run_end] - 1
+            f.seek(index.offsets[first])
+            block = f.read(index.offsets[last] + index.lengths[last] - index.offsets[first])
+            start = 0
+            for number in numbers[run_start : run_end + 1]:
+                length = index.lengths[number - 1]
+                yield block[start : start + length]
+                start += length
+            run_start = run_end + 1
+
+
+def read_transcript_page(
+    transcript_path: Path,
+    after: int = 0,
+    limit: Optional[int] = None,
+    kinds: Optional[Set[str]] = None,
+) -> TranscriptPage:
+    """Read messages after cursor `after`, at most `limit`, optionally by kind.
+
+    Only the selected lines are read from disk and parsed.
+    """
+    index = load_index(transcript_path)
+    numbers, has_more = index.select(after, limit, kinds)
+    messages = [json.loads(line) for line in _read_ranges(transcript_path, index, numbers)]
+    return TranscriptPage(
+        messages=messages,
+        numbers=numbers,
+        total=len(index),
+        next_after=numbers[-1] if numbers else max(after, 0),
+        has_more=has_more,
+    )
+
+
+def _iter_raw(
+    transcript_path: Path,
+    after: int,
+    kinds: Optional[Set[str]],
+) -> Iterator[bytes]:
+    """Indexed transcript bytes for iter_transcript_lines(), as stored."""
+    index = load_index(transcript_path)
+    if kinds is not None:
+        numbers, _ = index.select(after, None, kinds)
+        yield from _read_ranges(transcript_path, index, numbers)
+        return
+
+    numbers, _ = index.select(after, None, None)
+    if not numbers:
+        return
+    # Contiguous when the index skipped no malformed lines in this range
+    first, last = numbers[0] - 1, numbers[-1] - 1
+    end = index.offsets[last] + index.lengths[last]
+    if end - index.offsets[first] != sum(index.lengths[first : last + 1]):
+        yield from _read_ranges(transcript_path, index, numbers)
+        return
+    with transcript_path.open("rb") as f:
+        f.seek(index.offsets[first])
+        remaining = end - index.offsets[first]
+        while remaining > 0:
+            chunk = f.read(min(STREAM_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def iter_transcript_lines(
+    transcript_path: Path,
+    after: int = 0,
+    kinds: Optional[Set[str]] = None,
+) -> Iterator[bytes]:
+    """Yield raw NDJSON transcript lines after cursor `after`, optionally by kind.
+
+    Without a filter, complete indexed bytes are streamed in fixed-size chunks
+    (not line by line); lines are never parsed. A final line written without
+    a newline is terminated with one, so the output is always valid NDJSON.
+    """
+    last: Optional[bytes] = None
+    for last in _iter_raw(transcript_path, after, kinds):
+        yield last
+    if last and not last.endswith(b"\n"):
+        yield b"\n"
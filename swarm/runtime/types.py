@@ -96,6 +96,7 @@ class RunStatus(str, Enum):
     """Status of a run's execution lifecycle."""
 
     PENDING = "pending"
+    QUEUED = "queued"  # Waiting for a run scheduler slot
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
@@ -658,7 +659,8 @@ class HandoffEnvelope:
         step_id: The step ID that produced this envelope.
         flow_key: The flow key this step belongs to.
         run_id: The run ID.
-        routing_signal: The routing decision signal for this step.
+        routing_signal: The routing decision signal for this step. None until
+            the route phase has run.
         summary: Compressed summary of step output (1-2k chars max).
         artifacts: Map of artifact names to their file paths (relative to RUN_BASE).
         file_changes: Forensic file mutation scan results (authoritative, not agent-reported).
@@ -682,7 +684,7 @@ class HandoffEnvelope:
     step_id: str
     flow_key: str
     run_id: str
-    routing_signal: RoutingSignal
+    routing_signal: Optional[RoutingSignal]
     summary: str
     artifacts: Dict[str, str] = field(default_factory=dict)
     file_changes: Dict[str, Any] = field(default_factory=dict)
@@ -1512,7 +1514,11 @@ def handoff_envelope_to_dict(envelope: HandoffEnvelope) -> Dict[str, Any]:
         "step_id": envelope.step_id,
         "flow_key": envelope.flow_key,
         "run_id": envelope.run_id,
-        "routing_signal": routing_signal_to_dict(envelope.routing_signal),
+        "routing_signal": (
+            routing_signal_to_dict(envelope.routing_signal)
+            if envelope.routing_signal is not None
+            else None
+        ),
         "summary": envelope.summary,
         "artifacts": dict(envelope.artifacts),
         "file_changes": dict(envelope.file_changes),
@@ -1529,7 +1535,7 @@ def handoff_envelope_to_dict(envelope: HandoffEnvelope) -> Dict[str, Any]:
     }
 
     # Include routing audit trail if the routing signal has an explanation
-    if envelope.routing_signal.explanation:
+    if envelope.routing_signal is not None and envelope.routing_signal.explanation:
         result["routing_audit"] = routing_explanation_to_dict(envelope.routing_signal.explanation)
     elif envelope.routing_audit:
         result["routing_audit"] = envelope.routing_audit
@@ -1564,8 +1570,11 @@ def handoff_envelope_from_dict(data: Dict[str, Any]) -> HandoffEnvelope:
         verification_passed, verification_details, routing_audit) and
         assumption/decision logging fields (assumptions_made, decisions_made).
     """
+    # An explicit null means the envelope was written before routing ran
     routing_signal_data = data.get("routing_signal", {})
-    routing_signal = routing_signal_from_dict(routing_signal_data)
+    routing_signal = (
+        routing_signal_from_dict(routing_signal_data) if routing_signal_data is not None else None
+    )
 
     # Parse routing_audit if present (store as raw dict for flexibility)
     routing_audit = data.get("routing_audit")
@@ -7,6 +7,7 @@ This package provides the specification layer for the industrialized SDLC:
 - Fragments: Reusable prompt components
 - Compiler: Assembles specs + context into SDK inputs
 - Manager: Central authority for spec file operations (ADR-001)
+- Cache: Shared mtime-validated cache for specs, fragments and compiled prompts
 
 Usage:
     from swarm.spec import (
@@ -47,6 +48,13 @@ from .types import (
     PromptPlan,
 )
 
+from .cache import (
+    SpecCache,
+    SpecCacheStats,
+    get_spec_cache,
+    reset_spec_cache,
+)
+
 from .loader import (
     load_station,
     load_flow,
@@ -109,6 +117,11 @@ __all__ = [
     "FlowDefaults",
     "RoutingConfig",
     "PromptPlan",
+    # Cache
+    "SpecCache",
+    "SpecCacheStats",
+    "get_spec_cache",
+    "reset_spec_cache",
     # Loader
     "load_station",
     "load_flow",
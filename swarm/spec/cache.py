@@ -0,0 +1,324 @@
+"""
+cache.py - Shared, hot-reloading cache for parsed specs and compiled prompts.
+
+Specs used to be cached in several independent places (lru_cache in the
+loader, a bound-method lru_cache in SpecCompiler, a TTL cache in the prompt
+compiler, plain dicts in the API SpecManager), none of which noticed edits
+on disk. This module replaces them with one process-wide cache:
+- Entries are keyed by (namespace, key) and record the files they were
+  built from together with each file's (mtime_ns, size) signature
+- A lookup re-stats those files; any change, creation or deletion makes the
+  entry a miss, so edits are picked up without a restart
+- Derived values (a compiled prompt built from a prompt file plus several
+  fragments) record every file they read, so editing a fragment invalidates
+  the station and compiled-prompt entries built from it
+- invalidate_path() drops every entry that depends on a file immediately;
+  spec writers call it so their own writes are visible even within one
+  mtime tick
+- The cache is a bounded LRU (SWARM_SPEC_CACHE_SIZE entries, default 512;
+  0 disables caching)
+
+Design Philosophy:
+    - Validation is by stat, not by watching: a stat per dependency is far
+      cheaper than re-reading and re-parsing, and needs no watcher thread
+    - Missing files are dependencies too: a lookup that fell back to a
+      legacy YAML location records the absent JSON path, so creating the
+      JSON file invalidates the entry
+    - Values are shared between callers and must be treated as read-only
+    - Errors are never cached; a broken spec is re-read on every call
+
+Usage:
+    from swarm.spec.cache import get_spec_cache
+
+    cache = get_spec_cache()
+    station = cache.get("station", (station_id, root), [json_path, yaml_path],
+                        lambda: load_station(station_id, root))
+    plan = cache.get_derived("compiled-prompt", key, build)  # build -> (value, paths)
+    cache.invalidate_path(path)    # after writing a spec file
+    cache.stats().to_dict()        # hits, misses, evictions, invalidations
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 512
+
+# (mtime_ns, size), or None when the file does not exist
+Signature = Optional[Tuple[int, int]]
+
+CacheKey = Tuple[str, Hashable]
+PathLike = Union[str, Path]
+
+
+def file_signature(path: PathLike) -> Signature:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def max_entries_from_env() -> int:
+    """Cache capacity from SWARM_SPEC_CACHE_SIZE (0 disables caching)."""
+    raw = os.environ.get("SWARM_SPEC_CACHE_SIZE", "")
+    if not raw:
+        return DEFAULT_MAX_ENTRIES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid SWARM_SPEC_CACHE_SIZE=%r", raw)
+        return DEFAULT_MAX_ENTRIES
+
+
+@dataclass
+class _Entry:
+    value: Any
+    deps: Tuple[Tuple[str, Signature], ...]
+
+
+@dataclass
+class SpecCacheStats:
+    """Point-in-time view of the spec cache.
+
+    Attributes:
+        max_entries: Capacity of the LRU.
+        entries: Number of cached entries.
+        hits: Lookups served from cache.
+        misses: Lookups that loaded from disk (absent or stale entry).
+        evictions: Entries dropped to stay within max_entries.
+        invalidations: Entries dropped because a dependency changed or was
+            explicitly invalidated.
+        entries_by_namespace: Cached entries per namespace.
+    """
+
+    max_entries: int
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries_by_namespace: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_entries": self.max_entries,
+            "entries": self.entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries_by_namespace": dict(self.entries_by_namespace),
+        }
+
+
+class SpecCache:
+    """Bounded LRU of spec values validated against their source files.
+
+    Thread-safe. Loaders run outside the lock, so two threads missing on the
+    same key may both load it; the last one stored wins.
+
+    Args:
+        max_entries: Maximum number of entries (0 disables caching).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        # Reverse index: file path -> keys of entries that depend on it
+        self._dependents: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> "SpecCache":
+        return cls(max_entries=max_entries_from_env())
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def get(
+        self,
+        namespace: str,
+        key: Hashable,
+        paths: Iterable[PathLike],
+        load: Callable[[], T],
+    ) -> T:
+        """Return load(), cached while every file in paths is unchanged.
+
+        paths should list every location the loader consults, including
+        higher-priority ones that do not exist, so that creating them
+        invalidates the entry. Signatures are taken before loading, so a
+        write racing with the load is caught by the next lookup.
+        """
+        cache_key = (namespace, key)
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return cached.value
+
+        deps = tuple((str(p), file_signature(p)) for p in paths)
+        value = load()
+        self._store(cache_key, value, deps)
+        return value
+
+    def get_derived(
+        self,
+        namespace: str,
+        key: Hashable,
+        build: Callable[[], Tuple[T, Iterable[PathLike]]],
+    ) -> T:
+        """Return the value from build(), cached while its inputs are unchanged.
+
+        For values whose dependencies are only known once built: build()
+        returns (value, paths) where paths are all the files it read
+        (directly or through other cached entries).
+        """
+        cache_key = (namespace, key)
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return cached.value
+
+        value, paths = build()
+        deps = tuple((str(p), file_signature(p)) for p in dict.fromkeys(str(p) for p in paths))
+        self._store(cache_key, value, deps)
+        return value
+
+    def _lookup(self, cache_key: CacheKey) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+        if entry is not None and all(file_signature(p) == sig for p, sig in entry.deps):
+            with self._lock:
+                if cache_key in self._entries:
+                    self._entries.move_to_end(cache_key)
+                self._hits += 1
+            return entry
+
+        with self._lock:
+            self._misses += 1
+            if entry is not None and self._entries.get(cache_key) is entry:
+                self._remove_locked(cache_key)
+                self._invalidations += 1
+        return None
+
+    def _store(self, cache_key: CacheKey, value: Any, deps: Tuple[Tuple[str, Signature], ...]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove_locked(cache_key)
+            self._entries[cache_key] = _Entry(value, deps)
+            for path, _ in deps:
+                self._dependents.setdefault(path, set()).add(cache_key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self._evictions += 1
+
+    def _remove_locked(self, cache_key: CacheKey) -> None:
+        entry = self._entries.pop(cache_key)
+        for path, _ in entry.deps:
+            keys = self._dependents.get(path)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._dependents[path]
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def invalidate_path(self, path: PathLike) -> int:
+        """Drop every entry that depends on path. Returns the number dropped."""
+        with self._lock:
+            keys = list(self._dependents.get(str(path), ()))
+            for cache_key in keys:
+                self._remove_locked(cache_key)
+            self._invalidations += len(keys)
+        return len(keys)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop all entries, or only those in one namespace."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._dependents.clear()
+                return
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                self._remove_locked(cache_key)
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> SpecCacheStats:
+        with self._lock:
+            by_namespace: Dict[str, int] = {}
+            for namespace, _ in self._entries:
+                by_namespace[namespace] = by_namespace.get(namespace, 0) + 1
+            return SpecCacheStats(
+                max_entries=self.max_entries,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries_by_namespace=by_namespace,
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the counters (entries are kept)."""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+
+# Process-wide cache shared by the loader, compilers and spec managers
+_cache: Optional[SpecCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_spec_cache() -> SpecCache:
+    """Return the process-wide spec cache, sized from the environment."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SpecCache.from_env()
+        return _cache
+
+
+def reset_spec_cache() -> None:
+    """Drop the process-wide cache so the next call re-reads the environment."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -21,20 +21,28 @@ Key concepts:
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import json
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from swarm.config.model_registry import resolve_station_model
 from swarm.config.tool_profiles import resolve_tool_profile
 
-from .loader import load_flow, load_fragment, load_fragments, load_station
+from .cache import get_spec_cache
+from .loader import (
+    load_flow_cached,
+    load_fragment_cached,
+    load_fragments,
+    load_station_cached,
+    spec_source_paths,
+)
 from .types import (
     FlowSpec,
     FlowStep,
@@ -212,6 +220,9 @@ class StepPlan:
         default_factory=lambda: VerificationRequirements()
     )
     fragments_used: Tuple[FragmentReference, ...] = ()
+    # Compile timing (not part of prompt_plan.schema.json)
+    compile_ms: float = 0.0
+    compile_cache: str = ""  # "static" (station sections reused) or "miss"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary matching prompt_plan.schema.json."""
@@ -509,6 +520,17 @@ def build_user_prompt(
     Returns:
         Complete user prompt text.
     """
+    guidelines = _build_guidelines_section(station, repo_root)
+    step_sections = _build_step_sections(station, step, context_pack, run_base)
+    return f"{guidelines}\n{step_sections}" if guidelines else step_sections
+
+
+def _build_guidelines_section(station: StationSpec, repo_root: Optional[Path]) -> str:
+    """Guidelines section of the user prompt (station fragments, concatenated).
+
+    Depends only on the station and its fragment files, so it is part of the
+    static sections reused across compilations.
+    """
     parts: List[str] = []
 
     # 1. Load and concatenate fragments
@@ -516,12 +538,24 @@ def build_user_prompt(
         parts.append("## Guidelines\n")
         for frag_path in station.runtime_prompt.fragments:
             try:
-                frag_content = load_fragment(frag_path, repo_root)
+                frag_content = load_fragment_cached(frag_path, repo_root)
                 parts.append(frag_content.strip())
                 parts.append("")
             except FileNotFoundError:
                 logger.warning("Fragment not found: %s", frag_path)
 
+    return "\n".join(parts)
+
+
+def _build_step_sections(
+    station: StationSpec,
+    step: FlowStep,
+    context_pack: Optional["ContextPack"],
+    run_base: Path,
+) -> str:
+    """Per-step sections of the user prompt (objective, context, IO, handoff)."""
+    parts: List[str] = []
+
     # 2. Objective (from step)
     parts.append("## Objective\n")
     parts.append(step.objective)
@@ -691,6 +725,52 @@ def resolve_handoff_contract(
     )
 
 
+# =============================================================================
+# Plan Memoization
+# =============================================================================
+
+
+def _digest(value: Any) -> str:
+    """Short stable hash of a JSON-serializable value (for cache keys)."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _context_pack_fingerprint(context_pack: Optional["ContextPack"]) -> Any:
+    """The parts of a ContextPack that reach the compiled PromptPlan."""
+    if context_pack is None:
+        return None
+    return {
+        "artifacts": [[name, str(path)] for name, path in context_pack.upstream_artifacts.items()],
+        "envelopes": [
+            [env.step_id, env.status, env.summary[:200] if env.summary else ""]
+            for env in context_pack.previous_envelopes[-5:]
+        ],
+        "envelope_count": len(context_pack.previous_envelopes),
+    }
+
+
+@dataclass(frozen=True)
+class _StaticSections:
+    """Run-independent parts of a PromptPlan, memoized per flow step.
+
+    Rebuilt only when one of ``sources`` (flow, station and fragment files)
+    changes; the per-step variable sections are rendered on top.
+    """
+    flow: FlowSpec
+    step: FlowStep
+    station: StationSpec
+    flow_key: str
+    system_append: str
+    guidelines: str
+    model: str
+    permission_mode: str
+    allowed_tools: Tuple[str, ...]
+    max_turns: int
+    sandbox_enabled: bool
+    sources: Tuple[Path, ...]
+
+
 class SpecCompiler:
     """Compiler that produces PromptPlans from specs.
 
@@ -773,8 +853,61 @@ class SpecCompiler:
             FileNotFoundError: If flow or station spec not found.
             ValueError: If step not found in flow.
         """
+        start = time.perf_counter()
+        scent_trail = self._load_scent_trail()
+        effective_cwd = cwd or (str(self.repo_root) if self.repo_root else str(Path.cwd()))
+
+        # Static sections depend only on spec files (tracked by the spec
+        # cache) and these arguments; the full plan also on the run inputs
+        static_key = (
+            str(self.repo_root),
+            flow_id,
+            step_id,
+            use_v2,
+            tuple(policy_invariants_ref) if policy_invariants_ref is not None else None,
+            _digest(scent_trail),
+        )
+        plan_key = static_key + (
+            _digest([str(run_base), effective_cwd, _context_pack_fingerprint(context_pack)]),
+        )
+
+        cache = get_spec_cache()
+        outcome = "hit"
+
+        def build_static() -> Tuple[_StaticSections, List[Path]]:
+            nonlocal outcome
+            outcome = "miss"
+            static = self._compile_static_sections(
+                flow_id, step_id, scent_trail, policy_invariants_ref, use_v2
+            )
+            return static, list(static.sources)
+
+        def build_plan() -> Tuple[PromptPlan, List[Path]]:
+            nonlocal outcome
+            outcome = "static"
+            static = cache.get_derived("plan-static", static_key, build_static)
+            plan = self._render_plan(static, context_pack, run_base, effective_cwd)
+            return plan, list(static.sources)
+
+        plan = cache.get_derived("prompt-plan", plan_key, build_plan)
+        return dataclasses.replace(
+            plan,
+            compiled_at=datetime.now(timezone.utc).isoformat(),
+            compile_ms=round((time.perf_counter() - start) * 1000, 3),
+            compile_cache=outcome,
+        )
+
+    def _compile_static_sections(
+        self,
+        flow_id: str,
+        step_id: str,
+        scent_trail: Optional[str],
+        policy_invariants_ref: Optional[List[str]],
+        use_v2: bool,
+    ) -> "_StaticSections":
+        """Compile the parts of a PromptPlan that do not depend on the run."""
         # Load flow spec
-        flow = load_flow(flow_id, self.repo_root)
+        flow = load_flow_cached(flow_id, self.repo_root)
 
         # Extract flow key for routing
         flow_key = extract_flow_key(flow_id)
@@ -790,32 +923,7 @@ class SpecCompiler:
             raise ValueError(f"Step {step_id} not found in flow {flow_id}")
 
         # Load station spec
-        station = load_station(step.station, self.repo_root)
-
-        # Load scent trail
-        scent_trail = self._load_scent_trail()
-
-        # Build template variables for path resolution
-        variables = {
-            "run": {
-                "base": str(run_base),
-            },
-            "step": {
-                "id": step.id,
-                "objective": step.objective,
-                "scope": step.scope or "",
-            },
-            "flow": {
-                "id": flow.id,
-                "key": flow_key,
-                "version": str(flow.version),
-            },
-            "station": {
-                "id": station.id,
-                "title": station.title,
-                "version": str(station.version),
-            },
-        }
+        station = load_station_cached(step.station, self.repo_root)
 
         # Build system append (v1 or v2)
         if use_v2:
@@ -832,20 +940,6 @@ class SpecCompiler:
         else:
             system_append = build_system_append(station, scent_trail)
 
-        # Build user prompt
-        user_prompt = build_user_prompt(
-            station=station,
-            step=step,
-            context_pack=context_pack,
-            run_base=run_base,
-            repo_root=self.repo_root,
-        )
-
-        # Compute prompt hash for traceability (SHA256 of combined prompts)
-        prompt_hash = hashlib.sha256(
-            (system_append + user_prompt).encode("utf-8")
-        ).hexdigest()[:16]
-
         # Merge SDK settings (station + step overrides)
         # Resolve model: "inherit" -> category default, tier -> full ID
         raw_model = step.sdk_overrides.get("model", station.sdk.model)
@@ -864,11 +958,68 @@ class SpecCompiler:
             # Fallback to profile-based resolution using category
             allowed_tools = resolve_tool_profile("inherit", category=station.category.value)
 
-        max_turns = step.sdk_overrides.get("max_turns", station.sdk.max_turns)
-        sandbox_enabled = step.sdk_overrides.get("sandbox_enabled", station.sdk.sandbox.enabled)
+        # Files these sections were built from
+        fragment_paths = set(station.runtime_prompt.fragments) | set(policy_invariants_ref or ())
+        sources = spec_source_paths("flows", flow_id, self.repo_root)
+        sources += spec_source_paths("stations", station.id, self.repo_root)
+        for frag_path in sorted(fragment_paths):
+            sources += spec_source_paths("fragments", frag_path, self.repo_root)
 
-        # Determine cwd
-        effective_cwd = cwd or (str(self.repo_root) if self.repo_root else str(Path.cwd()))
+        return _StaticSections(
+            flow=flow,
+            step=step,
+            station=station,
+            flow_key=flow_key,
+            system_append=system_append,
+            guidelines=_build_guidelines_section(station, self.repo_root),
+            model=model,
+            permission_mode=permission_mode,
+            allowed_tools=allowed_tools,
+            max_turns=step.sdk_overrides.get("max_turns", station.sdk.max_turns),
+            sandbox_enabled=step.sdk_overrides.get("sandbox_enabled", station.sdk.sandbox.enabled),
+            sources=tuple(sources),
+        )
+
+    def _render_plan(
+        self,
+        static: "_StaticSections",
+        context_pack: Optional["ContextPack"],
+        run_base: Path,
+        cwd: str,
+    ) -> PromptPlan:
+        """Render the per-step variable sections onto cached static sections."""
+        flow, step, station = static.flow, static.step, static.station
+
+        # Build template variables for path resolution
+        variables = {
+            "run": {
+                "base": str(run_base),
+            },
+            "step": {
+                "id": step.id,
+                "objective": step.objective,
+                "scope": step.scope or "",
+            },
+            "flow": {
+                "id": flow.id,
+                "key": static.flow_key,
+                "version": str(flow.version),
+            },
+            "station": {
+                "id": station.id,
+                "title": station.title,
+                "version": str(station.version),
+            },
+        }
+
+        # Build user prompt
+        step_sections = _build_step_sections(station, step, context_pack, run_base)
+        user_prompt = f"{static.guidelines}\n{step_sections}" if static.guidelines else step_sections
+
+        # Compute prompt hash for traceability (SHA256 of combined prompts)
+        prompt_hash = hashlib.sha256(
+            (static.system_append + user_prompt).encode("utf-8")
+        ).hexdigest()[:16]
 
         # V2: Merge verification requirements from station and step
         verification = merge_verification_requirements(
@@ -893,14 +1044,14 @@ class SpecCompiler:
             step_id=step.id,
             prompt_hash=prompt_hash,
             # SDK Options
-            model=model,
-            permission_mode=permission_mode,
-            allowed_tools=allowed_tools,
-            max_turns=max_turns,
-            sandbox_enabled=sandbox_enabled,
-            cwd=effective_cwd,
+            model=static.model,
+            permission_mode=static.permission_mode,
+            allowed_tools=static.allowed_tools,
+            max_turns=static.max_turns,
+            sandbox_enabled=static.sandbox_enabled,
+            cwd=cwd,
             # Prompt Content
-            system_append=system_append,
+            system_append=static.system_append,
             user_prompt=user_prompt,
             # Metadata
             compiled_at=datetime.now(timezone.utc).isoformat(),
@@ -908,7 +1059,7 @@ class SpecCompiler:
             # V2 additions
             verification=verification,
             handoff=handoff,
-            flow_key=flow_key,
+            flow_key=static.flow_key,
         )
 
     def compile_from_context(
@@ -964,11 +1115,31 @@ class SpecCompiler:
             FileNotFoundError: If station spec not found.
             ValueError: If required parameters are missing.
         """
+        start = time.perf_counter()
+
         # Determine station ID from template or node overrides
         station_id = self._resolve_station_id(node, template)
 
-        # Load station spec
-        station = load_station(station_id, context.repo_root)
+        # Station-derived sections (system prompt, fragments, SDK options)
+        # are memoized until a station or fragment file changes
+        static_key = (
+            str(context.repo_root),
+            station_id,
+            _digest(context.scent_trail),
+            _digest(node.overrides),
+        )
+        outcome = "static"
+
+        def build_static() -> Tuple[Dict[str, Any], List[Path]]:
+            nonlocal outcome
+            outcome = "miss"
+            return self._compile_station_sections(station_id, node, context)
+
+        static = get_spec_cache().get_derived("step-static", static_key, build_static)
+        station = static["station"]
+        system_prompt = static["system_prompt"]
+        fragments_used = static["fragments_used"]
+        sdk_options = static["sdk_options"]
 
         # Build objective from template + node params
         objective = self._resolve_objective(node, template)
@@ -981,9 +1152,6 @@ class SpecCompiler:
             context=context,
         )
 
-        # Build system prompt
-        system_prompt = self.build_system_prompt(station, context.scent_trail)
-
         # Build user prompt
         user_prompt = self.build_user_prompt(
             objective=objective,
@@ -991,17 +1159,8 @@ class SpecCompiler:
             io_contract=self._build_io_contract(node, template, station),
             variables=variables,
         )
-
-        # Process fragment includes in both prompts
-        system_prompt = self._process_fragment_includes(system_prompt, context.repo_root)
         user_prompt = self._process_fragment_includes(user_prompt, context.repo_root)
 
-        # Collect fragment references for audit trail
-        fragments_used = self._collect_fragment_references(
-            station.runtime_prompt.fragments,
-            context.repo_root,
-        )
-
         # Compute prompt hash
         prompt_hash = self.compute_prompt_hash(system_prompt, user_prompt)
 
@@ -1019,9 +1178,6 @@ class SpecCompiler:
             node, template, station, variables
         )
 
-        # Build SDK options from station with node overrides
-        sdk_options = self._merge_sdk_options(station, node)
-
         return StepPlan(
             step_id=node.node_id,
             station_id=station.id,
@@ -1045,9 +1201,47 @@ class SpecCompiler:
             handoff_path=handoff_path,
             required_fields=station.handoff.required_fields,
             verification=verification,
-            fragments_used=tuple(fragments_used),
+            fragments_used=fragments_used,
+            compile_ms=round((time.perf_counter() - start) * 1000, 3),
+            compile_cache=outcome,
+        )
+
+    def _compile_station_sections(
+        self,
+        station_id: str,
+        node: FlowNode,
+        context: CompileContext,
+    ) -> Tuple[Dict[str, Any], List[Path]]:
+        """Build the station-derived parts of a StepPlan and their source files."""
+        repo_root = context.repo_root
+        station = load_station_cached(station_id, repo_root)
+
+        # Build system prompt and resolve its fragment includes
+        raw_system_prompt = self.build_system_prompt(station, context.scent_trail)
+        system_prompt = self._process_fragment_includes(raw_system_prompt, repo_root)
+
+        # Collect fragment references for audit trail
+        fragments_used = self._collect_fragment_references(
+            station.runtime_prompt.fragments,
+            repo_root,
         )
 
+        sources = spec_source_paths("stations", station_id, repo_root)
+        included = [
+            name if name.endswith(".md") else f"{name}.md"
+            for name in (m.strip() for m in re.findall(r"\{\{fragment:([^}]+)\}\}", raw_system_prompt))
+        ]
+        for frag_path in [*station.runtime_prompt.fragments, *included]:
+            sources += spec_source_paths("fragments", frag_path, repo_root)
+
+        static = {
+            "station": station,
+            "system_prompt": system_prompt,
+            "fragments_used": tuple(fragments_used),
+            "sdk_options": self._merge_sdk_options(station, node),
+        }
+        return static, sources
+
     def resolve_template(
         self,
         node: FlowNode,
@@ -1465,7 +1659,7 @@ class SpecCompiler:
             if not frag_path.endswith(".md"):
                 frag_path = f"{frag_path}.md"
             try:
-                return load_fragment(frag_path, repo_root)
+                return load_fragment_cached(frag_path, repo_root)
             except FileNotFoundError:
                 logger.warning("Fragment include not found: %s", frag_path)
                 return f"[Fragment not found: {frag_path}]"
@@ -1482,7 +1676,7 @@ class SpecCompiler:
 
         for frag_path in fragment_paths:
             try:
-                content = load_fragment(frag_path, repo_root)
+                content = load_fragment_cached(frag_path, repo_root)
                 content_hash = hashlib.sha256(content.encode()).hexdigest()[:12]
                 refs.append(FragmentReference(
                     path=frag_path,
@@ -1494,11 +1688,11 @@ class SpecCompiler:
 
         return refs
 
-    @lru_cache(maxsize=32)
     def _load_template(self, template_id: str) -> Optional[StepTemplate]:
         """Load a StepTemplate from disk.
 
-        Templates are stored in swarm/spec/templates/{template_id}.yaml
+        Templates are stored in swarm/spec/templates/{template_id}.yaml and
+        served from the shared spec cache until the file changes.
 
         Args:
             template_id: The template identifier.
@@ -1510,7 +1704,14 @@ class SpecCompiler:
             return None
 
         template_path = self.repo_root / "swarm" / "spec" / "templates" / f"{template_id}.yaml"
+        return get_spec_cache().get(
+            "step-template", (template_id, str(template_path)), [template_path],
+            lambda: self._read_template(template_id, template_path),
+        )
 
+    @staticmethod
+    def _read_template(template_id: str, template_path: Path) -> Optional[StepTemplate]:
+        """Parse a StepTemplate YAML file (None if missing or invalid)."""
         if not template_path.exists():
             logger.debug("Template not found: %s", template_path)
             return None
@@ -1560,7 +1761,7 @@ class SpecCompiler:
         Returns:
             MultiStepPromptPlan containing all step plans.
         """
-        flow = load_flow(flow_id, context.repo_root)
+        flow = load_flow_cached(flow_id, context.repo_root)
         flow_key = extract_flow_key(flow_id)
 
         step_plans: List[StepPlan] = []
@@ -1579,7 +1780,7 @@ class SpecCompiler:
             )
 
             # Load station for this step
-            station = load_station(step.station, context.repo_root)
+            station = load_station_cached(step.station, context.repo_root)
 
             # Build plan using compile_step infrastructure
             step_plan = self._compile_flow_step(
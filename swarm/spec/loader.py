@@ -10,6 +10,9 @@ The loader prioritizes JSON files from swarm/specs/:
 1. Check swarm/specs/stations/<id>.json first
 2. Fall back to swarm/spec/stations/<id>.yaml for migration period
 
+The *_cached variants go through the shared SpecCache (swarm/spec/cache.py)
+and reload automatically when the underlying file changes.
+
 For one-time migration from YAML to JSON, use:
     from swarm.spec.loader import migrate_yaml_to_json
     migrate_yaml_to_json()
@@ -19,12 +22,13 @@ from __future__ import annotations
 
 import json
 import logging
-from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+from .cache import get_spec_cache
+from .schema_registry import JSONSCHEMA_AVAILABLE, get_schema_registry
 from .types import (
     FlowSpec,
     StationSpec,
@@ -91,6 +95,40 @@ def _load_yaml_file(path: Path) -> Dict[str, Any]:
     return data
 
 
+def _as_repo_root(repo_root: Union[str, Path, None]) -> Optional[Path]:
+    """Accept the str form used by the *_cached functions as well as a Path."""
+    return Path(repo_root) if repo_root else None
+
+
+def spec_source_paths(kind: str, spec_id: str, repo_root: Optional[Path] = None) -> List[Path]:
+    """Every file a spec may be loaded from, in priority order.
+
+    Paths are returned whether or not they exist; they are the dependencies
+    recorded by the spec cache.
+
+    Args:
+        kind: "stations", "flows" or "fragments".
+        spec_id: Station/flow ID, or fragment path (e.g. "common/invariants.md").
+        repo_root: Optional repository root path.
+    """
+    if kind == "fragments":
+        return [
+            get_specs_root(repo_root) / "fragments" / spec_id,
+            get_spec_root(repo_root) / "fragments" / spec_id,
+        ]
+    return [
+        get_specs_root(repo_root) / kind / f"{spec_id}.json",
+        get_spec_root(repo_root) / kind / f"{spec_id}.yaml",
+    ]
+
+
+def _cache_clear(namespace: str) -> Callable[[], None]:
+    """lru_cache-compatible cache_clear() for a spec cache namespace."""
+    def cache_clear() -> None:
+        get_spec_cache().clear(namespace)
+    return cache_clear
+
+
 # =============================================================================
 # Station Loading
 # =============================================================================
@@ -145,10 +183,17 @@ def load_station(station_id: str, repo_root: Optional[Path] = None) -> StationSp
     )
 
 
-@lru_cache(maxsize=64)
-def load_station_cached(station_id: str, repo_root_str: str) -> StationSpec:
-    """Cached version of load_station for repeated access."""
-    return load_station(station_id, Path(repo_root_str) if repo_root_str else None)
+def load_station_cached(station_id: str, repo_root_str: Union[str, Path, None]) -> StationSpec:
+    """Cached version of load_station, reloaded when the spec file changes."""
+    repo_root = _as_repo_root(repo_root_str)
+    paths = spec_source_paths("stations", station_id, repo_root)
+    return get_spec_cache().get(
+        "station", (station_id, str(paths[0])), paths,
+        lambda: load_station(station_id, repo_root),
+    )
+
+
+load_station_cached.cache_clear = _cache_clear("station")  # type: ignore[attr-defined]
 
 
 def list_stations(repo_root: Optional[Path] = None) -> List[str]:
@@ -238,10 +283,17 @@ def load_flow(flow_id: str, repo_root: Optional[Path] = None) -> FlowSpec:
     )
 
 
-@lru_cache(maxsize=16)
-def load_flow_cached(flow_id: str, repo_root_str: str) -> FlowSpec:
-    """Cached version of load_flow for repeated access."""
-    return load_flow(flow_id, Path(repo_root_str) if repo_root_str else None)
+def load_flow_cached(flow_id: str, repo_root_str: Union[str, Path, None]) -> FlowSpec:
+    """Cached version of load_flow, reloaded when the spec file changes."""
+    repo_root = _as_repo_root(repo_root_str)
+    paths = spec_source_paths("flows", flow_id, repo_root)
+    return get_spec_cache().get(
+        "flow", (flow_id, str(paths[0])), paths,
+        lambda: load_flow(flow_id, repo_root),
+    )
+
+
+load_flow_cached.cache_clear = _cache_clear("flow")  # type: ignore[attr-defined]
 
 
 def list_flows(repo_root: Optional[Path] = None) -> List[str]:
@@ -340,7 +392,7 @@ def load_fragments(
 
     for frag_path in fragment_paths:
         try:
-            content = load_fragment(frag_path, repo_root)
+            content = load_fragment_cached(frag_path, repo_root)
             if content.strip():
                 contents.append(content.strip())
         except FileNotFoundError:
@@ -349,10 +401,17 @@ def load_fragments(
     return separator.join(contents)
 
 
-@lru_cache(maxsize=64)
-def load_fragment_cached(fragment_path: str, repo_root_str: str) -> str:
-    """Cached version of load_fragment for repeated access."""
-    return load_fragment(fragment_path, Path(repo_root_str) if repo_root_str else None)
+def load_fragment_cached(fragment_path: str, repo_root_str: Union[str, Path, None]) -> str:
+    """Cached version of load_fragment, reloaded when the fragment changes."""
+    repo_root = _as_repo_root(repo_root_str)
+    paths = spec_source_paths("fragments", fragment_path, repo_root)
+    return get_spec_cache().get(
+        "fragment", (fragment_path, str(paths[0])), paths,
+        lambda: load_fragment(fragment_path, repo_root),
+    )
+
+
+load_fragment_cached.cache_clear = _cache_clear("fragment")  # type: ignore[attr-defined]
 
 
 def list_fragments(repo_root: Optional[Path] = None) -> List[str]:
@@ -509,11 +568,11 @@ def validate_specs(repo_root: Optional[Path] = None) -> Dict[str, List[str]]:
     specs_root = get_specs_root(repo_root)
     spec_root = get_spec_root(repo_root)
 
-    # Load schema for validation if jsonschema is available
-    try:
-        import jsonschema
-        schema_available = True
-
+    # Compile schemas for validation if jsonschema is available
+    station_schema = None
+    flow_schema = None
+    schema_available = JSONSCHEMA_AVAILABLE
+    if schema_available:
         # Try new specs location first, then legacy
         station_schema_path = specs_root / "schemas" / "station.schema.json"
         if not station_schema_path.exists():
@@ -523,21 +582,12 @@ def validate_specs(repo_root: Optional[Path] = None) -> Dict[str, List[str]]:
         if not flow_schema_path.exists():
             flow_schema_path = spec_root / "schemas" / "flow.schema.json"
 
-        station_schema = None
-        flow_schema = None
-
+        registry = get_schema_registry()
         if station_schema_path.exists():
-            with open(station_schema_path, "r", encoding="utf-8") as f:
-                station_schema = json.load(f)
-
+            station_schema = registry.validator(station_schema_path)
         if flow_schema_path.exists():
-            with open(flow_schema_path, "r", encoding="utf-8") as f:
-                flow_schema = json.load(f)
-
-    except ImportError:
-        schema_available = False
-        station_schema = None
-        flow_schema = None
+            flow_schema = registry.validator(flow_schema_path)
+    else:
         warnings.append("jsonschema not installed - skipping JSON Schema validation")
 
     # Validate stations
@@ -560,9 +610,8 @@ def validate_specs(repo_root: Optional[Path] = None) -> Dict[str, List[str]]:
                 else:
                     continue
 
-                try:
-                    jsonschema.validate(raw_data, station_schema)
-                except jsonschema.ValidationError as ve:
+                ve = station_schema.best_error(raw_data)
+                if ve is not None:
                     errors.append(f"Station {station_id}: Schema validation failed - {ve.message}")
 
             # Check fragment references
@@ -594,9 +643,8 @@ def validate_specs(repo_root: Optional[Path] = None) -> Dict[str, List[str]]:
                 else:
                     continue
 
-                try:
-                    jsonschema.validate(raw_data, flow_schema)
-                except jsonschema.ValidationError as ve:
+                ve = flow_schema.best_error(raw_data)
+                if ve is not None:
                     errors.append(f"Flow {flow_id}: Schema validation failed - {ve.message}")
 
             # Check station references
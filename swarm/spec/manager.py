@@ -9,6 +9,8 @@ It provides:
 - Git integration (optional commit on save)
 - Compile-to-prompt-plan convenience methods
 - Shred/merge overlay behavior (flow.json + flow.ui.json)
+- Reads served from the shared spec cache (swarm/spec/cache.py); every
+  write invalidates the cache entries built from the written file
 
 This module follows ADR-001 (spec-first architecture) and provides the
 central authority for all spec file operations.
@@ -19,6 +21,7 @@ Legacy swarm/spec/ (YAML) is supported for migration but deprecated.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import logging
@@ -32,6 +35,9 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+from .cache import get_spec_cache
+from .schema_registry import get_schema_registry
+
 # Import canonical JSON utilities
 try:
     from swarm.runtime.spec_system.canonical import canonical_json, spec_hash
@@ -504,11 +510,28 @@ class SpecManager:
         return spec_hash(data, length=64)
 
     def _compute_file_etag(self, path: Path) -> Optional[str]:
-        """Compute ETag from file content."""
+        """Compute ETag from file content (cached until the file changes)."""
         if not path.exists():
             return None
-        content = path.read_bytes()
-        return self._compute_etag(content)
+        return get_spec_cache().get(
+            "spec-etag", str(path), [path],
+            lambda: self._compute_etag(path.read_bytes()),
+        )
+
+    def _read_json_spec(self, path: Path) -> Any:
+        """Parse a JSON spec file, returning a private copy.
+
+        The parsed document is kept in the shared spec cache until the file
+        changes, so repeated reads skip the disk and the parser.
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        data = get_spec_cache().get(
+            "spec-json", str(path), [path],
+            lambda: json.loads(path.read_bytes()),
+        )
+        return copy.deepcopy(data)
 
     # =========================================================================
     # Schema Loading
@@ -573,11 +596,9 @@ class SpecManager:
             return errors
 
         try:
-            import jsonschema
-            from jsonschema import Draft7Validator
-
-            validator = Draft7Validator(schema)
-            for error in validator.iter_errors(data):
+            # Compiled once per schema file and shared across the process
+            validator = get_schema_registry().validator(self._schema_path(spec_type))
+            for error in validator.errors(data):
                 path = ".".join(str(p) for p in error.absolute_path) or "root"
                 schema_path = ".".join(str(p) for p in error.schema_path)
                 errors.append(
@@ -640,8 +661,7 @@ class SpecManager:
             raise SpecNotFoundError("flow_graph", flow_id, path)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_spec(path)
         except json.JSONDecodeError as e:
             raise SpecValidationError(
                 "flow_graph",
@@ -676,8 +696,7 @@ class SpecManager:
             raise SpecNotFoundError("step_template", template_id, path)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_spec(path)
         except json.JSONDecodeError as e:
             raise SpecValidationError(
                 "step_template",
@@ -763,8 +782,7 @@ class SpecManager:
         if not path.exists():
             raise FileNotFoundError(f"Template not found: {template_id}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_json_spec(path)
 
         etag = self._compute_file_etag(path)
         return data, etag
@@ -811,6 +829,9 @@ class SpecManager:
             os.replace(tmp_path, path)
             logger.debug("Atomic write complete: %s", path)
 
+            # Visible to the next read even within the same mtime tick
+            get_spec_cache().invalidate_path(path)
+
         except Exception:
             # Clean up temp file on failure
             if os.path.exists(tmp_path):
@@ -1087,8 +1108,7 @@ class SpecManager:
             raise SpecNotFoundError("flow", flow_id, flow_path)
 
         try:
-            with open(flow_path, "r", encoding="utf-8") as f:
-                flow_data = json.load(f)
+            flow_data = self._read_json_spec(flow_path)
         except json.JSONDecodeError as e:
             raise SpecValidationError(
                 "flow",
@@ -1099,8 +1119,7 @@ class SpecManager:
         ui_data = {}
         if ui_path.exists():
             try:
-                with open(ui_path, "r", encoding="utf-8") as f:
-                    ui_data = json.load(f)
+                ui_data = self._read_json_spec(ui_path)
             except json.JSONDecodeError as e:
                 logger.warning("Invalid UI overlay JSON for %s: %s", flow_id, e)
 
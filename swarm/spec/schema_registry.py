@@ -0,0 +1,250 @@
+"""
+schema_registry.py - Process-wide registry of compiled JSON-schema validators.
+
+Envelope writes, spec validation and the preview API used to call
+jsonschema.validate() or build a Draft7Validator per instance, which
+re-checks the schema against its metaschema and rebuilds the validator and
+$ref resolver every time. The registry compiles each schema once:
+- A schema is identified by its file path; sibling *.schema.json files in
+  the same directory are registered under their $id so cross-file $refs
+  (handoff envelope -> routing signal, run state -> envelope) resolve
+  locally
+- The schema is checked against its metaschema once, at compile time
+- When fastjsonschema is installed, draft-04/06/07 schemas are also compiled
+  to Python code and used to accept valid instances quickly; instances it
+  rejects are re-validated with jsonschema so error messages are unchanged
+- Compiled validators live in the shared spec cache, so editing a schema
+  file recompiles it on the next use
+
+Design Philosophy:
+    - jsonschema stays the source of truth for errors: the generated code is
+      only a fast accept path, never the final word on a rejection
+    - Formats are not asserted, matching jsonschema's default
+    - validate_many() amortises lookup and compilation over large batches
+      (rebuilds, selftests, bulk envelope checks)
+
+Usage:
+    from swarm.spec.schema_registry import get_schema_registry
+
+    registry = get_schema_registry()
+    validator = registry.validator(schema_path)
+    errors = validator.errors(instance)        # [] when valid
+    results = registry.validate_many(schema_path, instances)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .cache import get_spec_cache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import jsonschema
+    from jsonschema.exceptions import best_match
+    from referencing import Registry, Resource
+    from referencing.jsonschema import specification_with
+
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+    jsonschema = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    fastjsonschema = None  # type: ignore[assignment]
+
+# Drafts fastjsonschema can generate code for
+_FAST_DRAFTS = ("draft-04", "draft-06", "draft-07")
+
+PathLike = Union[str, Path]
+
+
+class SchemaValidator:
+    """A schema compiled once and reused for every instance.
+
+    Attributes:
+        name: Schema file name (e.g., "handoff_envelope.schema.json").
+        schema: The parsed schema.
+        backend: "fastjsonschema" when a generated fast path is available,
+            otherwise "jsonschema".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schema: Dict[str, Any],
+        store: Dict[str, Dict[str, Any]],
+    ):
+        self.name = name
+        self.schema = schema
+
+        cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+        cls.check_schema(schema)
+        specification = specification_with(cls.META_SCHEMA["$schema"])
+        registry = Registry().with_resources(
+            (uri, Resource.from_contents(contents, default_specification=specification))
+            for uri, contents in store.items()
+        )
+        self._validator = cls(schema, registry=registry)
+        self._fast = _compile_fast(schema, store)
+        self.backend = "fastjsonschema" if self._fast is not None else "jsonschema"
+
+    def is_valid(self, instance: Any) -> bool:
+        """Whether instance conforms to the schema."""
+        if self._fast is not None:
+            try:
+                self._fast(instance)
+                return True
+            except Exception:
+                pass  # confirm with jsonschema below
+        return self._validator.is_valid(instance)
+
+    def errors(self, instance: Any) -> List["jsonschema.ValidationError"]:
+        """All validation errors for instance (empty when valid)."""
+        if self.is_valid(instance):
+            return []
+        return list(self._validator.iter_errors(instance))
+
+    def best_error(self, instance: Any) -> Optional["jsonschema.ValidationError"]:
+        """The error jsonschema.validate() would raise, or None when valid."""
+        if self.is_valid(instance):
+            return None
+        return best_match(self._validator.iter_errors(instance))
+
+
+def _compile_fast(
+    schema: Dict[str, Any], store: Dict[str, Dict[str, Any]]
+) -> Optional[Callable[[Any], Any]]:
+    """Generated-code validator for the fast accept path, if available."""
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+    if not any(draft in schema.get("$schema", "draft-07") for draft in _FAST_DRAFTS):
+        return None
+
+    def handler(uri: str) -> Dict[str, Any]:
+        return store[uri]
+
+    try:
+        return fastjsonschema.compile(
+            schema,
+            handlers={"http": handler, "https": handler},
+            use_formats=False,
+        )
+    except Exception as e:
+        logger.debug("fastjsonschema could not compile %s: %s", schema.get("$id", "schema"), e)
+        return None
+
+
+def _load_store(schema_dir: Path) -> Tuple[Dict[str, Dict[str, Any]], List[Path]]:
+    """Sibling schemas keyed by URI, and the files read.
+
+    Each schema is registered under its $id and under its file name joined
+    to every base URI used in the directory, so a relative $ref such as
+    "handoff_envelope.schema.json" resolves whichever $id it is relative to.
+    """
+    schemas: Dict[str, Dict[str, Any]] = {}
+    paths = sorted(schema_dir.glob("*.schema.json"))
+    for path in paths:
+        try:
+            contents = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug("Skipping unreadable schema %s: %s", path, e)
+            continue
+        if isinstance(contents, dict):
+            schemas[path.name] = contents
+
+    store: Dict[str, Dict[str, Any]] = {}
+    bases = {
+        schema["$id"].rsplit("/", 1)[0] + "/"
+        for schema in schemas.values()
+        if "://" in schema.get("$id", "")
+    }
+    for name, schema in schemas.items():
+        for base in bases:
+            store.setdefault(base + name, schema)
+    for schema in schemas.values():
+        if schema.get("$id"):
+            store[schema["$id"]] = schema
+    return store, paths
+
+
+class SchemaRegistry:
+    """Compiled validators for schema files, shared across the process.
+
+    Validators are stored in the shared spec cache and depend on every
+    schema file in their directory, so editing any of them recompiles.
+    """
+
+    def __init__(self) -> None:
+        self._compiled = 0
+        self._lock = threading.Lock()
+
+    def validator(self, schema_path: PathLike) -> SchemaValidator:
+        """Return the compiled validator for a schema file.
+
+        Raises:
+            RuntimeError: If jsonschema is not installed.
+            FileNotFoundError: If the schema file does not exist.
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        if not JSONSCHEMA_AVAILABLE:
+            raise RuntimeError("jsonschema is not installed")
+        path = Path(schema_path).resolve()
+
+        def build() -> Tuple[SchemaValidator, List[Path]]:
+            schema = json.loads(path.read_text(encoding="utf-8"))
+            store, sources = _load_store(path.parent)
+            validator = SchemaValidator(path.name, schema, store)
+            with self._lock:
+                self._compiled += 1
+            logger.debug("Compiled schema %s (%s)", path.name, validator.backend)
+            return validator, [path, *sources]
+
+        return get_spec_cache().get_derived("schema-validator", str(path), build)
+
+    def validate(self, schema_path: PathLike, instance: Any) -> List["jsonschema.ValidationError"]:
+        """All validation errors for one instance."""
+        return self.validator(schema_path).errors(instance)
+
+    def validate_many(
+        self, schema_path: PathLike, instances: Iterable[Any]
+    ) -> List[List["jsonschema.ValidationError"]]:
+        """Validate a batch against one schema; one error list per instance."""
+        validator = self.validator(schema_path)
+        return [validator.errors(instance) for instance in instances]
+
+    @property
+    def compiled(self) -> int:
+        """Number of schema compilations performed (cache misses)."""
+        return self._compiled
+
+
+_registry: Optional[SchemaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Return the process-wide schema registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SchemaRegistry()
+        return _registry
+
+
+def reset_schema_registry() -> None:
+    """Drop the registry and its compiled validators."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+    get_spec_cache().clear("schema-validator")
@@ -298,6 +298,11 @@ class PromptPlan:
     # V2: Flow key for routing (e.g., "build" from "3-build")
     flow_key: str = ""
 
+    # Compilation cost: wall time and plan cache outcome
+    # ("hit", "static" = static sections reused, "miss")
+    compile_ms: float = 0.0
+    compile_cache: str = ""
+
 
 @dataclass(frozen=True)
 class PromptReceipt:
@@ -33,7 +33,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.concurrency import run_in_threadpool
 
@@ -621,84 +621,102 @@ def create_fastapi_app() -> FastAPI:
     async def api_runs(
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        status: Optional[str] = Query(None, description="Only runs with this status"),
+        flow_key: Optional[str] = Query(None, description="Only runs that include this flow"),
+        tag: Optional[List[str]] = Query(None, description="Only runs with all of these tags"),
+        sort: str = Query("created_at", description="Sort key: created_at, status or flow_key"),
+        order: str = Query("desc", description="Sort direction: asc or desc"),
     ):
         """List available runs with pagination (active + examples).
 
         Args:
             limit: Maximum number of runs to return (default 100, max 500).
             offset: Number of runs to skip from the beginning (default 0).
+            cursor: Keyset cursor from a previous response; takes precedence
+                over offset.
+            status, flow_key, tag: Server-side filters.
+            sort, order: Sort key and direction. Examples always come first.
 
-        Delegates to RunService for unified run discovery and metadata.
-        Falls back to FlowStudioCore if RunService is unavailable.
+        Delegates to RunService, which answers from the indexed run catalog.
+        Falls back to FlowStudioCore if RunService is unavailable or finds
+        no runs (no filtering or cursors there).
 
-        Note: Uses run_in_threadpool because list_runs() does filesystem
-        work (directory scanning, stat calls) that can be slow on WSL/Windows.
+        Note: Uses run_in_threadpool because the catalog may reconcile
+        against the run directories (stat calls) before answering.
         """
         # Clamp pagination parameters
         limit = max(1, min(limit, 500))  # 1-500 range
         offset = max(0, offset)
 
-        def _fetch_runs():
-            """Blocking function to fetch runs - runs in threadpool."""
-            all_runs_inner = []
+        def _run_to_dict(summary) -> Dict[str, Any]:
+            """Convert a RunSummary to the backward-compatible dict format."""
+            # Determine run_type from tags
+            run_type = "example" if "example" in summary.tags else "active"
+
+            run_data = {
+                "run_id": summary.id,
+                "run_type": run_type,
+                "path": summary.path or "",
+                "status": summary.status.value,
+                "created_at": summary.created_at.isoformat(),
+            }
 
+            # Add optional metadata
+            if summary.title:
+                run_data["title"] = summary.title
+            if summary.description:
+                run_data["description"] = summary.description
+            # Add backend from spec
+            if summary.spec and summary.spec.backend:
+                run_data["backend"] = summary.spec.backend
+            # Add exemplar flag
+            if summary.is_exemplar:
+                run_data["is_exemplar"] = True
+            # Extract tags (excluding type markers)
+            filtered_tags = [t for t in summary.tags if t not in ("example", "legacy")]
+            if filtered_tags:
+                run_data["tags"] = filtered_tags
+            return run_data
+
+        def _fetch_page():
+            """Blocking function to fetch one page - runs in threadpool."""
             # Try RunService first for unified run listing
             if _run_service is not None:
                 try:
-                    summaries = _run_service.list_runs(
+                    page = _run_service.query_runs(
+                        flow_key=flow_key,
+                        status=status,
+                        tags=tag,
                         include_legacy=True,
                         include_examples=True,
+                        sort_by=sort,
+                        descending=(order.lower() != "asc"),
+                        limit=limit,
+                        offset=offset,
+                        cursor=cursor,
                     )
-
-                    # Convert RunSummary objects to backward-compatible dict format
-                    for summary in summaries:
-                        # Determine run_type from tags
-                        if "example" in summary.tags:
-                            run_type = "example"
-                        else:
-                            run_type = "active"
-
-                        run_data = {
-                            "run_id": summary.id,
-                            "run_type": run_type,
-                            "path": summary.path or "",
-                        }
-
-                        # Add optional metadata
-                        if summary.title:
-                            run_data["title"] = summary.title
-                        if summary.description:
-                            run_data["description"] = summary.description
-                        # Add backend from spec
-                        if summary.spec and summary.spec.backend:
-                            run_data["backend"] = summary.spec.backend
-                        # Add exemplar flag
-                        if summary.is_exemplar:
-                            run_data["is_exemplar"] = True
-                        # Extract tags (excluding type markers)
-                        filtered_tags = [t for t in summary.tags if t not in ("example", "legacy")]
-                        if filtered_tags:
-                            run_data["tags"] = filtered_tags
-
-                        all_runs_inner.append(run_data)
-
+                    filtered = status is not None or flow_key is not None or bool(tag)
+                    if page.total or filtered:
+                        return [_run_to_dict(s) for s in page.runs], page.total, page.next_cursor
+                except ValueError:
+                    raise
                 except Exception as e:
                     logger.warning(
-                        "RunService.list_runs failed, falling back to legacy inspector: %s",
+                        "RunService.query_runs failed, falling back to legacy inspector: %s",
                         e,
                         exc_info=True,
                     )
-                    all_runs_inner = []  # Reset for fallback
 
             # Fall back to FlowStudioCore if no runs from RunService
-            if not all_runs_inner and _core:
-                all_runs_inner = _core.list_runs()
-
-            return all_runs_inner
+            all_runs = _core.list_runs() if _core else []
+            return all_runs[offset:offset + limit], len(all_runs), None
 
         try:
             # Offload filesystem work to threadpool to avoid blocking event loop
-            all_runs = await run_in_threadpool(_fetch_runs)
+            runs, total, next_cursor = await run_in_threadpool(_fetch_page)
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
         except Exception:
             return JSONResponse(
                 {
@@ -712,17 +730,18 @@ def create_fastapi_app() -> FastAPI:
                 status_code=503
             )
 
-        # Apply pagination
-        total = len(all_runs)
-        paginated_runs = all_runs[offset:offset + limit]
-        has_more = (offset + limit) < total
+        if cursor is None:
+            has_more = (offset + limit) < total
+        else:
+            has_more = next_cursor is not None
 
         return {
-            "runs": paginated_runs,
+            "runs": runs,
             "total": total,
             "limit": limit,
             "offset": offset,
             "has_more": has_more,
+            "next_cursor": next_cursor,
         }
 
     @app.get("/api/runs/{run_id}/summary", response_model=schema.RunSummary if schema else None)
@@ -777,6 +796,17 @@ def create_fastapi_app() -> FastAPI:
                 status_code=500
             )
 
+    @app.get("/api/runs/scheduler", response_model=schema.RunSchedulerStatsResponse if schema else None)
+    async def api_run_scheduler():
+        """Run scheduler queue depth and slot usage."""
+        if _run_service is None:
+            return JSONResponse(
+                {"error": "RunService not available"},
+                status_code=503
+            )
+
+        return _run_service.scheduler_stats().to_dict()
+
     @app.post("/api/run", response_model=schema.StartRunResponse if schema else None)
     async def api_start_run(request: schema.StartRunRequest if schema else None):
         """Start a new run.
@@ -811,6 +841,14 @@ def create_fastapi_app() -> FastAPI:
                 initiator="flow-studio",
             )
             run_id = _run_service.start_run(spec)
+            summary = _run_service.get_run(run_id)
+            if summary is not None and summary.status == RunStatus.QUEUED:
+                logger.info("Queued run %s with flows: %s", run_id, request.flows)
+                return {
+                    "run_id": run_id,
+                    "status": "queued",
+                    "message": f"Run {run_id} queued with flows: {', '.join(request.flows)}",
+                }
             logger.info("Started run %s with flows: %s", run_id, request.flows)
             return {
                 "run_id": run_id,
@@ -862,31 +900,12 @@ def create_fastapi_app() -> FastAPI:
                 status_code=500
             )
 
-    @app.get("/api/runs/{run_id}/flows/{flow_key}/steps/{step_id}/transcript")
-    async def api_step_transcript(run_id: str, flow_key: str, step_id: str):
-        """Get LLM transcript for a specific step.
+    def _find_step_transcript(run_id: str, flow_key: str, step_id: str):
+        """Locate a step's transcript file.
 
-        Returns the conversation transcript (system/user/assistant messages)
-        from Claude or Gemini execution of a specific step.
-
-        Transcripts are stored at:
-            RUN_BASE/<flow_key>/llm/<step_id>-*.jsonl
-
-        Response:
-            {
-                "run_id": "...",
-                "flow_key": "...",
-                "step_id": "...",
-                "engine": "claude" | "gemini" | null,
-                "messages": [
-                    {"ts": "...", "type": "system", "content": "..."},
-                    {"ts": "...", "type": "user", "content": "..."},
-                    {"ts": "...", "type": "assistant", "content": "...", "tool_calls": [...]}
-                ]
-            }
+        Returns:
+            (transcript path, None) or (None, JSONResponse error).
         """
-        import json as json_module
-
         # Find run path
         run_path = None
         if _run_inspector is not None:
@@ -898,7 +917,7 @@ def create_fastapi_app() -> FastAPI:
             run_path = runtime_storage.find_run_path(run_id)
 
         if run_path is None:
-            return JSONResponse(
+            return None, JSONResponse(
                 {"error": f"Run '{run_id}' not found"},
                 status_code=404
             )
@@ -906,7 +925,7 @@ def create_fastapi_app() -> FastAPI:
         # Look for transcript files in llm/ subdirectory
         llm_dir = Path(run_path) / flow_key / "llm"
         if not llm_dir.exists():
-            return JSONResponse(
+            return None, JSONResponse(
                 {
                     "error": "No transcripts available for this step",
                     "hint": "Transcripts are written by Claude flows using record_event.py"
@@ -915,53 +934,153 @@ def create_fastapi_app() -> FastAPI:
             )
 
         # Find matching transcript file (pattern: <step_id>-<agent>-<engine>.jsonl)
-        transcripts = list(llm_dir.glob(f"{step_id}-*.jsonl"))
+        transcripts = sorted(llm_dir.glob(f"{step_id}-*.jsonl"))
         if not transcripts:
-            return JSONResponse(
+            return None, JSONResponse(
                 {
                     "error": f"No transcript found for step '{step_id}'",
                     "available_files": [f.name for f in llm_dir.glob("*.jsonl")]
                 },
                 status_code=404
             )
+        return transcripts[0], None
 
-        # Parse the transcript file
-        transcript_file = transcripts[0]
-        messages = []
-        engine = None
+    def _parse_message_kinds(value: Optional[str]):
+        """Comma-separated message kinds to a set, or None for no filter."""
+        if not value:
+            return None
+        kinds = {kind.strip() for kind in value.split(",") if kind.strip()}
+        return kinds or None
 
-        try:
-            with transcript_file.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        msg = json_module.loads(line)
-                        messages.append(msg)
-                    except json_module.JSONDecodeError:
-                        continue  # Skip malformed lines
+    @app.get("/api/runs/{run_id}/flows/{flow_key}/steps/{step_id}/transcript")
+    async def api_step_transcript(
+        run_id: str,
+        flow_key: str,
+        step_id: str,
+        after: int = Query(0, description="Cursor: return messages after this message number"),
+        limit: Optional[int] = Query(None, description="Maximum messages to return (max 5000)"),
+        kind: Optional[str] = Query(
+            None,
+            alias="type",
+            description="Comma-separated message kinds, e.g. assistant,tool_call",
+        ),
+    ):
+        """Get LLM transcript for a specific step.
+
+        Returns the conversation transcript (system/user/assistant messages)
+        from Claude or Gemini execution of a specific step.
+
+        Transcripts are stored at:
+            RUN_BASE/<flow_key>/llm/<step_id>-*.jsonl
 
-            # Try to infer engine from filename (e.g., "3.4-code-implementer-claude.jsonl")
-            parts = transcript_file.stem.split("-")
-            if len(parts) >= 3:
-                engine = parts[-1]  # Last part is engine
+        Messages are numbered from 1 in transcript order. Pass ?limit=M to
+        page, then ?after=<next_after> for the next page; ?type=tool_call
+        (or assistant, user, system, tool_result, error, ...) filters by
+        message kind. Only the requested lines are read, using the line
+        index written alongside the transcript. Without limit, every
+        matching message is returned. For very long transcripts prefer
+        /transcript/stream.
 
+        Response:
+            {
+                "run_id": "...",
+                "flow_key": "...",
+                "step_id": "...",
+                "engine": "claude" | "gemini" | null,
+                "messages": [
+                    {"ts": "...", "type": "system", "content": "..."},
+                    {"ts": "...", "type": "user", "content": "..."},
+                    {"ts": "...", "type": "assistant", "content": "...", "tool_calls": [...]}
+                ],
+                "total": 120,
+                "after": 0,
+                "next_after": 50,
+                "has_more": true
+            }
+        """
+        from swarm.runtime.transcript_io import read_transcript_page
+
+        transcript_file, error = _find_step_transcript(run_id, flow_key, step_id)
+        if error is not None:
+            return error
+
+        if limit is not None:
+            limit = max(1, min(limit, 5000))
+        after = max(0, after)
+
+        try:
+            page = await run_in_threadpool(
+                read_transcript_page,
+                transcript_file,
+                after,
+                limit,
+                _parse_message_kinds(kind),
+            )
         except Exception as e:
             return JSONResponse(
                 {"error": f"Failed to read transcript: {str(e)}"},
                 status_code=500
             )
 
+        # Try to infer engine from filename (e.g., "3.4-code-implementer-claude.jsonl")
+        engine = None
+        parts = transcript_file.stem.split("-")
+        if len(parts) >= 3:
+            engine = parts[-1]  # Last part is engine
+
         return {
             "run_id": run_id,
             "flow_key": flow_key,
             "step_id": step_id,
             "engine": engine,
-            "messages": messages,
+            "messages": page.messages,
             "transcript_file": transcript_file.name,
+            "total": page.total,
+            "after": after,
+            "next_after": page.next_after,
+            "has_more": page.has_more,
         }
 
+    @app.get("/api/runs/{run_id}/flows/{flow_key}/steps/{step_id}/transcript/stream")
+    async def api_step_transcript_stream(
+        run_id: str,
+        flow_key: str,
+        step_id: str,
+        after: int = Query(0, description="Cursor: stream messages after this message number"),
+        kind: Optional[str] = Query(
+            None,
+            alias="type",
+            description="Comma-separated message kinds, e.g. assistant,tool_call",
+        ),
+    ):
+        """Stream a step's LLM transcript as NDJSON (one message per line).
+
+        Lines are copied from the transcript file as written, without being
+        parsed or re-encoded, so memory use stays flat however long the
+        session was. Supports the same after/type parameters as /transcript.
+        The X-Transcript-Total header carries the total message count.
+        """
+        from swarm.runtime.transcript_io import iter_transcript_lines, load_index
+
+        transcript_file, error = _find_step_transcript(run_id, flow_key, step_id)
+        if error is not None:
+            return error
+
+        try:
+            # Build or load the index before the response starts
+            index = await run_in_threadpool(load_index, transcript_file)
+        except Exception as e:
+            return JSONResponse(
+                {"error": f"Failed to read transcript: {str(e)}"},
+                status_code=500
+            )
+
+        return StreamingResponse(
+            iter_transcript_lines(transcript_file, max(0, after), _parse_message_kinds(kind)),
+            media_type="application/x-ndjson",
+            headers={"X-Transcript-Total": str(len(index))},
+        )
+
     @app.get("/api/runs/{run_id}/flows/{flow_key}/steps/{step_id}/receipt")
     async def api_step_receipt(run_id: str, flow_key: str, step_id: str):
         """Get step receipt (summary) for a specific step.
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+End-to-end orchestrator throughput benchmark on the stub engine.
+
+Drives StepwiseOrchestrator.run_stepwise_flow_with_routing() over every
+shipped flow, and run_autopilot() over the default plan, with the Claude
+engine in stub mode (no LLM calls). Each scenario runs against a synthetic
+git repository of a given size, optionally with extra events per step, and
+reports:
+- Per-phase time (hydrate, prompt_build, engine, diff_scan, envelope_write,
+  routing, event_append, db_ingest), exclusive of nested phases, plus the
+  unattributed orchestrator remainder
+- Steps per second, events written, peak RSS
+
+Results are written as JSON and can be compared against a stored baseline;
+the comparison exits non-zero when a phase's per-step time regresses beyond
+the tolerance.
+
+Usage:
+  uv run swarm/tools/orchestrator_bench.py                      # Full matrix
+  uv run swarm/tools/orchestrator_bench.py --quick              # Small matrix
+  uv run swarm/tools/orchestrator_bench.py --save-baseline      # Store baseline
+  uv run swarm/tools/orchestrator_bench.py --baseline .benchmarks/orchestrator/baseline.json
+
+Examples:
+  uv run swarm/tools/orchestrator_bench.py --mode flows --repo-files 5000 --events-per-step 200
+  uv run swarm/tools/orchestrator_bench.py --flows signal,build --iterations 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add swarm package to path for library imports
+_SWARM_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_SWARM_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SWARM_ROOT))
+
+from swarm.config.flow_registry import FlowRegistry  # noqa: E402
+from swarm.runtime import storage  # noqa: E402
+from swarm.runtime.diff_scanner import close_diff_scanners  # noqa: E402
+from swarm.runtime.engines.claude import ClaudeStepEngine  # noqa: E402
+from swarm.runtime.engines.models import StepContext  # noqa: E402
+from swarm.runtime.phase_timing import PHASES, phase, recording  # noqa: E402
+from swarm.runtime.stepwise.orchestrator import get_orchestrator  # noqa: E402
+from swarm.runtime.types import RunEvent, RunSpec  # noqa: E402
+
+__version__ = "1.0.0"
+
+SCHEMA_VERSION = 1
+RESULTS_DIR = _SWARM_ROOT / ".benchmarks" / "orchestrator"
+DEFAULT_OUTPUT = RESULTS_DIR / "latest.json"
+DEFAULT_BASELINE = RESULTS_DIR / "baseline.json"
+
+# Phase regressions smaller than this are treated as noise
+NOISE_FLOOR_MS = 0.5
+
+# Top-level entries the runtime reads relative to repo_root
+_LINKED_ENTRIES = ("swarm", ".claude")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark configuration."""
+
+    mode: str  # "flows" or "autopilot"
+    repo_files: int
+    dirty_files: int
+    events_per_step: int
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{self.mode}-files{self.repo_files}-dirty{self.dirty_files}"
+            f"-events{self.events_per_step}"
+        )
+
+
+class BenchStubEngine(ClaudeStepEngine):
+    """Claude engine in stub mode with the work-phase overheads of the SDK path.
+
+    Stub mode skips prompt building; the SDK path always builds the prompt
+    after hydration, so the benchmark does too. Synthetic log events stand in
+    for the tool-call stream a real agent produces.
+    """
+
+    def __init__(self, repo_root: Path, events_per_step: int = 0):
+        super().__init__(repo_root, mode="stub")
+        self._events_per_step = events_per_step
+
+    def run_worker(self, ctx: StepContext):
+        ctx = self._hydrate_context(ctx)
+        self._build_prompt(ctx)
+        step_result, events, work_summary = super().run_worker(ctx)
+        events = list(events) + [
+            RunEvent(
+                run_id=ctx.run_id,
+                ts=datetime.now(timezone.utc),
+                kind="log",
+                flow_key=ctx.flow_key,
+                step_id=ctx.step_id,
+                payload={"message": f"synthetic tool call {i}", "tool": "Read", "bench": True},
+            )
+            for i in range(self._events_per_step)
+        ]
+        return step_result, events, work_summary
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def make_synthetic_repo(root: Path, files: int, dirty: int) -> Path:
+    """Create a git repository with `files` committed files, `dirty` of them modified.
+
+    The swarm configuration is linked in so flows, prompts and agents resolve,
+    and run artifacts land in the real runs directory.
+    """
+    repo = root / f"repo-{files}"
+    repo.mkdir()
+    for name in _LINKED_ENTRIES:
+        (repo / name).symlink_to(_SWARM_ROOT / name, target_is_directory=True)
+    per_dir = 200
+    for i in range(files):
+        path = repo / "src" / f"pkg{i // per_dir:03d}" / f"module_{i:05d}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'"""Synthetic module {i}."""\n\nVALUE = {i}\n')
+    _git(repo, "init", "-q")
+    _git(repo, "add", "-A")
+    _git(
+        repo,
+        "-c", "user.name=bench",
+        "-c", "user.email=bench@example.invalid",
+        "-c", "commit.gpgsign=false",
+        "commit", "-q", "-m", "synthetic repo",
+    )
+    for i in range(min(dirty, files)):
+        path = repo / "src" / f"pkg{i // per_dir:03d}" / f"module_{i:05d}.py"
+        path.write_text(path.read_text() + f"CHANGED = {i}\n")
+    return repo
+
+
+def _open_stats_db(path: Path):
+    """StatsDB for ingestion, or None when DuckDB is unavailable."""
+    from swarm.runtime.db import StatsDB
+
+    db = StatsDB(db_path=path)
+    return db if db.connection is not None else None
+
+
+def _count_events(run_id: str) -> Dict[str, int]:
+    counts = {"events": 0, "steps": 0}
+    events_file = storage.get_run_path(run_id) / "events.jsonl"
+    if not events_file.exists():
+        return counts
+    with events_file.open("rb") as f:
+        for line in f:
+            counts["events"] += 1
+            if b'"step_routed"' in line:
+                counts["steps"] += 1
+    return counts
+
+
+def run_scenario(
+    scenario: Scenario,
+    repo: Path,
+    flows: List[str],
+    iterations: int,
+    db_path: Optional[Path],
+) -> Dict[str, Any]:
+    """Run one scenario and return its metrics."""
+    engine = BenchStubEngine(repo, events_per_step=scenario.events_per_step)
+    orchestrator = get_orchestrator(engine=engine, repo_root=repo, skip_preflight=True)
+    db = _open_stats_db(db_path) if db_path else None
+    tailer = None
+    if db is not None:
+        from swarm.runtime.run_tailer import RunTailer
+
+        tailer = RunTailer(db)
+
+    run_ids: List[str] = []
+    failures: List[str] = []
+
+    def ingest(run_id: str) -> None:
+        if tailer is not None:
+            with phase("db_ingest"):
+                tailer.tail_run(run_id)
+
+    with recording() as recorder:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if scenario.mode == "autopilot":
+                spec = RunSpec(flow_keys=[], initiator="orchestrator-bench")
+                try:
+                    run_id = orchestrator.run_autopilot(spec)
+                    run_ids.append(run_id)
+                    ingest(run_id)
+                except Exception as e:
+                    failures.append(f"autopilot: {e}")
+                continue
+            for flow_key in flows:
+                spec = RunSpec(flow_keys=[flow_key], initiator="orchestrator-bench")
+                try:
+                    result = orchestrator.run_stepwise_flow_with_routing(flow_key, spec)
+                    run_ids.append(result.run_id)
+                    ingest(result.run_id)
+                except Exception as e:
+                    failures.append(f"{flow_key}: {e}")
+        wall_s = time.perf_counter() - start
+
+    totals = {"events": 0, "steps": 0}
+    for run_id in run_ids:
+        for key, value in _count_events(run_id).items():
+            totals[key] += value
+        shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+    if db is not None:
+        db.close()
+
+    steps = totals["steps"]
+    recorded = recorder.snapshot()
+    phases: Dict[str, Dict[str, Any]] = {}
+    attributed_s = 0.0
+    for name in PHASES:
+        entry = recorded.get(name, {"seconds": 0.0, "calls": 0})
+        attributed_s += entry["seconds"]
+        phases[name] = _phase_entry(entry["seconds"], entry["calls"], steps, wall_s)
+    phases["orchestrator"] = _phase_entry(max(wall_s - attributed_s, 0.0), 0, steps, wall_s)
+
+    return {
+        "scenario": {
+            "mode": scenario.mode,
+            "repo_files": scenario.repo_files,
+            "dirty_files": scenario.dirty_files,
+            "events_per_step": scenario.events_per_step,
+            "iterations": iterations,
+            "flows": flows if scenario.mode == "flows" else [],
+        },
+        "runs": len(run_ids),
+        "failures": failures,
+        "steps": steps,
+        "events": totals["events"],
+        "wall_s": round(wall_s, 4),
+        "steps_per_sec": round(steps / wall_s, 2) if wall_s else 0.0,
+        "ms_per_step": round(wall_s * 1000 / steps, 3) if steps else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "db_ingest": "enabled" if db is not None else "unavailable",
+        "phases": phases,
+    }
+
+
+def _phase_entry(seconds: float, calls: int, steps: int, wall_s: float) -> Dict[str, Any]:
+    return {
+        "total_ms": round(seconds * 1000, 3),
+        "ms_per_step": round(seconds * 1000 / steps, 3) if steps else 0.0,
+        "calls": calls,
+        "share": round(seconds / wall_s, 4) if wall_s else 0.0,
+    }
+
+
+def _peak_rss_mb() -> float:
+    """Process peak resident set size (high-water mark) in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_SWARM_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Per-step regressions of current against baseline, as readable lines."""
+    regressions: List[str] = []
+    for name, result in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        metrics = [("total", result["ms_per_step"], base["ms_per_step"])]
+        for phase_name, entry in result["phases"].items():
+            base_entry = base["phases"].get(phase_name)
+            if base_entry is not None:
+                metrics.append((phase_name, entry["ms_per_step"], base_entry["ms_per_step"]))
+        for metric, now, before in metrics:
+            if now - before > NOISE_FLOOR_MS and now > before * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {before:.2f} -> {now:.2f} ms/step "
+                    f"(+{(now / before - 1) * 100 if before else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def build_scenarios(args: argparse.Namespace) -> List[Scenario]:
+    modes = ["flows", "autopilot"] if args.mode == "all" else [args.mode]
+    return [
+        Scenario(mode, files, min(args.dirty_files, files), events)
+        for mode in modes
+        for files in args.repo_files
+        for events in args.events_per_step
+    ]
+
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name}: {result['steps']} steps in {result['wall_s']:.2f}s "
+        f"({result['steps_per_sec']:.1f} steps/s, {result['events']} events, "
+        f"peak RSS {result['peak_rss_mb']:.0f} MiB)"
+    )
+    for phase_name, entry in result["phases"].items():
+        if entry["total_ms"] or phase_name == "orchestrator":
+            print(
+                f"  {phase_name:<15} {entry['ms_per_step']:>8.2f} ms/step "
+                f"{entry['share'] * 100:>5.1f}%  ({entry['calls']} calls)"
+            )
+    for failure in result["failures"]:
+        print(f"  FAILED {failure}")
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark orchestrator overhead on the stub engine.",
+        epilog=f"Results are written to {DEFAULT_OUTPUT.relative_to(_SWARM_ROOT)} by default.",
+    )
+    parser.add_argument("--mode", choices=["flows", "autopilot", "all"], default="all")
+    parser.add_argument(
+        "--flows",
+        default="",
+        help="Comma-separated flow keys for flows mode (default: every shipped flow)",
+    )
+    parser.add_argument(
+        "--repo-files", type=_int_list, default=[100, 2000],
+        help="Comma-separated synthetic repo sizes in files (default: 100,2000)",
+    )
+    parser.add_argument(
+        "--dirty-files", type=int, default=20,
+        help="Files modified in the worktree before the run (default: 20)",
+    )
+    parser.add_argument(
+        "--events-per-step", type=_int_list, default=[0, 100],
+        help="Comma-separated synthetic events per step (default: 0,100)",
+    )
+    parser.add_argument("--iterations", type=int, default=1, help="Repetitions per scenario")
+    parser.add_argument("--quick", action="store_true", help="Smallest matrix (100 files, 0 events)")
+    parser.add_argument("--no-db", action="store_true", help="Skip DuckDB ingestion")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Results JSON path")
+    parser.add_argument(
+        "--baseline", type=Path, default=None,
+        help="Baseline JSON to compare against; exits 1 on regression",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help=f"Also write results to {DEFAULT_BASELINE.relative_to(_SWARM_ROOT)}",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="Allowed per-step slowdown before a regression is reported (default: 0.25)",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.repo_files, args.events_per_step = [100], [0]
+
+    flows = [f for f in args.flows.split(",") if f] or [
+        flow.key for flow in FlowRegistry.get_instance().flows
+    ]
+    logging.disable(logging.WARNING)
+
+    results: Dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scenarios": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="orchestrator-bench-") as tmp:
+        tmp_path = Path(tmp)
+        repos: Dict[int, Path] = {}
+        for scenario in build_scenarios(args):
+            if scenario.repo_files not in repos:
+                repos[scenario.repo_files] = make_synthetic_repo(
+                    tmp_path, scenario.repo_files, scenario.dirty_files
+                )
+            db_path = None if args.no_db else tmp_path / f"{scenario.name}.duckdb"
+            result = run_scenario(
+                scenario, repos[scenario.repo_files], flows, args.iterations, db_path
+            )
+            close_diff_scanners()
+            results["scenarios"][scenario.name] = result
+            print_result(scenario.name, result)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        DEFAULT_BASELINE.parent.mkdir(parents=True, exist_ok=True)
+        DEFAULT_BASELINE.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {DEFAULT_BASELINE}")
+
+    failed = any(r["failures"] for r in results["scenarios"].values())
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegressions vs {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
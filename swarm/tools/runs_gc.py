@@ -6,6 +6,9 @@ Provides commands for managing run lifecycle:
 - prune: Apply retention policy to delete old runs
 - quarantine: Move corrupt runs to _corrupt/ directory
 
+Both prune and quarantine also evict the fact extraction cache entries of
+runs that no longer exist under runs/ or examples/.
+
 Usage:
     uv run swarm/tools/runs_gc.py list
     uv run swarm/tools/runs_gc.py prune --keep 200 --days 7
@@ -38,6 +41,7 @@ from swarm.config.runs_retention_config import (
     is_retention_enabled,
     should_log_deletions,
 )
+from swarm.runtime.fact_cache import FACT_CACHE_DIR, fact_cache_root, prune_fact_cache
 from swarm.runtime.storage import (
     EXAMPLES_DIR,
     META_FILE,
@@ -185,6 +189,27 @@ def should_preserve_run(run: RunInfo) -> tuple[bool, str]:
     return False, ""
 
 
+def evict_fact_cache() -> None:
+    """Drop fact extraction cache entries of runs that no longer exist.
+
+    Prunes the cache root of every discovered run, plus the runs/ and
+    examples/ roots in case no surviving run maps to them.
+    """
+    runs = discover_all_runs()
+    live_run_ids = [run.run_id for run in runs]
+    roots = {RUNS_DIR / FACT_CACHE_DIR, EXAMPLES_DIR / FACT_CACHE_DIR}
+    roots.update(fact_cache_root(run.path) for run in runs)
+
+    removed = {"runs": 0, "objects": 0}
+    for root in sorted(roots):
+        for key, count in prune_fact_cache(root, live_run_ids).items():
+            removed[key] += count
+    if removed["runs"] or removed["objects"]:
+        logger.info(
+            f"Evicted fact cache entries: {removed['runs']} runs, {removed['objects']} objects"
+        )
+
+
 def format_size(size_bytes: int) -> str:
     """Format size in human-readable form."""
     if size_bytes < 1024:
@@ -341,6 +366,7 @@ def cmd_prune(args: argparse.Namespace) -> int:
     if not dry_run:
         logger.info("")
         logger.info(f"Deleted {deleted_count} runs.")
+        evict_fact_cache()
 
     return 0
 
@@ -386,6 +412,7 @@ def cmd_quarantine(args: argparse.Namespace) -> int:
     if not dry_run:
         logger.info("")
         logger.info(f"Quarantined {quarantined_count} runs to {quarantine_dir}")
+        evict_fact_cache()
 
     return 0
 
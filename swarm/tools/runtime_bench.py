@@ -0,0 +1,1365 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for runtime hot paths.
+
+Each scenario times an optimized path against the path it replaced (or a
+cold path against a warm one) on synthetic data and prints the timings.
+Timings are reported, never asserted: wall-clock ratios depend on the
+machine, so correctness lives in the unit tests and this tool is run by
+hand when tuning a path.
+
+Usage:
+  uv run swarm/tools/runtime_bench.py                   # Every scenario
+  uv run swarm/tools/runtime_bench.py --list            # Scenario names
+  uv run swarm/tools/runtime_bench.py db_ingest         # Selected scenarios
+  uv run swarm/tools/runtime_bench.py --large           # Larger inputs
+  uv run swarm/tools/runtime_bench.py --output .benchmarks/runtime/latest.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Add swarm package to path for library imports
+_SWARM_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_SWARM_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SWARM_ROOT))
+
+__version__ = "1.0.0"
+
+SCHEMA_VERSION = 1
+
+# Metrics a scenario returns, in print order
+Metrics = Dict[str, Any]
+ScenarioFn = Callable[[Path, bool], Metrics]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark: run(tmp_dir, large) returns its metrics."""
+
+    name: str
+    description: str
+    run: ScenarioFn
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str) -> Callable[[ScenarioFn], ScenarioFn]:
+    """Register a benchmark scenario under `name`."""
+
+    def register(fn: ScenarioFn) -> ScenarioFn:
+        SCENARIOS[name] = Scenario(name=name, description=description, run=fn)
+        return fn
+
+    return register
+
+
+def timed(fn: Callable[[], Any], repeat: int = 1) -> float:
+    """Mean seconds per call of fn over `repeat` calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def speedup(slow_s: float, fast_s: float) -> float:
+    return slow_s / fast_s if fast_s > 0 else float("inf")
+
+
+@contextmanager
+def patched(target: Any, **attrs: Any) -> Iterator[None]:
+    """Set attributes on a module or object, restoring them on exit."""
+    saved = {name: getattr(target, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(target, name, value)
+
+
+@contextmanager
+def patched_env(**values: Optional[str]) -> Iterator[None]:
+    """Set (or, for None, unset) environment variables, restoring them on exit."""
+    saved = {name: os.environ.get(name) for name in values}
+
+    def apply(updates: Dict[str, Optional[str]]) -> None:
+        for name, value in updates.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    apply(values)
+    try:
+        yield
+    finally:
+        apply(saved)
+
+
+# =============================================================================
+# Synthetic data
+# =============================================================================
+
+
+def synthetic_run_events(run_id: str, n_steps: int = 20, seed: int = 0) -> List[Dict[str, Any]]:
+    """Event stream of one run with microloops, tool calls, file changes and routing."""
+    rng = random.Random(seed)
+    events: List[Dict[str, Any]] = []
+
+    def add(kind: str, step_id: Optional[str] = None, payload: Optional[Dict[str, Any]] = None):
+        seq = len(events) + 1
+        events.append(
+            {
+                "event_id": f"{run_id}-{seq}",
+                "seq": seq,
+                "kind": kind,
+                "flow_key": "build",
+                "step_id": step_id,
+                "ts": f"2025-01-01T{seq // 3600:02d}:{seq // 60 % 60:02d}:{seq % 60:02d}Z",
+                "payload": payload or {},
+            }
+        )
+
+    add("run_start", payload={"flow_keys": ["build"], "profile_id": "p1", "engine": "stub"})
+    for i in range(n_steps):
+        step_id = f"step-{i % 5}"
+        add("step_start", step_id, {"step_index": i, "agent_key": "code-implementer"})
+        for _ in range(rng.randint(0, 3)):
+            add(
+                "tool_end",
+                step_id,
+                {"tool": rng.choice(["Read", "Edit", "Bash"]), "duration_ms": rng.randint(1, 100)},
+            )
+        if rng.random() > 0.5:
+            files = [
+                {"path": f"src/file_{rng.randint(0, 4)}.py", "status": "modified", "insertions": 3}
+                for _ in range(rng.randint(1, 3))
+            ]
+            add("file_changes", step_id, {"files": files})
+        add(
+            "route_decision",
+            step_id,
+            {"method": "deterministic", "selected_edge": "edge-1", "target_node": "next"},
+        )
+        add("step_complete", step_id, {"status": "succeeded", "duration_ms": rng.randint(10, 999)})
+    add("run_completed", payload={"status": "succeeded", "total_steps": n_steps})
+    return events
+
+
+# =============================================================================
+# Scenarios
+# =============================================================================
+
+
+@scenario("db_ingest", "StatsDB per-event ingest_events() vs set-based ingest_events_bulk()")
+def bench_db_ingest(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.db import StatsDB
+
+    n_runs = 100 if large else 10
+    runs = {f"run-{i}": synthetic_run_events(f"run-{i}", seed=i) for i in range(n_runs)}
+    total = sum(len(events) for events in runs.values())
+
+    per_event, bulk = StatsDB(None), StatsDB(None)
+    try:
+        per_event_s = timed(
+            lambda: [per_event.ingest_events(events, run_id) for run_id, events in runs.items()]
+        )
+        bulk_s = timed(lambda: bulk.ingest_events_bulk(runs))
+    finally:
+        per_event.close()
+        bulk.close()
+    return {
+        "events": total,
+        "per_event_s": per_event_s,
+        "bulk_s": bulk_s,
+        "per_event_ev_per_s": total / per_event_s,
+        "bulk_ev_per_s": total / bulk_s,
+        "speedup": speedup(per_event_s, bulk_s),
+    }
+
+
+@scenario("event_append", "append_event(): per-event open/flush vs EventWriter (flush, batched)")
+def bench_event_append(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime import storage
+    from swarm.runtime.event_writer import Durability, EventWriterConfig
+    from swarm.runtime.types import RunEvent
+
+    n = 10_000 if large else 1000
+    events = [
+        RunEvent(
+            run_id="bench",
+            ts=datetime.now(timezone.utc),
+            kind="tool_end",
+            flow_key="build",
+            step_id="step-1",
+            payload={"tool": "Read", "i": i},
+        )
+        for i in range(n)
+    ]
+
+    def legacy_append(run_id: str, event: RunEvent, runs_dir: Path) -> None:
+        # append_event() before EventWriter: mkdir, seq scan, open, write, flush
+        with storage._get_run_lock(run_id):
+            run_path = storage.create_run_dir(run_id, runs_dir)
+            event.seq = storage._next_seq(run_id)
+            line = json.dumps(storage.run_event_to_dict(event), ensure_ascii=False)
+            with open(run_path / storage.EVENTS_FILE, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+
+    def append(run_id: str, event: RunEvent, runs_dir: Path) -> None:
+        storage.append_event(run_id, event, runs_dir=runs_dir)
+
+    def events_per_s(label: str, append_fn: Callable[[str, RunEvent, Path], None]) -> float:
+        runs_dir = tmp / label
+
+        def write_all() -> None:
+            for event in events:
+                append_fn(f"bench-{label}", event, runs_dir)
+            storage.flush_events(f"bench-{label}", runs_dir)
+
+        rate = n / timed(write_all)
+        storage.close_event_writers(f"bench-{label}", runs_dir)
+        return rate
+
+    results: Metrics = {"events": n}
+    try:
+        results["legacy_ev_per_s"] = events_per_s("legacy", legacy_append)
+        results["flush_ev_per_s"] = events_per_s("flush", append)
+        storage.configure_event_writers(EventWriterConfig(max_batch_events=64))
+        results["batched_ev_per_s"] = events_per_s("batched", append)
+        storage.configure_event_writers(
+            EventWriterConfig(durability=Durability.FSYNC_INTERVAL, max_batch_events=64)
+        )
+        results["batched_fsync_ev_per_s"] = events_per_s("batched_fsync", append)
+    finally:
+        storage.configure_event_writers(None)
+    results["speedup_flush"] = results["flush_ev_per_s"] / results["legacy_ev_per_s"]
+    results["speedup_batched"] = results["batched_ev_per_s"] / results["legacy_ev_per_s"]
+    return results
+
+
+@scenario("sse_resume", "resume_offset() near the end of a long run: full scan vs seq index")
+def bench_sse_resume(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.event_index import index_path_for, resume_offset
+    from swarm.runtime.event_writer import EventWriter
+
+    path = tmp / "events.jsonl"
+    n = 200_000 if large else 20_000
+    writer = EventWriter(path, index_path=index_path_for(path))
+    try:
+        for seq in range(1, n + 1):
+            writer.write(json.dumps({"seq": seq, "event": "tick", "pad": "x" * (seq % 7)}), seq=seq)
+    finally:
+        writer.close()
+    after = n - 10
+
+    indexed_s = timed(lambda: resume_offset(path, after), repeat=20)
+    index_path_for(path).unlink()
+    scan_s = timed(lambda: resume_offset(path, after), repeat=20)
+    return {
+        "events": n,
+        "scan_ms": scan_s * 1000,
+        "indexed_ms": indexed_s * 1000,
+        "speedup": speedup(scan_s, indexed_s),
+    }
+
+
+@scenario(
+    "api_stream_latency",
+    "GET /api/runs/{id} latency during a large stream: inline vs off-loop reads",
+)
+def bench_api_stream_latency(tmp: Path, large: bool) -> Metrics:
+    import asyncio
+
+    import httpx
+
+    from swarm.api.latency import LatencyHistogram
+    from swarm.api.routes import events as events_module
+    from swarm.api.routes import runs as runs_module
+    from swarm.api.server import create_app, get_spec_manager
+
+    n = 200_000 if large else 50_000
+    for run_id, count in (("run-big", n), ("run-small", 1)):
+        run_dir = tmp / run_id
+        run_dir.mkdir()
+        with open(run_dir / "events.jsonl", "w", encoding="utf-8") as f:
+            for seq in range(1, count + 1):
+                f.write(
+                    json.dumps({"event": "step:progress", "seq": seq, "detail": "x" * 200}) + "\n"
+                )
+        (run_dir / "run_state.json").write_text(
+            json.dumps({"run_id": run_id, "flow_id": "build", "status": "succeeded"})
+        )
+
+    async def probe_during_stream(app: Any) -> Metrics:
+        histogram = LatencyHistogram()
+        done = asyncio.Event()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def stream() -> None:
+                for _ in range(3):
+                    await client.get("/api/runs/run-big/events", timeout=120)
+                done.set()
+
+            async def probe() -> None:
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await client.get("/api/runs/run-small")
+                    histogram.record((time.perf_counter() - start) * 1000)
+                    await asyncio.sleep(0.005)
+
+            await asyncio.gather(stream(), probe())
+        return histogram.to_dict()
+
+    async def inline(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # The events route before run_io(): file reads on the event loop
+        return func(*args, **kwargs)
+
+    app = create_app()
+    with (
+        patched(get_spec_manager(), runs_root=tmp),
+        patched(runs_module, _state_manager=runs_module.RunStateManager(tmp)),
+    ):
+        with patched(events_module, run_io=inline):
+            blocking = asyncio.run(probe_during_stream(app))
+        executor = asyncio.run(probe_during_stream(app))
+
+    return {
+        "events": n,
+        "blocking_p50_ms": blocking["p50_ms"],
+        "blocking_p99_ms": blocking["p99_ms"],
+        "blocking_max_ms": blocking["max_ms"],
+        "executor_p50_ms": executor["p50_ms"],
+        "executor_p99_ms": executor["p99_ms"],
+        "executor_max_ms": executor["max_ms"],
+    }
+
+
+@scenario("fact_extraction", "Marker extraction on a 3 MB artifact: per-type regex vs single pass")
+def bench_fact_extraction(tmp: Path, large: bool) -> Metrics:
+    import io
+
+    from swarm.runtime.fact_extraction import (
+        MARKER_PATTERNS,
+        _get_context,
+        extract_facts_from_stream,
+        extract_facts_from_text,
+    )
+
+    n_lines = 300_000 if large else 30_000
+    text = "\n".join(
+        f"REQ_{i % 1000:03d}: requirement {i} " + "d" * 40
+        if i % 6 == 0
+        else f"line {i} " + "filler text " * 8
+        for i in range(n_lines)
+    )
+
+    def legacy_extract() -> None:
+        # The extractor before the combined pattern: one pass per marker type
+        seen = set()
+        for marker_type, pattern in MARKER_PATTERNS.items():
+            for match in pattern.finditer(text):
+                marker_id = f"{marker_type}_{match.group(1)}"
+                if marker_id not in seen:
+                    seen.add(marker_id)
+                    text[: match.start()].count("\n")
+                    _get_context(text, match.start(), match.end())
+
+    legacy_s = timed(legacy_extract)
+    single_s = timed(lambda: extract_facts_from_text(text, source_file="big.md"))
+    streamed_s = timed(
+        lambda: extract_facts_from_stream(io.StringIO(text), "big.md", chunk_size=256 * 1024)
+    )
+    return {
+        "mb": len(text) / 1e6,
+        "legacy_ms": legacy_s * 1000,
+        "single_pass_ms": single_s * 1000,
+        "streamed_ms": streamed_s * 1000,
+        "speedup": speedup(legacy_s, single_s),
+    }
+
+
+@scenario("fact_cache", "Re-extract a run after one artifact changed: no cache vs FactCache")
+def bench_fact_cache(tmp: Path, large: bool) -> Metrics:
+
+    from swarm.runtime.fact_cache import FactCache
+    from swarm.runtime.fact_extraction import extract_facts_from_run
+
+    per_flow = 50 if large else 10
+    run_base = tmp / "runs" / "run-bench"
+    # Backdated so unchanged artifacts are trusted on stat alone
+    old_ns = time.time_ns() - 3600 * 10**9
+    for flow in ("signal", "plan", "build", "gate"):
+        (run_base / flow).mkdir(parents=True)
+        for i in range(per_flow):
+            lines = [f"REQ_{j:03d}: requirement {j} of {flow}/{i}" for j in range(200)]
+            lines += ["filler " * 20] * 2000
+            artifact = run_base / flow / f"artifact_{i}.md"
+            artifact.write_text("\n".join(lines))
+            os.utime(artifact, ns=(old_ns, old_ns))
+
+    extract_facts_from_run(run_base, "run-bench", workers=1, cache=FactCache.for_run(run_base))
+    changed = run_base / "build" / "artifact_3.md"
+    changed.write_text(changed.read_text() + "\nSOL_001: new solution\n")
+
+    uncached_s = timed(lambda: extract_facts_from_run(run_base, "run-bench", workers=1))
+    cache = FactCache.for_run(run_base)
+    cached_s = timed(lambda: extract_facts_from_run(run_base, "run-bench", workers=1, cache=cache))
+    return {
+        "artifacts": 4 * per_flow,
+        "cache_misses": cache.misses,
+        "uncached_ms": uncached_s * 1000,
+        "cached_ms": cached_s * 1000,
+        "speedup": speedup(uncached_s, cached_s),
+    }
+
+
+@scenario("routing_conditions", "Shipped edge conditions: string evaluator vs compiled predicates")
+def bench_routing_conditions(tmp: Path, large: bool) -> Metrics:
+    import itertools
+    import operator
+    import re
+
+    from swarm.runtime.router import CELEvaluator, FlowGraph
+
+    flows_dir = _SWARM_ROOT / "swarm" / "packs" / "flows"
+    conditions = [
+        edge.condition
+        for path in sorted(flows_dir.glob("*.json"))
+        for edge in FlowGraph.from_dict(json.loads(path.read_text(encoding="utf-8"))).edges
+        if edge.condition is not None and edge.condition.expression
+    ]
+    contexts = [
+        {
+            "status": status,
+            "can_further_iteration_help": can_help,
+            "has_mechanical_issues": issues,
+            "iteration_count": 2,
+        }
+        for status, can_help, issues in itertools.product(
+            ["VERIFIED", "UNVERIFIED", "BLOCKED", ""], [True, False], [True, False]
+        )
+    ]
+    evaluator = CELEvaluator()
+    compare = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        ">=": operator.ge,
+        "<=": operator.le,
+        ">": operator.gt,
+        "<": operator.lt,
+    }
+
+    def legacy_value(value_str: str, context: Dict[str, Any]) -> Any:
+        value_str = value_str.strip()
+        if value_str[:1] in ("'", '"') and value_str[-1:] == value_str[:1]:
+            return value_str[1:-1]
+        if value_str.lower() in ("true", "false"):
+            return value_str.lower() == "true"
+        try:
+            return float(value_str) if "." in value_str else int(value_str)
+        except ValueError:
+            return evaluator._resolve_field(value_str, context)
+
+    def legacy_simple(expr: str, context: Dict[str, Any]) -> bool:
+        left, op, right = re.split(r"(==|!=|>=|<=|>|<)", expr)
+        return compare[op](legacy_value(left, context), legacy_value(right, context))
+
+    def legacy_evaluate(expression: str, context: Dict[str, Any]) -> bool:
+        # The evaluator before compile_expression(): split and re-parse per decision
+        expr = expression.strip()
+        if "||" in expr:
+            return any(legacy_simple(part.strip(), context) for part in expr.split("||"))
+        if "&&" in expr:
+            return all(legacy_simple(part.strip(), context) for part in expr.split("&&"))
+        return legacy_simple(expr, context)
+
+    rounds = 3000 if large else 300
+    evaluations = rounds * len(conditions) * len(contexts)
+
+    def run_legacy() -> None:
+        for _ in range(rounds):
+            for condition in conditions:
+                for context in contexts:
+                    legacy_evaluate(condition.expression, context)
+
+    def run_compiled() -> None:
+        for _ in range(rounds):
+            for condition in conditions:
+                for context in contexts:
+                    evaluator.evaluate_condition(condition, context)
+
+    legacy_s = timed(run_legacy)
+    compiled_s = timed(run_compiled)
+    return {
+        "conditions": len(conditions),
+        "evaluations": evaluations,
+        "legacy_evals_per_s": evaluations / legacy_s,
+        "compiled_evals_per_s": evaluations / compiled_s,
+        "speedup": speedup(legacy_s, compiled_s),
+    }
+
+
+@scenario("flow_graph_index", "Outgoing-edge lookups on an injected graph: scan vs adjacency index")
+def bench_flow_graph_index(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.router import Edge, FlowGraph, NodeConfig
+
+    n_nodes = 500
+    n_injected = 50_000 if large else 5000
+    node_ids = [f"n{i}" for i in range(n_nodes + 1)]
+    graph = FlowGraph(
+        graph_id="bench",
+        nodes={node_id: NodeConfig(node_id=node_id, template_id=node_id) for node_id in node_ids},
+        edges=[Edge(f"e{i}", f"n{i}", f"n{i + 1}") for i in range(n_nodes)],
+    )
+    for i in range(n_injected):
+        graph.edges.append(Edge(f"inj{i}", f"n{i % n_nodes}", f"inj{i}", edge_type="injection"))
+    lookups = node_ids[:n_nodes]
+
+    scan_s = timed(lambda: [[e for e in graph.edges if e.from_node == node] for node in lookups])
+    indexed_s = timed(lambda: [graph.get_outgoing_edges(node) for node in lookups])
+    return {
+        "edges": len(graph.edges),
+        "lookups": len(lookups),
+        "scan_ms": scan_s * 1000,
+        "indexed_ms": indexed_s * 1000,
+        "speedup": speedup(scan_s, indexed_s),
+    }
+
+
+@scenario("run_state_journal", "Late step-commit latency: run_state.json rewrite vs journal")
+def bench_run_state_journal(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime import storage
+    from swarm.runtime.types import (
+        HandoffEnvelope,
+        RoutingDecision,
+        RoutingSignal,
+        RunState,
+        handoff_envelope_to_dict,
+        run_state_from_dict,
+        run_state_to_dict,
+    )
+
+    run_id = "run-bench"
+    steps = 2000 if large else 600
+
+    def legacy_commit(envelope: HandoffEnvelope, updates: Dict[str, Any], runs_dir: Path) -> None:
+        # commit_step_completion() before the journal: rewrite run_state.json per step
+        storage.write_envelope(run_id, "build", envelope.step_id, envelope, runs_dir)
+        path = runs_dir / run_id / storage.RUN_STATE_FILE
+        data = run_state_to_dict(run_state_from_dict(json.loads(path.read_text())))
+        data["handoff_envelopes"][envelope.step_id] = handoff_envelope_to_dict(envelope)
+        data.update({k: v for k, v in updates.items() if k in data})
+        data["timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
+        storage._atomic_write_json(path, run_state_to_dict(run_state_from_dict(data)))
+
+    def journal_commit(envelope: HandoffEnvelope, updates: Dict[str, Any], runs_dir: Path) -> None:
+        storage.commit_step_completion(run_id, "build", envelope, updates, runs_dir)
+
+    def late_commit_ms(label: str, commit: Callable[..., None]) -> float:
+        runs_dir = tmp / label
+        storage._run_state_journals.clear()
+        storage.write_run_state(run_id, RunState(run_id=run_id, flow_key="build"), runs_dir)
+        timings = []
+        for step in range(steps):
+            envelope = HandoffEnvelope(
+                step_id=str(step),
+                flow_key="build",
+                run_id=run_id,
+                routing_signal=RoutingSignal(decision=RoutingDecision.ADVANCE),
+                summary="summary " * 50,
+                artifacts={"out": f"build/{step}.md"},
+            )
+            updates = {"step_index": step, "current_step_id": str(step + 1)}
+            timings.append(timed(lambda: commit(envelope, updates, runs_dir)))
+        return sum(timings[-100:]) / 100 * 1000
+
+    try:
+        legacy_ms = late_commit_ms("legacy", legacy_commit)
+        journal_ms = late_commit_ms("journal", journal_commit)
+    finally:
+        storage._run_state_journals.clear()
+    return {
+        "steps": steps,
+        "legacy_last100_ms": legacy_ms,
+        "journal_last100_ms": journal_ms,
+        "speedup": speedup(legacy_ms, journal_ms),
+    }
+
+
+@scenario("diff_scan", "Per-step change scan of a dirty repo: three git calls vs DiffScanner")
+def bench_diff_scan(tmp: Path, large: bool) -> Metrics:
+    """Each step writes 10 artifacts into a repo with 5% of tracked files dirty.
+
+    The legacy path spawns three git processes and diffs every dirty file.
+    The scoped path snapshots at step start (cold, or reusing the previous
+    step's post-scan state) and scans only what changed since.
+    """
+    import subprocess
+
+    from swarm.runtime.diff_scanner import (
+        close_diff_scanners,
+        scan_file_changes_sync,
+        take_worktree_snapshot,
+    )
+
+    n_files = 100_000 if large else 10_000
+    repo = tmp / "repo"
+    repo.mkdir()
+    git_env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "bench",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "bench",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+    }
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo, env=git_env, capture_output=True, check=True)
+
+    git("init", "-q")
+    for i in range(n_files):
+        path = repo / f"d{i // 1000}" / f"f{i}.txt"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"line {i}\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "init")
+    for i in range(0, n_files, 20):
+        (repo / f"d{i // 1000}" / f"f{i}.txt").write_text(f"before {i}\n")
+    (repo / "artifacts").mkdir()
+
+    def legacy_scan() -> None:
+        # The per-step git calls made before DiffScanner existed
+        for args in (
+            ["rev-parse", "--git-dir"],
+            ["diff", "HEAD", "--numstat", "--find-renames"],
+            ["status", "--porcelain", "-uall"],
+        ):
+            subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True)
+
+    def run_step(step: str) -> None:
+        for i in range(10):
+            (repo / "artifacts" / f"s{step}-{i}.md").write_text(f"artifact {i}\n")
+
+    rounds = 5
+    legacy_scan()  # warm the index refresh for all paths
+    legacy_s = 0.0
+    for step in range(rounds):
+        run_step(f"legacy-{step}")
+        legacy_s += timed(legacy_scan)
+    legacy_s /= rounds
+
+    def scoped_step_s(reuse: bool) -> float:
+        scan_file_changes_sync(repo)  # post-scan of the step before
+        total = 0.0
+        for step in range(rounds):
+            start = time.perf_counter()
+            baseline = take_worktree_snapshot(repo, reuse_last_scan=reuse)
+            total += time.perf_counter() - start
+            run_step(f"{reuse}-{step}")
+            total += timed(lambda: scan_file_changes_sync(repo, baseline=baseline))
+        return total / rounds
+
+    try:
+        cold_s = scoped_step_s(reuse=False)
+        reused_s = scoped_step_s(reuse=True)
+    finally:
+        close_diff_scanners()
+    return {
+        "tracked_files": n_files,
+        "legacy_ms": legacy_s * 1000,
+        "cold_snapshot_ms": cold_s * 1000,
+        "reused_snapshot_ms": reused_s * 1000,
+        "speedup": speedup(legacy_s, reused_s),
+    }
+
+
+@scenario("run_catalog", "First page of 100 runs: directory scan vs run catalog")
+def bench_run_catalog(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime import run_catalog, storage
+    from swarm.runtime import service as runtime_service
+    from swarm.runtime.service import RunService
+    from swarm.runtime.types import RunSpec, RunStatus, RunSummary, SDLCStatus
+
+    n = 20_000 if large else 2000
+    runs_dir, examples_dir = tmp / "runs", tmp / "examples"
+    runs_dir.mkdir()
+    examples_dir.mkdir()
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    with (
+        patched(storage, RUNS_DIR=runs_dir, EXAMPLES_DIR=examples_dir),
+        patched(runtime_service, EXAMPLES_DIR=examples_dir),
+        # Runs written a moment ago would otherwise be re-checked on every query
+        patched(run_catalog, RACY_WINDOW_NS=0),
+    ):
+        for i in range(n):
+            created = base + timedelta(minutes=i)
+            summary = RunSummary(
+                id=f"run-{i:05d}",
+                spec=RunSpec(flow_keys=["build"], profile_id=None, backend="claude-harness"),
+                status=RunStatus.SUCCEEDED,
+                sdlc_status=SDLCStatus.UNKNOWN,
+                created_at=created,
+                updated_at=created,
+            )
+            storage.write_summary(summary.id, summary, runs_dir)
+        RunService.reset()
+        service = RunService()
+        try:
+            service.list_runs()  # initial reconcile
+            scan_s = timed(lambda: service._list_runs_scan()[:100])
+            catalog_s = timed(lambda: service.query_runs(limit=100))
+        finally:
+            run_catalog.close_run_catalogs()
+            RunService.reset()
+    return {
+        "runs": n,
+        "scan_ms": scan_s * 1000,
+        "catalog_ms": catalog_s * 1000,
+        "speedup": speedup(scan_s, catalog_s),
+    }
+
+
+@scenario("run_scheduler", "CPU-bound run burst completion: thread-per-run vs one slot per core")
+def bench_run_scheduler(tmp: Path, large: bool) -> Metrics:
+    """Unbounded, every run shares the CPU and all finish near the end of the
+    burst; bounded, runs finish a slot-width at a time, so the mean time to a
+    finished run drops while total throughput is unchanged.
+    """
+    import subprocess
+    import threading
+
+    from swarm.runtime.run_scheduler import RunScheduler
+
+    n = 32 if large else 8
+    workers = os.cpu_count() or 1
+    cpu_work = "sum(i * i for i in range(1_500_000))"
+
+    def mean_completion_s(scheduler: RunScheduler) -> float:
+        start = time.perf_counter()
+        done: List[float] = []
+        lock = threading.Lock()
+
+        def run() -> None:
+            subprocess.run([sys.executable, "-c", cpu_work], check=True)
+            with lock:
+                done.append(time.perf_counter() - start)
+
+        for i in range(n):
+            scheduler.submit(f"run-{i}", "claude-harness", run)
+        scheduler.wait_idle(600)
+        return sum(done) / len(done)
+
+    unbounded_s = mean_completion_s(RunScheduler(max_workers=None))
+    bounded_s = mean_completion_s(RunScheduler(max_workers=workers))
+    return {
+        "runs": n,
+        "workers": workers,
+        "unbounded_mean_ms": unbounded_s * 1000,
+        "bounded_mean_ms": bounded_s * 1000,
+        "speedup": speedup(unbounded_s, bounded_s),
+    }
+
+
+@scenario("selftest_schedule", "Synthetic selftest: wave barriers vs DAG schedule vs cached re-run")
+def bench_selftest_schedule(tmp: Path, large: bool) -> Metrics:
+    """Waves: [kernel] [slow-a, quick-b, x, y] [after-b]. after-b only depends
+    on quick-b, so the wave barrier makes it wait for slow-a.
+    """
+    import shlex
+
+    tools_dir = str(Path(__file__).resolve().parent)
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+    from selftest import DistributedSelfTestRunner, critical_path_priorities
+    from selftest_cache import SelfTestCache
+    from selftest_config import SelfTestCategory, SelfTestSeverity, SelfTestStep, SelfTestTier
+
+    scale = 4 if large else 1
+    python = shlex.quote(sys.executable)
+
+    def make_step(step_id: str, seconds: float, deps: Optional[List[str]] = None) -> SelfTestStep:
+        return SelfTestStep(
+            id=step_id,
+            name=step_id,
+            description=f"bench step {step_id}",
+            tier=SelfTestTier.KERNEL if step_id == "kernel" else SelfTestTier.GOVERNANCE,
+            severity=SelfTestSeverity.WARNING,
+            category=SelfTestCategory.CORRECTNESS,
+            command=[f"{python} -c 'import time; time.sleep({seconds * scale})'"],
+            dependencies=deps,
+            inputs=["src"],
+        )
+
+    steps = [
+        make_step("kernel", 0.05),
+        make_step("slow-a", 0.6),
+        make_step("quick-b", 0.05),
+        make_step("x", 0.1),
+        make_step("y", 0.1),
+        make_step("after-b", 0.5, deps=["quick-b"]),
+    ]
+    waves = [["kernel"], ["slow-a", "quick-b", "x", "y"], ["after-b"]]
+    wave_graph = {sid: (waves[i - 1] if i else []) for i, wave in enumerate(waves) for sid in wave}
+
+    repo = tmp / "repo"
+    (repo / "src").mkdir(parents=True)
+    # Backdated so the cache trusts file stats on the re-run
+    old_ns = time.time_ns() - 3600 * 10**9
+    for name in ("a.py", "b.py"):
+        (repo / "src" / name).write_text(f"{name[0]} = 1\n")
+        os.utime(repo / "src" / name, ns=(old_ns, old_ns))
+
+    def runner(use_cache: bool) -> DistributedSelfTestRunner:
+        return DistributedSelfTestRunner(
+            max_workers=4,
+            json_output=True,
+            use_cache=use_cache,
+            steps=steps,
+            cache=SelfTestCache(tmp / "cache.json", repo) if use_cache else None,
+            durations={},
+        )
+
+    # Keep the repo's selftest_metrics.jsonl untouched
+    with patched_env(SELFTEST_METRICS_BACKEND="none"):
+        wave_s = timed(
+            lambda: runner(False).run_dag(wave_graph, critical_path_priorities(wave_graph, {}))
+        )
+        dag_s = timed(lambda: runner(True).run_distributed())
+        cached_s = timed(lambda: runner(True).run_distributed())
+    return {
+        "waves_ms": wave_s * 1000,
+        "dag_ms": dag_s * 1000,
+        "cached_ms": cached_s * 1000,
+        "dag_speedup": speedup(wave_s, dag_s),
+        "cached_speedup": speedup(wave_s, cached_s),
+    }
+
+
+@scenario("validate_cache", "validate_swarm.py on a many-agent repo: --no-cache vs cold vs warm")
+def bench_validate_cache(tmp: Path, large: bool) -> Metrics:
+    import shutil
+    import subprocess
+
+    n_agents = 1000 if large else 300
+    repo = tmp / "repo"
+    (repo / "swarm" / "tools").mkdir(parents=True)
+    shutil.copy(_SWARM_ROOT / "swarm" / "tools" / "validate_swarm.py", repo / "swarm" / "tools")
+    shutil.copy(_SWARM_ROOT / "swarm" / "__init__.py", repo / "swarm")
+    shutil.copytree(
+        _SWARM_ROOT / "swarm" / "validator",
+        repo / "swarm" / "validator",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+
+    agents = [f"agent-{i:03d}" for i in range(n_agents)]
+    rows = "\n".join(
+        f"| {a} | build | implementation | green | project/user | Agent {a} |" for a in agents
+    )
+    (repo / "swarm" / "AGENTS.md").write_text(
+        "# Agent Registry\n\n"
+        "| Key | Flows | Role Family | Color | Source | Short Role |\n"
+        "|-----|-------|-------------|-------|--------|------------|\n"
+        f"{rows}\n"
+    )
+    agents_dir = repo / ".claude" / "agents"
+    config_dir = repo / "swarm" / "config" / "agents"
+    agents_dir.mkdir(parents=True)
+    config_dir.mkdir(parents=True)
+    body = "\n".join(f"Guidance line {i} for this agent." for i in range(40))
+    for a in agents:
+        (agents_dir / f"{a}.md").write_text(
+            f"---\nname: {a}\ndescription: Bench agent {a}\ncolor: green\nmodel: inherit\n---\n\n"
+            f"## Inputs\n\n- RUN_BASE/build/\n\n## Outputs\n\n- RUN_BASE/build/out.md\n\n"
+            f"## Behavior\n\n{body}\n"
+        )
+        (config_dir / f"{a}.yaml").write_text(
+            f"key: {a}\nflows:\n  - build\ncategory: implementation\ncolor: green\n"
+            "source: project/user\n"
+        )
+    (repo / "swarm" / "config" / "flows").mkdir(parents=True)
+    steps = "\n".join(
+        f"  - id: step-{i}\n    agents:\n      - {a}\n    role: Run {a}"
+        for i, a in enumerate(agents)
+    )
+    (repo / "swarm" / "config" / "flows" / "build.yaml").write_text(
+        f"key: build\ntitle: Build\ndescription: Build flow\nsteps:\n{steps}\n"
+    )
+    (repo / "swarm" / "flows").mkdir(parents=True)
+    refs = "\n".join(f"- Agent: `{a}`" for a in agents)
+    (repo / "swarm" / "flows" / "flow-build.md").write_text(
+        f"# Flow: Build\n\n<!-- FLOW AUTOGEN START -->\n{refs}\n<!-- FLOW AUTOGEN END -->\n"
+    )
+    # Backdated so the parse cache persists every file
+    old = time.time() - 3600
+    for path in repo.rglob("*"):
+        if path.is_file():
+            os.utime(path, (old, old))
+
+    def validate(*flags: str) -> None:
+        subprocess.run(
+            [sys.executable, "swarm/tools/validate_swarm.py", *flags],
+            cwd=repo,
+            capture_output=True,
+            check=True,
+        )
+
+    uncached_s = min(timed(lambda: validate("--no-cache")) for _ in range(3))
+    cold_s = timed(validate)
+    warm_s = min(timed(validate) for _ in range(3))
+    return {
+        "agents": n_agents,
+        "no_cache_ms": uncached_s * 1000,
+        "cold_ms": cold_s * 1000,
+        "warm_ms": warm_s * 1000,
+        "speedup": speedup(uncached_s, warm_s),
+    }
+
+
+@scenario("spec_cache", "Compile every agentic step prompt: cold vs SpecCache")
+def bench_spec_cache(tmp: Path, large: bool) -> Metrics:
+    from swarm.prompts.compiler import compile_prompt_with_metadata
+    from swarm.spec.cache import get_spec_cache, reset_spec_cache
+
+    prompts = sorted((_SWARM_ROOT / "swarm" / "prompts" / "agentic_steps").glob("*.md"))
+    rounds = 20 if large else 5
+
+    def compile_all(use_cache: bool) -> None:
+        for _ in range(rounds):
+            for prompt in prompts:
+                compile_prompt_with_metadata(str(prompt), _SWARM_ROOT, use_cache=use_cache)
+
+    reset_spec_cache()
+    try:
+        cold_s = timed(lambda: compile_all(use_cache=False))
+        compile_all(use_cache=True)
+        cached_s = timed(lambda: compile_all(use_cache=True))
+        hit_rate = get_spec_cache().stats().hit_rate
+    finally:
+        reset_spec_cache()
+    return {
+        "prompts": len(prompts),
+        "rounds": rounds,
+        "cold_ms": cold_s * 1000,
+        "cached_ms": cached_s * 1000,
+        "hit_rate": hit_rate,
+        "speedup": speedup(cold_s, cached_s),
+    }
+
+
+@scenario("plan_memo", "Compile every deploy-flow step for a run sequence: cold vs memoized")
+def bench_plan_memo(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.context_pack import ContextPack
+    from swarm.runtime.types import HandoffEnvelope
+    from swarm.spec.cache import reset_spec_cache
+    from swarm.spec.compiler import SpecCompiler
+    from swarm.spec.loader import load_flow
+
+    steps = [step.id for step in load_flow("6-deploy", _SWARM_ROOT).steps]
+    rounds = 20 if large else 5
+    pack = ContextPack(
+        run_id="run-bench",
+        flow_key="signal",
+        step_id="normalize",
+        previous_envelopes=[
+            HandoffEnvelope(
+                step_id="step-0",
+                flow_key="signal",
+                run_id="run-bench",
+                routing_signal=None,
+                summary="done",
+                status="verified",
+                timestamp=datetime.now(timezone.utc),
+            )
+        ],
+        upstream_artifacts={"issue": Path("signal/issue.md")},
+    )
+
+    def compile_runs(compiler: SpecCompiler, prefix: str) -> None:
+        # A new run_base per round: only the static sections can be reused
+        for i in range(rounds):
+            for step_id in steps:
+                compiler.compile("6-deploy", step_id, pack, tmp / f"{prefix}-{i}")
+
+    try:
+        with patched_env(SWARM_SPEC_CACHE_SIZE="0"):
+            reset_spec_cache()
+            cold_s = timed(lambda: compile_runs(SpecCompiler(_SWARM_ROOT), "cold"))
+        reset_spec_cache()
+        compiler = SpecCompiler(_SWARM_ROOT)
+        compile_runs(compiler, "warmup")
+        memo_s = timed(lambda: compile_runs(compiler, "memo"))
+    finally:
+        reset_spec_cache()
+    return {
+        "steps": len(steps),
+        "runs": rounds,
+        "cold_ms": cold_s * 1000,
+        "memoized_ms": memo_s * 1000,
+        "speedup": speedup(cold_s, memo_s),
+    }
+
+
+@scenario("envelope_index", "Per-step envelope hydration: full parse vs EnvelopeIndex")
+def bench_envelope_index(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.context_pack import load_previous_envelopes, save_envelope
+    from swarm.runtime.envelope_index import reset_envelope_indexes
+    from swarm.runtime.types import (
+        HandoffEnvelope,
+        RoutingDecision,
+        RoutingSignal,
+        handoff_envelope_from_dict,
+    )
+
+    n_steps = 500 if large else 150
+    summary = "Step summary with enough text to look like a real envelope. " * 10
+
+    def full_parse(run_base: Path) -> List[HandoffEnvelope]:
+        # load_previous_envelopes() before the index: list, open and parse everything
+        found = []
+        for entry in (run_base / "handoff").iterdir():
+            if entry.is_file() and entry.name.endswith(".json"):
+                with open(entry, encoding="utf-8") as f:
+                    found.append(handoff_envelope_from_dict(json.load(f)))
+        return found
+
+    def hydrate_run(label: str, hydrate: Callable[[Path], List[HandoffEnvelope]]) -> None:
+        # Hydrate before every step, then save its envelope, as the orchestrator does
+        run_base = tmp / label
+        (run_base / "handoff").mkdir(parents=True)
+        for i in range(n_steps):
+            hydrate(run_base)
+            envelope = HandoffEnvelope(
+                step_id=f"step-{i:03d}",
+                flow_key="build",
+                run_id="run-bench",
+                routing_signal=RoutingSignal(decision=RoutingDecision.ADVANCE),
+                summary=summary,
+                status="verified",
+                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            )
+            save_envelope(envelope, run_base)
+
+    reset_envelope_indexes()
+    try:
+        full_s = timed(lambda: hydrate_run("full", full_parse))
+        index_s = timed(
+            lambda: hydrate_run("index", lambda rb: load_previous_envelopes(rb, "build"))
+        )
+    finally:
+        reset_envelope_indexes()
+    return {
+        "steps": n_steps,
+        "full_parse_ms": full_s * 1000,
+        "index_ms": index_s * 1000,
+        "speedup": speedup(full_s, index_s),
+    }
+
+
+@scenario("schema_registry", "Handoff envelope validation: per-call jsonschema vs SchemaRegistry")
+def bench_schema_registry(tmp: Path, large: bool) -> Metrics:
+    import warnings
+
+    import jsonschema
+
+    from swarm.spec.schema_registry import get_schema_registry, reset_schema_registry
+
+    schema_path = _SWARM_ROOT / "swarm" / "schemas" / "handoff_envelope.schema.json"
+    schema = json.loads(schema_path.read_text())
+    store = {
+        s["$id"]: s
+        for s in (json.loads(p.read_text()) for p in schema_path.parent.glob("*.schema.json"))
+        if "$id" in s
+    }
+    n = 20_000 if large else 2000
+    envelopes = [
+        {
+            "step_id": f"step-{i}",
+            "flow_key": "build",
+            "run_id": "run-bench",
+            "routing_signal": {
+                "decision": "advance",
+                "next_step_id": f"step-{i + 1}",
+                "confidence": 0.9,
+            },
+            "summary": f"Completed step {i}",
+            "artifacts": {"summary": f"build/step-{i}.md"},
+            "status": "succeeded",
+            "duration_ms": 1200,
+            "timestamp": "2025-01-01T00:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+    def per_call() -> None:
+        # handoff_io before the registry: new resolver + jsonschema.validate per envelope
+        for envelope in sample:
+            resolver = jsonschema.RefResolver.from_schema(schema, store=store)
+            jsonschema.validate(envelope, schema, resolver=resolver)
+
+    sample = envelopes[: n // 10]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        per_call_s = timed(per_call)
+
+    reset_schema_registry()
+    try:
+        registry = get_schema_registry()
+        backend = registry.validator(schema_path).backend
+        registry_s = timed(lambda: registry.validate_many(schema_path, envelopes))
+    finally:
+        reset_schema_registry()
+    return {
+        "backend": backend,
+        "per_call_per_s": len(sample) / per_call_s,
+        "registry_per_s": n / registry_s,
+        "speedup": speedup(per_call_s / len(sample), registry_s / n),
+    }
+
+
+@scenario("context_budgets", "Per-step context budget resolution: resolver per call vs table")
+def bench_context_budgets(tmp: Path, large: bool) -> Metrics:
+    from swarm.config.flow_registry import FlowRegistry
+    from swarm.config.runtime_config import (
+        ContextBudgetResolver,
+        get_context_budget_table,
+        get_resolved_context_budgets,
+        reset_config,
+    )
+
+    steps = [(f.key, s.id) for f in FlowRegistry.get_instance().flows for s in f.steps]
+    rounds = 2000 if large else 200
+    calls = rounds * len(steps)
+
+    def resolve_per_call() -> None:
+        # get_resolved_context_budgets() before the table: a resolver per call
+        for _ in range(rounds):
+            for flow_key, step_id in steps:
+                ContextBudgetResolver("baseline").resolve(flow_key, step_id)
+
+    def resolve_from_table() -> None:
+        for _ in range(rounds):
+            for flow_key, step_id in steps:
+                get_resolved_context_budgets(flow_key, step_id, profile_id="baseline")
+
+    reset_config()
+    try:
+        resolver_s = timed(resolve_per_call)
+        get_context_budget_table("baseline")
+        table_s = timed(resolve_from_table)
+    finally:
+        reset_config()
+    return {
+        "calls": calls,
+        "resolver_us_per_call": resolver_s * 1e6 / calls,
+        "table_us_per_call": table_s * 1e6 / calls,
+        "speedup": speedup(resolver_s, table_s),
+    }
+
+
+@scenario("autopilot_executor", "Stub-engine autopilot runs: thread per run vs 4-worker executor")
+def bench_autopilot_executor(tmp: Path, large: bool) -> Metrics:
+    import shutil
+    import threading
+
+    from swarm.runtime import storage
+    from swarm.runtime.autopilot import AutopilotController
+    from swarm.runtime.autopilot_executor import AutopilotExecutor
+    from swarm.runtime.engines import GeminiStepEngine
+    from swarm.runtime.stepwise.orchestrator import get_orchestrator
+
+    n_runs = 200 if large else 50
+    flows = ["signal", "plan", "build"]
+    # The orchestrator writes step artifacts under <repo_root>/swarm/runs
+    repo_root = tmp
+    runs_dir = repo_root / "swarm" / "runs"
+    runs_dir.mkdir(parents=True)
+
+    def controller() -> AutopilotController:
+        orchestrator = get_orchestrator(
+            engine=GeminiStepEngine(repo_root), repo_root=repo_root, skip_preflight=True
+        )
+        return AutopilotController(repo_root=repo_root, orchestrator=orchestrator)
+
+    def thread_per_run() -> None:
+        # The only way to drive many runs before the executor
+        threads = [threading.Thread(target=threaded.run_to_completion, args=(r,)) for r in run_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def pooled() -> None:
+        executor.start(recover=False)
+        executor.wait_idle(timeout=1800)
+
+    created: List[str] = []
+    # Pin the stub engine: otherwise the mode follows the cached runtime
+    # config and whether a gemini CLI is on PATH
+    with patched_env(SWARM_GEMINI_STUB="1"), patched(storage, RUNS_DIR=runs_dir):
+        try:
+            threaded = controller()
+            run_ids = [threaded.start(flow_keys=flows) for _ in range(n_runs)]
+            created.extend(run_ids)
+            threaded_s = timed(thread_per_run)
+
+            executor = AutopilotExecutor(controller=controller(), max_workers=4)
+            created.extend(executor.submit(flow_keys=flows) for _ in range(n_runs))
+            try:
+                executor_s = timed(pooled)
+            finally:
+                executor.shutdown()
+        finally:
+            # The orchestrator appends events through storage's bound default
+            # runs directory, so those run directories are removed explicitly
+            for run_id in created:
+                shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+
+    stats = executor.stats()
+    flows_done = sum(f.executed for f in stats.flows.values())
+    metrics: Metrics = {
+        "runs": n_runs,
+        "flows_executed": flows_done,
+        "thread_per_run_s": threaded_s,
+        "executor_s": executor_s,
+        "executor_flows_per_s": flows_done / executor_s,
+    }
+    for flow_key, flow in stats.flows.items():
+        metrics[f"{flow_key}_p95_ms"] = flow.p95_ms
+        metrics[f"{flow_key}_wait_ms"] = flow.mean_wait_ms
+    return metrics
+
+
+@scenario("transcript_page", "Large transcript: full read and parse vs indexed filtered pages")
+def bench_transcript_page(tmp: Path, large: bool) -> Metrics:
+    from swarm.runtime.transcript_io import (
+        read_transcript_page,
+        reset_transcript_index_cache,
+        write_transcript,
+    )
+
+    n = 1_000_000 if large else 200_000
+    padding = "x" * 200
+
+    def messages() -> Iterator[Dict[str, Any]]:
+        # Assistant text and tool calls, with a tool result after each call
+        for i in range(n):
+            if i % 3 == 0:
+                message = {"role": "assistant", "content": f"thinking {i}"}
+            elif i % 3 == 1:
+                message = {"type": "tool_use", "name": "Read", "input": {"path": f"f{i}.py"}}
+            else:
+                message = {"type": "tool_result", "content": f"result {i}"}
+            yield {**message, "padding": padding}
+
+    path = tmp / "transcript.jsonl"
+    write_transcript(path, messages())
+
+    def full_read() -> None:
+        with open(path, "r", encoding="utf-8") as f:
+            [json.loads(line) for line in f if line.strip()]
+
+    reset_transcript_index_cache()
+    try:
+        full_s = timed(full_read)
+        start = time.perf_counter()
+        first = read_transcript_page(path, limit=100, kinds={"tool_call"})
+        cold_s = time.perf_counter() - start
+        after = first.next_after
+        warm_s = timed(
+            lambda: read_transcript_page(path, after=after, limit=100, kinds={"tool_call"})
+        )
+    finally:
+        reset_transcript_index_cache()
+    return {
+        "messages": n,
+        "mib": path.stat().st_size / (1024 * 1024),
+        "full_read_ms": full_s * 1000,
+        "first_page_ms": cold_s * 1000,
+        "next_page_ms": warm_s * 1000,
+        "speedup_first_page": speedup(full_s, cold_s),
+    }
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.0f}" if abs(value) >= 1000 else f"{value:.4g}"
+    return str(value)
+
+
+def run_scenarios(names: List[str], large: bool) -> Dict[str, Metrics]:
+    """Run the named scenarios, each in its own temporary directory."""
+    results: Dict[str, Metrics] = {}
+    for name in names:
+        bench = SCENARIOS[name]
+        with tempfile.TemporaryDirectory(prefix=f"runtime-bench-{name}-") as tmp:
+            metrics = bench.run(Path(tmp), large)
+        results[name] = metrics
+        print(f"{name}: {bench.description}")
+        for key, value in metrics.items():
+            print(f"  {key:<24} {_format(value)}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for runtime hot paths.")
+    parser.add_argument("scenarios", nargs="*", help="Scenarios to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--large", action="store_true", help="Use larger inputs")
+    parser.add_argument("--output", type=Path, default=None, help="Also write results as JSON")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in SCENARIOS.values():
+            print(f"{bench.name:<24} {bench.description}")
+        return
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+
+    logging.disable(logging.WARNING)
+    results = run_scenarios(args.scenarios or list(SCENARIOS), args.large)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "schema_version": SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "large": args.large,
+            "scenarios": results,
+        }
+        args.output.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,12 @@ Run and output JSON report:
 Run kernel smoke checks only:
   uv run swarm/tools/selftest.py --kernel-only
 
+Run in parallel (critical-path scheduling, unchanged steps served from cache):
+  uv run swarm/tools/selftest.py --distributed
+
+Explain which steps the result cache would serve, and why:
+  uv run swarm/tools/selftest.py --explain-cache
+
 ## Exit Codes
 
 0   All executed steps passed
@@ -53,6 +59,10 @@ Default: Human-readable text with per-step status (PASS / FAIL / SKIP)
 - --step <id>: Run only the specified step
 - --until <id>: Run steps in order up to and including <id>
 - --plan: Show the execution plan without running
+- --distributed: Run steps in parallel as soon as their dependencies finish,
+  longest critical path first; steps with unchanged command and declared
+  inputs are served from the result cache (--no-cache disables it)
+- --explain-cache: Report cache HIT / MISS / UNCACHEABLE per step and exit
 """
 
 import argparse
@@ -63,7 +73,7 @@ import socket
 import subprocess
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
@@ -94,7 +104,9 @@ try:
         SelfTestStep,
         SelfTestTier,
         get_step_by_id,
+        get_step_graph,
         get_steps_in_order,
+        get_wave_for_step,
         validate_step_list,
         validate_wave_definitions,
     )
@@ -109,6 +121,13 @@ except ImportError:
     print("Error: Could not import selftest_paths module", file=sys.stderr)
     sys.exit(2)
 
+# Import result cache
+try:
+    from selftest_cache import CacheDecision, SelfTestCache, format_explain_report
+except ImportError:
+    print("Error: Could not import selftest_cache module", file=sys.stderr)
+    sys.exit(2)
+
 # Import schema and artifact manager
 try:
     from artifact_manager import ArtifactManager
@@ -145,10 +164,14 @@ except ImportError:
 
 # Import metrics (optional, graceful fallback if not available)
 try:
-    from selftest_metrics import SelftestMetrics
+    from selftest_metrics import SelftestMetrics, load_step_durations
     METRICS_AVAILABLE = True
 except ImportError:
     METRICS_AVAILABLE = False
+
+    def load_step_durations(*args, **kwargs) -> Dict[str, float]:
+        return {}
+
     # No-op metrics class
     class SelftestMetrics:
         def __init__(self, *args, **kwargs):
@@ -1024,33 +1047,50 @@ class SelfTestRunner:
         return 1
 
 
+def _serialize_step(step: SelfTestStep) -> Dict[str, Any]:
+    """Everything a worker process needs to run a step."""
+    return {
+        "id": step.id,
+        "command": step.full_command(),
+        "timeout": step.timeout,
+        "tier": step.tier.value,
+        "severity": step.severity.value,
+        "category": step.category.value,
+        "description": step.description,
+    }
+
+
 def _run_step_in_process(step_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Run a single step in an isolated subprocess.
 
     This is a module-level function to work with ProcessPoolExecutor.
-    Takes a serialized step dict, runs it, and returns serialized result.
+    Takes a serialized step dict (see _serialize_step; a bare {"id": ...} is
+    resolved from the registry), runs it, and returns serialized result.
     """
-    step = get_step_by_id(step_data["id"])
-    if step is None:
-        return {
-            "step_id": step_data["id"],
-            "passed": False,
-            "skipped": False,
-            "exit_code": -1,
-            "duration_ms": 0,
-            "stdout": "",
-            "stderr": f"Unknown step: {step_data['id']}",
-            "timestamp_start": time.time(),
-            "timestamp_end": time.time(),
-        }
+    if "command" not in step_data:
+        step = get_step_by_id(step_data["id"])
+        if step is None:
+            return {
+                "step_id": step_data["id"],
+                "passed": False,
+                "skipped": False,
+                "exit_code": -1,
+                "duration_ms": 0,
+                "stdout": "",
+                "stderr": f"Unknown step: {step_data['id']}",
+                "timestamp_start": time.time(),
+                "timestamp_end": time.time(),
+            }
+        step_data = _serialize_step(step)
 
+    timeout = step_data["timeout"]
     timestamp_start = time.time()
     try:
         # Use Popen with start_new_session=True for proper timeout handling.
         # This ensures child processes are killed when timeout fires.
         proc = subprocess.Popen(
-            step.full_command(),
+            step_data["command"],
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -1058,7 +1098,7 @@ def _run_step_in_process(step_data: Dict[str, Any]) -> Dict[str, Any]:
             start_new_session=True,  # Create new process group for proper cleanup
         )
         try:
-            stdout, stderr = proc.communicate(timeout=step.timeout)
+            stdout, stderr = proc.communicate(timeout=timeout)
             exit_code = proc.returncode
             passed = proc.returncode == 0
         except subprocess.TimeoutExpired:
@@ -1071,7 +1111,7 @@ def _run_step_in_process(step_data: Dict[str, Any]) -> Dict[str, Any]:
             proc.wait()  # Clean up zombie process
             exit_code = -1
             stdout = ""
-            stderr = f"Command timed out after {step.timeout} seconds"
+            stderr = f"Command timed out after {timeout} seconds"
             passed = False
     except Exception as e:
         exit_code = -1
@@ -1083,7 +1123,7 @@ def _run_step_in_process(step_data: Dict[str, Any]) -> Dict[str, Any]:
     duration_ms = int((timestamp_end - timestamp_start) * 1000)
 
     return {
-        "step_id": step.id,
+        "step_id": step_data["id"],
         "passed": passed,
         "skipped": False,
         "exit_code": exit_code,
@@ -1092,20 +1132,64 @@ def _run_step_in_process(step_data: Dict[str, Any]) -> Dict[str, Any]:
         "stderr": stderr,
         "timestamp_start": timestamp_start,
         "timestamp_end": timestamp_end,
-        "tier": step.tier.value,
-        "severity": step.severity.value,
-        "category": step.category.value,
-        "description": step.description,
+        "tier": step_data["tier"],
+        "severity": step_data["severity"],
+        "category": step_data["category"],
+        "description": step_data["description"],
     }
 
 
+def critical_path_priorities(
+    graph: Dict[str, List[str]],
+    estimates: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    Critical-path rank of each step.
+
+    A step's rank is its own estimated duration plus the longest chain of
+    estimated durations among the steps that (transitively) depend on it.
+    Starting the highest-ranked ready step first keeps the longest chain
+    moving, which bounds total wall-clock time.
+
+    Args:
+        graph: Step id -> ids it depends on (see get_step_graph).
+        estimates: Step id -> estimated duration in seconds.
+
+    Returns:
+        Step id -> rank in seconds.
+    """
+    dependents: Dict[str, List[str]] = {sid: [] for sid in graph}
+    for sid, deps in graph.items():
+        for dep in deps:
+            dependents.setdefault(dep, []).append(sid)
+
+    ranks: Dict[str, float] = {}
+
+    def rank(sid: str) -> float:
+        if sid not in ranks:
+            downstream = max((rank(child) for child in dependents.get(sid, [])), default=0.0)
+            ranks[sid] = estimates.get(sid, 0.0) + downstream
+        return ranks[sid]
+
+    for sid in graph:
+        rank(sid)
+    return ranks
+
+
 class DistributedSelfTestRunner:
     """
     Runs selftest with parallel execution using ProcessPoolExecutor.
 
-    Executes steps in waves, where steps within a wave run in parallel.
-    Wave 0 (KERNEL) always runs first and alone. Subsequent waves run
-    in parallel where dependencies allow.
+    Steps are scheduled as a DAG (get_step_graph): each step starts as soon
+    as its own dependencies finish, instead of waiting for a whole wave.
+    Among ready steps, the one with the longest remaining critical path
+    (from historical durations in selftest_metrics) starts first. KERNEL
+    steps gate everything else; a KERNEL failure aborts the run.
+
+    Steps whose command and declared inputs are unchanged since their last
+    passing run are served from the result cache (selftest_cache).
+
+    Results are still reported grouped by EXECUTION_WAVES for compatibility.
     """
 
     max_workers: int
@@ -1126,17 +1210,39 @@ class DistributedSelfTestRunner:
         verbose: bool = False,
         json_output: bool = False,
         json_v2: bool = False,
+        use_cache: bool = True,
+        steps: Optional[List[SelfTestStep]] = None,
+        cache: Optional[SelfTestCache] = None,
+        durations: Optional[Dict[str, float]] = None,
     ) -> None:
-        self.max_workers = max_workers
+        """
+        Args:
+            max_workers: Parallel worker processes (at least 1 is used).
+            verbose: Print cache decisions for every step.
+            json_output: Emit JSON instead of text.
+            json_v2: Emit JSON instead of text.
+            use_cache: Serve unchanged steps from the result cache.
+            steps: Steps to run. Defaults to all registered steps.
+            cache: Result cache. Defaults to SelfTestCache() when use_cache.
+            durations: Historical step durations in seconds. Defaults to
+                load_step_durations() from the local metrics log.
+        """
+        self.max_workers = max(1, max_workers)
         self.verbose = verbose
         self.json_output = json_output
         self.json_v2 = json_v2
+        self.steps = list(steps) if steps is not None else list(SELFTEST_STEPS)
+        self.cache = (cache or SelfTestCache()) if use_cache else None
+        self.durations = durations
+        self.metrics = SelftestMetrics()
         self.wave_results: List[Dict[str, Any]] = []
         self.all_results: List[Dict[str, Any]] = []
         self.failed_steps: List[str] = []
         self.kernel_failed: List[str] = []
         self.governance_failed: List[str] = []
         self.optional_failed: List[str] = []
+        self.start_order: List[str] = []
+        self.cache_decisions: Dict[str, CacheDecision] = {}
         self.run_id = f"distributed-{int(time.time())}"
 
     def _print(self, msg: str) -> None:
@@ -1166,86 +1272,183 @@ class DistributedSelfTestRunner:
             pass
         return branch, commit
 
-    def run_wave(self, wave_idx: int, step_ids: List[str]) -> Dict[str, Any]:
+    def _estimates(self) -> Dict[str, float]:
+        """Estimated duration per step: history, else a tenth of the timeout."""
+        history = self.durations if self.durations is not None else load_step_durations()
+        return {step.id: history.get(step.id, step.timeout / 10) for step in self.steps}
+
+    def _cached_result(self, decision: CacheDecision) -> Dict[str, Any]:
+        """Result dict for a step served from cache."""
+        result = dict(decision.entry["result"])
+        now = time.time()
+        result.update({
+            "cached": True,
+            "cached_duration_ms": result.get("duration_ms", 0),
+            "duration_ms": 0,
+            "timestamp_start": now,
+            "timestamp_end": now,
+        })
+        return result
+
+    def _record(self, step: SelfTestStep, result: Dict[str, Any]) -> None:
+        """Print a finished step and track failures by tier."""
+        if result.get("cached"):
+            self._print(
+                f"  {result['step_id']:20s} PASS (cached, {result['cached_duration_ms']}ms saved)"
+            )
+        else:
+            status = "PASS" if result["passed"] else "FAIL"
+            self._print(f"  {result['step_id']:20s} {status} ({result['duration_ms']}ms)")
+            self.metrics.step_completed(
+                step_id=step.id,
+                tier=step.tier.value,
+                passed=result["passed"],
+                duration_seconds=result["duration_ms"] / 1000,
+                exit_code=result["exit_code"],
+                severity=step.severity.value,
+            )
+
+        if not result["passed"] and not result.get("skipped", False):
+            self.failed_steps.append(result["step_id"])
+            tier = result.get("tier", "")
+            if tier == "kernel":
+                self.kernel_failed.append(result["step_id"])
+            elif tier == "governance":
+                self.governance_failed.append(result["step_id"])
+            elif tier == "optional":
+                self.optional_failed.append(result["step_id"])
+
+    def run_dag(self, graph: Dict[str, List[str]], ranks: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
         """
-        Execute a wave of steps, potentially in parallel.
+        Execute steps as soon as their dependencies finish.
 
         Returns:
-            Dict with wave metadata and results.
+            Dict mapping step id to its result, for every step that ran.
         """
-        wave_start = time.time()
-        wave_results = []
-        step_data_list = [{"id": sid} for sid in step_ids]
-
-        if len(step_ids) == 1:
-            # Single step, run directly (no pool overhead)
-            self._print(f"Wave {wave_idx}: Running {step_ids[0]}...")
-            result = _run_step_in_process(step_data_list[0])
-            wave_results.append(result)
-            status = "PASS" if result["passed"] else "FAIL"
-            self._print(f"  {result['step_id']:20s} {status} ({result['duration_ms']}ms)")
-        else:
-            # Multiple steps, run in parallel
-            self._print(f"Wave {wave_idx}: Running {len(step_ids)} steps in parallel...")
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(_run_step_in_process, sd): sd
-                    for sd in step_data_list
-                }
-                for future in as_completed(futures):
+        steps_by_id = {step.id: step for step in self.steps}
+        position = {step.id: idx for idx, step in enumerate(self.steps)}
+        waiting = {sid: set(deps) for sid, deps in graph.items()}
+        ready = [sid for sid, deps in waiting.items() if not deps]
+        results: Dict[str, Dict[str, Any]] = {}
+        aborted = False
+
+        def finish(sid: str, result: Dict[str, Any]) -> None:
+            nonlocal aborted
+            results[sid] = result
+            self._record(steps_by_id[sid], result)
+            if steps_by_id[sid].tier == SelfTestTier.KERNEL and not result["passed"]:
+                if not aborted:
+                    self._print("KERNEL failure detected - aborting run")
+                aborted = True
+            for other, deps in waiting.items():
+                if sid in deps:
+                    deps.discard(sid)
+                    if not deps and other not in results:
+                        ready.append(other)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            running: Dict[Any, Tuple[str, Optional[CacheDecision]]] = {}
+            while not aborted and (ready or running):
+                ready.sort(key=lambda s: (-ranks[s], position[s]))
+                while ready and not aborted and len(running) < self.max_workers:
+                    sid = ready.pop(0)
+                    step = steps_by_id[sid]
+                    decision = self.cache.lookup(step) if self.cache else None
+                    if decision is not None:
+                        self.cache_decisions[sid] = decision
+                        if self.verbose:
+                            self._print(f"  {sid:20s} cache {decision.status}: {decision.reason}")
+                    if decision is not None and decision.hit:
+                        finish(sid, self._cached_result(decision))
+                        continue
+                    self.start_order.append(sid)
+                    future = executor.submit(_run_step_in_process, _serialize_step(step))
+                    running[future] = (sid, decision)
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    sid, decision = running.pop(future)
                     try:
-                        result = future.result(timeout=60)
-                        wave_results.append(result)
-                        status = "PASS" if result["passed"] else "FAIL"
-                        self._print(f"  {result['step_id']:20s} {status} ({result['duration_ms']}ms)")
+                        result = future.result()
                     except Exception as e:
-                        step_data = futures[future]
-                        error_result = {
-                            "step_id": step_data["id"],
+                        result = {
+                            "step_id": sid,
                             "passed": False,
                             "skipped": False,
                             "exit_code": -1,
                             "duration_ms": 0,
                             "stdout": "",
                             "stderr": str(e),
-                            "timestamp_start": wave_start,
+                            "timestamp_start": time.time(),
                             "timestamp_end": time.time(),
+                            "tier": steps_by_id[sid].tier.value,
                         }
-                        wave_results.append(error_result)
-                        self._print(f"  {step_data['id']:20s} ERROR ({str(e)[:50]})")
-
-        wave_duration_ms = int((time.time() - wave_start) * 1000)
-        all_passed = all(r["passed"] for r in wave_results)
-
-        # Track failures by tier
-        for result in wave_results:
-            if not result["passed"] and not result.get("skipped", False):
-                self.failed_steps.append(result["step_id"])
-                tier = result.get("tier", "")
-                if tier == "kernel":
-                    self.kernel_failed.append(result["step_id"])
-                elif tier == "governance":
-                    self.governance_failed.append(result["step_id"])
-                elif tier == "optional":
-                    self.optional_failed.append(result["step_id"])
+                    if decision is not None:
+                        self.cache.store(steps_by_id[sid], decision, result)
+                    finish(sid, result)
 
-        return {
-            "wave": wave_idx,
-            "steps": step_ids,
-            "duration_ms": wave_duration_ms,
-            "all_passed": all_passed,
-            "parallel": len(step_ids) > 1,
-            "results": wave_results,
-        }
+            # On abort, let in-flight steps finish so their results are reported
+            for future, (sid, _decision) in running.items():
+                try:
+                    finish(sid, future.result())
+                except Exception:
+                    pass
+
+        if self.cache is not None:
+            self.cache.save()
+        return results
+
+    def _group_by_wave(self, results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Report results grouped by EXECUTION_WAVES (output compatibility)."""
+        groups: Dict[int, List[Dict[str, Any]]] = {}
+        for step in self.steps:
+            if step.id in results:
+                wave_idx = get_wave_for_step(step.id)
+                if wave_idx is None:
+                    wave_idx = len(EXECUTION_WAVES)
+                groups.setdefault(wave_idx, []).append(results[step.id])
+
+        waves = []
+        for wave_idx in sorted(groups):
+            wave = groups[wave_idx]
+            start = min(r["timestamp_start"] for r in wave)
+            end = max(r["timestamp_end"] for r in wave)
+            waves.append({
+                "wave": wave_idx,
+                "steps": [r["step_id"] for r in wave],
+                "duration_ms": int((end - start) * 1000),
+                "all_passed": all(r["passed"] for r in wave),
+                "parallel": len(wave) > 1,
+                "results": wave,
+            })
+        return waves
+
+    @staticmethod
+    def _critical_path(graph: Dict[str, List[str]], ranks: Dict[str, float]) -> List[str]:
+        """Step ids along the highest-ranked dependency chain."""
+        dependents: Dict[str, List[str]] = {sid: [] for sid in graph}
+        for sid, deps in graph.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(sid)
+        roots = [sid for sid, deps in graph.items() if not deps]
+        path: List[str] = []
+        candidates = roots
+        while candidates:
+            best = max(candidates, key=lambda s: ranks[s])
+            path.append(best)
+            candidates = dependents.get(best, [])
+        return path
 
     def run_distributed(self) -> Dict[str, Any]:
         """
-        Run selftest with wave-based parallel execution.
+        Run selftest with critical-path DAG scheduling.
 
         Returns:
             Dict with execution results including waves and summary.
         """
-        # Validate wave definitions
+        # Validate wave definitions (still used to group the report)
         wave_errors = validate_wave_definitions()
         if wave_errors:
             self._print("ERROR: Invalid wave definitions:")
@@ -1253,29 +1456,26 @@ class DistributedSelfTestRunner:
                 self._print(f"  - {error}")
             return {"status": "ERROR", "errors": wave_errors}
 
+        graph = get_step_graph(self.steps)
+        estimates = self._estimates()
+        ranks = critical_path_priorities(graph, estimates)
+        critical_path = self._critical_path(graph, ranks)
+
         self._print("=" * 70)
         self._print("DISTRIBUTED SELFTEST RUNNER")
         self._print(f"Workers: {self.max_workers}")
+        self._print(f"Cache:   {'enabled' if self.cache else 'disabled'}")
+        self._print(f"Critical path: {' -> '.join(critical_path)}")
         self._print("=" * 70)
         self._print("")
 
         total_start = time.time()
-
-        for wave_idx, wave_steps in enumerate(EXECUTION_WAVES):
-            wave_result = self.run_wave(wave_idx, wave_steps)
-            self.wave_results.append(wave_result)
-            self.all_results.extend(wave_result["results"])
-
-            # If KERNEL wave fails, stop immediately
-            if wave_idx == 0 and not wave_result["all_passed"]:
-                self._print("")
-                self._print("KERNEL failure detected - aborting run")
-                break
-
-            # For other waves, complete the wave but record failures
-            self._print("")
-
+        results = self.run_dag(graph, ranks)
         total_duration_ms = int((time.time() - total_start) * 1000)
+        self._print("")
+
+        self.wave_results = self._group_by_wave(results)
+        self.all_results = [r for wave in self.wave_results for r in wave["results"]]
 
         # Calculate sequential estimate (sum of all step durations)
         sequential_estimate_ms = sum(r["duration_ms"] for r in self.all_results)
@@ -1291,12 +1491,15 @@ class DistributedSelfTestRunner:
         passed = sum(1 for r in self.all_results if r["passed"])
         failed = sum(1 for r in self.all_results if not r["passed"] and not r.get("skipped", False))
         skipped = sum(1 for r in self.all_results if r.get("skipped", False))
+        cached = [r for r in self.all_results if r.get("cached")]
+        saved_ms = sum(r.get("cached_duration_ms", 0) for r in cached)
 
         summary = {
             "total_steps": len(self.all_results),
             "passed": passed,
             "failed": failed,
             "skipped": skipped,
+            "cached": len(cached),
             "sequential_estimate_ms": sequential_estimate_ms,
             "actual_duration_ms": total_duration_ms,
             "speedup": speedup_str,
@@ -1311,6 +1514,7 @@ class DistributedSelfTestRunner:
         self._print(f"Passed:  {passed}/{len(self.all_results)}")
         self._print(f"Failed:  {failed}/{len(self.all_results)}")
         self._print(f"Skipped: {skipped}/{len(self.all_results)}")
+        self._print(f"Cached:  {len(cached)}/{len(self.all_results)} ({saved_ms}ms saved)")
         self._print("")
         self._print(f"Sequential estimate: {sequential_estimate_ms}ms")
         self._print(f"Actual duration:     {total_duration_ms}ms")
@@ -1326,6 +1530,7 @@ class DistributedSelfTestRunner:
         # Get git info
         git_branch, git_commit = self._get_git_info()
 
+        decisions = list(self.cache_decisions.values())
         result = {
             "version": "2.0",
             "execution_mode": "distributed",
@@ -1338,6 +1543,20 @@ class DistributedSelfTestRunner:
                 "hostname": socket.gethostname(),
                 "platform": sys.platform,
             },
+            "schedule": {
+                "strategy": "critical-path",
+                "start_order": self.start_order,
+                "critical_path": critical_path,
+                "estimated_critical_path_ms": int(ranks[critical_path[0]] * 1000) if critical_path else 0,
+            },
+            "cache": {
+                "enabled": self.cache is not None,
+                "hits": sum(1 for d in decisions if d.status == "HIT"),
+                "misses": sum(1 for d in decisions if d.status == "MISS"),
+                "uncacheable": sum(1 for d in decisions if d.status == "UNCACHEABLE"),
+                "saved_ms": saved_ms,
+                "steps": [d.to_dict() for d in decisions],
+            },
             "waves": self.wave_results,
             "summary": summary,
         }
@@ -1433,7 +1652,7 @@ def main() -> int:
     parser.add_argument(
         "--distributed",
         action="store_true",
-        help="Run steps in parallel where possible (wave-based execution)",
+        help="Run steps in parallel as soon as their dependencies finish (critical-path scheduling)",
     )
     parser.add_argument(
         "--workers",
@@ -1442,6 +1661,16 @@ def main() -> int:
         metavar="N",
         help="Number of parallel workers for distributed mode (default: 4)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Distributed mode: re-run every step instead of serving unchanged steps from cache",
+    )
+    parser.add_argument(
+        "--explain-cache",
+        action="store_true",
+        help="Show which steps would be served from the result cache, and why, then exit",
+    )
     parser.add_argument(
         "--skip-steps",
         type=str,
@@ -1488,9 +1717,20 @@ def main() -> int:
         runner.show_plan(steps)
         return 0
 
+    # Handle cache explanation mode
+    if args.explain_cache:
+        cache = SelfTestCache()
+        decisions = cache.explain(steps)
+        cache.save()  # Persist the file-hash memo for the next lookup
+        if args.json or args.json_v2:
+            print(json.dumps({"version": "1.0", "steps": [d.to_dict() for d in decisions]}, indent=2))
+        else:
+            print(format_explain_report(decisions))
+        return 0
+
     # Handle distributed mode
     if args.distributed:
-        # Distributed mode runs all steps using wave-based parallelization
+        # Distributed mode runs all steps using critical-path DAG scheduling
         # It does not support --step, --until, or --degraded flags
         if args.step or args.until or args.degraded or args.kernel_only:
             print("ERROR: --distributed cannot be combined with --step, --until, --degraded, or --kernel-only", file=sys.stderr)
@@ -1501,6 +1741,7 @@ def main() -> int:
             verbose=args.verbose,
             json_output=args.json,
             json_v2=args.json_v2,
+            use_cache=not args.no_cache,
         )
         return runner.run()
 
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+selftest_cache.py - Content-addressed result cache for selftest steps
+
+Distributed selftest re-executed every step on every run, even when nothing
+a step depends on had changed. This module serves such steps from cache.
+
+## Cache Key
+
+Each step's key is a SHA-256 over:
+- the cache format version
+- the step's full command (commands joined with &&)
+- its declared input patterns (SelfTestStep.inputs)
+- the repo-relative path and content hash of every file the patterns match
+
+Steps with inputs=None (unknown inputs) are never cached. Steps with
+inputs=[] depend only on their command. Only passing results are stored, so
+a failure always re-runs.
+
+## Storage
+
+A single JSON file (SELFTEST_CACHE_PATH, gitignored) holding one entry per
+step plus a stat memo (mtime_ns, size -> sha256) so unchanged files are not
+re-hashed. Files modified within the last RACY_WINDOW_S seconds are not
+memoized, because a second write within the same mtime tick would be missed.
+Delete the file at any time to reset the cache.
+
+## Usage
+
+```python
+from selftest_cache import SelfTestCache
+
+cache = SelfTestCache()
+decision = cache.lookup(step)
+if decision.hit:
+    result = decision.entry["result"]
+else:
+    result = run(step)
+    cache.store(step, decision, result)
+cache.save()
+
+for decision in cache.explain(steps):
+    print(decision.step_id, decision.status, decision.reason)
+```
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from selftest_config import SelfTestStep
+from selftest_paths import REPO_ROOT, SELFTEST_CACHE_PATH
+
+CACHE_VERSION = 1
+
+# Files modified this recently are hashed but not memoized
+RACY_WINDOW_S = 2.0
+
+# Never treated as step inputs
+EXCLUDED_PARTS = {"__pycache__", ".git", "node_modules", ".venv", ".pytest_cache", ".ruff_cache"}
+EXCLUDED_PREFIXES = ("swarm/runs/",)
+
+# Changed inputs listed by --explain-cache before summarizing the rest
+MAX_LISTED_CHANGES = 5
+
+GLOB_CHARS = set("*?[")
+
+
+@dataclass
+class CacheDecision:
+    """
+    Outcome of a cache lookup for one step.
+
+    Attributes:
+        step_id: Step identifier
+        status: "HIT", "MISS", or "UNCACHEABLE"
+        reason: Human-readable explanation of the status
+        key: Cache key for the step's current inputs (None if uncacheable)
+        inputs: Current input hashes (repo-relative path -> sha256)
+        changed_inputs: Paths added, removed or modified since the cached entry
+        entry: The cached entry on a hit
+    """
+    step_id: str
+    status: str
+    reason: str
+    key: Optional[str] = None
+    inputs: Dict[str, str] = field(default_factory=dict)
+    changed_inputs: List[str] = field(default_factory=list)
+    entry: Optional[Dict[str, Any]] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.status == "HIT"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step_id": self.step_id,
+            "status": self.status,
+            "reason": self.reason,
+            "key": self.key,
+            "input_files": len(self.inputs),
+            "changed_inputs": self.changed_inputs,
+            "cached_at": self.entry.get("stored_at") if self.entry else None,
+        }
+
+
+def _is_excluded(rel_path: str) -> bool:
+    if rel_path.startswith(EXCLUDED_PREFIXES):
+        return True
+    return any(part in EXCLUDED_PARTS for part in rel_path.split("/"))
+
+
+class SelfTestCache:
+    """
+    Result cache for selftest steps, keyed on command and input file hashes.
+
+    Args:
+        path: Cache file. Defaults to SELFTEST_CACHE_PATH.
+        repo_root: Root that input patterns are relative to.
+    """
+
+    def __init__(self, path: Optional[Path] = None, repo_root: Optional[Path] = None) -> None:
+        self.path = Path(path or SELFTEST_CACHE_PATH)
+        self.repo_root = Path(repo_root or REPO_ROOT)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._file_memo: Dict[str, Tuple[int, int, str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        self._entries = data.get("steps", {})
+        self._file_memo = {k: tuple(v) for k, v in data.get("files", {}).items()}
+
+    def save(self) -> None:
+        """Write the cache file if anything changed (atomic replace)."""
+        if not self._dirty:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "steps": self._entries,
+            "files": self._file_memo,
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, sort_keys=True))
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    # -------------------------------------------------------------------------
+    # Input hashing
+    # -------------------------------------------------------------------------
+
+    def _walk(self, base: Path, name_pattern: str) -> List[Path]:
+        """Files under base whose name matches, pruning excluded directories."""
+        found: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(base):
+            rel_dir = Path(dirpath).relative_to(self.repo_root).as_posix()
+            dirnames[:] = [
+                d for d in dirnames
+                if d not in EXCLUDED_PARTS and not _is_excluded(f"{rel_dir}/{d}/")
+            ]
+            found.extend(Path(dirpath, f) for f in filenames if fnmatch.fnmatch(f, name_pattern))
+        return found
+
+    def _expand(self, pattern: str) -> List[Path]:
+        """Files matched by one input pattern (a path, directory, or glob)."""
+        if not GLOB_CHARS & set(pattern):
+            target = self.repo_root / pattern
+            if target.is_dir():
+                return self._walk(target, "*")
+            return [target] if target.is_file() else []
+        head, sep, tail = pattern.partition("/**")
+        tail = tail.lstrip("/")
+        if sep and not GLOB_CHARS & set(head) and "/" not in tail:
+            return self._walk(self.repo_root / head, tail or "*")
+        return [p for p in self.repo_root.glob(pattern) if p.is_file()]
+
+    def _hash_file(self, rel_path: str, path: Path) -> str:
+        st = path.stat()
+        memo = self._file_memo.get(rel_path)
+        if memo and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+            return memo[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if time.time() - st.st_mtime_ns / 1e9 > RACY_WINDOW_S:
+            self._file_memo[rel_path] = (st.st_mtime_ns, st.st_size, digest)
+            self._dirty = True
+        return digest
+
+    def input_hashes(self, step: SelfTestStep) -> Dict[str, str]:
+        """Content hash of every file matched by the step's input patterns."""
+        hashes: Dict[str, str] = {}
+        for pattern in step.inputs or []:
+            for path in self._expand(pattern):
+                rel_path = path.relative_to(self.repo_root).as_posix()
+                if rel_path in hashes or _is_excluded(rel_path):
+                    continue
+                try:
+                    hashes[rel_path] = self._hash_file(rel_path, path)
+                except OSError:
+                    continue  # vanished between glob and read
+        return dict(sorted(hashes.items()))
+
+    @staticmethod
+    def step_key(step: SelfTestStep, hashes: Dict[str, str]) -> str:
+        """Cache key for a step given its input hashes."""
+        h = hashlib.sha256()
+        h.update(f"v{CACHE_VERSION}\0{step.full_command()}\0".encode())
+        for pattern in step.inputs or []:
+            h.update(f"{pattern}\0".encode())
+        for rel_path, digest in hashes.items():
+            h.update(f"{rel_path}\0{digest}\0".encode())
+        return h.hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Lookup / store
+    # -------------------------------------------------------------------------
+
+    def lookup(self, step: SelfTestStep) -> CacheDecision:
+        """Hash the step's inputs and check for a cached passing result."""
+        if step.inputs is None:
+            return CacheDecision(step.id, "UNCACHEABLE", "no inputs declared")
+
+        hashes = self.input_hashes(step)
+        key = self.step_key(step, hashes)
+        entry = self._entries.get(step.id)
+        if entry is None:
+            return CacheDecision(step.id, "MISS", "no cached result", key, hashes)
+        if entry.get("key") == key:
+            return CacheDecision(
+                step.id, "HIT", f"inputs unchanged ({len(hashes)} files)", key, hashes, entry=entry
+            )
+        if entry.get("command") != step.full_command():
+            return CacheDecision(step.id, "MISS", "command changed", key, hashes)
+        if entry.get("patterns") != list(step.inputs):
+            return CacheDecision(step.id, "MISS", "input patterns changed", key, hashes)
+
+        cached = entry.get("inputs", {})
+        changed = sorted(
+            path for path in set(cached) | set(hashes) if cached.get(path) != hashes.get(path)
+        )
+        listed = ", ".join(changed[:MAX_LISTED_CHANGES])
+        if len(changed) > MAX_LISTED_CHANGES:
+            listed += f" (+{len(changed) - MAX_LISTED_CHANGES} more)"
+        return CacheDecision(
+            step.id, "MISS", f"inputs changed: {listed}", key, hashes, changed_inputs=changed
+        )
+
+    def store(self, step: SelfTestStep, decision: CacheDecision, result: Dict[str, Any]) -> bool:
+        """
+        Record a step result under the key computed at lookup time.
+
+        Only passing results of cacheable steps are stored. Returns True if
+        the result was stored.
+        """
+        if decision.key is None or not result.get("passed"):
+            return False
+        self._entries[step.id] = {
+            "key": decision.key,
+            "command": step.full_command(),
+            "patterns": list(step.inputs or []),
+            "inputs": decision.inputs,
+            "stored_at": datetime.now(timezone.utc).isoformat(),
+            "result": result,
+        }
+        self._dirty = True
+        return True
+
+    def explain(self, steps: List[SelfTestStep]) -> List[CacheDecision]:
+        """Cache decision for each step, without running anything."""
+        return [self.lookup(step) for step in steps]
+
+
+def format_explain_report(decisions: List[CacheDecision]) -> str:
+    """Render --explain-cache decisions as a text table."""
+    lines = [
+        "SELFTEST CACHE",
+        "=" * 70,
+        f"{'Step':24s} {'Status':12s} Reason",
+        "-" * 70,
+    ]
+    for d in decisions:
+        lines.append(f"{d.step_id:24s} {d.status:12s} {d.reason}")
+    hits = sum(1 for d in decisions if d.status == "HIT")
+    misses = sum(1 for d in decisions if d.status == "MISS")
+    uncacheable = sum(1 for d in decisions if d.status == "UNCACHEABLE")
+    lines.append("-" * 70)
+    lines.append(f"Hits: {hits}  Misses: {misses}  Uncacheable: {uncacheable}")
+    return "\n".join(lines)
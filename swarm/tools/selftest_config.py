@@ -24,6 +24,8 @@ Represents one selftest step with:
 - command: shell command(s) to run (list of strings, joined with &&)
 - allow_fail_in_degraded: bool (if True, failures are warnings in --degraded mode)
 - dependencies: list of step ids that must pass before this step runs
+- inputs: repo-relative files/globs the result depends on (enables caching;
+  None means unknown, so the step always re-runs)
 
 ## Step Registry
 
@@ -49,7 +51,7 @@ Represents one selftest step with:
 import json
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class SelfTestTier(Enum):
@@ -91,6 +93,11 @@ class SelfTestStep:
         dependencies: List of step ids that must pass before this step runs
         ac_ids: List of acceptance criteria IDs that this step covers (e.g., ['AC-SELFTEST-KERNEL-FAST'])
         timeout: Timeout in seconds for step execution (default: 300)
+        inputs: Repo-relative paths or globs the step's result depends on.
+            Distributed mode serves the step from the result cache while the
+            command and these files are unchanged. None (default) means the
+            inputs are unknown and the step is never cached; [] means the
+            result depends only on the command.
     """
     id: str
     name: str
@@ -103,6 +110,7 @@ class SelfTestStep:
     allow_fail_in_degraded: bool = False
     dependencies: Optional[List[str]] = None
     timeout: int = 300  # Default 5 minute timeout
+    inputs: Optional[List[str]] = None
 
     def __post_init__(self):
         """Validate step definition."""
@@ -158,6 +166,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-KERNEL-FAST", "AC-SELFTEST-FAILURE-HINTS"],
         allow_fail_in_degraded=False,
+        inputs=["swarm/tools/**/*.py", "swarm/validator/**/*.py", "pyproject.toml", "uv.lock"],
     ),
     SelfTestStep(
         id="skills-governance",
@@ -171,6 +180,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
+        inputs=[".claude/skills/**", "swarm/tools/skills_lint.py", "pyproject.toml", "uv.lock"],
     ),
     SelfTestStep(
         id="agents-governance",
@@ -197,6 +207,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
+        inputs=["features/**/*.feature", "swarm/tools/bdd_validator.py", "pyproject.toml", "uv.lock"],
     ),
     SelfTestStep(
         id="ac-status",
@@ -211,6 +222,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
+        inputs=[],
     ),
     SelfTestStep(
         id="policy-tests",
@@ -225,6 +237,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
+        inputs=[],
     ),
     SelfTestStep(
         id="devex-contract",
@@ -241,6 +254,11 @@ SELFTEST_STEPS = [
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
         dependencies=["core-checks"],
+        inputs=[
+            ".claude/**", "CLAUDE.md", "swarm/AGENTS.md", "swarm/config/**",
+            "swarm/flows/**", "swarm/spec/**", "swarm/platforms/**", "swarm/templates/**",
+            "swarm/tools/**/*.py", "swarm/validator/**/*.py", "pyproject.toml", "uv.lock",
+        ],
     ),
     SelfTestStep(
         id="graph-invariants",
@@ -255,6 +273,7 @@ SELFTEST_STEPS = [
         ac_ids=["AC-SELFTEST-INTROSPECTABLE", "AC-SELFTEST-FAILURE-HINTS", "AC-SELFTEST-DEGRADATION-TRACKED"],
         allow_fail_in_degraded=True,
         dependencies=["devex-contract"],
+        inputs=[],
     ),
     SelfTestStep(
         id="flowstudio-smoke",
@@ -283,6 +302,10 @@ SELFTEST_STEPS = [
         ac_ids=["AC-SELFTEST-STEPWISE-GEMINI"],
         allow_fail_in_degraded=True,
         timeout=120,
+        inputs=[
+            "swarm/**/*.py", "swarm/config/**", "swarm/spec/**", "swarm/prompts/**",
+            "tests/test_gemini_stepwise_backend.py", "tests/conftest.py", "pyproject.toml", "uv.lock",
+        ],
     ),
     SelfTestStep(
         id="claude-stepwise-tests",
@@ -297,6 +320,10 @@ SELFTEST_STEPS = [
         ac_ids=["AC-SELFTEST-STEPWISE-CLAUDE"],
         allow_fail_in_degraded=True,
         timeout=120,
+        inputs=[
+            "swarm/**/*.py", "swarm/config/**", "swarm/spec/**", "swarm/prompts/**",
+            "tests/test_claude_stepwise_backend.py", "tests/conftest.py", "pyproject.toml", "uv.lock",
+        ],
     ),
     SelfTestStep(
         id="runs-gc-dry-check",
@@ -324,6 +351,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-INDIVIDUAL-STEPS", "AC-SELFTEST-FAILURE-HINTS"],
         allow_fail_in_degraded=False,
+        inputs=[],
     ),
     SelfTestStep(
         id="provider-env-check",
@@ -367,6 +395,7 @@ SELFTEST_STEPS = [
         ],
         ac_ids=["AC-SELFTEST-DEGRADED", "AC-SELFTEST-FAILURE-HINTS"],
         allow_fail_in_degraded=False,
+        inputs=[],
     ),
 ]
 
@@ -448,6 +477,35 @@ def validate_wave_definitions() -> List[str]:
     return errors
 
 
+def get_step_graph(steps: Optional[List[SelfTestStep]] = None) -> Dict[str, List[str]]:
+    """
+    Dependency graph for the distributed (critical-path) scheduler.
+
+    Unlike EXECUTION_WAVES, a step only waits for what it actually needs:
+    its declared dependencies plus every KERNEL step (the kernel gate, so a
+    KERNEL failure still stops the run before anything else starts).
+
+    Args:
+        steps: Steps to include. Defaults to all steps. Dependencies on steps
+            outside this list are dropped.
+
+    Returns:
+        Dict mapping step id to the ids that must finish before it starts.
+    """
+    if steps is None:
+        steps = SELFTEST_STEPS
+    ids = {step.id for step in steps}
+    kernel = [step.id for step in steps if step.tier == SelfTestTier.KERNEL]
+
+    graph: Dict[str, List[str]] = {}
+    for step in steps:
+        deps = [d for d in (step.dependencies or []) if d in ids]
+        if step.tier != SelfTestTier.KERNEL:
+            deps += [k for k in kernel if k not in deps]
+        graph[step.id] = deps
+    return graph
+
+
 def get_step_by_id(step_id: str) -> Optional[SelfTestStep]:
     """Retrieve a step by its id."""
     for step in SELFTEST_STEPS:
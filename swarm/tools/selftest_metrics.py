@@ -84,10 +84,12 @@ Metrics will be exposed at http://localhost:9091/metrics
 import json
 import os
 import socket
+import statistics
 import sys
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Dict, Optional
 
 # Prometheus client is optional (graceful fallback if not available)
 try:
@@ -121,6 +123,9 @@ except ImportError:
             pass
 
 
+# Local JSONL metrics log (relative to the working directory, like the runner)
+LOCAL_METRICS_PATH = Path("selftest_metrics.jsonl")
+
 # Histogram buckets for step duration (from observability spec)
 STEP_DURATION_BUCKETS = [0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0]
 
@@ -148,7 +153,7 @@ class SelftestMetrics:
         self.metrics_started = False
 
         # Local JSONL log path
-        self.local_log_path = Path("selftest_metrics.jsonl")
+        self.local_log_path = LOCAL_METRICS_PATH
 
         # Initialize Prometheus metrics if backend is prometheus
         if self.backend == "prometheus" and PROMETHEUS_AVAILABLE:
@@ -457,3 +462,37 @@ class SelftestMetrics:
             self.prom_last_run_timestamp.labels(**timestamp_labels).set(current_timestamp)
 
         self._emit_local("selftest_last_run_timestamp", "gauge", current_timestamp, timestamp_labels)
+
+
+def load_step_durations(path: Optional[Path] = None, window: int = 10) -> Dict[str, float]:
+    """
+    Typical duration of each step, from the local metrics log.
+
+    Reads the selftest_step_duration_seconds samples written by the local
+    backend and returns the median of each step's last `window` samples.
+    The distributed runner uses this to schedule the critical path first.
+
+    Args:
+        path: JSONL metrics log. Defaults to LOCAL_METRICS_PATH.
+        window: Number of most recent samples per step to consider.
+
+    Returns:
+        Dict mapping step_id to duration in seconds. Empty if the log is
+        missing or unreadable.
+    """
+    samples: Dict[str, Deque[float]] = {}
+    try:
+        with open(path or LOCAL_METRICS_PATH) as f:
+            for line in f:
+                if "selftest_step_duration_seconds" not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    step_id = entry["labels"]["step_id"]
+                    value = float(entry["value"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                samples.setdefault(step_id, deque(maxlen=window)).append(value)
+    except OSError:
+        return {}
+    return {step_id: statistics.median(values) for step_id, values in samples.items()}
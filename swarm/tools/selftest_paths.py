@@ -21,6 +21,10 @@ _REPO_ROOT = _SCRIPT_DIR.parent.parent
 # Written by selftest.py, consumed by BDD tests and observability tools
 DEGRADATIONS_LOG_PATH = _REPO_ROOT / "selftest_degradations.log"
 
+# Result cache for distributed selftest: step results keyed on command + input
+# file hashes. Local state only (gitignored); safe to delete at any time
+SELFTEST_CACHE_PATH = _REPO_ROOT / ".selftest_cache.json"
+
 # Convenience export for repo root (useful for other path computations)
 REPO_ROOT = _REPO_ROOT
 
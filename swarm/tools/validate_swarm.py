@@ -72,6 +72,9 @@ Run git-aware mode (only check modified files):
 Run with debug output:
   uv run swarm/tools/validate_swarm.py --debug
 
+Run without the parse cache:
+  uv run swarm/tools/validate_swarm.py --no-cache
+
 Show version:
   uv run swarm/tools/validate_swarm.py --version
 
@@ -81,6 +84,8 @@ Show version:
 --check-prompts     Validate agent prompt sections (## Inputs, ## Outputs, ## Behavior)
 --strict            Enforce swarm design constraints (tools/permissionMode become errors)
 --debug             Show timing and validation steps
+--no-cache          Re-parse every file instead of using .swarm/cache/validate.pickle
+--jobs N            Number of validator groups to run concurrently (1 = sequential)
 --version           Show validator version
 
 ## Exit Codes
@@ -117,6 +122,11 @@ Example:
 - Baseline: < 2 seconds on repos with ~45 agents
 - Git-aware mode: >= 50% faster on incremental changes
 - Fast-path optimization for common checks (bijection + frontmatter)
+- Parse cache: AGENTS.md, agent frontmatter, agent configs, flow configs,
+  flow spec agent references and microloop phrase matches are cached in
+  .swarm/cache/validate.pickle, keyed by path, mtime and size. Unchanged
+  files are not re-parsed.
+- Validator groups (agents, flows, skills, microloop, prompts) run concurrently
 
 ## Notes
 
@@ -143,9 +153,10 @@ import subprocess
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 # Add swarm package to path for library imports
 _SWARM_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -154,7 +165,9 @@ if str(_SWARM_ROOT) not in sys.path:
 
 # Lazy import: flow_registry is imported inside functions that need it
 # This allows the validator to work in test repos without swarm/config/
-from swarm.validator import SimpleYAMLParser, ValidationError, ValidationResult  # noqa: E402
+from swarm.validator import ParseCache, SimpleYAMLParser, ValidationError, ValidationResult  # noqa: E402
+
+T = TypeVar("T")
 
 # ============================================================================
 # Constants
@@ -231,6 +244,65 @@ FLOW_SPECS_DIR = ROOT / "swarm" / "flows"
 FLOWS_CONFIG_DIR = ROOT / "swarm" / "config" / "flows"
 AGENTS_DIR = ROOT / ".claude" / "agents"
 SKILLS_DIR = ROOT / ".claude" / "skills"
+PARSE_CACHE_PATH = ROOT / ".swarm" / "cache" / "validate.pickle"
+
+
+# ============================================================================
+# Parse Cache
+# ============================================================================
+
+# Active parse cache (None = every file is re-parsed on every call)
+_parse_cache: Optional[ParseCache] = None
+
+
+def _parser_fingerprint() -> Tuple[Any, ...]:
+    """Identify the parser code, so a changed validator invalidates the cache."""
+    from swarm.validator import yaml as yaml_module
+
+    sources = []
+    for source in (Path(__file__), Path(yaml_module.__file__)):
+        st = source.stat()
+        sources.append((source.name, st.st_mtime_ns, st.st_size))
+    return (tuple(sys.version_info[:2]), tuple(sources))
+
+
+def enable_parse_cache(path: Optional[Path] = None) -> ParseCache:
+    """
+    Load the on-disk parse cache and use it for all subsequent parsing.
+
+    Args:
+        path: Cache file (default: .swarm/cache/validate.pickle)
+
+    Returns:
+        The active ParseCache
+    """
+    global _parse_cache
+    _parse_cache = ParseCache(path or PARSE_CACHE_PATH, fingerprint=_parser_fingerprint())
+    return _parse_cache
+
+
+def disable_parse_cache() -> None:
+    """Stop using the parse cache (files are re-parsed on every call)."""
+    global _parse_cache
+    _parse_cache = None
+
+
+def cached_parse(namespace: str, path: Path, parser: Callable[[Path], T]) -> T:
+    """
+    Parse a file through the active parse cache, if any.
+
+    Args:
+        namespace: Distinguishes different parsers of the same file
+        path: File to parse
+        parser: Function from path to parsed value (must be picklable output)
+
+    Returns:
+        The parsed value (shared with other callers; do not mutate)
+    """
+    cache = _parse_cache
+    if cache is None:
+        return parser(path)
+    return cache.get(namespace, path, parser)
 
 
 # ============================================================================
@@ -251,78 +323,93 @@ def parse_agents_registry() -> Dict[str, Dict[str, Any]]:
         print(f"ERROR: {AGENTS_MD} not found (required for validation)", file=sys.stderr)
         sys.exit(EXIT_FATAL_ERROR)
 
+    try:
+        agents, old_format = cached_parse("agents-registry", AGENTS_MD, _parse_agents_table)
+    except Exception as e:
+        print(f"ERROR: Failed to parse {AGENTS_MD}: {e}", file=sys.stderr)
+        sys.exit(EXIT_FATAL_ERROR)
+
+    if old_format:
+        # Old format without color - log warning and continue
+        print(f"WARNING: {AGENTS_MD} uses old format without Role Family/Color columns", file=sys.stderr)
+
+    return agents
+
+
+def _parse_agents_table(agents_md: Path) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+    """
+    Parse the AGENTS.md pipe table.
+
+    Returns:
+        Tuple of (agent key -> metadata dict, True if the old format was used)
+    """
     agents: Dict[str, Dict[str, Any]] = {}
     in_table = False
-    line_number = 0
+    old_format = False
 
-    try:
-        with AGENTS_MD.open(encoding="utf-8") as f:
-            for line_number, line in enumerate(f, start=1):
-                line = line.rstrip("\n")
+    with agents_md.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
 
-                # Detect table header (new format with role_family and color)
-                if line.startswith("| Key") and "Role Family" in line and "Color" in line and "Short Role" in line:
-                    in_table = True
-                    continue
+            # Detect table header (new format with role_family and color)
+            if line.startswith("| Key") and "Role Family" in line and "Color" in line and "Short Role" in line:
+                in_table = True
+                continue
 
-                # Fallback: old format header (for backward compatibility during migration)
-                if line.startswith("| Key") and "Category" in line and "Short Role" in line and "Role Family" not in line:
-                    # Old format without color - log warning and continue
-                    print(f"WARNING: {AGENTS_MD} uses old format without Role Family/Color columns", file=sys.stderr)
-                    in_table = True
-                    continue
+            # Fallback: old format header (for backward compatibility during migration)
+            if line.startswith("| Key") and "Category" in line and "Short Role" in line and "Role Family" not in line:
+                old_format = True
+                in_table = True
+                continue
 
-                # Skip separator row
-                if in_table and line.startswith("|---"):
+            # Skip separator row
+            if in_table and line.startswith("|---"):
+                continue
+
+            # Parse table row
+            if in_table:
+                if not line.strip():
                     continue
+                if not line.startswith("|"):
+                    break
 
-                # Parse table row
-                if in_table:
-                    if not line.strip():
+                cols = [c.strip() for c in line.strip("|").split("|")]
+
+                # New format: Key | Flows | Role Family | Color | Source | Short Role
+                if len(cols) == 6:
+                    key, flows, role_family, color, source, role = cols
+                    key = key.strip()
+
+                    if not key or key == "Key":
                         continue
-                    if not line.startswith("|"):
-                        break
-
-                    cols = [c.strip() for c in line.strip("|").split("|")]
-
-                    # New format: Key | Flows | Role Family | Color | Source | Short Role
-                    if len(cols) == 6:
-                        key, flows, role_family, color, source, role = cols
-                        key = key.strip()
-
-                        if not key or key == "Key":
-                            continue
-
-                        agents[key] = {
-                            "flows": flows.strip(),
-                            "role_family": role_family.strip(),
-                            "color": color.strip(),
-                            "source": source.strip(),
-                            "role": role.strip(),
-                            "line": line_number
-                        }
-                    # Old format: Key | Flows | Category | Source | Short Role
-                    elif len(cols) == 5:
-                        key, flows, category, source, role = cols
-                        key = key.strip()
-
-                        if not key or key == "Key":
-                            continue
-
-                        agents[key] = {
-                            "flows": flows.strip(),
-                            "category": category.strip(),
-                            "source": source.strip(),
-                            "role": role.strip(),
-                            "line": line_number
-                        }
-                    else:
+
+                    agents[key] = {
+                        "flows": flows.strip(),
+                        "role_family": role_family.strip(),
+                        "color": color.strip(),
+                        "source": source.strip(),
+                        "role": role.strip(),
+                        "line": line_number
+                    }
+                # Old format: Key | Flows | Category | Source | Short Role
+                elif len(cols) == 5:
+                    key, flows, category, source, role = cols
+                    key = key.strip()
+
+                    if not key or key == "Key":
                         continue
-    except Exception as e:
-        print(f"ERROR: Failed to parse {AGENTS_MD}: {e}", file=sys.stderr)
-        sys.exit(EXIT_FATAL_ERROR)
 
-    return agents
+                    agents[key] = {
+                        "flows": flows.strip(),
+                        "category": category.strip(),
+                        "source": source.strip(),
+                        "role": role.strip(),
+                        "line": line_number
+                    }
+                else:
+                    continue
+
+    return agents, old_format
 
 
 # ============================================================================
@@ -344,9 +431,10 @@ def parse_config_files() -> Dict[str, Dict[str, Any]]:
 
     for config_file in config_dir.glob("*.yaml"):
         try:
-            content = config_file.read_text(encoding="utf-8")
             # Parse raw YAML config (not frontmatter format)
-            parsed = _parse_raw_yaml(content)
+            parsed = cached_parse(
+                "agent-config", config_file, lambda p: _parse_raw_yaml(p.read_text(encoding="utf-8"))
+            )
             key = parsed.get("key", config_file.stem)
             configs[key] = {**parsed, "file_path": str(config_file)}
         except Exception:
@@ -584,6 +672,21 @@ def validate_bijection(registry: Dict[str, Dict[str, Any]]) -> ValidationResult:
 # FR-002: Frontmatter Validation
 # ============================================================================
 
+def parse_frontmatter_file(path: Path, strict: bool = False) -> Dict[str, Any]:
+    """
+    Read a file and parse its YAML frontmatter (cached while unchanged).
+
+    Raises:
+        ValueError: If the frontmatter is malformed
+        OSError: If the file cannot be read
+    """
+    return cached_parse(
+        "frontmatter-strict" if strict else "frontmatter",
+        path,
+        lambda p: SimpleYAMLParser.parse(p.read_text(encoding="utf-8"), p, strict=strict),
+    )
+
+
 def validate_frontmatter(_registry: Dict[str, Dict[str, Any]], strict_mode: bool = False) -> ValidationResult:
     """
     Validate YAML frontmatter in all agent files.
@@ -620,8 +723,7 @@ def validate_frontmatter(_registry: Dict[str, Dict[str, Any]], strict_mode: bool
 
         # Parse frontmatter
         try:
-            content = path.read_text(encoding="utf-8")
-            fm = SimpleYAMLParser.parse(content, path, strict=strict_mode)
+            fm = parse_frontmatter_file(path, strict=strict_mode)
         except ValueError as e:
             result.add_error(
                 "FRONTMATTER",
@@ -805,8 +907,7 @@ def validate_colors(registry: Dict[str, Dict[str, Any]]) -> ValidationResult:
 
         # Parse frontmatter
         try:
-            content = path.read_text(encoding="utf-8")
-            fm = SimpleYAMLParser.parse(content, path)
+            fm = parse_frontmatter_file(path)
         except Exception:
             # Skip color check if frontmatter parsing failed (already reported)
             continue
@@ -981,7 +1082,7 @@ def validate_flow_references(registry: Dict[str, Dict[str, Any]]) -> ValidationR
             continue
 
         rel_path = flow_path.relative_to(ROOT)
-        agent_refs = parse_flow_spec_agents(flow_path)
+        agent_refs = cached_parse("flow-spec-agents", flow_path, parse_flow_spec_agents)
 
         for line_num, agent_name in agent_refs:
             if agent_name not in valid_agents:
@@ -1034,8 +1135,7 @@ def validate_skills() -> ValidationResult:
                 # Skip symlinks: validation only applies to real files
                 continue
             try:
-                content = agent_path.read_text(encoding="utf-8")
-                fm = SimpleYAMLParser.parse(content)
+                fm = parse_frontmatter_file(agent_path)
                 if "skills" in fm and isinstance(fm["skills"], list):
                     # Type ignore: fm from YAML parser returns Any; we know skills are strings
                     skills_list: list[str] = [str(s) for s in fm["skills"]]  # type: ignore[misc]
@@ -1059,8 +1159,7 @@ def validate_skills() -> ValidationResult:
 
         # Validate skill frontmatter
         try:
-            content = skill_file.read_text(encoding="utf-8")
-            fm = SimpleYAMLParser.parse(content)
+            fm = parse_frontmatter_file(skill_file)
 
             if "name" not in fm or not fm.get("name", "").strip():
                 result.add_error(
@@ -1441,6 +1540,20 @@ def parse_flow_config(flow_path: Path) -> Dict[str, Any]:
     return result
 
 
+def load_flow_configs() -> Dict[str, Dict[str, Any]]:
+    """
+    Parse every flow config in swarm/config/flows/ (cached while unchanged).
+
+    Returns:
+        Dict mapping flow id (file stem) -> parse_flow_config() result
+    """
+    flow_configs: Dict[str, Dict[str, Any]] = {}
+    if FLOWS_CONFIG_DIR.is_dir():
+        for flow_file in sorted(FLOWS_CONFIG_DIR.glob("*.yaml")):
+            flow_configs[flow_file.stem] = cached_parse("flow-config", flow_file, parse_flow_config)
+    return flow_configs
+
+
 def validate_no_empty_flows(flow_configs: Dict[str, Dict[str, Any]]) -> ValidationResult:
     """
     Validate that each flow has at least one step.
@@ -1814,30 +1927,38 @@ def validate_microloop_phrases() -> ValidationResult:
         (ROOT / "CLAUDE.md", "CLAUDE.md"),
     ]
 
+    banned_patterns = [(phrase, re.compile(phrase, re.IGNORECASE)) for phrase in banned_phrases]
+
+    # Helper: (line number, banned phrase) for every match in a file
+    def find_banned_phrases(file_path: Path) -> List[Tuple[int, str]]:
+        matches: List[Tuple[int, str]] = []
+        for i, line in enumerate(file_path.read_text(encoding="utf-8").splitlines(), start=1):
+            # Skip comments and code blocks that might be examples
+            if line.strip().startswith("#"):
+                continue
+
+            for banned_phrase, pattern in banned_patterns:
+                if pattern.search(line):
+                    matches.append((i, banned_phrase))
+        return matches
+
     # Helper: check file for banned phrases
     def check_file_for_banned_phrases(file_path: Path, _display_name: str) -> None:
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
-
-            for i, line in enumerate(lines, start=1):
-                # Skip comments and code blocks that might be examples
-                if line.strip().startswith("#"):
-                    continue
-
-                for banned_phrase in banned_phrases:
-                    if re.search(banned_phrase, line, re.IGNORECASE):
-                        rel_path = file_path.relative_to(ROOT)
-                        result.add_error(
-                            "MICROLOOP",
-                            f"{rel_path}:line {i}",
-                            f"uses banned microloop phrase '{banned_phrase}' (old iteration logic)",
-                            "Replace with explicit 'can_further_iteration_help: yes/no' or Status-based exit logic",
-                            line_number=i,
-                            file_path=str(file_path)
-                        )
+            matches = cached_parse("microloop-phrases", file_path, find_banned_phrases)
         except (OSError, UnicodeDecodeError):
-            pass  # Skip files that can't be read
+            return  # Skip files that can't be read
+
+        rel_path = file_path.relative_to(ROOT)
+        for i, banned_phrase in matches:
+            result.add_error(
+                "MICROLOOP",
+                f"{rel_path}:line {i}",
+                f"uses banned microloop phrase '{banned_phrase}' (old iteration logic)",
+                "Replace with explicit 'can_further_iteration_help: yes/no' or Status-based exit logic",
+                line_number=i,
+                file_path=str(file_path)
+            )
 
     # Check specified files
     for file_path, display_name in check_files:
@@ -2000,6 +2121,7 @@ class ValidatorRunner:
         strict: If True, enforce swarm design constraints as errors
         flows_only: If True, only run flow validation checks
         check_prompts: If True, validate agent prompt sections
+        jobs: Validator groups run concurrently (None = all at once, 1 = sequential)
     """
 
     def __init__(
@@ -2010,6 +2132,7 @@ class ValidatorRunner:
         strict: bool = False,
         flows_only: bool = False,
         check_prompts: bool = False,
+        jobs: Optional[int] = None,
     ):
         """
         Initialize the validator runner.
@@ -2021,6 +2144,8 @@ class ValidatorRunner:
             strict: If True, enforce swarm design constraints as errors
             flows_only: If True, only run flow validation checks
             check_prompts: If True, validate agent prompt sections
+            jobs: Number of validator groups to run concurrently
+                (None = one thread per group, 1 = sequential)
         """
         self.registry = registry
         self.modified_files = modified_files
@@ -2028,6 +2153,7 @@ class ValidatorRunner:
         self.strict = strict
         self.flows_only = flows_only
         self.check_prompts = check_prompts
+        self.jobs = jobs
 
     def _should_check(self, *path_prefixes: str) -> bool:
         """
@@ -2067,12 +2193,15 @@ class ValidatorRunner:
             self._debug_print("Running flows-only validation")
             result.extend(self.run_flows())
         else:
-            # Full validation: run all checks in order
-            result.extend(self.run_agents())
-            result.extend(self.run_flows())
-            result.extend(self.run_skills())
-            result.extend(self._run_microloop_validation())
-            result.extend(self._run_prompt_validation())
+            # Full validation: groups are independent, results merged in order
+            for group_result in self._run_groups([
+                self.run_agents,
+                self.run_flows,
+                self.run_skills,
+                self._run_microloop_validation,
+                self._run_prompt_validation,
+            ]):
+                result.extend(group_result)
 
         elapsed = time.time() - start_time
         mode = "Flows-only" if self.flows_only else "Full"
@@ -2080,6 +2209,21 @@ class ValidatorRunner:
 
         return result
 
+    def _run_groups(self, groups: List[Callable[[], ValidationResult]]) -> List[ValidationResult]:
+        """
+        Run independent validator groups, concurrently unless jobs == 1.
+
+        Groups only read files and build their own ValidationResult, so they
+        can overlap file I/O (and the Flow Studio probe). Results come back
+        in the order given, so output is identical to a sequential run.
+        """
+        jobs = len(groups) if self.jobs is None else max(1, min(self.jobs, len(groups)))
+        if jobs == 1:
+            return [group() for group in groups]
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="validate") as pool:
+            futures = [pool.submit(group) for group in groups]
+            return [future.result() for future in futures]
+
     def run_agents(self) -> ValidationResult:
         """
         Run agent-related validation checks.
@@ -2174,11 +2318,8 @@ class ValidatorRunner:
         result = ValidationResult()
 
         # Parse all flow configs
-        flow_configs: Dict[str, Dict[str, Any]] = {}
+        flow_configs = load_flow_configs()
         if FLOWS_CONFIG_DIR.is_dir():
-            for flow_file in sorted(FLOWS_CONFIG_DIR.glob("*.yaml")):
-                flow_id = flow_file.stem
-                flow_configs[flow_id] = parse_flow_config(flow_file)
             self._debug_print(f"Parsed {len(flow_configs)} flow configs")
 
         # Invariant 1: No empty flows
@@ -2293,12 +2434,15 @@ def run_validation(
     debug: bool = False,
     strict_mode: bool = False,
     flows_only: bool = False,
-    check_prompts: bool = False
+    check_prompts: bool = False,
+    jobs: Optional[int] = None,
 ) -> ValidationResult:
     """
     Run all validation checks.
 
     This is a thin wrapper around ValidatorRunner for backward compatibility.
+    If a parse cache is enabled (see enable_parse_cache), it is saved after
+    the run.
 
     Args:
         check_modified: If True, only check modified files (git-aware mode)
@@ -2306,6 +2450,7 @@ def run_validation(
         strict_mode: If True, enforce swarm design constraints as errors (not warnings)
         flows_only: If True, only run flow validation checks
         check_prompts: If True, validate agent prompt sections (## Inputs, ## Outputs, ## Behavior)
+        jobs: Validator groups to run concurrently (None = all, 1 = sequential)
 
     Returns:
         ValidationResult with all errors and warnings
@@ -2339,9 +2484,18 @@ def run_validation(
         strict=strict_mode,
         flows_only=flows_only,
         check_prompts=check_prompts,
+        jobs=jobs,
     )
 
-    return runner.run_all()
+    result = runner.run_all()
+
+    cache = _parse_cache
+    if cache is not None:
+        cache.save()
+        if debug:
+            print(f"Debug: Parse cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+
+    return result
 
 
 # ============================================================================
@@ -2508,9 +2662,7 @@ def build_detailed_json_output(
     steps_data: Dict[str, Any] = {}
     # Steps can be identified from flow config files
     if FLOWS_CONFIG_DIR.is_dir():
-        for flow_file in sorted(FLOWS_CONFIG_DIR.glob("*.yaml")):
-            flow_id = flow_file.stem
-            flow_config = parse_flow_config(flow_file)
+        for flow_id, flow_config in load_flow_configs().items():
             for step in flow_config.get("steps", []):
                 step_id = step.get("id", "")
                 full_step_id = f"{flow_id}:{step_id}"
@@ -2794,6 +2946,7 @@ Examples:
   uv run swarm/tools/validate_swarm.py --check-modified
   uv run swarm/tools/validate_swarm.py --flows-only
   uv run swarm/tools/validate_swarm.py --debug
+  uv run swarm/tools/validate_swarm.py --no-cache
         """
     )
 
@@ -2827,6 +2980,20 @@ Examples:
         help="Enable debug output with timing and validation steps"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every file instead of using the parse cache (.swarm/cache/validate.pickle)"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of validator groups to run concurrently (default: all, 1 = sequential)"
+    )
+
     parser.add_argument(
         "--json",
         action="store_true",
@@ -2847,6 +3014,9 @@ Examples:
 
     args = parser.parse_args()
 
+    if not args.no_cache:
+        enable_parse_cache()
+
     # Parse registry first (needed for both validation and JSON output)
     try:
         registry = parse_agents_registry()
@@ -2872,7 +3042,8 @@ Examples:
             debug=args.debug,
             strict_mode=args.strict,
             flows_only=args.flows_only,
-            check_prompts=args.check_prompts
+            check_prompts=args.check_prompts,
+            jobs=args.jobs,
         )
     except SystemExit:
         raise
@@ -2,9 +2,11 @@
 """Swarm validator library - extracted modules for maintainability."""
 
 from swarm.validator.errors import ValidationError, ValidationResult
+from swarm.validator.parse_cache import ParseCache
 from swarm.validator.yaml import SimpleYAMLParser
 
 __all__ = [
+    "ParseCache",
     "SimpleYAMLParser",
     "ValidationError",
     "ValidationResult",
@@ -0,0 +1,136 @@
+# swarm/validator/parse_cache.py
+"""On-disk parse cache keyed by file path, mtime and size."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = 1
+
+# Files modified this recently are cached in memory but not persisted: a
+# second write within the same mtime tick (and same size) would otherwise go
+# unnoticed by the next run.
+RACY_WINDOW_S = 2.0
+
+
+class _CachedError:
+    """A parse error recorded in the cache and re-raised on hit."""
+
+    def __init__(self, error: ValueError):
+        self.error = error
+
+
+class ParseCache:
+    """
+    Cache of parsed file contents, persisted with pickle.
+
+    Entries are keyed by (namespace, path) and are valid while the file's
+    mtime_ns and size are unchanged. The namespace distinguishes different
+    parsers of the same file (e.g. strict vs lenient frontmatter). ValueError
+    from a parser is cached too, so a broken file is not re-parsed every run.
+    Cached values are shared between callers and must be treated as
+    read-only.
+
+    The whole cache is discarded when ``fingerprint`` differs from the one it
+    was saved with; callers pass something that changes whenever the parsers
+    themselves change.
+
+    Thread-safe: validators running in parallel share one instance.
+    """
+
+    def __init__(self, path: Optional[Path] = None, fingerprint: Any = None):
+        self.path = Path(path) if path else None
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+        self._racy: Set[Tuple[str, str]] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with self.path.open("rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            # Missing, truncated or written by an incompatible version
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("format") == CACHE_FORMAT
+            and data.get("fingerprint") == self.fingerprint
+        ):
+            self._entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Persist the cache if anything changed, dropping deleted files."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key not in self._racy and os.path.exists(key[1])
+            }
+            data = {"format": CACHE_FORMAT, "fingerprint": self.fingerprint, "entries": entries}
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # Cache is best-effort; validation results are unaffected
+
+    def get(self, namespace: str, path: Path, parser: Callable[[Path], T]) -> T:
+        """
+        Return ``parser(path)``, served from cache when the file is unchanged.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+            ValueError: Whatever the parser raised (possibly from cache)
+        """
+        st = os.stat(path)
+        key = (namespace, str(path))
+        value: Any
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            with self._lock:
+                self.hits += 1
+            value = entry[2]
+            if isinstance(value, _CachedError):
+                raise value.error
+            return value
+
+        try:
+            value = parser(path)
+        except ValueError as e:
+            value = _CachedError(e)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (st.st_mtime_ns, st.st_size, value)
+            if time.time() - st.st_mtime_ns / 1e9 > RACY_WINDOW_S:
+                self._racy.discard(key)
+                self._dirty = True
+            else:
+                self._racy.add(key)
+
+        if isinstance(value, _CachedError):
+            raise value.error
+        return value
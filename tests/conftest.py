@@ -13,10 +13,11 @@ warnings.filterwarnings(
     category=DeprecationWarning,
 )
 
+import random
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import pytest
 from fastapi.testclient import TestClient
@@ -547,6 +548,107 @@ def flowstudio_client() -> TestClient:
     return TestClient(app)
 
 
+# ============================================================================
+# Run Event Stream Helpers (projection DB tests)
+# ============================================================================
+
+
+# Columns compared per table (surrogate ids and ingestion timestamps differ by design)
+TABLE_COLUMNS = {
+    "runs": "*",
+    "steps": "* EXCLUDE (id)",
+    "tool_calls": "* EXCLUDE (id)",
+    "file_changes": "* EXCLUDE (id)",
+    "routing_decisions": "* EXCLUDE (id)",
+    "events": "* EXCLUDE (ingested_at)",
+}
+
+
+def make_run_events(run_id: str, n_steps: int = 20, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate a realistic event stream with loops, tools, file changes and routing."""
+    rng = random.Random(seed)
+    events: List[Dict[str, Any]] = []
+
+    def add(kind: str, step_id: Optional[str] = None, payload: Optional[Dict[str, Any]] = None):
+        seq = len(events) + 1
+        events.append(
+            {
+                "event_id": f"{run_id}-{seq}",
+                "seq": seq,
+                "kind": kind,
+                "flow_key": "build",
+                "step_id": step_id,
+                "ts": f"2025-01-01T{seq // 3600:02d}:{seq // 60 % 60:02d}:{seq % 60:02d}Z",
+                "payload": payload or {},
+            }
+        )
+
+    add("run_start", payload={"flow_keys": ["build"], "profile_id": "p1", "engine": "stub"})
+    for i in range(n_steps):
+        # Reuse step ids so microloops produce several rows per step
+        step_id = f"step-{i % 5}"
+        add("step_start", step_id, {"step_index": i, "agent_key": "code-implementer"})
+        for _ in range(rng.randint(0, 3)):
+            add(
+                "tool_end",
+                step_id,
+                {
+                    "tool": rng.choice(["Read", "Edit", "Bash"]),
+                    "duration_ms": rng.randint(1, 100),
+                    "success": rng.random() > 0.1,
+                },
+            )
+        if rng.random() > 0.5:
+            files = [
+                {
+                    "path": f"src/file_{rng.randint(0, 4)}.py",
+                    "status": rng.choice(["modified", "added"]),
+                    "insertions": rng.randint(0, 9),
+                    "deletions": rng.randint(0, 3),
+                }
+                for _ in range(rng.randint(1, 3))
+            ]
+            add("file_changes", step_id, {"files": files})
+        add(
+            "route_decision",
+            step_id,
+            {
+                "method": rng.choice(["deterministic", "llm_tiebreak", "no_candidates"]),
+                "explanation": {"candidates_evaluated": 2},
+                "selected_edge": "edge-1",
+                "target_node": "next",
+            },
+        )
+        # Some steps never complete (crash mid-step)
+        if rng.random() > 0.1:
+            add(
+                "step_complete",
+                step_id,
+                {
+                    "status": rng.choice(["succeeded", "failed"]),
+                    "duration_ms": rng.randint(10, 1000),
+                    "prompt_tokens": 100,
+                    "completion_tokens": 50,
+                },
+            )
+    add(
+        "run_completed",
+        payload={"status": "succeeded", "total_steps": n_steps, "steps_completed": n_steps},
+    )
+    return events
+
+
+def dump_tables(db) -> Dict[str, List[str]]:
+    """Dump all projection tables in a comparable form."""
+    return {
+        table: sorted(
+            repr(row)
+            for row in db.connection.execute(f"SELECT {cols} FROM {table}").fetchall()
+        )
+        for table, cols in TABLE_COLUMNS.items()
+    }
+
+
 # ============================================================================
 # Pytest Configuration for BDD
 # ============================================================================
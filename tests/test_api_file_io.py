@@ -0,0 +1,200 @@
+"""Tests for off-loop file I/O and latency histograms in the Flow Studio API.
+
+These tests verify that:
+1. run_io() runs blocking calls on the bounded "api-io" pool
+2. Events and run-state routes do their file I/O off the event loop
+3. Latency histograms estimate percentiles and label requests by route template
+4. GET /api/metrics/latency reports (and optionally resets) the histograms
+
+Latency under a concurrent stream is measured by swarm/tools/runtime_bench.py
+(api_stream_latency), not here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def api_app(tmp_path, monkeypatch):
+    """create_app() with SpecManager and RunStateManager rooted at tmp_path."""
+    from swarm.api.routes import runs as runs_module
+    from swarm.api.server import create_app, get_spec_manager
+
+    app = create_app()
+    monkeypatch.setattr(get_spec_manager(), "runs_root", tmp_path)
+    monkeypatch.setattr(runs_module, "_state_manager", runs_module.RunStateManager(tmp_path))
+    return app
+
+
+def write_run(runs_root: Path, run_id: str, events: int, status: str = "succeeded") -> None:
+    """Create a run directory with `events` SSE-style events and a run state."""
+    run_dir = runs_root / run_id
+    run_dir.mkdir(parents=True)
+    with open(run_dir / "events.jsonl", "w", encoding="utf-8") as f:
+        for seq in range(1, events + 1):
+            f.write(
+                json.dumps({"event": "step:progress", "seq": seq, "detail": "x" * 200}) + "\n"
+            )
+    (run_dir / "run_state.json").write_text(
+        json.dumps({"run_id": run_id, "flow_id": "build", "status": status})
+    )
+
+
+class TestRunIO:
+    """The bounded file I/O executor."""
+
+    def test_runs_on_io_threads(self):
+        from swarm.api.file_io import run_io
+
+        name = asyncio.run(run_io(lambda: threading.current_thread().name))
+        assert name.startswith("api-io")
+
+    def test_exceptions_propagate(self, tmp_path):
+        from swarm.api.file_io import read_json
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(read_json(tmp_path / "missing.json"))
+
+    def test_write_json_atomic_round_trip(self, tmp_path):
+        from swarm.api.file_io import read_json, write_json_atomic
+
+        path = tmp_path / "run" / "run_state.json"
+
+        async def run():
+            await write_json_atomic(path, {"status": "running"})
+            return await read_json(path)
+
+        assert asyncio.run(run()) == {"status": "running"}
+        assert not path.with_suffix(".tmp").exists()
+
+    def test_pool_is_bounded_and_recreated(self, monkeypatch):
+        from swarm.api import file_io
+
+        file_io.shutdown_io_executor()
+        monkeypatch.setenv("SWARM_API_IO_WORKERS", "2")
+        try:
+            assert file_io.get_io_executor()._max_workers == 2
+        finally:
+            file_io.shutdown_io_executor()
+        monkeypatch.delenv("SWARM_API_IO_WORKERS")
+        assert file_io.get_io_executor()._max_workers == file_io.DEFAULT_IO_WORKERS
+
+
+class TestRoutesOffLoop:
+    """Route helpers hand their file access to the executor."""
+
+    def test_read_events_file_uses_executor(self, tmp_path, monkeypatch):
+        from swarm.api.routes import events as events_module
+
+        write_run(tmp_path, "run-a", 3)
+        threads = []
+        original = events_module._read_new_events
+
+        def spy(*args):
+            threads.append(threading.current_thread().name)
+            return original(*args)
+
+        monkeypatch.setattr(events_module, "_read_new_events", spy)
+        events, position = asyncio.run(
+            events_module.read_events_file(tmp_path / "run-a" / "events.jsonl")
+        )
+        assert [e["seq"] for e in events] == [1, 2, 3]
+        assert position == (tmp_path / "run-a" / "events.jsonl").stat().st_size
+        assert threads and threads[0].startswith("api-io")
+
+    def test_state_manager_round_trip(self, tmp_path):
+        from swarm.api.routes.runs import RunStateManager
+
+        async def run():
+            manager = RunStateManager(tmp_path)
+            state = await manager.create_run("build", run_id="run-sm")
+            await manager.update_run("run-sm", {"status": "running"})
+            fresh = RunStateManager(tmp_path)
+            loaded, _ = await fresh.get_run("run-sm")
+            with pytest.raises(FileNotFoundError):
+                await fresh.get_run("missing")
+            return state, loaded
+
+        state, loaded = asyncio.run(run())
+        assert state["status"] == "running"
+        assert loaded["status"] == "running"
+        assert json.loads((tmp_path / "run-sm" / "run_state.json").read_text())["run_id"] == "run-sm"
+
+
+class TestLatencyHistogram:
+    """Bucketed percentile estimates."""
+
+    def test_percentiles(self):
+        from swarm.api.latency import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        assert histogram.percentile(0.99) is None
+        for _ in range(98):
+            histogram.record(3.0)
+        histogram.record(40.0)
+        histogram.record(4000.0)
+
+        assert 2.5 <= histogram.percentile(0.50) <= 5
+        assert 25 <= histogram.percentile(0.99) <= 50
+        assert histogram.percentile(1.0) == 4000.0
+        summary = histogram.to_dict()
+        assert summary["count"] == 100
+        assert summary["buckets"]["5"] == 98
+        assert sum(summary["buckets"].values()) == 100
+
+    def test_overflow_bucket_capped_at_max(self):
+        from swarm.api.latency import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        histogram.record(60_000.0)
+        assert 10_000 <= histogram.percentile(0.5) <= 60_000.0
+        assert histogram.percentile(1.0) == 60_000.0
+        assert histogram.to_dict()["buckets"]["+Inf"] == 1
+
+
+class TestRouteLabel:
+    """Route templates rebuilt from the scope."""
+
+    def test_substitutes_path_params(self):
+        from swarm.api.latency import route_label
+
+        scope = {
+            "route": object(),
+            "path": "/api/runs/run-1/events",
+            "path_params": {"run_id": "run-1"},
+        }
+        assert route_label(scope) == "/api/runs/{run_id}/events"
+        assert route_label({"path": "/api/nope"}) is None
+
+
+class TestLatencyMetricsEndpoint:
+    """Middleware recording and GET /api/metrics/latency."""
+
+    def test_records_route_templates(self, api_app, tmp_path):
+        from fastapi.testclient import TestClient
+
+        from swarm.api.latency import get_latency_registry
+
+        get_latency_registry().reset()
+        write_run(tmp_path, "run-1", 1)
+        write_run(tmp_path, "run-2", 1)
+        client = TestClient(api_app)
+        assert client.get("/api/runs/run-1").status_code == 200
+        assert client.get("/api/runs/run-2").status_code == 200
+        client.get("/api/no-such-endpoint")
+
+        routes = client.get("/api/metrics/latency", params={"reset": True}).json()["routes"]
+        by_route = {(r["method"], r["route"]): r for r in routes}
+        assert by_route[("GET", "/api/runs/{run_id}")]["count"] == 2
+        assert by_route[("GET", "<unmatched>")]["count"] == 1
+        assert by_route[("GET", "/api/runs/{run_id}")]["p99_ms"] is not None
+
+        # reset=True cleared everything recorded before the snapshot
+        routes = client.get("/api/metrics/latency").json()["routes"]
+        assert [(r["route"], r["count"]) for r in routes] == [("/api/metrics/latency", 1)]
@@ -0,0 +1,231 @@
+"""
+Tests for the concurrent autopilot executor.
+
+Covers:
+- Round-robin scheduling of runs across a fixed worker pool
+- A run is never ticked concurrently with itself
+- Pause / resume / cancel through the executor
+- AutopilotState persistence and recovery of in-flight runs after a restart
+- Per-flow throughput and latency metrics, including failures
+- A run whose tick keeps raising is failed instead of re-queued forever
+
+Throughput against thread-per-run is measured by swarm/tools/runtime_bench.py
+(autopilot_executor), not here.
+"""
+
+import threading
+import time
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.autopilot import (
+    AutopilotController,
+    AutopilotStatus,
+    autopilot_state_from_dict,
+    autopilot_state_to_dict,
+)
+from swarm.runtime.autopilot_executor import MAX_TICK_ERRORS, AutopilotExecutor
+
+FLOWS = ["signal", "plan", "build"]
+
+
+class RecordingOrchestrator:
+    """Orchestrator double that records which run executed which flow."""
+
+    def __init__(self, delay: float = 0.0, fail_flows=()):
+        self.delay = delay
+        self.fail_flows = set(fail_flows)
+        self.calls = []
+        self.active = set()
+        self.overlaps = 0
+        self._lock = threading.Lock()
+
+    def run_stepwise_flow(self, flow_key, spec, run_id, resume=False):
+        with self._lock:
+            if run_id in self.active:
+                self.overlaps += 1
+            self.active.add(run_id)
+            self.calls.append((run_id, flow_key))
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if flow_key in self.fail_flows:
+                raise RuntimeError(f"{flow_key} exploded")
+            return run_id
+        finally:
+            with self._lock:
+                self.active.discard(run_id)
+
+
+class BrokenController(AutopilotController):
+    """Controller whose tick raises before the flow runs, every time."""
+
+    def tick(self, run_id):
+        raise OSError("disk full")
+
+
+@pytest.fixture
+def runs_dir(tmp_path, monkeypatch):
+    """Isolate run directories (and the run catalog) from the real swarm/runs."""
+    runs_dir = tmp_path / "swarm" / "runs"
+    runs_dir.mkdir(parents=True)
+    monkeypatch.setattr(storage, "RUNS_DIR", runs_dir)
+    return runs_dir
+
+
+def make_executor(runs_dir, orchestrator, workers=1, controller_cls=AutopilotController):
+    controller = controller_cls(repo_root=runs_dir.parents[1], orchestrator=orchestrator)
+    return AutopilotExecutor(controller=controller, max_workers=workers)
+
+
+class TestScheduling:
+    def test_runs_share_one_worker_round_robin(self, runs_dir):
+        orchestrator = RecordingOrchestrator()
+        executor = make_executor(runs_dir, orchestrator, workers=1)
+        run_ids = [executor.submit(flow_keys=FLOWS) for _ in range(3)]
+
+        executor.start(recover=False)
+        assert executor.wait_idle(timeout=30)
+        executor.shutdown()
+
+        expected = [(run_id, flow) for flow in FLOWS for run_id in run_ids]
+        assert orchestrator.calls == expected
+        for run_id in run_ids:
+            assert executor.controller.get_result(run_id).status == AutopilotStatus.SUCCEEDED
+
+    def test_run_never_ticked_concurrently(self, runs_dir):
+        orchestrator = RecordingOrchestrator(delay=0.005)
+        executor = make_executor(runs_dir, orchestrator, workers=4)
+        run_ids = [executor.submit(flow_keys=FLOWS) for _ in range(6)]
+        for run_id in run_ids:
+            assert executor.enqueue(run_id) is False  # already queued
+
+        executor.start(recover=False)
+        assert executor.wait_idle(timeout=30)
+        executor.shutdown()
+
+        assert orchestrator.overlaps == 0
+        assert len(orchestrator.calls) == len(run_ids) * len(FLOWS)
+        assert executor.stats().runs_finished == len(run_ids)
+
+
+class TestControl:
+    def test_pause_and_resume(self, runs_dir):
+        orchestrator = RecordingOrchestrator()
+        executor = make_executor(runs_dir, orchestrator)
+        run_id = executor.submit(flow_keys=FLOWS)
+        assert executor.pause(run_id)
+
+        executor.start(recover=False)
+        assert executor.wait(run_id, timeout=30).status == AutopilotStatus.PAUSED
+        assert orchestrator.calls == []
+        persisted = storage.read_autopilot_state(run_id, runs_dir)
+        assert persisted["status"] == "paused"
+
+        assert executor.resume(run_id)
+        result = executor.wait(run_id, timeout=30)
+        executor.shutdown()
+        assert result.status == AutopilotStatus.SUCCEEDED
+        assert result.flows_completed == FLOWS
+
+    def test_cancel_drops_run(self, runs_dir):
+        orchestrator = RecordingOrchestrator()
+        executor = make_executor(runs_dir, orchestrator)
+        run_id = executor.submit(flow_keys=FLOWS)
+        assert executor.cancel(run_id)
+
+        executor.start(recover=False)
+        assert executor.wait(run_id, timeout=30).status == AutopilotStatus.CANCELED
+        executor.shutdown()
+        assert orchestrator.calls == []
+
+
+class TestPersistence:
+    def test_state_round_trip(self, runs_dir):
+        controller = AutopilotController(
+            repo_root=runs_dir.parents[1], orchestrator=RecordingOrchestrator()
+        )
+        run_id = controller.start(flow_keys=FLOWS, auto_apply_wisdom=True)
+        controller.tick(run_id)
+
+        state = controller.get_state(run_id)
+        restored = autopilot_state_from_dict(autopilot_state_to_dict(state))
+        assert autopilot_state_to_dict(restored) == autopilot_state_to_dict(state)
+        assert restored.current_flow_index == 1
+        assert restored.started_at == state.started_at
+
+    def test_restart_recovers_in_flight_runs(self, runs_dir):
+        # First process: one run advanced a flow, one finished, then "crash"
+        first = make_executor(runs_dir, RecordingOrchestrator())
+        in_flight = first.submit(flow_keys=FLOWS)
+        finished = first.submit(flow_keys=["signal"])
+        first.controller.tick(in_flight)
+        first.controller.run_to_completion(finished)
+        first._persist(in_flight)
+        first._persist(finished)
+
+        # Second process: fresh controller, state only on disk
+        orchestrator = RecordingOrchestrator()
+        second = make_executor(runs_dir, orchestrator)
+        second.start()
+        assert second.tracks(in_flight) and not second.tracks(finished)
+        result = second.wait(in_flight, timeout=30)
+        second.shutdown()
+
+        assert result.status == AutopilotStatus.SUCCEEDED
+        assert result.flows_completed == FLOWS
+        assert (in_flight, "signal") not in orchestrator.calls
+        assert second.stats().runs_recovered >= 1
+        assert storage.read_autopilot_state(in_flight, runs_dir)["status"] == "succeeded"
+
+
+class TestMetrics:
+    def test_per_flow_metrics(self, runs_dir):
+        orchestrator = RecordingOrchestrator(delay=0.002, fail_flows={"build"})
+        executor = make_executor(runs_dir, orchestrator, workers=2)
+        run_ids = [executor.submit(flow_keys=FLOWS) for _ in range(3)]
+        executor.start(recover=False)
+        assert executor.wait_idle(timeout=30)
+        executor.shutdown()
+
+        stats = executor.stats()
+        assert stats.flows["signal"].succeeded == 3
+        assert stats.flows["build"].failed == 3
+        assert stats.flows["plan"].p95_ms >= stats.flows["plan"].p50_ms > 0
+        assert stats.runs_finished == 3
+        assert set(stats.to_dict()["flows"]) == set(FLOWS)
+        for run_id in run_ids:
+            assert executor.controller.get_result(run_id).status == AutopilotStatus.FAILED
+
+
+class TestTickErrors:
+    def test_run_failed_after_repeated_tick_errors(self, runs_dir):
+        executor = make_executor(runs_dir, RecordingOrchestrator(), controller_cls=BrokenController)
+        run_id = executor.submit(flow_keys=FLOWS)
+        executor.start(recover=False)
+        assert executor.wait_idle(timeout=30)
+        executor.shutdown()
+
+        result = executor.controller.get_result(run_id)
+        assert result.status == AutopilotStatus.FAILED
+        assert f"{MAX_TICK_ERRORS} times in a row" in result.error
+        assert storage.read_autopilot_state(run_id, runs_dir)["status"] == "failed"
+        assert executor.stats().runs_finished == 1
+
+    def test_successful_tick_resets_error_count(self, runs_dir):
+        executor = make_executor(runs_dir, RecordingOrchestrator())
+        run_id = executor.submit(flow_keys=FLOWS)
+        failures = iter([True] * (MAX_TICK_ERRORS - 1) + [False] + [True] * (MAX_TICK_ERRORS - 1))
+        tick = executor.controller.tick
+
+        def flaky_tick(rid):
+            if next(failures, False):
+                raise OSError("transient")
+            return tick(rid)
+
+        executor.controller.tick = flaky_tick
+        executor.start(recover=False)
+        result = executor.wait(run_id, timeout=30)
+        executor.shutdown()
+        assert result.status == AutopilotStatus.SUCCEEDED
@@ -0,0 +1,149 @@
+"""
+Tests for the flattened context-budget resolution table.
+
+Covers:
+- ContextBudgetTable lookups match ContextBudgetResolver.resolve() for every
+  flow and step, with and without a profile
+- Step and flow overrides, unknown flows/steps falling back a level
+- Lookups return copies; tables are shared per profile
+- runtime.yaml edits rebuild the table
+
+Resolution time is measured by swarm/tools/runtime_bench.py (context_budgets),
+not here.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from swarm.config import runtime_config
+from swarm.config.flow_registry import (
+    ContextBudgetOverride,
+    EngineProfile,
+    FlowDefinition,
+    FlowRegistry,
+    StepDefinition,
+)
+from swarm.config.runtime_config import (
+    ContextBudgetResolver,
+    get_context_budget_table,
+    get_resolved_context_budgets,
+    reset_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables():
+    reset_config()
+    yield
+    reset_config()
+    FlowRegistry.reset()
+
+
+def touch_later(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class FakeFlowRegistry:
+    """Flow registry with engine-profile budget overrides on the build flow."""
+
+    def __init__(self):
+        steps = (
+            StepDefinition(
+                id="implement",
+                index=1,
+                agents=("code-implementer",),
+                role="",
+                engine_profile=EngineProfile(
+                    context_budgets=ContextBudgetOverride(context_budget_chars=300_000)
+                ),
+            ),
+            StepDefinition(id="critique_code", index=2, agents=("code-critic",), role=""),
+        )
+        self.flows = [
+            FlowDefinition(key="build", index=3, title="", short_title="", description="", steps=steps)
+        ]
+
+    def get_flow(self, key):
+        return next((f for f in self.flows if f.key == key), None)
+
+
+def as_tuple(budgets):
+    return (
+        budgets.context_budget_chars,
+        budgets.history_max_recent_chars,
+        budgets.history_max_older_chars,
+        budgets.source,
+    )
+
+
+class TestContextBudgetTable:
+    @pytest.mark.parametrize("profile_id", [None, "baseline", "missing-profile"])
+    def test_matches_resolver_for_every_step(self, profile_id):
+        resolver = ContextBudgetResolver(profile_id)
+        table = get_context_budget_table(profile_id)
+        for flow in FlowRegistry.get_instance().flows:
+            assert as_tuple(table.lookup(flow.key)) == as_tuple(resolver.resolve(flow.key))
+            for step in flow.steps:
+                assert as_tuple(table.lookup(flow.key, step.id)) == as_tuple(
+                    resolver.resolve(flow.key, step.id)
+                )
+        assert as_tuple(table.lookup()) == as_tuple(resolver.resolve())
+
+    def test_step_override_and_fallbacks(self, monkeypatch):
+        monkeypatch.setattr(FlowRegistry, "_instance", FakeFlowRegistry())
+        resolver = ContextBudgetResolver()
+
+        for flow_key, step_id in [
+            ("build", "implement"),
+            ("build", "critique_code"),
+            ("build", "no_such_step"),
+            ("no_such_flow", "implement"),
+            (None, "implement"),
+        ]:
+            resolved = get_resolved_context_budgets(flow_key, step_id)
+            assert as_tuple(resolved) == as_tuple(resolver.resolve(flow_key, step_id))
+
+        implement = get_resolved_context_budgets("build", "implement")
+        assert implement.context_budget_chars == 300_000
+        assert implement.source == "step"
+        assert get_resolved_context_budgets("build", "critique_code").source == "default"
+
+    def test_lookups_are_copies(self):
+        first = get_resolved_context_budgets("build", "implement")
+        first.context_budget_chars = 1
+        assert get_resolved_context_budgets("build", "implement").context_budget_chars != 1
+        assert get_context_budget_table() is get_context_budget_table()
+
+    def test_runtime_yaml_change_rebuilds(self, tmp_path, monkeypatch):
+        config_path = tmp_path / "runtime.yaml"
+        config_path.write_text("defaults:\n  context_budget_chars: 100000\n")
+        monkeypatch.setattr(runtime_config, "_CONFIG_PATH", config_path)
+        monkeypatch.setattr(runtime_config, "BUDGET_TABLE_CHECK_INTERVAL_S", 0.0)
+        reset_config()
+        assert get_resolved_context_budgets("build").context_budget_chars == 100_000
+
+        config_path.write_text("defaults:\n  context_budget_chars: 150000\n")
+        touch_later(config_path)
+        assert get_resolved_context_budgets("build").context_budget_chars == 150_000
+
+    def test_config_change_leaves_shared_registries_alone(self, tmp_path, monkeypatch):
+        config_path = tmp_path / "runtime.yaml"
+        config_path.write_text("defaults:\n  context_budget_chars: 100000\n")
+        monkeypatch.setattr(runtime_config, "_CONFIG_PATH", config_path)
+        monkeypatch.setattr(runtime_config, "BUDGET_TABLE_CHECK_INTERVAL_S", 0.0)
+        registry = FakeFlowRegistry()
+        monkeypatch.setattr(FlowRegistry, "_instance", registry)
+        implement = get_resolved_context_budgets("build", "implement")
+        assert implement.context_budget_chars == 300_000
+        cached = runtime_config._load_config()
+
+        config_path.write_text("defaults:\n  context_budget_chars: 150000\n")
+        touch_later(config_path)
+        # The table follows the edit (from the real flows); running code does not
+        assert get_resolved_context_budgets("build").context_budget_chars == 150_000
+        assert FlowRegistry.get_instance() is registry
+        assert runtime_config._load_config() is cached
@@ -0,0 +1,149 @@
+"""Tests for set-based bulk ingestion (StatsDB.ingest_events_bulk).
+
+These tests verify that:
+1. Bulk ingestion produces the same tables as the per-event path
+2. Incremental and duplicate events are deduplicated like ingest_events()
+3. Runs the set-based path cannot reproduce fall back to per-event ingestion
+4. rebuild_stats_db / rebuild_all_from_events give identical results in both modes
+
+Throughput is measured by swarm/tools/runtime_bench.py (db_ingest), not here.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from conftest import dump_tables, make_run_events
+
+
+@pytest.fixture
+def make_db():
+    """Create in-memory StatsDB instances and close them afterwards."""
+    from swarm.runtime.db import StatsDB
+
+    dbs = []
+
+    def _make():
+        db = StatsDB(None)
+        dbs.append(db)
+        return db
+
+    yield _make
+    for db in dbs:
+        db.close()
+
+
+class TestBulkIngestEquivalence:
+    """Bulk ingestion must produce the same tables as ingest_events()."""
+
+    def test_matches_per_event_path(self, make_db):
+        runs = {f"run-{i}": make_run_events(f"run-{i}", seed=i) for i in range(4)}
+        per_event, bulk = make_db(), make_db()
+
+        counts = {run_id: per_event.ingest_events(events, run_id) for run_id, events in runs.items()}
+        bulk_counts = bulk.ingest_events_bulk(runs)
+
+        assert bulk_counts == counts
+        assert dump_tables(bulk) == dump_tables(per_event)
+
+    def test_incremental_and_duplicate_events(self, make_db):
+        """Previously ingested events and in-batch duplicates are skipped."""
+        events = make_run_events("run-inc", seed=7)
+        events.append(dict(events[5]))  # duplicate event_id within the batch
+        half = events[: len(events) // 2]
+        per_event, bulk = make_db(), make_db()
+
+        per_event.ingest_events(half, "run-inc")
+        bulk.ingest_events(half, "run-inc")
+
+        expected = per_event.ingest_events(events, "run-inc")
+        assert bulk.ingest_events_bulk({"run-inc": events}) == {"run-inc": expected}
+        assert dump_tables(bulk) == dump_tables(per_event)
+
+        # Re-ingesting everything is a no-op
+        assert bulk.ingest_events_bulk({"run-inc": events}) == {"run-inc": 0}
+
+    def test_invalid_events_are_skipped(self, make_db):
+        """Events rejected by the raw events table are never projected."""
+        events = make_run_events("run-bad", n_steps=3)
+        events[1] = {**events[1], "event_id": None}
+        events[2] = {**events[2], "ts": "not-a-timestamp"}
+        del events[3]["flow_key"]
+        per_event, bulk = make_db(), make_db()
+
+        expected = per_event.ingest_events(events, "run-bad")
+        assert bulk.ingest_events_bulk({"run-bad": events}) == {"run-bad": expected}
+        assert dump_tables(bulk) == dump_tables(per_event)
+
+    def test_untyped_payload_falls_back_to_per_event(self, make_db):
+        """Runs with values the set-based path cannot reproduce use ingest_events()."""
+        events = make_run_events("run-odd", n_steps=3)
+        events.append(
+            {
+                "event_id": "run-odd-x",
+                "seq": len(events) + 1,
+                "kind": "tool_end",
+                "flow_key": "build",
+                "step_id": "step-0",
+                "ts": "2025-01-01T01:00:00Z",
+                "payload": {"tool": "Bash", "duration_ms": "12", "success": "yes"},
+            }
+        )
+        runs = {"run-ok": make_run_events("run-ok", seed=3), "run-odd": events}
+        per_event, bulk = make_db(), make_db()
+
+        counts = {run_id: per_event.ingest_events(evts, run_id) for run_id, evts in runs.items()}
+        assert bulk.ingest_events_bulk(runs) == counts
+        assert dump_tables(bulk) == dump_tables(per_event)
+
+    def test_empty_batch(self, make_db):
+        db = make_db()
+        assert db.ingest_events_bulk({}) == {}
+        assert db.ingest_events_bulk({"run-empty": []}) == {"run-empty": 0}
+
+
+class TestBulkRebuild:
+    """Rebuild entry points give identical projections in bulk and per-event mode."""
+
+    @pytest.fixture
+    def runs_dir(self, tmp_path: Path) -> Path:
+        runs_dir = tmp_path / "runs"
+        for i in range(3):
+            run_dir = runs_dir / f"run-{i}"
+            run_dir.mkdir(parents=True)
+            with (run_dir / "events.jsonl").open("w") as f:
+                for event in make_run_events(f"run-{i}", seed=i):
+                    f.write(json.dumps(event) + "\n")
+        return runs_dir
+
+    def test_rebuild_stats_db_bulk_matches_per_event(self, runs_dir, tmp_path):
+        from swarm.runtime.db import StatsDB, rebuild_stats_db
+
+        bulk_path = tmp_path / "bulk.duckdb"
+        per_event_path = tmp_path / "per_event.duckdb"
+
+        bulk_result = rebuild_stats_db(runs_dir=runs_dir, db_path=bulk_path)
+        per_event_result = rebuild_stats_db(
+            runs_dir=runs_dir, db_path=per_event_path, bulk=False
+        )
+        assert bulk_result == per_event_result
+
+        bulk_db, per_event_db = StatsDB(bulk_path), StatsDB(per_event_path)
+        try:
+            assert dump_tables(bulk_db) == dump_tables(per_event_db)
+        finally:
+            bulk_db.close()
+            per_event_db.close()
+
+    def test_rebuild_all_from_events_bulk_matches_per_event(self, runs_dir, make_db):
+        bulk, per_event = make_db(), make_db()
+
+        bulk_stats = bulk.rebuild_all_from_events(runs_dir=runs_dir)
+        per_event_stats = per_event.rebuild_all_from_events(runs_dir=runs_dir, bulk=False)
+
+        assert bulk_stats == per_event_stats
+        assert bulk_stats["runs_succeeded"] == 3
+        assert dump_tables(bulk) == dump_tables(per_event)
@@ -0,0 +1,219 @@
+"""Tests for the persistent DiffScanner and baseline-scoped scans.
+
+These tests verify that:
+1. get_diff_scanner() returns one shared scanner per repo root
+2. HEAD is resolved through the long-lived cat-file process and tracks commits
+3. Scans against a baseline report only paths touched since the snapshot
+4. A moved HEAD falls back to the full scan
+5. A step-start snapshot can reuse the previous step's post-scan state
+
+Per-step scan cost is measured by swarm/tools/runtime_bench.py (diff_scan), not here.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime.diff_scanner import (
+    close_diff_scanners,
+    get_diff_scanner,
+    scan_file_changes_sync,
+    take_worktree_snapshot,
+)
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        env={**os.environ, **GIT_ENV},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def make_repo(root: Path, n_files: int = 3) -> Path:
+    """Git repo with n committed files spread over subdirectories."""
+    root.mkdir(parents=True, exist_ok=True)
+    git(root, "init", "-q")
+    for i in range(n_files):
+        path = root / f"d{i // 1000}" / f"f{i}.txt"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"line {i}\n")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def touch(path: Path, text: str) -> None:
+    """Rewrite a file and bump its mtime so the stat signature changes."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture(autouse=True)
+def _reset_scanners():
+    close_diff_scanners()
+    yield
+    close_diff_scanners()
+
+
+class TestScannerRegistry:
+    def test_one_scanner_per_root(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        assert get_diff_scanner(repo) is get_diff_scanner(repo / ".")
+        assert get_diff_scanner(repo) is not get_diff_scanner(make_repo(tmp_path / "other"))
+
+    def test_head_follows_commits(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        scanner = get_diff_scanner(repo)
+        assert scanner.head() == git(repo, "rev-parse", "HEAD").strip()
+
+        git(repo, "commit", "-q", "--allow-empty", "-m", "next")
+        assert scanner.head() == git(repo, "rev-parse", "HEAD").strip()
+
+    def test_head_restarts_after_close(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        scanner = get_diff_scanner(repo)
+        head = scanner.head()
+        scanner.close()
+        assert scanner.head() == head
+
+    def test_unborn_head(self, tmp_path):
+        repo = tmp_path / "empty"
+        repo.mkdir()
+        git(repo, "init", "-q")
+        assert get_diff_scanner(repo).head() == ""
+
+    def test_snapshot_outside_repo(self, tmp_path):
+        assert take_worktree_snapshot(tmp_path) is None
+
+
+class TestBaselineScan:
+    def test_without_baseline_reports_everything(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+        (repo / "pre.txt").write_text("x")
+
+        changes = scan_file_changes_sync(repo)
+        assert [f.path for f in changes.files] == ["d0/f0.txt"]
+        assert changes.untracked == ["pre.txt"]
+
+    def test_only_paths_touched_since_baseline(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+        (repo / "pre.txt").write_text("x")
+
+        baseline = take_worktree_snapshot(repo)
+        touch(repo / "d0" / "f1.txt", "changed during\nsecond\n")
+        (repo / "during.txt").write_text("y")
+
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert [f.path for f in changes.files] == ["d0/f1.txt"]
+        assert changes.untracked == ["during.txt"]
+        assert (changes.total_insertions, changes.total_deletions) == (2, 1)
+
+    def test_non_ascii_path_keeps_line_counts(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        (repo / "é.txt").write_text("one\n")
+        git(repo, "add", "é.txt")
+        git(repo, "commit", "-q", "-m", "add")
+
+        baseline = take_worktree_snapshot(repo)
+        touch(repo / "é.txt", "one\ntwo\nthree\n")
+
+        for scan_baseline in (None, baseline):
+            changes = scan_file_changes_sync(repo, baseline=scan_baseline)
+            assert [(f.path, f.insertions) for f in changes.files] == [("é.txt", 2)]
+            assert changes.total_insertions == 2
+
+    def test_file_dirty_at_baseline_and_edited_again(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+
+        baseline = take_worktree_snapshot(repo)
+        touch(repo / "d0" / "f0.txt", "changed again, longer\n")
+
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert [f.path for f in changes.files] == ["d0/f0.txt"]
+
+    def test_staging_counts_as_touched(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+
+        baseline = take_worktree_snapshot(repo)
+        git(repo, "add", "d0/f0.txt")
+
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert changes.staged == ["d0/f0.txt"]
+
+    def test_no_changes_during_step(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+
+        baseline = take_worktree_snapshot(repo)
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert changes.scan_error is None
+        assert not changes.has_changes
+
+    def test_moved_head_falls_back_to_full_scan(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+
+        baseline = take_worktree_snapshot(repo)
+        git(repo, "commit", "-q", "--allow-empty", "-m", "step commit")
+
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert [f.path for f in changes.files] == ["d0/f0.txt"]
+
+
+class TestReuseLastScan:
+    def test_snapshot_reuses_previous_scan(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        touch(repo / "d0" / "f0.txt", "changed before\n")
+
+        first = take_worktree_snapshot(repo, reuse_last_scan=True)
+        touch(repo / "d0" / "f1.txt", "step one\n")
+        changes = scan_file_changes_sync(repo, baseline=first)
+        assert [f.path for f in changes.files] == ["d0/f1.txt"]
+
+        second = take_worktree_snapshot(repo, reuse_last_scan=True)
+        assert second is get_diff_scanner(repo)._last_scan
+        touch(repo / "d0" / "f2.txt", "step two\n")
+        changes = scan_file_changes_sync(repo, baseline=second)
+        assert [f.path for f in changes.files] == ["d0/f2.txt"]
+
+    def test_changes_between_steps_go_to_next_step(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        scan_file_changes_sync(repo)
+        (repo / "between.txt").write_text("x")
+
+        baseline = take_worktree_snapshot(repo, reuse_last_scan=True)
+        changes = scan_file_changes_sync(repo, baseline=baseline)
+        assert changes.untracked == ["between.txt"]
+
+        fresh = take_worktree_snapshot(repo)
+        assert not scan_file_changes_sync(repo, baseline=fresh).has_changes
+
+    def test_moved_head_takes_fresh_snapshot(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        scan_file_changes_sync(repo)
+        git(repo, "commit", "-q", "--allow-empty", "-m", "step commit")
+
+        baseline = take_worktree_snapshot(repo, reuse_last_scan=True)
+        assert baseline is not get_diff_scanner(repo)._last_scan
+        assert baseline.head == get_diff_scanner(repo).head()
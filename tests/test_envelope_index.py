@@ -0,0 +1,183 @@
+"""
+Tests for the incremental handoff envelope index.
+
+Covers:
+- EnvelopeIndex: recorded writes are not parsed back, in-place edits and
+  new/removed files are picked up, malformed files skipped
+- Manifest: a fresh process rebuilds from handoff/.index.jsonl without
+  parsing envelopes, stale records are ignored, compaction bounds its size
+- load_previous_envelopes / save_envelope / storage.write_envelope wiring
+- _scan_common_artifacts sees artifacts created after a previous scan
+
+Hydration time is measured by swarm/tools/runtime_bench.py (envelope_index),
+not here.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.context_pack import (
+    _scan_common_artifacts,
+    load_previous_envelopes,
+    save_envelope,
+)
+from swarm.runtime.envelope_index import (
+    MANIFEST_NAME,
+    get_envelope_index,
+    reset_envelope_indexes,
+)
+from swarm.runtime.types import (
+    HandoffEnvelope,
+    RoutingDecision,
+    RoutingSignal,
+    handoff_envelope_from_dict,
+    handoff_envelope_to_dict,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    reset_envelope_indexes()
+    yield
+    reset_envelope_indexes()
+
+
+def make_envelope(step_id: str, summary: str = "done") -> HandoffEnvelope:
+    return HandoffEnvelope(
+        step_id=step_id,
+        flow_key="build",
+        run_id="run-1",
+        routing_signal=RoutingSignal(decision=RoutingDecision.ADVANCE),
+        summary=summary,
+        status="verified",
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def touch_later(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def write_raw(run_base: Path, envelope: HandoffEnvelope) -> Path:
+    """Write an envelope without telling the index (like an agent would)."""
+    path = run_base / "handoff" / f"{envelope.step_id}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(handoff_envelope_to_dict(envelope), indent=2))
+    return path
+
+
+def summaries(envelopes):
+    return [(env.step_id, env.summary) for env in envelopes]
+
+
+class TestEnvelopeIndex:
+    def test_recorded_writes_are_not_parsed(self, tmp_path):
+        for step in ("a", "b", "c"):
+            save_envelope(make_envelope(step), tmp_path)
+
+        index = get_envelope_index(tmp_path)
+        order = {"a": 0, "b": 1, "c": 2}
+        assert summaries(index.envelopes(order)) == [("a", "done"), ("b", "done"), ("c", "done")]
+        assert summaries(index.latest(2, order)) == [("b", "done"), ("c", "done")]
+        assert index.parses == 0
+
+    def test_external_changes_are_picked_up(self, tmp_path):
+        save_envelope(make_envelope("a"), tmp_path)
+        path_b = write_raw(tmp_path, make_envelope("b"))
+        index = get_envelope_index(tmp_path)
+        assert index.get("b").summary == "done"
+        assert index.parses == 1
+
+        # In-place edit (routing patch, assumption, agent rewrite)
+        path_b.write_text(json.dumps(handoff_envelope_to_dict(make_envelope("b", "patched"))))
+        touch_later(path_b)
+        assert index.get("b").summary == "patched"
+
+        path_b.unlink()
+        assert index.get("b") is None
+        assert [env.step_id for env in index.envelopes()] == ["a"]
+        assert index.parses == 2
+
+    def test_malformed_envelope_skipped(self, tmp_path):
+        save_envelope(make_envelope("a"), tmp_path)
+        (tmp_path / "handoff" / "broken.json").write_text("{not json")
+        index = get_envelope_index(tmp_path)
+        assert [env.step_id for env in index.envelopes()] == ["a"]
+        index.envelopes()
+        assert index.parses == 1  # the broken file is not re-read until it changes
+
+
+class TestManifest:
+    def test_restart_rebuilds_from_manifest(self, tmp_path):
+        for step in ("a", "b"):
+            save_envelope(make_envelope(step), tmp_path)
+        write_raw(tmp_path, make_envelope("c"))
+        get_envelope_index(tmp_path).envelopes()  # parses c, appends it
+
+        reset_envelope_indexes()
+        index = get_envelope_index(tmp_path)
+        assert sorted(env.step_id for env in index.envelopes()) == ["a", "b", "c"]
+        assert index.parses == 0
+
+    def test_stale_manifest_record_ignored(self, tmp_path):
+        save_envelope(make_envelope("a"), tmp_path)
+        reset_envelope_indexes()
+
+        path = write_raw(tmp_path, make_envelope("a", "rewritten offline"))
+        touch_later(path)
+        index = get_envelope_index(tmp_path)
+        assert index.get("a").summary == "rewritten offline"
+        assert index.parses == 1
+
+    def test_manifest_is_not_an_envelope(self, tmp_path):
+        runs_dir = tmp_path / "runs"
+        path = storage.write_envelope("run-1", "build", "a", make_envelope("a"), runs_dir)
+        assert (path.parent / MANIFEST_NAME).is_file()
+        assert list(storage.list_envelopes("run-1", "build", runs_dir)) == ["a"]
+
+    def test_compaction_bounds_manifest(self, tmp_path):
+        for i in range(30):
+            save_envelope(make_envelope("a", f"rev {i}"), tmp_path)
+        lines = (tmp_path / "handoff" / MANIFEST_NAME).read_text().splitlines()
+        assert len(lines) <= 11
+
+        reset_envelope_indexes()
+        assert get_envelope_index(tmp_path).get("a").summary == "rev 29"
+
+
+class TestContextPackWiring:
+    def test_load_previous_envelopes_matches_full_parse(self, tmp_path):
+        steps = ["load_context", "author_tests", "implement", "critique_code"]
+        for step in reversed(steps):
+            save_envelope(make_envelope(step, f"{step} summary"), tmp_path)
+        write_raw(tmp_path, make_envelope("zz_unknown"))
+
+        envelopes = load_previous_envelopes(tmp_path, "build")
+        reference = [
+            handoff_envelope_from_dict(json.loads(p.read_text()))
+            for p in (tmp_path / "handoff").glob("*.json")
+        ]
+        assert sorted(summaries(envelopes)) == sorted(summaries(reference))
+        assert envelopes[-1].step_id == "zz_unknown"  # unknown steps sort last
+
+    def test_missing_handoff_dir(self, tmp_path):
+        assert load_previous_envelopes(tmp_path / "nowhere", "build") == []
+
+    def test_scan_sees_new_artifacts(self, tmp_path):
+        run_dir = tmp_path / "run-1"
+        (run_dir / "plan").mkdir(parents=True)
+        (run_dir / "plan" / "adr.md").write_text("adr")
+        assert list(_scan_common_artifacts(run_dir / "build", run_dir)) == ["plan/adr.md"]
+
+        (run_dir / "plan" / "test_plan.md").write_text("plan")
+        assert sorted(_scan_common_artifacts(run_dir / "build", run_dir)) == [
+            "plan/adr.md",
+            "plan/test_plan.md",
+        ]
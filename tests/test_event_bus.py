@@ -0,0 +1,284 @@
+"""Tests for push-based change notification (swarm.runtime.event_bus).
+
+These tests verify that:
+1. Subscribers wake on publish (from any thread) and time out quietly
+2. One file watch is shared by all subscribers of a run directory
+3. inotify and polling watchers pick up out-of-process style writes,
+   including run-state journal appends
+4. EventWriter commits and run state writes publish to the bus
+5. RunTailer.watch_run and the SSE stream wake on changes, not on polling
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from swarm.runtime.event_bus import EventBus, get_event_bus
+
+
+async def wait_for_change(subscription, timeout: float = 2.0):
+    """Wait until the subscription reports a change (or fail after timeout)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changed = await subscription.wait(timeout=deadline - time.monotonic())
+        if changed:
+            return changed
+    pytest.fail("No change notification received")
+
+
+class TestEventBus:
+    """In-process publish/subscribe."""
+
+    def test_publish_wakes_subscriber(self, tmp_path):
+        bus = EventBus(watcher="off")
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.01, bus.publish, tmp_path / "events.jsonl")
+                return await sub.wait(timeout=2.0)
+
+        changed = asyncio.run(run())
+        assert [p.name for p in changed] == ["events.jsonl"]
+
+    def test_publish_from_other_thread(self, tmp_path):
+        bus = EventBus(watcher="off")
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                threading.Timer(0.01, bus.publish, [tmp_path / "run_state.json"]).start()
+                start = time.monotonic()
+                changed = await sub.wait(timeout=5.0)
+                return changed, time.monotonic() - start
+
+        changed, elapsed = asyncio.run(run())
+        assert {p.name for p in changed} == {"run_state.json"}
+        assert elapsed < 2.0
+
+    def test_changes_coalesce_and_timeout_is_empty(self, tmp_path):
+        bus = EventBus(watcher="off")
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                for _ in range(5):
+                    bus.publish(tmp_path / "events.jsonl")
+                first = await sub.wait(timeout=0.01)
+                second = await sub.wait(timeout=0.01)
+                return first, second
+
+        first, second = asyncio.run(run())
+        assert len(first) == 1
+        assert second == set()
+
+    def test_other_runs_and_wildcard(self, tmp_path):
+        bus = EventBus(watcher="off")
+        run_a, run_b = tmp_path / "a", tmp_path / "b"
+
+        async def run():
+            with bus.subscribe(run_a) as sub_a, bus.subscribe() as sub_all:
+                bus.publish(run_b / "events.jsonl")
+                return await sub_a.wait(timeout=0.01), await sub_all.wait(timeout=0.01)
+
+        changed_a, changed_all = asyncio.run(run())
+        assert changed_a == set()
+        assert [p.parent.name for p in changed_all] == ["b"]
+
+    def test_watch_is_shared_and_released(self, tmp_path):
+        bus = EventBus(watcher="poll", poll_interval=60)
+        try:
+            first = bus.subscribe(tmp_path)
+            second = bus.subscribe(tmp_path)
+            assert len(bus.watched_dirs()) == 1
+            first.close()
+            assert len(bus.watched_dirs()) == 1
+            second.close()
+            assert bus.watched_dirs() == set()
+        finally:
+            bus.close()
+
+
+class TestFileWatchers:
+    """Writers that bypass the bus (other processes) are still noticed."""
+
+    @pytest.mark.parametrize("watcher", ["inotify", "poll"])
+    def test_external_append_is_noticed(self, tmp_path, watcher):
+        bus = EventBus(watcher=watcher, poll_interval=0.02)
+        if bus.watcher_kind != watcher:
+            bus.close()
+            pytest.skip(f"{watcher} watcher not available")
+        events_file = tmp_path / "events.jsonl"
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                with events_file.open("a") as f:
+                    f.write('{"seq": 1}\n')
+                return await wait_for_change(sub)
+
+        try:
+            changed = asyncio.run(run())
+        finally:
+            bus.close()
+        assert "events.jsonl" in {p.name for p in changed}
+
+    @pytest.mark.parametrize("watcher", ["inotify", "poll"])
+    def test_external_journal_append_is_noticed(self, tmp_path, watcher):
+        from swarm.runtime.run_state_journal import JOURNAL_FILE
+
+        bus = EventBus(watcher=watcher, poll_interval=0.02)
+        if bus.watcher_kind != watcher:
+            bus.close()
+            pytest.skip(f"{watcher} watcher not available")
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                with (tmp_path / JOURNAL_FILE).open("a") as f:
+                    f.write('{"updates": {"status": "succeeded"}, "gen": 1}\n')
+                return await wait_for_change(sub)
+
+        try:
+            changed = asyncio.run(run())
+        finally:
+            bus.close()
+        assert JOURNAL_FILE in {p.name for p in changed}
+
+    def test_unwatched_files_are_ignored(self, tmp_path):
+        bus = EventBus(watcher="auto", poll_interval=0.02)
+
+        async def run():
+            with bus.subscribe(tmp_path) as sub:
+                (tmp_path / "notes.txt").write_text("x")
+                return await sub.wait(timeout=0.2)
+
+        try:
+            assert asyncio.run(run()) == set()
+        finally:
+            bus.close()
+
+
+class TestWriterIntegration:
+    """Storage writers and readers wired to the global bus."""
+
+    def _event(self, run_id: str, kind: str = "tool_end"):
+        from swarm.runtime.types import RunEvent
+
+        return RunEvent(
+            run_id=run_id,
+            ts=datetime.now(timezone.utc).replace(tzinfo=None),
+            kind=kind,
+            flow_key="build",
+            step_id="s1",
+            payload={},
+        )
+
+    def test_append_event_publishes(self, tmp_path):
+        from swarm.runtime import storage
+
+        run_id = "run-bus-append"
+        storage.create_run_dir(run_id, tmp_path)
+
+        async def run():
+            with get_event_bus().subscribe(tmp_path / run_id) as sub:
+                storage.append_event(run_id, self._event(run_id), runs_dir=tmp_path)
+                return await sub.wait(timeout=1.0)
+
+        assert "events.jsonl" in {p.name for p in asyncio.run(run())}
+
+    def test_watch_run_wakes_on_append(self, tmp_path):
+        from swarm.runtime import storage
+        from swarm.runtime.db import StatsDB
+        from swarm.runtime.run_tailer import RunTailer
+
+        run_id = "run-bus-tail"
+        storage.create_run_dir(run_id, tmp_path)
+        db = StatsDB(tmp_path / ".stats.duckdb")
+
+        async def run():
+            tailer = RunTailer(db, tmp_path)
+            loop = asyncio.get_running_loop()
+            loop.call_later(
+                0.05,
+                storage.append_event,
+                run_id,
+                self._event(run_id, "run_start"),
+                tmp_path,
+            )
+            start = time.monotonic()
+            # The safety-net interval is far longer than the test may take
+            async for count in tailer.watch_run(
+                run_id, poll_interval_ms=30_000, stop_on_complete=False
+            ):
+                return count, time.monotonic() - start
+
+        try:
+            count, elapsed = asyncio.run(asyncio.wait_for(run(), timeout=10))
+        finally:
+            db.close()
+        assert count == 1
+        assert elapsed < 5.0
+
+    def test_sse_stream_wakes_on_changes(self, tmp_path):
+        from swarm.api.routes.events import generate_run_events, write_event_sync
+
+        run_id = "run-bus-sse"
+        run_dir = tmp_path / run_id
+        run_dir.mkdir()
+        state_file = run_dir / "run_state.json"
+        state_file.write_text(json.dumps({"status": "running"}))
+
+        def finish():
+            write_event_sync(run_id, tmp_path, "step:started", {"step_id": "s1"})
+            state_file.write_text(json.dumps({"status": "succeeded"}))
+            get_event_bus().publish(state_file)
+
+        async def run():
+            received = []
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, finish)
+            start = time.monotonic()
+            async for chunk in generate_run_events(
+                run_id, tmp_path, poll_interval=30.0, heartbeat_interval=30.0
+            ):
+                received.extend(line for line in chunk.split("\n") if line.startswith("event:"))
+            return received, time.monotonic() - start
+
+        received, elapsed = asyncio.run(asyncio.wait_for(run(), timeout=10))
+        assert received == ["event: connected", "event: step:started", "event: run:completed"]
+        assert elapsed < 5.0
+
+    def test_sse_stream_wakes_on_journal_only_state_change(self, tmp_path):
+        from swarm.api.routes.events import generate_run_events
+        from swarm.runtime import storage
+        from swarm.runtime.run_state_journal import RunStateJournal
+        from swarm.runtime.types import RunState
+
+        if get_event_bus().watcher_kind == "off":
+            pytest.skip("No file watcher available")
+        run_id = "run-bus-journal"
+        storage.create_run_dir(run_id, tmp_path)
+        storage.write_run_state(
+            run_id, RunState(run_id=run_id, flow_key="build", status="running"), tmp_path
+        )
+
+        def finish():
+            # Another process: appends to the journal without publishing, and
+            # run_state.json itself is left untouched
+            RunStateJournal(tmp_path / run_id).append({"updates": {"status": "succeeded"}})
+
+        async def run():
+            received = []
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, finish)
+            async for chunk in generate_run_events(
+                run_id, tmp_path, poll_interval=30.0, heartbeat_interval=30.0
+            ):
+                received.extend(line for line in chunk.split("\n") if line.startswith("event:"))
+            return received
+
+        received = asyncio.run(asyncio.wait_for(run(), timeout=10))
+        assert received == ["event: connected", "event: run:completed"]
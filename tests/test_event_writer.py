@@ -0,0 +1,213 @@
+"""Tests for the buffered, group-committed events.jsonl writer.
+
+These tests verify that:
+1. The default config commits every event before write() returns
+2. Batched configs group-commit on count, size and age thresholds
+3. Durability levels fsync as configured
+4. Every commit writes whole lines (crash safety for RunTailer)
+5. append_event() keeps working across deleted run dirs and config changes
+
+Throughput is measured by swarm/tools/runtime_bench.py (event_append), not here.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.event_writer import Durability, EventWriter, EventWriterConfig
+from swarm.runtime.types import RunEvent
+
+
+def make_event(run_id: str, i: int) -> RunEvent:
+    return RunEvent(
+        run_id=run_id,
+        ts=datetime.now(timezone.utc),
+        kind="tool_end",
+        flow_key="build",
+        step_id="step-1",
+        payload={"tool": "Read", "i": i},
+    )
+
+
+@pytest.fixture
+def events_path(tmp_path: Path) -> Path:
+    return tmp_path / "run-1" / "events.jsonl"
+
+
+@pytest.fixture
+def writer_config():
+    """Restore storage's EventWriter config after a test changes it."""
+    yield storage.configure_event_writers
+    storage.configure_event_writers(None)
+
+
+class TestEventWriter:
+    """Group commit and durability behaviour of EventWriter."""
+
+    def test_default_commits_each_write(self, events_path):
+        writer = EventWriter(events_path)
+        try:
+            writer.write('{"a": 1}')
+            assert events_path.read_text() == '{"a": 1}\n'
+            writer.write('{"a": 2}')
+            assert events_path.read_text().splitlines() == ['{"a": 1}', '{"a": 2}']
+        finally:
+            writer.close()
+
+    def test_batches_until_count_threshold(self, events_path):
+        writer = EventWriter(events_path, EventWriterConfig(max_batch_events=3, max_delay_ms=60_000))
+        try:
+            writer.write("1")
+            writer.write("2")
+            assert not events_path.exists()
+            assert writer.pending_events == 2
+            writer.write("3")
+            assert events_path.read_text() == "1\n2\n3\n"
+            assert writer.pending_events == 0
+        finally:
+            writer.close()
+
+    def test_batches_until_size_threshold(self, events_path):
+        writer = EventWriter(
+            events_path,
+            EventWriterConfig(max_batch_events=1000, max_batch_bytes=10, max_delay_ms=60_000),
+        )
+        try:
+            writer.write("12345")
+            assert not events_path.exists()
+            writer.write("67890")
+            assert events_path.read_text() == "12345\n67890\n"
+        finally:
+            writer.close()
+
+    def test_flusher_enforces_max_delay(self, events_path):
+        writer = EventWriter(events_path, EventWriterConfig(max_batch_events=1000, max_delay_ms=20))
+        try:
+            writer.write("late")
+            deadline = time.monotonic() + 2.0
+            while not events_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.005)
+            assert events_path.read_text() == "late\n"
+        finally:
+            writer.close()
+
+    def test_close_and_flush_commit_pending(self, events_path):
+        writer = EventWriter(events_path, EventWriterConfig(max_batch_events=1000, max_delay_ms=60_000))
+        writer.write("a")
+        writer.flush()
+        assert events_path.read_text() == "a\n"
+        writer.write("b")
+        writer.close()
+        assert events_path.read_text() == "a\nb\n"
+
+        # References held across close() still commit, synchronously
+        writer.write("c")
+        assert events_path.read_text() == "a\nb\nc\n"
+
+    @pytest.mark.parametrize(
+        "durability,writes,expected_fsyncs",
+        [
+            (Durability.FLUSH, 5, 0),
+            (Durability.FSYNC_EACH, 5, 5),
+            (Durability.FSYNC_INTERVAL, 5, 1),
+        ],
+    )
+    def test_durability_levels(self, events_path, monkeypatch, durability, writes, expected_fsyncs):
+        fsyncs = []
+        monkeypatch.setattr("swarm.runtime.event_writer.os.fsync", fsyncs.append)
+        writer = EventWriter(
+            events_path, EventWriterConfig(durability=durability, fsync_interval_ms=60_000)
+        )
+        # FSYNC_INTERVAL: the first commit is due immediately only once the
+        # interval has elapsed since the writer was created
+        writer._last_fsync -= 61
+        for i in range(writes):
+            writer.write(str(i))
+        assert len(fsyncs) == expected_fsyncs
+        writer.close()
+
+    def test_commits_are_whole_lines(self, events_path):
+        """Readers (RunTailer) only ever see complete lines after a commit."""
+        writer = EventWriter(events_path, EventWriterConfig(max_batch_events=7, max_delay_ms=60_000))
+        try:
+            for i in range(50):
+                writer.write(json.dumps({"i": i, "pad": "x" * i}))
+                if events_path.exists():
+                    assert events_path.read_bytes().endswith(b"\n")
+            writer.flush()
+            lines = events_path.read_text().splitlines()
+            assert [json.loads(line)["i"] for line in lines] == list(range(50))
+        finally:
+            writer.close()
+
+    def test_reopens_deleted_file(self, events_path):
+        writer = EventWriter(events_path)
+        try:
+            writer.write("before")
+            events_path.unlink()
+            events_path.parent.rmdir()
+            writer.write("after")
+            assert events_path.read_text() == "after\n"
+        finally:
+            writer.close()
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("SWARM_EVENT_DURABILITY", "FSYNC_EACH")
+        monkeypatch.setenv("SWARM_EVENT_BATCH_EVENTS", "32")
+        monkeypatch.setenv("SWARM_EVENT_BATCH_DELAY_MS", "bogus")
+        config = EventWriterConfig.from_env()
+        assert config.durability == Durability.FSYNC_EACH
+        assert config.max_batch_events == 32
+        assert config.max_delay_ms == EventWriterConfig().max_delay_ms
+
+        monkeypatch.setenv("SWARM_EVENT_DURABILITY", "never")
+        assert EventWriterConfig.from_env().durability == Durability.FLUSH
+
+
+class TestAppendEventWriter:
+    """storage.append_event() through the per-run EventWriter."""
+
+    def test_seq_and_read_back_with_batching(self, tmp_path, writer_config):
+        writer_config(EventWriterConfig(max_batch_events=1000, max_delay_ms=60_000))
+        for i in range(10):
+            storage.append_event("run-batched", make_event("run-batched", i), runs_dir=tmp_path)
+
+        # read_events() commits this process's buffered events first
+        events = storage.read_events("run-batched", runs_dir=tmp_path)
+        assert [e.payload["i"] for e in events] == list(range(10))
+        assert [e.seq for e in events] == list(range(1, 11))
+
+    def test_seq_recovered_after_writer_closed(self, tmp_path):
+        run_id = "run-recover"
+        storage.append_event(run_id, make_event(run_id, 0), runs_dir=tmp_path)
+        storage.close_event_writers(run_id, runs_dir=tmp_path)
+        storage.append_event(run_id, make_event(run_id, 1), runs_dir=tmp_path)
+
+        seqs = [e.seq for e in storage.read_events(run_id, runs_dir=tmp_path)]
+        assert seqs == sorted(set(seqs))
+
+    def test_run_dir_deleted_between_events(self, tmp_path):
+        import shutil
+
+        run_id = "run-deleted"
+        storage.append_event(run_id, make_event(run_id, 0), runs_dir=tmp_path)
+        shutil.rmtree(tmp_path / run_id)
+        storage.append_event(run_id, make_event(run_id, 1), runs_dir=tmp_path)
+
+        events = storage.read_events(run_id, runs_dir=tmp_path)
+        assert [e.payload["i"] for e in events] == [1]
+
+    def test_open_writers_are_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(storage, "MAX_OPEN_EVENT_WRITERS", 3)
+        for i in range(6):
+            storage.append_event(f"run-{i}", make_event(f"run-{i}", 0), runs_dir=tmp_path)
+        assert len(storage._event_writers) <= 3
+        for i in range(6):
+            assert len(storage.read_events(f"run-{i}", runs_dir=tmp_path)) == 1
+        storage.close_event_writers()
@@ -0,0 +1,329 @@
+"""Tests for the content-hash fact extraction cache (fact_cache.py).
+
+These tests verify that:
+1. Unchanged files are served from the cache without being scanned (or,
+   once their mtime is old enough, even read)
+2. Changed files are rescanned, including same-size rewrites within one
+   mtime tick
+3. The index persists across instances and objects are shared across runs
+4. Corrupt cache files are treated as misses
+5. Cached run extraction matches uncached extraction
+6. prune_fact_cache() and runs_gc evict entries of removed runs
+
+Re-extraction time is measured by swarm/tools/runtime_bench.py (fact_cache), not here.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import fact_cache as fact_cache_module
+from swarm.runtime.fact_cache import (
+    FACT_CACHE_DIR,
+    FactCache,
+    fact_cache_root,
+    prune_fact_cache,
+)
+
+
+class Counter:
+    """compute() stand-in that records the files it was called for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path: Path):
+        self.calls.append(path.name)
+        return [["REQ", "REQ_001", path.read_text(), 1, ""]]
+
+
+@pytest.fixture
+def trust_stat(monkeypatch):
+    """Treat freshly written files as old enough for stat-only hits."""
+    monkeypatch.setattr(fact_cache_module, "RACY_WINDOW_NS", -10**12)
+
+
+def make_cache(tmp_path: Path, run_id: str = "run-1") -> FactCache:
+    return FactCache.for_run(tmp_path / "runs" / run_id)
+
+
+class TestFactCacheLoad:
+    """FactCache.load() hit/miss behaviour."""
+
+    def test_unchanged_file_is_not_rescanned(self, tmp_path, trust_stat, monkeypatch):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        cache = make_cache(tmp_path)
+        compute = Counter()
+
+        first = cache.load(path, compute)
+        hashed = []
+        original = fact_cache_module.file_sha256
+        monkeypatch.setattr(
+            fact_cache_module, "file_sha256", lambda p: hashed.append(p) or original(p)
+        )
+        assert cache.load(path, compute) == first
+        assert compute.calls == ["req.md"]
+        assert hashed == []  # Served from stat alone
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_racy_entry_is_rehashed_not_rescanned(self, tmp_path, monkeypatch):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        cache = make_cache(tmp_path)
+        compute = Counter()
+        cache.load(path, compute)
+
+        hashed = []
+        original = fact_cache_module.file_sha256
+        monkeypatch.setattr(
+            fact_cache_module, "file_sha256", lambda p: hashed.append(p) or original(p)
+        )
+        cache.load(path, compute)
+        assert compute.calls == ["req.md"]
+        assert hashed == [path]
+
+    def test_same_size_rewrite_in_same_tick_is_detected(self, tmp_path):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        cache = make_cache(tmp_path)
+        compute = Counter()
+        cache.load(path, compute)
+
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("two")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        assert cache.load(path, compute)[0][2] == "two"
+        assert compute.calls == ["req.md", "req.md"]
+
+    def test_changed_file_is_rescanned(self, tmp_path, trust_stat):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        cache = make_cache(tmp_path)
+        compute = Counter()
+        cache.load(path, compute)
+        path.write_text("longer")
+        assert cache.load(path, compute)[0][2] == "longer"
+        assert cache.misses == 2
+
+    def test_compute_errors_propagate(self, tmp_path):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        cache = make_cache(tmp_path)
+
+        def fail(_path):
+            raise OSError("boom")
+
+        with pytest.raises(OSError):
+            cache.load(path, fail)
+        assert not (cache.cache_root / "objects").exists()
+
+
+class TestFactCachePersistence:
+    """Index files, shared objects and corruption."""
+
+    def test_index_survives_new_instance(self, tmp_path, trust_stat):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        compute = Counter()
+        cache = make_cache(tmp_path)
+        cache.load(path, compute)
+        cache.save()
+
+        fresh = make_cache(tmp_path)
+        fresh.load(path, compute)
+        assert compute.calls == ["req.md"]
+        assert fresh.hits == 1
+
+    def test_objects_are_shared_across_runs(self, tmp_path):
+        a = tmp_path / "a.md"
+        b = tmp_path / "b.md"
+        a.write_text("same")
+        b.write_text("same")
+        compute = Counter()
+        make_cache(tmp_path, "run-1").load(a, compute)
+        make_cache(tmp_path, "run-2").load(b, compute)
+        assert compute.calls == ["a.md"]
+
+    def test_corrupt_files_are_misses(self, tmp_path, trust_stat):
+        path = tmp_path / "req.md"
+        path.write_text("one")
+        compute = Counter()
+        cache = make_cache(tmp_path)
+        cache.load(path, compute)
+        cache.save()
+
+        cache.index_path.write_text("{not json")
+        for object_file in (cache.cache_root / "objects").iterdir():
+            object_file.write_text(json.dumps({"version": 999, "records": []}))
+        make_cache(tmp_path).load(path, compute)
+        assert compute.calls == ["req.md", "req.md"]
+
+    def test_save_drops_deleted_files(self, tmp_path):
+        keep = tmp_path / "keep.md"
+        gone = tmp_path / "gone.md"
+        keep.write_text("k")
+        gone.write_text("g")
+        cache = make_cache(tmp_path)
+        cache.load(keep, Counter())
+        cache.load(gone, Counter())
+        gone.unlink()
+        cache.save()
+        files = json.loads(cache.index_path.read_text())["files"]
+        assert list(files) == [str(keep)]
+
+
+class TestCachedExtraction:
+    """extract_facts_from_run() with a FactCache."""
+
+    def _make_run(self, run_base: Path) -> None:
+        signal = run_base / "signal"
+        (signal / "handoff").mkdir(parents=True)
+        (signal / "requirements.md").write_text("REQ_001: Login\nREQ_002: Logout\n")
+        (signal / "problem.md").write_text("ASM_001: Users exist\nREQ_001: Login again\n")
+        (signal / "handoff" / "1.json").write_text(
+            json.dumps({"step_id": "1", "summary": "DEC_001: From envelope"})
+        )
+        (run_base / "plan").mkdir()
+        (run_base / "plan" / "adr.md").write_text("DEC_002: Use DuckDB\n")
+
+    def _comparable(self, result):
+        return [
+            {k: v for k, v in f.to_dict().items() if k != "extracted_at"} for f in result.facts
+        ]
+
+    def test_matches_uncached_and_rescans_only_changes(self, tmp_path, trust_stat):
+        from swarm.runtime.fact_extraction import extract_facts_from_run
+
+        run_base = tmp_path / "runs" / "run-1"
+        self._make_run(run_base)
+        expected = self._comparable(extract_facts_from_run(run_base, "run-1"))
+
+        cache = FactCache.for_run(run_base)
+        assert self._comparable(extract_facts_from_run(run_base, "run-1", cache=cache)) == expected
+        assert cache.misses == 3
+
+        (run_base / "plan" / "adr.md").write_text("DEC_002: Use DuckDB\nSOL_001: Projection\n")
+        cache = FactCache.for_run(run_base)
+        result = extract_facts_from_run(run_base, "run-1", cache=cache)
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert self._comparable(result) == self._comparable(
+            extract_facts_from_run(run_base, "run-1")
+        )
+        assert (tmp_path / "runs" / FACT_CACHE_DIR / "runs" / "run-1.json").exists()
+
+    def test_step_hook_uses_cache(self, tmp_path):
+        from swarm.runtime.fact_extraction import extract_and_ingest_step_facts
+
+        run_base = tmp_path / "runs" / "run-hook"
+        self._make_run(run_base)
+        result = extract_and_ingest_step_facts(run_base, "signal", "1", "run-hook")
+        assert {f.marker_id for f in result.facts} == {"REQ_001", "REQ_002", "ASM_001", "DEC_001"}
+        assert FactCache.for_run(run_base).index_path.exists()
+
+
+class TestCacheRoot:
+    def test_runs_use_their_runs_dir(self, tmp_path):
+        assert fact_cache_root(tmp_path / "runs" / "run-1") == tmp_path / "runs" / FACT_CACHE_DIR
+        assert FactCache.for_run(tmp_path / "runs" / "run-1").cache_root == (
+            tmp_path / "runs" / FACT_CACHE_DIR
+        )
+
+    def test_example_runs_use_default_runs_dir(self, tmp_path, monkeypatch):
+        from swarm.runtime import storage
+
+        monkeypatch.setattr(storage, "RUNS_DIR", tmp_path / "runs")
+        monkeypatch.setattr(storage, "EXAMPLES_DIR", tmp_path / "examples")
+        cache = FactCache.for_run(tmp_path / "examples" / "demo")
+        assert cache.cache_root == tmp_path / "runs" / FACT_CACHE_DIR
+        assert cache.run_key == "demo"
+
+    def test_facts_api_uses_run_cache_root(self, tmp_path, monkeypatch):
+        pytest.importorskip("fastapi")
+        import asyncio
+
+        from swarm.api.routes import facts
+
+        run_base = tmp_path / "runs" / "run-api"
+        artifact = run_base / "signal" / "req.md"
+        artifact.parent.mkdir(parents=True)
+        artifact.write_text("REQ_001: api")
+        monkeypatch.setattr(facts, "find_run_path", lambda run_id: run_base)
+
+        response = asyncio.run(facts.list_facts("run-api"))
+        assert [f.marker_id for f in response.facts] == ["REQ_001"]
+        assert FactCache.for_run(run_base).index_path.exists()
+
+
+class TestEviction:
+    """prune_fact_cache() and the runs_gc hook."""
+
+    def test_prune_removes_dead_runs_and_orphans(self, tmp_path):
+        shared = tmp_path / "shared.md"
+        only_dead = tmp_path / "dead.md"
+        shared.write_text("shared")
+        only_dead.write_text("dead")
+
+        live = make_cache(tmp_path, "live")
+        live.load(shared, Counter())
+        live.save()
+        dead = make_cache(tmp_path, "dead")
+        dead.load(shared, Counter())
+        dead.load(only_dead, Counter())
+        dead.save()
+
+        cache_root = live.cache_root
+        assert prune_fact_cache(cache_root, ["live"]) == {"runs": 1, "objects": 1}
+        assert not dead.index_path.exists()
+        assert len(list((cache_root / "objects").iterdir())) == 1
+        assert make_cache(tmp_path, "live").load(shared, Counter()) is not None
+        assert prune_fact_cache(tmp_path / "missing", []) == {"runs": 0, "objects": 0}
+
+    def test_runs_gc_evicts_pruned_runs(self, tmp_path, monkeypatch):
+        from swarm.tools import runs_gc
+
+        runs_dir = tmp_path / "runs"
+        monkeypatch.setattr(runs_gc, "RUNS_DIR", runs_dir)
+        monkeypatch.setattr(runs_gc, "EXAMPLES_DIR", tmp_path / "examples")
+        for run_id in ("kept", "deleted"):
+            artifact = runs_dir / run_id / "signal" / "req.md"
+            artifact.parent.mkdir(parents=True)
+            artifact.write_text(f"REQ_001: {run_id}")
+            cache = FactCache.for_run(runs_dir / run_id)
+            cache.load(artifact, Counter())
+            cache.save()
+
+        import shutil
+
+        shutil.rmtree(runs_dir / "deleted")
+        runs_gc.evict_fact_cache()
+        remaining = sorted(p.stem for p in (runs_dir / FACT_CACHE_DIR / "runs").iterdir())
+        assert remaining == ["kept"]
+        assert len(list((runs_dir / FACT_CACHE_DIR / "objects").iterdir())) == 1
+
+    def test_runs_gc_prunes_every_cache_root(self, tmp_path, monkeypatch):
+        from swarm.runtime import storage
+        from swarm.tools import runs_gc
+
+        runs_dir, examples_dir = tmp_path / "runs", tmp_path / "examples"
+        for module in (runs_gc, storage):
+            monkeypatch.setattr(module, "RUNS_DIR", runs_dir)
+            monkeypatch.setattr(module, "EXAMPLES_DIR", examples_dir)
+        artifact = examples_dir / "demo" / "signal" / "req.md"
+        artifact.parent.mkdir(parents=True)
+        artifact.write_text("REQ_001: demo")
+        cache = FactCache.for_run(examples_dir / "demo")
+        cache.load(artifact, Counter())
+        cache.save()
+        # Left behind under examples/ by an older layout
+        stale = FactCache(examples_dir / FACT_CACHE_DIR, "gone")
+        stale.load(artifact, Counter())
+        stale.save()
+
+        runs_gc.evict_fact_cache()
+        assert cache.index_path.exists()
+        assert not stale.index_path.exists()
@@ -7,6 +7,9 @@ These tests verify:
 4. extract_facts_from_step aggregates across artifacts
 5. DuckDB integration works for ingestion and querying
 6. CLI entry point produces expected output
+
+Extraction throughput is measured by swarm/tools/runtime_bench.py
+(fact_extraction), not here.
 """
 
 from __future__ import annotations
@@ -535,3 +538,272 @@ class TestCLIIntegration:
         )
         assert result.returncode == 0
         assert "extract" in result.stdout.lower() or "marker" in result.stdout.lower()
+
+
+# =============================================================================
+# Single-pass scanner, streaming, parallel run scan and bulk ingest
+# =============================================================================
+
+
+def _legacy_extract_facts_from_text(text: str) -> List[tuple]:
+    """The original extractor: one regex pass per marker type, line by count()."""
+    from swarm.runtime.fact_extraction import _get_context
+
+    facts = []
+    seen = set()
+    for marker_type, pattern in MARKER_PATTERNS.items():
+        for match in pattern.finditer(text):
+            marker_id = f"{marker_type}_{match.group(1)}"
+            if marker_id in seen:
+                continue
+            seen.add(marker_id)
+            facts.append(
+                (
+                    marker_id,
+                    match.group(2).strip(),
+                    text[: match.start()].count("\n") + 1,
+                    _get_context(text, match.start(), match.end()),
+                )
+            )
+    return sorted(facts)
+
+
+def _comparable(facts: List[ExtractedFact]) -> List[dict]:
+    return [{k: v for k, v in f.to_dict().items() if k != "extracted_at"} for f in facts]
+
+
+def _sample_text(lines: int = 400, seed: int = 7) -> str:
+    """Markers of every type and case, repeats, long lines and marker-free filler."""
+    import random
+
+    rng = random.Random(seed)
+    types = ["REQ", "req", "SOL", "Trc", "ASM", "dec"]
+    out = []
+    for i in range(lines):
+        roll = rng.random()
+        if roll < 0.4:
+            marker = f"{rng.choice(types)}_{rng.randint(1, 60):03d}"
+            out.append(f"- {marker}: item {i} " + "w" * rng.randint(0, 300))
+        elif roll < 0.5:
+            out.append("x" * rng.randint(200, 900))
+        else:
+            out.append(f"plain line {i} mentioning REQ-{i} and SOL_12345")
+    return "\n".join(out)
+
+
+def _nested_sample_text(count: int = 300, seed: int = 3) -> str:
+    """Markers nested in, adjacent to and split across lines from each other."""
+    import random
+
+    rng = random.Random(seed)
+    tokens = [
+        "REQ_001", "SOL_002", "trc_003", "ASM_004", "DEC_005", "REQ_006", "SOL_001",
+        "REQ_0012", "xREQ_007", ":", " - ", "-", ".", "\n", "\n\n", " ", "\t",
+        "foo", "bar baz", "->", "(login flow)",
+    ]
+    return "".join(rng.choice(tokens) for _ in range(count))
+
+
+class TestSinglePassScanner:
+    """The combined pattern and LineIndex reproduce the per-type scan."""
+
+    def test_matches_legacy_extractor(self):
+        text = _sample_text()
+        new = [
+            (f.marker_id, f.content, f.source_line, f.context)
+            for f in extract_facts_from_text(text)
+        ]
+        assert new == _legacy_extract_facts_from_text(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "TRC_001: REQ_001 -> SOL_001 (login flow)",
+            "REQ_001 SOL_001 TRC_001",
+            "REQ_001:REQ_002 foo",
+            "DEC_001 -\n\nASM_002: bar",
+            "SOL_003: uses REQ_004\nREQ_004: login",
+        ],
+    )
+    def test_nested_and_adjacent_markers(self, text):
+        new = [
+            (f.marker_id, f.content, f.source_line, f.context)
+            for f in extract_facts_from_text(text)
+        ]
+        assert new == _legacy_extract_facts_from_text(text)
+
+    def test_nested_trace_keeps_all_markers(self):
+        facts = extract_facts_from_text("TRC_001: REQ_001 -> SOL_001 (login flow)")
+        assert [f.marker_id for f in facts] == ["REQ_001", "SOL_001", "TRC_001"]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_legacy_extractor_on_marker_soup(self, seed):
+        for case in range(25):
+            text = _nested_sample_text(count=30, seed=seed * 100 + case)
+            new = [
+                (f.marker_id, f.content, f.source_line, f.context)
+                for f in extract_facts_from_text(text)
+            ]
+            assert new == _legacy_extract_facts_from_text(text), repr(text)
+
+    def test_line_index(self):
+        from swarm.runtime.fact_extraction import LineIndex
+
+        text = "ab\ncd\n\nef"
+        index = LineIndex(text)
+        for pos in range(len(text)):
+            assert index.line_number(pos) == text[:pos].count("\n") + 1
+
+
+class TestStreamingExtraction:
+    """extract_facts_from_stream() matches the in-memory path."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000, 1 << 20])
+    def test_stream_matches_text(self, chunk_size):
+        import io
+
+        from swarm.runtime.fact_extraction import extract_facts_from_stream
+
+        text = _sample_text(seed=chunk_size)
+        expected = _comparable(extract_facts_from_text(text, source_file="a.md"))
+        streamed = extract_facts_from_stream(
+            io.StringIO(text), source_file="a.md", chunk_size=chunk_size
+        )
+        assert _comparable(streamed) == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 8, 13, 64])
+    def test_stream_matches_text_across_chunk_boundaries(self, chunk_size):
+        """Separators spanning newlines and nested markers split at any point."""
+        import io
+
+        from swarm.runtime.fact_extraction import extract_facts_from_stream
+
+        for seed in range(40):
+            text = _nested_sample_text(count=40, seed=seed)
+            expected = _comparable(extract_facts_from_text(text, source_file="a.md"))
+            streamed = extract_facts_from_stream(
+                io.StringIO(text), source_file="a.md", chunk_size=chunk_size
+            )
+            assert _comparable(streamed) == expected, repr(text)
+
+    def test_file_above_threshold_is_streamed(self, tmp_path, monkeypatch):
+        import swarm.runtime.fact_extraction as fe
+
+        path = tmp_path / "big.md"
+        path.write_text(_sample_text())
+        in_memory = _comparable(extract_facts_from_file(path))
+
+        calls = []
+        original = fe._scan_stream
+        monkeypatch.setattr(fe, "STREAM_THRESHOLD_BYTES", 1)
+        monkeypatch.setattr(
+            fe, "_scan_stream", lambda *a, **kw: calls.append(1) or original(*a, **kw)
+        )
+        assert _comparable(extract_facts_from_file(path)) == in_memory
+        assert calls
+
+
+def _make_run(run_base: Path) -> None:
+    """A run with stepped and step-less flows, shared markers and envelopes."""
+    signal = run_base / "signal"
+    (signal / "handoff").mkdir(parents=True)
+    (signal / "requirements.md").write_text("REQ_001: Login\nREQ_002: Logout\n")
+    (signal / "problem.md").write_text("ASM_001: Users exist\nREQ_001: Login again\n")
+    (signal / "handoff" / "1.json").write_text(
+        json.dumps({"step_id": "1", "summary": "REQ_002: dup\nDEC_001: From envelope"})
+    )
+    (signal / "handoff" / "2.json").write_text(
+        json.dumps({"step_id": "2", "summary": "DEC_001: Again\nTRC_004: Trace"})
+    )
+
+    plan = run_base / "plan"
+    plan.mkdir()
+    (plan / "adr.md").write_text("DEC_002: Use DuckDB\nSOL_001: Projection\n")
+    (plan / "notes.md").write_text("DEC_002: Use DuckDB (notes)\n")
+
+    (run_base / "build").mkdir()
+    (run_base / "build" / "code.md").write_text(_sample_text(lines=50))
+
+
+def _legacy_extract_facts_from_run(run_base: Path, run_id: str) -> List[ExtractedFact]:
+    """The original run scan: extract_facts_from_step() for every step, then merge."""
+    from swarm.runtime.fact_extraction import FLOW_KEYS, _flow_step_ids
+
+    facts = []
+    for flow_key in FLOW_KEYS:
+        flow_path = run_base / flow_key
+        if not flow_path.exists():
+            continue
+        step_ids = _flow_step_ids(flow_path)
+        if step_ids:
+            for step_id in step_ids:
+                facts.extend(extract_facts_from_step(run_base, flow_key, step_id, run_id).facts)
+        else:
+            for md_file in flow_path.glob("*.md"):
+                facts.extend(extract_facts_from_file(md_file, None, flow_key, run_id))
+
+    unique = {}
+    for fact in facts:
+        unique.setdefault(f"{fact.marker_id}:{fact.source_file}", fact)
+    return sorted(unique.values(), key=lambda f: (f.flow_key or "", f.marker_type, f.marker_id))
+
+
+class TestParallelRunExtraction:
+    """extract_facts_from_run() scans each artifact once, on a thread pool."""
+
+    def test_matches_per_step_extraction(self, tmp_path):
+        _make_run(tmp_path)
+        expected = _comparable(_legacy_extract_facts_from_run(tmp_path, "run-1"))
+        assert expected
+        for workers in (1, 4):
+            result = extract_facts_from_run(tmp_path, "run-1", workers=workers)
+            assert not result.errors
+            assert _comparable(result.facts) == expected
+
+
+class TestBulkFactIngestion:
+    """StatsDB.ingest_facts_bulk() behaves like repeated ingest_fact()."""
+
+    def _row(self, marker_id: str, content: str, step_id: str = "1") -> dict:
+        return {
+            "run_id": "run-bulk",
+            "step_id": step_id,
+            "flow_key": "signal",
+            "marker_type": marker_id[:3],
+            "marker_id": marker_id,
+            "fact_type": "requirement",
+            "content": content,
+            "metadata": {"source_file": "req.md"},
+        }
+
+    def test_upsert_last_wins(self, tmp_path):
+        from swarm.runtime.db import StatsDB
+
+        db = StatsDB(tmp_path / "bulk.duckdb", projection_only=False)
+        try:
+            assert db.ingest_facts_bulk(
+                [self._row("REQ_001", "first"), self._row("REQ_002", "b"), self._row("REQ_001", "second")]
+            ) == 3
+            assert db.ingest_facts_bulk([self._row("REQ_002", "updated"), self._row("REQ_002", "s2", "2")]) == 2
+
+            rows = db.connection.execute(
+                "SELECT step_id, marker_id, content, json_extract_string(metadata, '$.source_file') "
+                "FROM facts ORDER BY step_id, marker_id"
+            ).fetchall()
+            assert rows == [
+                ("1", "REQ_001", "second", "req.md"),
+                ("1", "REQ_002", "updated", "req.md"),
+                ("2", "REQ_002", "s2", "req.md"),
+            ]
+        finally:
+            db.close()
+
+    def test_projection_only_is_noop(self, tmp_path):
+        from swarm.runtime.db import StatsDB
+
+        db = StatsDB(tmp_path / "bulk.duckdb", projection_only=True)
+        try:
+            assert db.ingest_facts_bulk([self._row("REQ_001", "x")]) == 0
+            assert db.connection.execute("SELECT COUNT(*) FROM facts").fetchone()[0] == 0
+        finally:
+            db.close()
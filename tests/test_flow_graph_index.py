@@ -0,0 +1,103 @@
+"""Tests for the FlowGraph adjacency index (router.py).
+
+These tests verify that:
+1. Outgoing lookups match a scan of the edge list, in edge order
+2. Appended (injected) edges are picked up; reindex() covers other changes
+3. StepRouter and SmartRouter route the shipped flow graphs as before
+
+Lookup time is measured by swarm/tools/runtime_bench.py (flow_graph_index), not here.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from swarm.runtime.router import Edge, FlowGraph, NodeConfig
+
+FLOWS_DIR = Path(__file__).resolve().parent.parent / "swarm" / "packs" / "flows"
+
+
+def make_graph(edges) -> FlowGraph:
+    """Graph from (edge_id, from, to[, type[, priority]]) tuples."""
+    edge_objs = []
+    nodes = {}
+    for spec in edges:
+        edge_id, src, dst = spec[:3]
+        edge_type = spec[3] if len(spec) > 3 else "sequence"
+        priority = spec[4] if len(spec) > 4 else 50
+        edge_objs.append(Edge(edge_id, src, dst, edge_type=edge_type, priority=priority))
+        for node_id in (src, dst):
+            nodes[node_id] = NodeConfig(node_id=node_id, template_id=node_id)
+    return FlowGraph(graph_id="g", nodes=nodes, edges=edge_objs)
+
+
+class TestAdjacency:
+    """Lookups through the index."""
+
+    def test_matches_scan_on_shipped_graphs(self):
+        for path in sorted(FLOWS_DIR.glob("*.json")):
+            graph = FlowGraph.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            for node_id in graph.nodes:
+                assert graph.get_outgoing_edges(node_id) == [
+                    e for e in graph.edges if e.from_node == node_id
+                ]
+
+    def test_priority_order_and_returned_lists_are_copies(self):
+        graph = make_graph(
+            [("b", "x", "y", "sequence", 10), ("a", "x", "z", "loop", 10), ("c", "x", "w", "branch", 90)]
+        )
+        assert [e.edge_id for e in graph.get_outgoing_edges_by_priority("x")] == ["c", "a", "b"]
+        graph.get_outgoing_edges("x").clear()
+        graph.get_outgoing_edges_by_priority("x").clear()
+        assert len(graph.get_outgoing_edges("x")) == 3
+        assert graph.has_loop_edges("x") and not graph.has_loop_edges("y")
+        assert graph.get_outgoing_edges("missing") == []
+
+    def test_mutations_update_index(self):
+        graph = make_graph([("e1", "a", "b")])
+        assert graph.get_outgoing_edges("b") == []
+
+        graph.edges.append(Edge("inj-in", "b", "inj", edge_type="injection"))  # Detected by length
+        assert [e.edge_id for e in graph.get_outgoing_edges("b")] == ["inj-in"]
+
+        graph.edges[0] = Edge("swapped", "a", "c")
+        graph.reindex()
+        assert [e.edge_id for e in graph.get_outgoing_edges("a")] == ["swapped"]
+
+        graph.edges = [Edge("replaced", "c", "a")]  # New list: detected by identity
+        assert graph.get_outgoing_edges("a") == []
+        assert [e.edge_id for e in graph.get_outgoing_edges("c")] == ["replaced"]
+
+
+class TestRoutingUnchanged:
+    """Routers use the index without changing decisions."""
+
+    def test_step_router_on_shipped_loops(self):
+        from swarm.runtime.router import RunContext, StepRouter
+
+        graph = FlowGraph.from_dict(json.loads((FLOWS_DIR / "build.json").read_text()))
+        router = StepRouter()
+        critic = next(e.from_node for e in graph.edges if e.edge_type == "loop")
+
+        for status, can_help, expected_type in [
+            ("UNVERIFIED", True, "loop"),
+            ("VERIFIED", True, "sequence"),
+            ("UNVERIFIED", False, "sequence"),
+        ]:
+            context = RunContext(
+                run_id="r",
+                flow_key="build",
+                step_output={"status": status, "can_further_iteration_help": can_help},
+            )
+            result = router.route(critic, graph, context)
+            assert result.edge.edge_type == expected_type, status
+
+    def test_smart_router_counts_loop_iterations(self):
+        from swarm.runtime.router import RouteContext, SmartRouter, StepOutput
+
+        graph = make_graph([("loop", "critic", "author", "loop", 40), ("exit", "critic", "next")])
+        context = RouteContext(run_id="r", flow_key="build")
+        output = StepOutput(status="UNVERIFIED", can_further_iteration_help=True)
+        SmartRouter().route("critic", graph, output, context)
+        assert context.get_iteration_count("critic") == 1
@@ -508,3 +508,64 @@ class TestFileChangesExtraction:
         read_result = read_handoff_envelope(run_base, "test_step")
         assert read_result is not None
         assert "file_changes" not in read_result
+
+
+class TestUnroutedEnvelope:
+    """Envelopes written before the route phase carry no routing signal."""
+
+    def test_null_routing_signal_round_trips(self):
+        """Verify a None signal serializes as null, validates and parses back to None."""
+        from datetime import datetime, timezone
+
+        from swarm.runtime.types import (
+            HandoffEnvelope,
+            handoff_envelope_from_dict,
+            handoff_envelope_to_dict,
+        )
+
+        envelope = HandoffEnvelope(
+            step_id="test_step",
+            flow_key="build",
+            run_id="test_run_001",
+            routing_signal=None,
+            summary="Work done, not routed yet",
+            timestamp=datetime.now(timezone.utc),
+        )
+        data = handoff_envelope_to_dict(envelope)
+
+        assert data["routing_signal"] is None
+        assert "routing_audit" not in data
+        assert validate_envelope(data) == []
+        assert handoff_envelope_from_dict(data).routing_signal is None
+
+    def test_inline_finalization_leaves_routing_to_route_phase(self, tmp_path: Path):
+        """Verify inline finalization writes no routing decision of its own."""
+        from swarm.runtime.engines.claude.stubs import finalize_from_existing_handoff
+        from swarm.runtime.engines.models import StepContext, StepResult
+        from swarm.runtime.handoff_io import read_routing_from_envelope
+        from swarm.runtime.types import RunSpec
+
+        ctx = StepContext(
+            repo_root=tmp_path,
+            run_id="test_run_001",
+            flow_key="build",
+            step_id="test_step",
+            step_index=1,
+            total_steps=1,
+            spec=RunSpec(flow_keys=["build"]),
+            flow_title="Build",
+            step_role="Implement",
+        )
+        handoff_path = tmp_path / "handoff.json"
+        handoff_path.write_text(json.dumps({"status": "VERIFIED", "summary": "done"}))
+        step_result = StepResult(step_id="test_step", status="succeeded", output="done")
+
+        result = finalize_from_existing_handoff(ctx, step_result, "done", handoff_path)
+
+        assert result.envelope.routing_signal is None
+        assert read_handoff_envelope(ctx.run_base, "test_step")["routing_signal"] is None
+        assert read_routing_from_envelope(ctx.run_base, "test_step") is None
+
+        routing = {"decision": "loop", "reason": "needs_rework", "confidence": 0.8}
+        update_envelope_routing(ctx.run_base, "test_step", routing)
+        assert read_routing_from_envelope(ctx.run_base, "test_step") == routing
@@ -0,0 +1,139 @@
+"""
+Tests for opt-in per-phase timing and the orchestrator benchmark.
+
+Covers:
+- Nothing is recorded without an installed recorder
+- Nested phases are exclusive; totals never exceed wall time
+- Per-thread phase stacks
+- Runtime call sites attribute a stub-engine flow to its phases
+- Baseline comparison in swarm/tools/orchestrator_bench.py
+
+Stub-engine flow throughput is measured by swarm/tools/orchestrator_bench.py
+itself (e.g. --mode flows --repo-files 2000 --events-per-step 100), not here.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from swarm.runtime import phase_timing
+from swarm.runtime.phase_timing import PhaseRecorder, phase, recording, timed_phase
+from swarm.tools import orchestrator_bench
+from swarm.tools.orchestrator_bench import Scenario, compare, make_synthetic_repo, run_scenario
+
+
+@timed_phase("event_append")
+def append(delay: float = 0.0) -> str:
+    time.sleep(delay)
+    return "appended"
+
+
+class TestPhaseRecorder:
+    def test_disabled_by_default(self):
+        assert phase_timing._recorder is None
+        with phase("engine"):
+            assert append() == "appended"
+
+    def test_nested_phases_are_exclusive(self):
+        with recording() as recorder:
+            start = time.perf_counter()
+            with phase("engine"):
+                time.sleep(0.02)
+                append(0.03)
+            wall = time.perf_counter() - start
+        snapshot = recorder.snapshot()
+
+        assert snapshot["event_append"]["calls"] == 1
+        assert snapshot["event_append"]["seconds"] >= 0.03
+        assert 0.02 <= snapshot["engine"]["seconds"] < 0.03
+        assert sum(entry["seconds"] for entry in snapshot.values()) <= wall
+        assert phase_timing._recorder is None
+
+    def test_threads_keep_separate_stacks(self):
+        recorder = PhaseRecorder()
+
+        def work():
+            with phase("routing"):
+                time.sleep(0.01)
+
+        with recording(recorder):
+            with phase("engine"):
+                threads = [threading.Thread(target=work) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        snapshot = recorder.snapshot()
+        assert snapshot["routing"]["calls"] == 4
+        # Worker time is not subtracted from the main thread's engine phase
+        assert snapshot["engine"]["seconds"] >= 0.01
+
+    def test_exception_still_recorded(self):
+        @timed_phase("diff_scan")
+        def boom():
+            raise RuntimeError("scan failed")
+
+        with recording() as recorder:
+            with pytest.raises(RuntimeError):
+                boom()
+        assert recorder.snapshot()["diff_scan"]["calls"] == 1
+
+
+@pytest.fixture(scope="module")
+def synthetic_repo(tmp_path_factory):
+    return make_synthetic_repo(tmp_path_factory.mktemp("bench"), files=50, dirty=5)
+
+
+class TestOrchestratorBench:
+    def test_stub_flow_attributes_phases(self, synthetic_repo):
+        logging.disable(logging.WARNING)
+        try:
+            result = run_scenario(
+                Scenario("flows", 50, 5, events_per_step=3),
+                synthetic_repo,
+                flows=["signal"],
+                iterations=1,
+                db_path=None,
+            )
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert result["failures"] == []
+        assert result["runs"] == 1 and result["steps"] > 0
+        phases = result["phases"]
+        for name in ("hydrate", "prompt_build", "engine", "diff_scan", "envelope_write", "routing"):
+            assert phases[name]["calls"] >= result["steps"], name
+        assert phases["event_append"]["calls"] >= result["steps"] * 3
+        assert sum(p["total_ms"] for p in phases.values()) == pytest.approx(
+            result["wall_s"] * 1000, rel=0.01
+        )
+
+    def test_synthetic_repo_layout(self, synthetic_repo):
+        assert (synthetic_repo / "swarm").resolve() == orchestrator_bench._SWARM_ROOT / "swarm"
+        assert len(list((synthetic_repo / "src").rglob("*.py"))) == 50
+
+    def test_compare_reports_regressions(self):
+        def results(total, engine, diff_scan):
+            return {
+                "scenarios": {
+                    "flows-x": {
+                        "ms_per_step": total,
+                        "phases": {
+                            "engine": {"ms_per_step": engine},
+                            "diff_scan": {"ms_per_step": diff_scan},
+                        },
+                    }
+                }
+            }
+
+        baseline = results(40.0, 2.0, 30.0)
+        assert compare(results(42.0, 2.2, 30.0), baseline, tolerance=0.25) == []
+        regressions = compare(results(60.0, 2.3, 50.0), baseline, tolerance=0.25)
+        assert [line.split(":")[0] for line in regressions] == [
+            "flows-x total",
+            "flows-x diff_scan",
+        ]
+        # Scenarios missing from the baseline are skipped
+        assert compare(results(60.0, 2.0, 50.0), {"scenarios": {}}, tolerance=0.25) == []
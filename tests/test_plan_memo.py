@@ -0,0 +1,184 @@
+"""
+Tests for memoized PromptPlan compilation.
+
+Covers:
+- SpecCompiler.compile: full-plan hits, static-section reuse when only run
+  inputs change, rebuilds when a station or fragment file is edited
+- Memoized plans are identical to plans compiled with caching disabled
+- SpecCompiler.compile_step: station sections reused across run contexts
+- emit_step_execution_events: compile_ms / compile_cache in step_timing
+
+Plan compilation time is measured by swarm/tools/runtime_bench.py
+(plan_memo), not here.
+"""
+
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime.context_pack import ContextPack
+from swarm.runtime.engines.models import StepResult
+from swarm.runtime.stepwise.engine_runner import StepRunResult, emit_step_execution_events
+from swarm.runtime.types import HandoffEnvelope
+from swarm.spec.cache import reset_spec_cache
+from swarm.spec.compiler import CompileContext, FlowNode, SpecCompiler
+from swarm.spec.loader import load_flow
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_spec_cache()
+    yield
+    reset_spec_cache()
+
+
+@pytest.fixture
+def spec_repo(tmp_path):
+    """A repo with the signal flow, its normalizer station and common fragments."""
+    src = REPO_ROOT / "swarm" / "spec"
+    dst = tmp_path / "swarm" / "spec"
+    (dst / "flows").mkdir(parents=True)
+    (dst / "stations").mkdir()
+    shutil.copy(src / "flows" / "1-signal.yaml", dst / "flows")
+    shutil.copy(src / "stations" / "signal-normalizer.yaml", dst / "stations")
+    shutil.copytree(src / "fragments", dst / "fragments")
+    return tmp_path
+
+
+def touch_later(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def make_pack(*summaries: str) -> ContextPack:
+    envelopes = [
+        HandoffEnvelope(
+            step_id=f"step-{i}",
+            flow_key="signal",
+            run_id="run-1",
+            routing_signal=None,
+            summary=summary,
+            status="verified",
+            timestamp=datetime.now(timezone.utc),
+        )
+        for i, summary in enumerate(summaries)
+    ]
+    return ContextPack(
+        run_id="run-1",
+        flow_key="signal",
+        step_id="normalize",
+        previous_envelopes=envelopes,
+        upstream_artifacts={"issue": Path("signal/issue.md")},
+    )
+
+
+class TestCompileMemo:
+    def test_hit_static_and_miss(self, spec_repo, tmp_path):
+        compiler = SpecCompiler(spec_repo)
+        run_base = tmp_path / "runs" / "run-1"
+
+        first = compiler.compile("1-signal", "normalize", make_pack("a"), run_base)
+        again = compiler.compile("1-signal", "normalize", make_pack("a"), run_base)
+        assert (first.compile_cache, again.compile_cache) == ("miss", "hit")
+        assert again.prompt_hash == first.prompt_hash
+        assert again.compile_ms >= 0
+
+        changed = compiler.compile("1-signal", "normalize", make_pack("a", "b"), run_base)
+        assert changed.compile_cache == "static"
+        assert changed.system_append == first.system_append
+        assert "step-1" in changed.user_prompt
+        assert changed.context_pack_size == 2
+
+    def test_fragment_edit_rebuilds_static_sections(self, spec_repo, tmp_path):
+        compiler = SpecCompiler(spec_repo)
+        run_base = tmp_path / "runs" / "run-1"
+        first = compiler.compile("1-signal", "normalize", None, run_base)
+
+        fragment = spec_repo / "swarm" / "spec" / "fragments" / "common" / "invariants.md"
+        fragment.write_text(fragment.read_text() + "\n- Always cite the memo test.\n")
+        touch_later(fragment)
+
+        rebuilt = compiler.compile("1-signal", "normalize", None, run_base)
+        assert rebuilt.compile_cache == "miss"
+        assert "Always cite the memo test." in rebuilt.system_append
+        assert rebuilt.prompt_hash != first.prompt_hash
+
+    def test_station_edit_rebuilds(self, spec_repo, tmp_path):
+        compiler = SpecCompiler(spec_repo)
+        run_base = tmp_path / "runs" / "run-1"
+        compiler.compile("1-signal", "normalize", None, run_base)
+
+        station = spec_repo / "swarm" / "spec" / "stations" / "signal-normalizer.yaml"
+        station.write_text(station.read_text().replace("max_turns:", "max_turns: 3\n  _old_max_turns:", 1))
+        touch_later(station)
+
+        rebuilt = compiler.compile("1-signal", "normalize", None, run_base)
+        assert rebuilt.compile_cache == "miss"
+        assert rebuilt.max_turns == 3
+
+    def test_memoized_matches_uncached(self, tmp_path, monkeypatch):
+        run_base = tmp_path / "runs" / "run-1"
+        steps = [step.id for step in load_flow("6-deploy", REPO_ROOT).steps]
+        compiler = SpecCompiler(REPO_ROOT)
+        for step_id in steps:
+            compiler.compile("6-deploy", step_id, make_pack("x"), run_base)
+        memoized = [compiler.compile("6-deploy", s, make_pack("x"), run_base) for s in steps]
+        assert {plan.compile_cache for plan in memoized} == {"hit"}
+
+        monkeypatch.setenv("SWARM_SPEC_CACHE_SIZE", "0")
+        reset_spec_cache()
+        uncached = SpecCompiler(REPO_ROOT)
+        for plan, step_id in zip(memoized, steps):
+            fresh = uncached.compile("6-deploy", step_id, make_pack("x"), run_base)
+            assert fresh.compile_cache == "miss"
+            assert (plan.prompt_hash, plan.user_prompt, plan.handoff) == (
+                fresh.prompt_hash,
+                fresh.user_prompt,
+                fresh.handoff,
+            )
+
+
+class TestCompileStepMemo:
+    def test_station_sections_reused(self, spec_repo, tmp_path):
+        compiler = SpecCompiler(spec_repo)
+        node = FlowNode(node_id="normalize", template_id="", overrides={"station_id": "signal-normalizer"})
+
+        def context(run_id):
+            return CompileContext(run_id=run_id, run_base=tmp_path / run_id, repo_root=spec_repo)
+
+        first = compiler.compile_step(node, None, context("signal-1"))
+        second = compiler.compile_step(node, None, context("signal-2"))
+        assert (first.compile_cache, second.compile_cache) == ("miss", "static")
+        assert second.system_prompt == first.system_prompt
+        assert second.handoff_path != first.handoff_path
+        assert "compile_ms" not in first.to_dict()["traceability"]
+
+
+class TestStepTimingEvent:
+    def test_compile_fields_in_step_timing(self):
+        step_result = StepResult(
+            step_id="normalize",
+            status="succeeded",
+            output="ok",
+            artifacts={"compile_ms": 1.25, "compile_cache": "hit"},
+        )
+        events = emit_step_execution_events(
+            "run-1", "signal", "normalize", 0, 1, StepRunResult(step_result=step_result, duration_ms=10)
+        )
+        timing = next(e for e in events if e.kind == "step_timing")
+        assert timing.payload["compile_ms"] == 1.25
+        assert timing.payload["compile_cache"] == "hit"
+
+    def test_no_compile_fields_without_plan(self):
+        step_result = StepResult(step_id="normalize", status="succeeded", output="ok", artifacts={})
+        events = emit_step_execution_events(
+            "run-1", "signal", "normalize", 0, 1, StepRunResult(step_result=step_result)
+        )
+        timing = next(e for e in events if e.kind == "step_timing")
+        assert "compile_ms" not in timing.payload
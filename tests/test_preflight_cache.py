@@ -0,0 +1,253 @@
+"""Tests for concurrent preflight checks and the preflight result cache (preflight.py).
+
+These tests verify that:
+1. run_all_checks() runs the independent checks concurrently and reports
+   them in declaration order
+2. Run-independent checks are cached per (repo_root, backend) and reused
+   until the TTL expires or .git/HEAD / .git/index change
+3. Credentials, paths and failed results are never served from the cache
+4. Concurrent callers against one repo pay for the cached checks once
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from swarm.runtime import preflight
+from swarm.runtime.preflight import (
+    CheckResult,
+    CheckStatus,
+    PreflightOrchestrator,
+    clear_preflight_cache,
+)
+
+CHECK_METHODS = {
+    "harness": "check_harness_health",
+    "credentials": "check_credentials",
+    "repo": "check_repo_health",
+    "paths": "check_paths",
+    "backend": "check_backend_availability",
+}
+
+
+class CountingOrchestrator(PreflightOrchestrator):
+    """Orchestrator whose checks sleep, count calls and return canned statuses."""
+
+    def __init__(self, repo_root: Path, delay: float = 0.0, **kwargs):
+        super().__init__(repo_root=repo_root, **kwargs)
+        self.delay = delay
+        self.calls: Dict[str, int] = {name: 0 for name in CHECK_METHODS}
+        self.statuses: Dict[str, CheckStatus] = {}
+        self._lock = threading.Lock()
+
+    def _fake(self, name: str) -> CheckResult:
+        with self._lock:
+            self.calls[name] += 1
+        time.sleep(self.delay)
+        return CheckResult(
+            name=name,
+            status=self.statuses.get(name, CheckStatus.PASSED),
+            message=f"{name} ok",
+            details={"thread": threading.current_thread().name},
+        )
+
+    def check_harness_health(self) -> CheckResult:
+        return self._fake("harness")
+
+    def check_credentials(self, backend=None, required_providers=None) -> CheckResult:
+        return self._fake("credentials")
+
+    def check_repo_health(self) -> CheckResult:
+        return self._fake("repo")
+
+    def check_paths(self, run_id=None) -> CheckResult:
+        return self._fake("paths")
+
+    def check_backend_availability(self, backend: str) -> CheckResult:
+        return self._fake("backend")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A fake checkout with .git/HEAD and .git/index; preflight cache reset."""
+    monkeypatch.delenv("SWARM_PREFLIGHT_CACHE_TTL", raising=False)
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "index").write_bytes(b"DIRC")
+    clear_preflight_cache()
+    yield tmp_path
+    clear_preflight_cache()
+
+
+def bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def cached_names(checks: List[CheckResult]) -> List[str]:
+    return [c.name for c in checks if c.cached]
+
+
+class TestConcurrentChecks:
+    def test_checks_run_concurrently(self, repo):
+        orch = CountingOrchestrator(repo, delay=0.2, use_cache=False)
+
+        start = time.perf_counter()
+        result = orch.run_all_checks(backend="claude-harness", run_id="r1")
+        elapsed = time.perf_counter() - start
+
+        assert result.passed
+        assert elapsed < 0.6  # five 0.2s checks in sequence would take 1.0s
+        threads = {c.details["thread"] for c in result.checks}
+        assert len(threads) > 1
+
+    def test_results_keep_declaration_order(self, repo):
+        orch = CountingOrchestrator(repo, use_cache=False, skip_checks=["repo"])
+
+        result = orch.run_all_checks(backend="claude-harness")
+
+        assert [c.name for c in result.checks] == list(CHECK_METHODS)
+        assert result.checks[2].status == CheckStatus.SKIPPED
+        assert orch.calls["repo"] == 0
+
+    def test_failures_and_warnings_are_aggregated(self, repo):
+        orch = CountingOrchestrator(repo, use_cache=False)
+        orch.statuses = {"backend": CheckStatus.FAILED, "repo": CheckStatus.WARNING}
+
+        result = orch.run_all_checks(backend="claude-harness")
+
+        assert not result.passed
+        assert result.blocking_issues == ["backend: backend ok"]
+        assert result.warnings == ["repo: repo ok"]
+
+    def test_raising_check_becomes_failed_result(self, repo):
+        class Raising(CountingOrchestrator):
+            def check_repo_health(self) -> CheckResult:
+                raise RuntimeError("boom")
+
+        result = Raising(repo, use_cache=False).run_all_checks(backend="claude-harness")
+
+        assert not result.passed
+        assert any("boom" in issue for issue in result.blocking_issues)
+
+
+class TestPreflightCache:
+    def test_second_run_reuses_run_independent_checks(self, repo):
+        first = CountingOrchestrator(repo)
+        first.run_all_checks(backend="claude-harness", run_id="r1")
+        second = CountingOrchestrator(repo)
+
+        result = second.run_all_checks(backend="claude-harness", run_id="r2")
+
+        assert result.passed
+        assert sorted(cached_names(result.checks)) == ["backend", "harness", "repo"]
+        assert second.calls == {
+            "harness": 0,
+            "credentials": 1,
+            "repo": 0,
+            "paths": 1,
+            "backend": 0,
+        }
+        assert result.to_dict()["checks"][0]["cached"] is True
+
+    def test_cache_is_keyed_by_backend(self, repo):
+        CountingOrchestrator(repo).run_all_checks(backend="claude-harness")
+        other = CountingOrchestrator(repo)
+
+        result = other.run_all_checks(backend="gemini-cli")
+
+        assert cached_names(result.checks) == []
+        assert other.calls["harness"] == 1
+
+    @pytest.mark.parametrize("name", ["HEAD", "index"])
+    def test_git_change_invalidates(self, repo, name):
+        CountingOrchestrator(repo).run_all_checks(backend="claude-harness")
+        bump_mtime(repo / ".git" / name)
+        again = CountingOrchestrator(repo)
+
+        result = again.run_all_checks(backend="claude-harness")
+
+        assert cached_names(result.checks) == []
+        assert again.calls["repo"] == 1
+
+    def test_ttl_expiry(self, repo, monkeypatch):
+        monkeypatch.setenv("SWARM_PREFLIGHT_CACHE_TTL", "0.05")
+        CountingOrchestrator(repo).run_all_checks(backend="claude-harness")
+        time.sleep(0.1)
+        again = CountingOrchestrator(repo)
+
+        result = again.run_all_checks(backend="claude-harness")
+
+        assert cached_names(result.checks) == []
+
+    def test_ttl_zero_disables_cache(self, repo, monkeypatch):
+        monkeypatch.setenv("SWARM_PREFLIGHT_CACHE_TTL", "0")
+        CountingOrchestrator(repo).run_all_checks(backend="claude-harness")
+        again = CountingOrchestrator(repo)
+
+        again.run_all_checks(backend="claude-harness")
+
+        assert again.calls["harness"] == 1
+
+    def test_failed_results_are_not_cached(self, repo):
+        failing = CountingOrchestrator(repo)
+        failing.statuses = {"backend": CheckStatus.FAILED}
+        failing.run_all_checks(backend="claude-harness")
+        fixed = CountingOrchestrator(repo)
+
+        result = fixed.run_all_checks(backend="claude-harness")
+
+        assert result.passed
+        assert fixed.calls["backend"] == 1
+        assert fixed.calls["harness"] == 0
+
+    def test_skipped_check_is_filled_in_later(self, repo):
+        CountingOrchestrator(repo, skip_checks=["harness"]).run_all_checks(
+            backend="claude-harness"
+        )
+        full = CountingOrchestrator(repo)
+
+        result = full.run_all_checks(backend="claude-harness")
+
+        assert full.calls["harness"] == 1
+        assert sorted(cached_names(result.checks)) == ["backend", "repo"]
+
+    def test_worktree_git_file_is_followed(self, tmp_path):
+        real_git = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        real_git.mkdir(parents=True)
+        (real_git / "HEAD").write_text("ref: refs/heads/wt\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {real_git}\n")
+
+        before = preflight._git_fingerprint(worktree)
+        bump_mtime(real_git / "HEAD")
+
+        assert before[0] is not None
+        assert preflight._git_fingerprint(worktree) != before
+
+    def test_concurrent_batch_pays_once(self, repo):
+        orchestrators = [CountingOrchestrator(repo, delay=0.05) for _ in range(6)]
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(
+                    lambda pair: pair[1].run_all_checks(
+                        backend="claude-harness", run_id=f"r{pair[0]}"
+                    ),
+                    enumerate(orchestrators),
+                )
+            )
+
+        assert all(r.passed for r in results)
+        assert sum(o.calls["harness"] for o in orchestrators) == 1
+        assert sum(o.calls["repo"] for o in orchestrators) == 1
+        assert sum(o.calls["paths"] for o in orchestrators) == 6
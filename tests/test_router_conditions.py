@@ -0,0 +1,213 @@
+"""Tests for compiled edge-condition expressions in router.py.
+
+These tests verify that:
+1. compile_expression() honours CEL precedence, parentheses, negation,
+   literals, field paths and string methods
+2. Errors follow CEL semantics (a decisive operand wins over an error) and
+   syntax errors are reported as "Invalid expression"
+3. Compiled predicates are cached on the EdgeCondition and refreshed when it
+   changes
+4. The shipped flow graphs route exactly as with the old string evaluator
+
+Evaluation throughput is measured by swarm/tools/runtime_bench.py
+(routing_conditions), not here.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from swarm.runtime.router import (
+    CELEvaluator,
+    EdgeCondition,
+    ExpressionSyntaxError,
+    FlowGraph,
+    compile_expression,
+)
+
+FLOWS_DIR = Path(__file__).resolve().parent.parent / "swarm" / "packs" / "flows"
+
+
+def load_shipped_graphs() -> List[FlowGraph]:
+    return [
+        FlowGraph.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        for path in sorted(FLOWS_DIR.glob("*.json"))
+    ]
+
+
+class _LegacyEvaluator:
+    """The string evaluator the compiler replaced (expression path only)."""
+
+    def __init__(self):
+        self._cel = CELEvaluator()
+
+    def evaluate(self, expression: str, context: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        try:
+            expr = expression.strip()
+            if "||" in expr:
+                for part in (p.strip() for p in expr.split("||")):
+                    result, err = self._simple(part, context)
+                    if err is None and result:
+                        return True, None
+                return False, None
+            if "&&" in expr:
+                for part in (p.strip() for p in expr.split("&&")):
+                    result, err = self._simple(part, context)
+                    if err is not None or not result:
+                        return False, err
+                return True, None
+            return self._simple(expr, context)
+        except Exception as e:
+            return False, str(e)
+
+    def _simple(self, expr: str, context: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        match = re.split(r"(==|!=|>=|<=|>|<)", expr)
+        if len(match) != 3:
+            return False, f"Invalid expression: {expr}"
+        left = self._value(match[0], context)
+        right = self._value(match[2], context)
+        compare = {
+            "==": lambda a, b: a == b,
+            "!=": lambda a, b: a != b,
+            ">=": lambda a, b: a >= b,
+            "<=": lambda a, b: a <= b,
+            ">": lambda a, b: a > b,
+            "<": lambda a, b: a < b,
+        }[match[1]]
+        return compare(left, right), None
+
+    def _value(self, value_str: str, context: Dict[str, Any]) -> Any:
+        value_str = value_str.strip()
+        if value_str[:1] in ("'", '"') and value_str[-1:] == value_str[:1]:
+            return value_str[1:-1]
+        if value_str.lower() in ("true", "false"):
+            return value_str.lower() == "true"
+        try:
+            return float(value_str) if "." in value_str else int(value_str)
+        except ValueError:
+            return self._cel._resolve_field(value_str, context)
+
+
+def routing_contexts() -> List[Dict[str, Any]]:
+    """Every combination of the fields the shipped conditions read."""
+    return [
+        {
+            "status": status,
+            "can_further_iteration_help": can_help,
+            "has_mechanical_issues": issues,
+            "iteration_count": 2,
+        }
+        for status, can_help, issues in itertools.product(
+            ["VERIFIED", "UNVERIFIED", "BLOCKED", ""], [True, False], [True, False]
+        )
+    ]
+
+
+class TestCompileExpression:
+    """Grammar and literal handling."""
+
+    @pytest.mark.parametrize(
+        "expression, context, expected",
+        [
+            ("status == 'VERIFIED'", {"status": "VERIFIED"}, True),
+            ('status == "VERIFIED"', {"status": "NOPE"}, False),
+            ("iteration_count >= 3", {"iteration_count": 3}, True),
+            ("iteration_count < 2.5", {"iteration_count": 2}, True),
+            ("delta > -1", {"delta": 0}, True),
+            ("flag == TRUE", {"flag": True}, True),
+            ("missing == null", {}, True),
+            ("output.severity == 'high'", {"output": {"severity": "high"}}, True),
+            ("output.severity == 'high'", {"output": None}, False),
+            # && binds tighter than ||
+            ("a == 1 || b == 1 && c == 1", {"a": 1, "b": 0, "c": 0}, True),
+            ("(a == 1 || b == 1) && c == 1", {"a": 1, "b": 0, "c": 0}, False),
+            ("!(status == 'VERIFIED')", {"status": "UNVERIFIED"}, True),
+            ("!done", {"done": False}, True),
+            ("summary.contains('TODO')", {"summary": "has TODO items"}, True),
+            ("summary.startsWith('ok') && summary.endsWith('!')", {"summary": "ok!"}, True),
+            ("branch.matches('^feat/')", {"branch": "feat/x"}, True),
+            ("branch.matches('^feat/')", {"branch": None}, False),
+        ],
+    )
+    def test_evaluates(self, expression, context, expected):
+        assert bool(compile_expression(expression)(context)) is expected
+
+    @pytest.mark.parametrize(
+        "expression", ["", "status ==", "a == 1 )", "(a == 1", "a.nope(1)", "a = 1", "a == 'x"]
+    )
+    def test_syntax_errors(self, expression):
+        with pytest.raises(ExpressionSyntaxError):
+            compile_expression(expression)
+
+    def test_compiled_once_per_expression(self):
+        assert compile_expression("x == 1") is compile_expression("x == 1")
+
+
+class TestCELEvaluator:
+    """evaluate_condition() results, errors and caching."""
+
+    def test_error_semantics(self):
+        evaluator = CELEvaluator()
+
+        def evaluate(expression, context):
+            return evaluator.evaluate_condition(EdgeCondition(expression=expression), context)
+
+        # None >= 3 raises; a true || operand or a false && operand decides anyway
+        verified = {"status": "VERIFIED"}
+        assert evaluate("count >= 3 || status == 'VERIFIED'", verified) == (True, None)
+        assert evaluate("count >= 3 && status == 'VERIFIED'", {"status": "NOPE"}) == (False, None)
+        result, error = evaluate("count >= 3 || status == 'VERIFIED'", {"status": "NOPE"})
+        assert result is False and "not supported" in error
+
+        result, error = evaluate("status ==", {})
+        assert result is False and error.startswith("Invalid expression: status ==")
+
+    def test_field_conditions(self):
+        evaluator = CELEvaluator()
+        ctx = {"output": {"severity": "high", "tags": "a,b"}}
+        assert evaluator.evaluate_condition(
+            EdgeCondition(field="output.severity", operator="in", value=["high", "low"]), ctx
+        ) == (True, None)
+        assert evaluator.evaluate_condition(
+            EdgeCondition(field="output.tags", operator="matches", value=r"\bb\b"), ctx
+        ) == (True, None)
+        assert evaluator.evaluate_condition(
+            EdgeCondition(field="output.severity", operator="bogus"), ctx
+        ) == (False, "Unknown operator: bogus")
+        assert evaluator.evaluate_condition(EdgeCondition(), ctx) == (True, None)
+
+    def test_predicate_cached_on_condition_and_refreshed(self):
+        evaluator = CELEvaluator()
+        condition = EdgeCondition(expression="status == 'VERIFIED'")
+        first = evaluator.compile_condition(condition)
+        assert evaluator.compile_condition(condition) is first
+        assert "_compiled" not in repr(condition)
+        assert condition == EdgeCondition(expression="status == 'VERIFIED'")
+
+        condition.expression = "status == 'BLOCKED'"
+        assert evaluator.evaluate_condition(condition, {"status": "BLOCKED"}) == (True, None)
+
+
+class TestShippedGraphs:
+    """The pack flow graphs route as they did with the string evaluator."""
+
+    def test_matches_legacy_evaluator(self):
+        evaluator = CELEvaluator()
+        legacy = _LegacyEvaluator()
+        conditions = [
+            edge.condition
+            for graph in load_shipped_graphs()
+            for edge in graph.edges
+            if edge.condition is not None and edge.condition.expression
+        ]
+        assert conditions
+        for condition, context in itertools.product(conditions, routing_contexts()):
+            assert evaluator.evaluate_condition(condition, context) == legacy.evaluate(
+                condition.expression, context
+            ), condition.expression
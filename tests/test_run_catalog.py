@@ -0,0 +1,280 @@
+"""Tests for the indexed run catalog (run_catalog.py).
+
+These tests verify that:
+1. write_summary()/update_summary() keep the catalog current
+2. reconcile() picks up legacy, example, external and deleted runs
+3. RunService.list_runs() returns the same runs, in the same order, as the
+   directory scan
+4. Filters, sorting and keyset pagination return every run exactly once
+
+Listing time is measured by swarm/tools/runtime_bench.py (run_catalog), not here.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import run_catalog, storage
+from swarm.runtime import service as runtime_service
+from swarm.runtime.run_catalog import (
+    CATALOG_FILE,
+    close_run_catalogs,
+    get_run_catalog,
+)
+from swarm.runtime.service import RunService
+from swarm.runtime.types import RunSpec, RunStatus, RunSummary, SDLCStatus
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """Isolated runs/ and examples/ directories with a fresh catalog."""
+    runs_dir = tmp_path / "runs"
+    examples_dir = tmp_path / "examples"
+    runs_dir.mkdir()
+    examples_dir.mkdir()
+    monkeypatch.setattr(storage, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(storage, "EXAMPLES_DIR", examples_dir)
+    monkeypatch.setattr(runtime_service, "EXAMPLES_DIR", examples_dir)
+    monkeypatch.setattr(run_catalog, "RACY_WINDOW_NS", 0)
+    monkeypatch.delenv("SWARM_RUN_CATALOG", raising=False)
+    close_run_catalogs()
+    RunService.reset()
+    yield {"runs_dir": runs_dir, "examples_dir": examples_dir}
+    close_run_catalogs()
+    RunService.reset()
+
+
+def make_summary(
+    run_id: str,
+    minutes: int = 0,
+    status: RunStatus = RunStatus.SUCCEEDED,
+    flow_keys=("build",),
+    tags=(),
+) -> RunSummary:
+    created = BASE_TIME + timedelta(minutes=minutes)
+    return RunSummary(
+        id=run_id,
+        spec=RunSpec(flow_keys=list(flow_keys), profile_id=None, backend="claude-harness",
+                     initiator="test"),
+        status=status,
+        sdlc_status=SDLCStatus.UNKNOWN,
+        created_at=created,
+        updated_at=created,
+        tags=list(tags),
+    )
+
+
+def make_legacy(root: Path, run_id: str, flows=("signal",), run_json=None) -> Path:
+    run_path = root / run_id
+    for flow in flows:
+        (run_path / flow).mkdir(parents=True)
+    if run_json is not None:
+        (run_path / "run.json").write_text(json.dumps(run_json))
+    return run_path
+
+
+def ids(summaries):
+    return [s.id for s in summaries]
+
+
+class TestCatalogUpkeep:
+    def test_write_summary_records_row(self, env):
+        storage.write_summary("run-a", make_summary("run-a"), env["runs_dir"])
+        assert (env["runs_dir"] / CATALOG_FILE).exists()
+
+        page = get_run_catalog(env["runs_dir"]).query()
+        assert ids(page.runs) == ["run-a"]
+        assert page.total == 1
+
+    def test_update_summary_updates_row(self, env):
+        storage.write_summary("run-a", make_summary("run-a", status=RunStatus.RUNNING),
+                              env["runs_dir"])
+        catalog = get_run_catalog(env["runs_dir"])
+        assert catalog.query(status="running").total == 1
+
+        storage.update_summary("run-a", {"status": "failed"}, env["runs_dir"])
+        assert catalog.query(status="running").total == 0
+        assert ids(catalog.query(status="failed").runs) == ["run-a"]
+
+    def test_unchanged_runs_are_not_reread(self, env, monkeypatch):
+        for i in range(3):
+            storage.write_summary(f"run-{i}", make_summary(f"run-{i}", i), env["runs_dir"])
+        catalog = get_run_catalog(env["runs_dir"])
+        catalog.reconcile(force=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("meta.json re-read")
+
+        monkeypatch.setattr(storage, "read_summary", fail)
+        assert catalog.reconcile(force=True) == 0
+        assert catalog.query().total == 3
+
+    def test_failed_upsert_is_repaired_by_next_query(self, env, monkeypatch):
+        storage.write_summary("run-a", make_summary("run-a", status=RunStatus.RUNNING),
+                              env["runs_dir"])
+        catalog = get_run_catalog(env["runs_dir"])
+        assert catalog.query(status="running").total == 1
+
+        def fail(*args, **kwargs):
+            raise run_catalog.sqlite3.OperationalError("database is locked")
+
+        with monkeypatch.context() as m:
+            m.setattr(run_catalog, "_upsert", fail)
+            storage.update_summary("run-a", {"status": "failed"}, env["runs_dir"])
+        # The roots did not change, so only the invalidation forces a reconcile
+        assert ids(catalog.query(status="failed").runs) == ["run-a"]
+        assert catalog.query(status="running").total == 0
+
+    def test_reconcile_external_and_deleted_runs(self, env):
+        storage.write_summary("run-a", make_summary("run-a"), env["runs_dir"])
+        catalog = get_run_catalog(env["runs_dir"])
+        assert catalog.query().total == 1
+
+        # Written by a process that bypassed storage
+        external = env["runs_dir"] / "run-b"
+        external.mkdir()
+        data = storage.run_summary_to_dict(make_summary("run-b", 5))
+        (external / "meta.json").write_text(json.dumps(data))
+        shutil.rmtree(env["runs_dir"] / "run-a")
+
+        assert ids(catalog.query().runs) == ["run-b"]
+
+    def test_rebuilds_after_database_removed(self, env):
+        storage.write_summary("run-a", make_summary("run-a"), env["runs_dir"])
+        close_run_catalogs()
+        for path in env["runs_dir"].glob(CATALOG_FILE + "*"):
+            path.unlink()
+
+        assert ids(get_run_catalog(env["runs_dir"]).query().runs) == ["run-a"]
+
+    def test_directory_without_run_is_ignored(self, env):
+        storage.create_run_dir("run-empty", env["runs_dir"])
+        assert get_run_catalog(env["runs_dir"]).query().total == 0
+
+    def test_disabled_catalog_scans(self, env, monkeypatch):
+        monkeypatch.setenv("SWARM_RUN_CATALOG", "0")
+        storage.write_summary("run-a", make_summary("run-a"), env["runs_dir"])
+        assert not (env["runs_dir"] / CATALOG_FILE).exists()
+        assert ids(RunService().list_runs()) == ["run-a"]
+
+
+class TestRunServiceListing:
+    def populate(self, env):
+        runs_dir, examples_dir = env["runs_dir"], env["examples_dir"]
+        storage.write_summary("run-old", make_summary("run-old", 1, flow_keys=["signal"]), runs_dir)
+        storage.write_summary("run-new", make_summary("run-new", 9, flow_keys=["build", "gate"]),
+                              runs_dir)
+        make_legacy(runs_dir, "legacy-run", flows=("plan",))
+        make_legacy(examples_dir, "demo", flows=("signal", "build"),
+                    run_json={"title": "Demo", "tags": ["teaching"]})
+        # An example shadows an active run with the same ID
+        storage.write_summary("demo", make_summary("demo", 20), runs_dir)
+
+    def test_matches_directory_scan(self, env):
+        self.populate(env)
+        service = RunService()
+        for kwargs in (
+            {},
+            {"flow_key": "build"},
+            {"include_legacy": False},
+            {"include_examples": False},
+        ):
+            listed = service.list_runs(**kwargs)
+            scanned = service._list_runs_scan(**kwargs)
+            assert ids(listed) == ids(scanned), kwargs
+            assert [s.tags for s in listed] == [s.tags for s in scanned]
+
+    def test_runs_only_query_keeps_example_rows(self, env):
+        self.populate(env)
+        service = RunService()
+        assert "demo" in ids(service.list_runs())
+        assert ids(service.list_runs(include_examples=False)) == ids(
+            service._list_runs_scan(include_examples=False)
+        )
+        assert ids(service.list_runs()) == ids(service._list_runs_scan())
+
+    def test_catalog_without_examples_root_keeps_example_rows(self, env):
+        self.populate(env)
+        with_examples = get_run_catalog(env["runs_dir"], env["examples_dir"])
+        assert with_examples.query().runs[0].id == "demo"
+
+        runs_only = get_run_catalog(env["runs_dir"])
+        runs_only.reconcile(force=True)
+        assert with_examples.query().runs[0].id == "demo"
+
+    def test_examples_first_then_newest(self, env):
+        self.populate(env)
+        listed = ids(RunService().list_runs(include_legacy=False))
+        assert listed == ["demo", "run-new", "run-old"]
+        assert RunService().list_runs()[0].title == "Demo"
+
+
+class TestQuery:
+    @pytest.fixture
+    def catalog(self, env):
+        statuses = [RunStatus.SUCCEEDED, RunStatus.FAILED, RunStatus.RUNNING]
+        flows = ["signal", "build", "gate", "deploy"]
+        for i in range(30):
+            tags = ["nightly"] if i % 3 == 0 else []
+            if i % 5 == 0:
+                tags.append("release")
+            storage.write_summary(
+                f"run-{i:02d}",
+                make_summary(f"run-{i:02d}", i // 2, statuses[i % 3], [flows[i % 4]], tags),
+                env["runs_dir"],
+            )
+        return get_run_catalog(env["runs_dir"])
+
+    def test_filters(self, catalog):
+        assert catalog.query(status="failed").total == 10
+        assert catalog.query(flow_key="gate").total == 7
+        assert ids(catalog.query(tags=["nightly", "release"]).runs) == ["run-15", "run-00"]
+
+    @pytest.mark.parametrize("sort_by", ["created_at", "status", "flow_key"])
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_keyset_pages_cover_all_runs_in_order(self, catalog, sort_by, descending):
+        full = catalog.query(sort_by=sort_by, descending=descending)
+        paged, cursor = [], None
+        while True:
+            page = catalog.query(sort_by=sort_by, descending=descending, limit=7, cursor=cursor)
+            assert page.total == 30
+            paged.extend(ids(page.runs))
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert paged == ids(full.runs)
+        assert len(set(paged)) == 30
+
+    def test_created_at_order_with_ties(self, catalog):
+        runs = catalog.query(descending=True).runs
+        keys = [(s.created_at, s.id) for s in runs]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_offset_pagination(self, catalog):
+        full = ids(catalog.query().runs)
+        page = catalog.query(limit=10, offset=10)
+        assert ids(page.runs) == full[10:20]
+        assert page.next_cursor is not None
+
+    def test_filtered_pagination(self, catalog):
+        page = catalog.query(status="failed", limit=4)
+        second = catalog.query(status="failed", limit=4, cursor=page.next_cursor)
+        assert page.total == second.total == 10
+        assert all(s.status == RunStatus.FAILED for s in page.runs + second.runs)
+        assert not set(ids(page.runs)) & set(ids(second.runs))
+
+    def test_invalid_arguments(self, catalog):
+        page = catalog.query(limit=5)
+        with pytest.raises(ValueError):
+            catalog.query(sort_by="status", cursor=page.next_cursor)
+        with pytest.raises(ValueError):
+            catalog.query(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            catalog.query(sort_by="title")
@@ -0,0 +1,292 @@
+"""Tests for the bounded run admission scheduler (run_scheduler.py).
+
+These tests verify that:
+1. No more than max_workers runs execute at once, per backend limits hold,
+   and a saturated backend does not block other backends
+2. Interactive runs are admitted before autopilot runs
+3. Queued runs can be canceled and failing runs release their slot
+4. Backends record queued runs in meta.json (status "queued", run_queued and
+   run_admitted events) and RunService cancels them
+
+Burst completion latency is measured by swarm/tools/runtime_bench.py
+(run_scheduler), not here.
+"""
+
+from __future__ import annotations
+
+import shutil
+import threading
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.backends import RunBackend
+from swarm.runtime.run_scheduler import (
+    RunScheduler,
+    backend_limits_from_env,
+    max_workers_from_env,
+    run_priority,
+)
+from swarm.runtime.service import RunService
+from swarm.runtime.types import (
+    BackendCapabilities,
+    RunEvent,
+    RunId,
+    RunSpec,
+    RunStatus,
+    RunSummary,
+    SDLCStatus,
+    generate_run_id,
+)
+
+
+class Recorder:
+    """Blocking run targets that record start order and peak concurrency."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started: List[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def target(self, name: str):
+        def run() -> None:
+            with self._lock:
+                self.started.append(name)
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            self.release.wait(5)
+            with self._lock:
+                self.active -= 1
+
+        return run
+
+
+class TestAdmission:
+    def test_bounds_concurrency(self):
+        scheduler = RunScheduler(max_workers=2)
+        rec = Recorder()
+        queued = [scheduler.submit(f"r{i}", "a", rec.target(f"r{i}")) for i in range(5)]
+
+        assert queued == [False, False, True, True, True]
+        stats = scheduler.stats()
+        assert (stats.running, stats.queued) == (2, 3)
+        assert scheduler.queue_position("r4") == 3
+
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+        assert rec.peak == 2
+        assert rec.started == ["r0", "r1", "r2", "r3", "r4"]
+
+    def test_backend_limit_does_not_block_other_backends(self):
+        scheduler = RunScheduler(max_workers=3, backend_limits={"a": 1})
+        rec = Recorder()
+        assert scheduler.submit("a1", "a", rec.target("a1")) is False
+        assert scheduler.submit("a2", "a", rec.target("a2")) is True
+        assert scheduler.submit("b1", "b", rec.target("b1")) is False
+
+        stats = scheduler.stats()
+        assert stats.running_by_backend == {"a": 1, "b": 1}
+        assert stats.queued_by_backend == {"a": 1}
+
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+        assert set(rec.started) == {"a1", "a2", "b1"}
+
+    def test_interactive_before_autopilot(self):
+        scheduler = RunScheduler(max_workers=1)
+        rec = Recorder()
+        scheduler.submit("first", "a", rec.target("first"))
+        scheduler.submit("auto-1", "a", rec.target("auto-1"), priority="autopilot")
+        scheduler.submit("inter-1", "a", rec.target("inter-1"))
+        scheduler.submit("auto-2", "a", rec.target("auto-2"), priority="autopilot")
+        assert scheduler.stats().queued_by_priority == {"interactive": 1, "autopilot": 2}
+
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+        assert rec.started == ["first", "inter-1", "auto-1", "auto-2"]
+
+    def test_unbounded(self):
+        scheduler = RunScheduler(max_workers=None)
+        rec = Recorder()
+        assert not any(scheduler.submit(f"r{i}", "a", rec.target(f"r{i}")) for i in range(10))
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+
+    def test_invalid_submissions(self):
+        scheduler = RunScheduler(max_workers=1)
+        rec = Recorder()
+        with pytest.raises(ValueError):
+            scheduler.submit("r0", "a", rec.target("r0"), priority="urgent")
+        scheduler.submit("r0", "a", rec.target("r0"))
+        with pytest.raises(ValueError):
+            scheduler.submit("r0", "a", rec.target("r0"))
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+
+
+class TestCancelAndFailure:
+    def test_cancel_queued_run(self):
+        scheduler = RunScheduler(max_workers=1)
+        rec = Recorder()
+        scheduler.submit("r0", "a", rec.target("r0"))
+        scheduler.submit("r1", "a", rec.target("r1"))
+        scheduler.submit("r2", "a", rec.target("r2"))
+
+        assert scheduler.cancel("r1") is True
+        assert scheduler.cancel("r0") is False  # already running
+        assert scheduler.queue_position("r2") == 1
+
+        rec.release.set()
+        assert scheduler.wait_idle(5)
+        assert rec.started == ["r0", "r2"]
+
+    def test_failing_run_releases_slot(self):
+        scheduler = RunScheduler(max_workers=1)
+        rec = Recorder()
+        rec.release.set()
+
+        def boom() -> None:
+            raise RuntimeError("backend crashed")
+
+        scheduler.submit("bad", "a", boom)
+        scheduler.submit("good", "a", rec.target("good"))
+        assert scheduler.wait_idle(5)
+        assert rec.started == ["good"]
+        assert scheduler.stats().running == 0
+
+
+class TestConfiguration:
+    def test_env_parsing(self, monkeypatch):
+        monkeypatch.delenv("SWARM_RUN_WORKERS", raising=False)
+        assert max_workers_from_env() == 4
+        monkeypatch.setenv("SWARM_RUN_WORKERS", "0")
+        assert max_workers_from_env() is None
+        monkeypatch.setenv("SWARM_RUN_WORKERS", "many")
+        assert max_workers_from_env() == 4
+
+        monkeypatch.setenv("SWARM_RUN_BACKEND_LIMITS", "claude-harness=2, gemini-cli=1,bogus")
+        assert backend_limits_from_env() == {"claude-harness": 2, "gemini-cli": 1}
+
+    def test_run_priority(self):
+        assert run_priority(RunSpec(flow_keys=["build"])) == "interactive"
+        assert run_priority(RunSpec(flow_keys=["build"], no_human_mid_flow=True)) == "autopilot"
+        assert run_priority(RunSpec(flow_keys=["build"], params={"autopilot": True})) == "autopilot"
+        spec = RunSpec(flow_keys=["build"], params={"autopilot": True, "priority": "interactive"})
+        assert run_priority(spec) == "interactive"
+
+
+# -----------------------------------------------------------------------------
+# Backend integration
+# -----------------------------------------------------------------------------
+
+
+class GateBackend(RunBackend):
+    """Minimal backend whose runs block until the gate opens."""
+
+    def __init__(self, scheduler: RunScheduler):
+        self.scheduler = scheduler
+        self.gate = threading.Event()
+
+    @property
+    def id(self):
+        return "gate-backend"
+
+    def capabilities(self) -> BackendCapabilities:
+        return BackendCapabilities(id="claude-harness", label="Gate")
+
+    def start(self, spec: RunSpec) -> RunId:
+        run_id = generate_run_id()
+        now = datetime.now(timezone.utc)
+        storage.create_run_dir(run_id)
+        storage.write_summary(
+            run_id,
+            RunSummary(
+                id=run_id,
+                spec=spec,
+                status=RunStatus.PENDING,
+                sdlc_status=SDLCStatus.UNKNOWN,
+                created_at=now,
+                updated_at=now,
+            ),
+        )
+        self._launch(run_id, spec, self._execute)
+        return run_id
+
+    def _execute(self, run_id: RunId, spec: RunSpec) -> None:
+        self.gate.wait(5)
+        storage.update_summary(run_id, {"status": RunStatus.SUCCEEDED.value})
+
+    def get_summary(self, run_id: RunId) -> Optional[RunSummary]:
+        return storage.read_summary(run_id)
+
+    def list_summaries(self) -> List[RunSummary]:
+        return []
+
+    def get_events(self, run_id: RunId) -> List[RunEvent]:
+        return storage.read_events(run_id)
+
+
+@pytest.fixture
+def gate_backend():
+    """GateBackend with one slot; removes the runs it created afterwards."""
+    scheduler = RunScheduler(max_workers=1)
+    backend = GateBackend(scheduler)
+    created: List[str] = []
+    original_start = backend.start
+
+    def start(spec: RunSpec) -> RunId:
+        run_id = original_start(spec)
+        created.append(run_id)
+        return run_id
+
+    backend.start = start
+    yield backend
+    backend.gate.set()
+    scheduler.wait_idle(5)
+    for run_id in created:
+        shutil.rmtree(storage.RUNS_DIR / run_id, ignore_errors=True)
+
+
+def event_kinds(run_id: str) -> List[str]:
+    return [e.kind for e in storage.read_events(run_id)]
+
+
+class TestBackendIntegration:
+    def test_queued_status_visible_in_summary(self, gate_backend):
+        spec = RunSpec(flow_keys=["build"], initiator="test")
+        first = gate_backend.start(spec)
+        second = gate_backend.start(RunSpec(flow_keys=["build"], no_human_mid_flow=True))
+
+        assert storage.read_summary(first).status == RunStatus.PENDING
+        assert storage.read_summary(second).status == RunStatus.QUEUED
+        queued_event = storage.read_events(second)[-1]
+        assert queued_event.kind == "run_queued"
+        assert queued_event.payload == {
+            "backend": "gate-backend",
+            "priority": "autopilot",
+            "position": 1,
+        }
+
+        gate_backend.gate.set()
+        assert gate_backend.scheduler.wait_idle(5)
+        assert storage.read_summary(second).status == RunStatus.SUCCEEDED
+        assert event_kinds(second) == ["run_queued", "run_admitted"]
+        assert "run_queued" not in event_kinds(first)
+
+    def test_run_service_cancels_queued_run(self, gate_backend):
+        service = RunService(scheduler=gate_backend.scheduler)
+        gate_backend.start(RunSpec(flow_keys=["build"]))
+        queued = gate_backend.start(RunSpec(flow_keys=["build"]))
+        assert service.scheduler_stats().queued == 1
+
+        assert service.cancel_run(queued) is True
+        summary = storage.read_summary(queued)
+        assert summary.status == RunStatus.CANCELED
+        assert summary.completed_at is not None
+        assert event_kinds(queued)[-1] == "run_canceled"
+        assert service.scheduler_stats().queued == 0
+        assert service.cancel_run(queued) is False
@@ -339,7 +339,7 @@ class TestRunService:
             updated_at=now,
             is_exemplar=False,
         )
-        storage.write_summary("normal-run", normal_summary)
+        storage.write_summary("normal-run", normal_summary, runs_dir=tmp_path)
 
         # Create exemplar run
         exemplar_summary = RunSummary(
@@ -351,7 +351,7 @@ class TestRunService:
             updated_at=now,
             is_exemplar=True,
         )
-        storage.write_summary("exemplar-run", exemplar_summary)
+        storage.write_summary("exemplar-run", exemplar_summary, runs_dir=tmp_path)
 
         exemplars = service.list_exemplars()
         assert len(exemplars) == 1
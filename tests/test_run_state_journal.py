@@ -0,0 +1,246 @@
+"""Tests for the run-state journal (run_state_journal.py, storage.py).
+
+These tests verify that:
+1. commit_step_completion() appends to the journal without rewriting
+   run_state.json, and read_run_state() replays snapshot + journal
+2. Compaction runs every compact_every records and on status changes, and
+   the snapshot stores handoff envelopes by reference
+3. Crash states recover: torn trailing records, stale records after a
+   crash mid-compaction, and envelopes written without a journal record
+4. Legacy inline snapshots still load and write_run_state() supersedes the
+   journal
+
+Per-step write cost is measured by swarm/tools/runtime_bench.py
+(run_state_journal), not here.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.run_state_journal import ENVELOPE_REF_KEY, JOURNAL_FILE, RunStateJournal
+from swarm.runtime.types import (
+    HandoffEnvelope,
+    RoutingDecision,
+    RoutingSignal,
+    RunState,
+    run_state_to_dict,
+)
+
+RUN_ID = "run-journal"
+
+
+def make_envelope(step_id: str, summary: str = "done") -> HandoffEnvelope:
+    return HandoffEnvelope(
+        step_id=step_id,
+        flow_key="build",
+        run_id=RUN_ID,
+        routing_signal=RoutingSignal(decision=RoutingDecision.ADVANCE),
+        summary=summary,
+        artifacts={"out": f"build/{step_id}.md"},
+    )
+
+
+@pytest.fixture
+def runs_dir(tmp_path, monkeypatch):
+    """A runs directory holding one pending build run; journal cache reset."""
+    monkeypatch.setenv("SWARM_RUN_STATE_COMPACT_EVERY", "1000")
+    storage._run_state_journals.clear()
+    storage.write_run_state(RUN_ID, RunState(run_id=RUN_ID, flow_key="build"), tmp_path)
+    yield tmp_path
+    storage._run_state_journals.clear()
+
+
+def commit(runs_dir: Path, step: int, **updates) -> None:
+    storage.commit_step_completion(
+        RUN_ID,
+        "build",
+        make_envelope(str(step)),
+        {"step_index": step, "current_step_id": str(step + 1), **updates},
+        runs_dir,
+    )
+
+
+def reload(runs_dir: Path) -> RunState:
+    """read_run_state() as a fresh process would see it."""
+    storage._run_state_journals.clear()
+    return storage.read_run_state(RUN_ID, runs_dir)
+
+
+class TestJournalAppend:
+    """Step completion appends deltas."""
+
+    def test_commit_does_not_rewrite_snapshot(self, runs_dir):
+        snapshot = runs_dir / RUN_ID / storage.RUN_STATE_FILE
+        commit(runs_dir, 0, status="running")  # Status change: compacted
+        before = snapshot.stat()
+
+        for step in range(1, 6):
+            commit(runs_dir, step, status="running")
+
+        after = snapshot.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        lines = (runs_dir / RUN_ID / JOURNAL_FILE).read_text().splitlines()
+        assert len(lines) == 5
+        assert "summary" not in lines[0]  # Envelope stored by reference
+
+        for state in (storage.read_run_state(RUN_ID, runs_dir), reload(runs_dir)):
+            assert state.step_index == 5
+            assert state.current_step_id == "6"
+            assert state.status == "running"
+            assert sorted(state.handoff_envelopes) == ["0", "1", "2", "3", "4", "5"]
+            assert state.handoff_envelopes["3"].artifacts == {"out": "build/3.md"}
+
+    def test_update_run_state_appends_and_ignores_unknown_fields(self, runs_dir):
+        state = storage.update_run_state(RUN_ID, {"step_index": 7, "bogus": 1}, runs_dir)
+        assert state.step_index == 7
+        assert "bogus" not in run_state_to_dict(reload(runs_dir))
+        assert reload(runs_dir).step_index == 7
+
+        with pytest.raises(FileNotFoundError):
+            storage.update_run_state("missing", {"step_index": 1}, runs_dir)
+
+    def test_returned_state_is_independent_of_cache(self, runs_dir):
+        state = storage.update_run_state(RUN_ID, {"loop_state": {"critic": 1}}, runs_dir)
+        state.loop_state["critic"] = 99
+        assert storage.read_run_state(RUN_ID, runs_dir).loop_state == {"critic": 1}
+
+
+class TestCompaction:
+    """Snapshots fold the journal in."""
+
+    def test_compacts_every_n_records(self, runs_dir, monkeypatch):
+        monkeypatch.setenv("SWARM_RUN_STATE_COMPACT_EVERY", "4")
+        storage._run_state_journals.clear()
+        for step in range(10):
+            commit(runs_dir, step)
+
+        journal_path = runs_dir / RUN_ID / JOURNAL_FILE
+        assert len(journal_path.read_text().splitlines()) == 2
+        snapshot = json.loads((runs_dir / RUN_ID / storage.RUN_STATE_FILE).read_text())
+        assert snapshot["_journal"]["generation"] == 3
+        assert snapshot["step_index"] == 7
+        assert snapshot["handoff_envelopes"]["0"] == {ENVELOPE_REF_KEY: "build/handoff/0.json"}
+
+        state = reload(runs_dir)
+        assert state.step_index == 9
+        assert len(state.handoff_envelopes) == 10
+
+    def test_status_change_compacts(self, runs_dir):
+        commit(runs_dir, 0, status="running")
+        commit(runs_dir, 1, status="running")
+        storage.update_run_state(RUN_ID, {"status": "succeeded"}, runs_dir)
+
+        snapshot = json.loads((runs_dir / RUN_ID / storage.RUN_STATE_FILE).read_text())
+        assert snapshot["status"] == "succeeded"
+        assert snapshot["step_index"] == 1
+        assert (runs_dir / RUN_ID / JOURNAL_FILE).read_text() == ""
+
+    def test_write_run_state_supersedes_journal_and_keeps_refs(self, runs_dir):
+        commit(runs_dir, 0, status="running")
+        commit(runs_dir, 1)
+        state = storage.read_run_state(RUN_ID, runs_dir)
+        state.step_index = 42
+        storage.write_run_state(RUN_ID, state, runs_dir)
+
+        snapshot = json.loads((runs_dir / RUN_ID / storage.RUN_STATE_FILE).read_text())
+        assert snapshot["handoff_envelopes"]["1"] == {ENVELOPE_REF_KEY: "build/handoff/1.json"}
+        assert reload(runs_dir).step_index == 42
+
+    def test_legacy_inline_snapshot(self, tmp_path):
+        run_path = tmp_path / RUN_ID
+        run_path.mkdir()
+        legacy = run_state_to_dict(
+            RunState(
+                run_id=RUN_ID,
+                flow_key="build",
+                step_index=2,
+                handoff_envelopes={"1": make_envelope("1", "inline")},
+            )
+        )
+        (run_path / storage.RUN_STATE_FILE).write_text(json.dumps(legacy))
+
+        storage.update_run_state(RUN_ID, {"step_index": 3}, tmp_path)
+        state = reload(tmp_path)
+        assert state.step_index == 3
+        assert state.handoff_envelopes["1"].summary == "inline"
+
+
+class TestCrashRecovery:
+    """Journal replay after an interrupted write."""
+
+    def test_torn_record_is_ignored_and_repaired(self, runs_dir):
+        commit(runs_dir, 0)
+        journal_path = runs_dir / RUN_ID / JOURNAL_FILE
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"gen": 1, "updates": {"step_ind')
+
+        assert reload(runs_dir).step_index == 0
+        commit(runs_dir, 1)
+        lines = journal_path.read_text().splitlines()
+        assert len(lines) == 2 and all(json.loads(line) for line in lines)
+        assert reload(runs_dir).step_index == 1
+
+    def test_records_of_previous_generation_are_ignored(self, runs_dir):
+        commit(runs_dir, 0)
+        journal_path = runs_dir / RUN_ID / JOURNAL_FILE
+        stale = journal_path.read_text()
+
+        # Crash after the new snapshot was written, before the journal was truncated
+        RunStateJournal(runs_dir / RUN_ID).compact()
+        storage.update_run_state(RUN_ID, {"step_index": 5}, runs_dir)
+        current = journal_path.read_text()
+        journal_path.write_text(stale.replace('"step_index": 0', '"step_index": 99') + current)
+        assert reload(runs_dir).step_index == 5
+
+    def test_envelope_without_journal_record_is_recovered(self, runs_dir):
+        # Crash after step 1 of commit_step_completion
+        storage.write_envelope(RUN_ID, "build", "1", make_envelope("1", "orphan"), runs_dir)
+        state = reload(runs_dir)
+        assert state.handoff_envelopes["1"].summary == "orphan"
+
+    def test_missing_or_corrupt_snapshot(self, tmp_path):
+        assert storage.read_run_state("nope", tmp_path) is None
+        (tmp_path / "bad").mkdir()
+        (tmp_path / "bad" / storage.RUN_STATE_FILE).write_text("{not json")
+        assert storage.read_run_state("bad", tmp_path) is None
+
+
+class TestRawStateReaders:
+    """read_run_state_data() serves API readers the journaled state."""
+
+    def test_sees_journal_and_resolves_refs(self, runs_dir):
+        commit(runs_dir, 0, status="running")
+        commit(runs_dir, 1, status="running")
+        run_path = runs_dir / RUN_ID
+
+        snapshot = json.loads((run_path / storage.RUN_STATE_FILE).read_text())
+        assert snapshot["step_index"] == 0  # Snapshot alone lags the journal
+        assert ENVELOPE_REF_KEY in snapshot["handoff_envelopes"]["0"]
+
+        for data in (storage.read_run_state_data(run_path), storage.read_run_state_data(run_path)):
+            assert data["step_index"] == 1
+            assert data["current_step_id"] == "2"
+            assert data["handoff_envelopes"]["0"]["summary"] == "done"
+            assert "_journal" not in data
+
+    def test_file_without_journal_is_returned_as_written(self, tmp_path):
+        run_path = tmp_path / "api-run"
+        run_path.mkdir()
+        state = {"run_id": "api-run", "status": "pending", "current_step": "1"}
+        (run_path / storage.RUN_STATE_FILE).write_text(json.dumps(state))
+        assert storage.read_run_state_data(run_path) == state
+        assert storage.read_run_state_data(tmp_path / "missing") is None
+
+    def test_sse_state_reader_uses_journal(self, runs_dir):
+        pytest.importorskip("fastapi")
+        from swarm.api.routes.events import _read_state
+
+        commit(runs_dir, 0, status="running")
+        commit(runs_dir, 1, status="running")
+        state = _read_state(runs_dir / RUN_ID / storage.RUN_STATE_FILE)
+        assert state["step_index"] == 1
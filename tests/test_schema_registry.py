@@ -0,0 +1,141 @@
+"""
+Tests for the compiled JSON-schema validator registry.
+
+Covers:
+- SchemaRegistry: one compilation per schema, recompilation after an edit,
+  cross-file $refs resolved from sibling schemas, validate_many
+- Error output identical to a freshly built Draft7Validator
+- The jsonschema-only backend when fastjsonschema is unavailable
+- handoff_io.validate_envelope / validate_envelopes and
+  SpecManager.validate_spec served from the registry
+
+Validation throughput is measured by swarm/tools/runtime_bench.py
+(schema_registry), not here.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+jsonschema = pytest.importorskip("jsonschema")
+
+from swarm.runtime.handoff_io import validate_envelope, validate_envelopes  # noqa: E402
+from swarm.spec import schema_registry  # noqa: E402
+from swarm.spec.cache import reset_spec_cache  # noqa: E402
+from swarm.spec.manager import SpecManager  # noqa: E402
+from swarm.spec.schema_registry import get_schema_registry, reset_schema_registry  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENVELOPE_SCHEMA = REPO_ROOT / "swarm" / "schemas" / "handoff_envelope.schema.json"
+SPEC_SCHEMAS = REPO_ROOT / "swarm" / "spec" / "schemas"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_spec_cache()
+    reset_schema_registry()
+    yield
+    reset_spec_cache()
+    reset_schema_registry()
+
+
+def make_envelope(i: int = 0, **overrides):
+    envelope = {
+        "step_id": f"step-{i}",
+        "flow_key": "build",
+        "run_id": "run-1",
+        "routing_signal": {"decision": "advance", "next_step_id": f"step-{i + 1}", "confidence": 0.9},
+        "summary": f"Completed step {i}",
+        "artifacts": {"summary": f"build/step-{i}.md"},
+        "status": "succeeded",
+        "duration_ms": 1200,
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+    envelope.update(overrides)
+    return envelope
+
+
+def touch_later(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSchemaRegistry:
+    def test_compiled_once(self):
+        registry = get_schema_registry()
+        first = registry.validator(ENVELOPE_SCHEMA)
+        assert registry.validator(str(ENVELOPE_SCHEMA)) is first
+        assert registry.compiled == 1
+
+    def test_schema_edit_recompiles(self, tmp_path):
+        schema_path = tmp_path / "thing.schema.json"
+        schema_path.write_text(json.dumps({"type": "object", "required": ["a"]}))
+        registry = get_schema_registry()
+        assert registry.validate(schema_path, {}) != []
+
+        schema_path.write_text(json.dumps({"type": "object"}))
+        touch_later(schema_path)
+        assert registry.validate(schema_path, {}) == []
+        assert registry.compiled == 2
+
+    def test_cross_file_refs_resolve(self):
+        registry = get_schema_registry()
+        errors = registry.validate(ENVELOPE_SCHEMA, make_envelope(routing_signal={"decision": "sideways"}))
+        assert [list(e.absolute_path) for e in errors] == [["routing_signal", "decision"]]
+
+        run_state = registry.validator(SPEC_SCHEMAS / "run_state.schema.json")
+        assert run_state.errors({}) != []  # refs to handoff_envelope resolve locally
+
+    def test_errors_match_fresh_validator(self):
+        schema = json.loads((SPEC_SCHEMAS / "flow_graph.schema.json").read_text())
+        bad = {"id": 3, "nodes": "none"}
+        expected = sorted(e.message for e in jsonschema.Draft7Validator(schema).iter_errors(bad))
+        errors = get_schema_registry().validate(SPEC_SCHEMAS / "flow_graph.schema.json", bad)
+        assert sorted(e.message for e in errors) == expected
+
+    def test_validate_many(self):
+        instances = [make_envelope(0), make_envelope(1, status="bogus"), make_envelope(2)]
+        results = get_schema_registry().validate_many(ENVELOPE_SCHEMA, instances)
+        assert [len(errors) for errors in results] == [0, 1, 0]
+
+    def test_jsonschema_backend_without_fastjsonschema(self, monkeypatch):
+        monkeypatch.setattr(schema_registry, "FASTJSONSCHEMA_AVAILABLE", False)
+        validator = get_schema_registry().validator(ENVELOPE_SCHEMA)
+        assert validator.backend == "jsonschema"
+        assert validator.is_valid(make_envelope())
+        assert not validator.is_valid(make_envelope(summary=None))
+
+    def test_fast_backend_rejections_confirmed(self):
+        pytest.importorskip("fastjsonschema")
+        validator = get_schema_registry().validator(ENVELOPE_SCHEMA)
+        assert validator.backend == "fastjsonschema"
+        # Formats are not asserted, as with jsonschema
+        assert validator.errors(make_envelope(timestamp="yesterday")) == []
+        assert validator.best_error(make_envelope(status="bogus")).message.startswith("'bogus'")
+
+
+class TestCallers:
+    def test_validate_envelope_messages(self):
+        assert validate_envelope(make_envelope()) == []
+        assert validate_envelope({"step_id": "x"}) == [
+            "Validation error at $: 'flow_key' is a required property"
+        ]
+
+    def test_validate_envelopes_batch(self):
+        results = validate_envelopes([make_envelope(0), make_envelope(1, status="bogus")])
+        assert results[0] == []
+        assert results[1] == [
+            "Validation error at $.status: 'bogus' is not one of ['succeeded', 'failed', 'skipped']"
+        ]
+        assert get_schema_registry().compiled == 1
+
+    def test_spec_manager_uses_registry(self):
+        manager = SpecManager(repo_root=REPO_ROOT)
+        for _ in range(3):
+            result = manager.validate_flow_graph({"id": "x"})
+            assert not result.valid
+            assert any(e.message == "'nodes' is a required property" for e in result.errors)
+        assert get_schema_registry().compiled == 1
@@ -0,0 +1,248 @@
+"""
+Tests for critical-path scheduling and result caching in distributed selftest.
+
+Covers:
+- get_step_graph(): declared dependencies plus the KERNEL gate
+- critical_path_priorities(): longest remaining chain ranks first
+- load_step_durations(): history from the local metrics log
+- SelfTestCache: keys, hits, miss explanations, failed results not stored
+- DistributedSelfTestRunner: steps start as soon as their own dependencies
+  finish, KERNEL failure aborts, unchanged steps are served from cache
+
+Scheduling and cache speedups are measured by swarm/tools/runtime_bench.py
+(selftest_schedule), not here.
+"""
+
+import json
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "swarm" / "tools"))
+
+import selftest_cache  # noqa: E402
+from selftest import DistributedSelfTestRunner, critical_path_priorities  # noqa: E402
+from selftest_cache import SelfTestCache, format_explain_report  # noqa: E402
+from selftest_config import (  # noqa: E402
+    SELFTEST_STEPS,
+    SelfTestCategory,
+    SelfTestSeverity,
+    SelfTestStep,
+    SelfTestTier,
+    get_step_graph,
+)
+from selftest_metrics import load_step_durations  # noqa: E402
+
+PY = shlex.quote(sys.executable)
+
+
+def make_step(step_id, seconds=0.0, deps=None, tier=SelfTestTier.GOVERNANCE, inputs=None, exit_code=0):
+    command = f"{PY} -c 'import time, sys; time.sleep({seconds}); sys.exit({exit_code})'"
+    return SelfTestStep(
+        id=step_id,
+        name=step_id,
+        description=f"test step {step_id}",
+        tier=tier,
+        severity=SelfTestSeverity.WARNING,
+        category=SelfTestCategory.CORRECTNESS,
+        command=[command],
+        dependencies=deps,
+        inputs=inputs,
+    )
+
+
+def kernel(seconds=0.0, exit_code=0, inputs=None):
+    return make_step("kernel", seconds, tier=SelfTestTier.KERNEL, inputs=inputs, exit_code=exit_code)
+
+
+@pytest.fixture(autouse=True)
+def no_metrics(monkeypatch):
+    """Keep the runner from appending to the repo's selftest_metrics.jsonl."""
+    monkeypatch.setenv("SELFTEST_METRICS_BACKEND", "none")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(selftest_cache, "RACY_WINDOW_S", 0)
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "a.py").write_text("a = 1\n")
+    (root / "src" / "b.py").write_text("b = 2\n")
+    (root / "src" / "__pycache__").mkdir()
+    (root / "src" / "__pycache__" / "a.pyc").write_bytes(b"\0")
+    return root
+
+
+def run(steps, tmp_path, workers=2, use_cache=False, durations=None, repo_root=None):
+    cache = SelfTestCache(tmp_path / "cache.json", repo_root or tmp_path) if use_cache else None
+    runner = DistributedSelfTestRunner(
+        max_workers=workers,
+        json_output=True,
+        use_cache=use_cache,
+        steps=steps,
+        cache=cache,
+        durations=durations or {},
+    )
+    return runner, runner.run_distributed()
+
+
+def results_by_id(report):
+    return {r["step_id"]: r for wave in report["waves"] for r in wave["results"]}
+
+
+class TestStepGraph:
+    def test_kernel_gate_and_declared_dependencies(self):
+        steps = [kernel(), make_step("a"), make_step("b", deps=["a"]), make_step("c", deps=["missing"])]
+        assert get_step_graph(steps) == {
+            "kernel": [],
+            "a": ["kernel"],
+            "b": ["a", "kernel"],
+            "c": ["kernel"],
+        }
+
+    def test_registry_graph_has_no_wave_barriers(self):
+        graph = get_step_graph()
+        assert graph["core-checks"] == []
+        assert graph["graph-invariants"] == ["devex-contract", "core-checks"]
+        # OPTIONAL steps no longer wait for every GOVERNANCE step
+        assert graph["extras"] == ["core-checks"]
+        assert set(graph) == {s.id for s in SELFTEST_STEPS}
+
+    def test_critical_path_ranks(self):
+        graph = {"k": [], "a": ["k"], "b": ["a"], "c": ["k"]}
+        ranks = critical_path_priorities(graph, {"k": 1, "a": 2, "b": 3, "c": 4})
+        assert ranks == {"k": 6, "a": 5, "b": 3, "c": 4}
+
+
+class TestDurationHistory:
+    def test_median_of_recent_samples(self, tmp_path):
+        log = tmp_path / "metrics.jsonl"
+        lines = [
+            {"metric_name": "selftest_step_duration_seconds", "value": v, "labels": {"step_id": "a"}}
+            for v in (100.0, 1.0, 2.0, 3.0)
+        ]
+        lines.append({"metric_name": "selftest_step_total", "value": 1, "labels": {"step_id": "a"}})
+        log.write_text("\n".join(json.dumps(x) for x in lines) + "\nnot json selftest_step_duration_seconds\n")
+        assert load_step_durations(log, window=3) == {"a": 2.0}
+
+    def test_missing_log(self, tmp_path):
+        assert load_step_durations(tmp_path / "absent.jsonl") == {}
+
+
+class TestSelfTestCache:
+    def test_hit_after_store(self, repo, tmp_path):
+        step = make_step("lint", inputs=["src/**/*.py"])
+        cache = SelfTestCache(tmp_path / "cache.json", repo)
+        miss = cache.lookup(step)
+        assert (miss.status, miss.reason) == ("MISS", "no cached result")
+        assert list(miss.inputs) == ["src/a.py", "src/b.py"]
+        assert cache.store(step, miss, {"step_id": "lint", "passed": True, "duration_ms": 5})
+        cache.save()
+
+        hit = SelfTestCache(tmp_path / "cache.json", repo).lookup(step)
+        assert hit.hit
+        assert hit.entry["result"]["duration_ms"] == 5
+
+    def test_miss_reasons(self, repo, tmp_path):
+        step = make_step("lint", inputs=["src"])
+        cache = SelfTestCache(tmp_path / "cache.json", repo)
+        cache.store(step, cache.lookup(step), {"passed": True})
+
+        (repo / "src" / "a.py").write_text("a = 10\n")
+        (repo / "src" / "c.py").write_text("c = 3\n")
+        decision = cache.lookup(step)
+        assert decision.status == "MISS"
+        assert decision.changed_inputs == ["src/a.py", "src/c.py"]
+        assert decision.reason == "inputs changed: src/a.py, src/c.py"
+
+        changed = make_step("lint", seconds=1, inputs=["src"])
+        assert cache.lookup(changed).reason == "command changed"
+
+    def test_uncacheable_and_failed_results(self, repo, tmp_path):
+        cache = SelfTestCache(tmp_path / "cache.json", repo)
+        unknown = make_step("smoke")
+        assert cache.lookup(unknown).status == "UNCACHEABLE"
+
+        step = make_step("lint", inputs=[])
+        assert not cache.store(step, cache.lookup(step), {"passed": False})
+        assert cache.lookup(step).status == "MISS"
+
+    def test_unchanged_files_are_not_rehashed(self, repo, tmp_path, monkeypatch):
+        step = make_step("lint", inputs=["src/**/*.py"])
+        SelfTestCache(tmp_path / "cache.json", repo).lookup(step)
+        cache = SelfTestCache(tmp_path / "cache.json", repo)
+        cache.lookup(step)
+        cache.save()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file re-hashed")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        assert SelfTestCache(tmp_path / "cache.json", repo).lookup(step).status == "MISS"
+
+    def test_explain_report(self, repo, tmp_path):
+        cache = SelfTestCache(tmp_path / "cache.json", repo)
+        report = format_explain_report(cache.explain([make_step("a", inputs=[]), make_step("b")]))
+        assert "a                        MISS         no cached result" in report
+        assert "Hits: 0  Misses: 1  Uncacheable: 1" in report
+
+
+class TestDistributedRunner:
+    def test_steps_start_when_own_dependencies_finish(self, tmp_path):
+        steps = [
+            kernel(),
+            make_step("slow", 0.8),
+            make_step("fast", 0.05),
+            make_step("after-fast", 0.05, deps=["fast"]),
+        ]
+        _, report = run(steps, tmp_path, workers=3)
+        results = results_by_id(report)
+        assert report["summary"]["passed"] == 4
+        # No wave barrier: after-fast does not wait for slow
+        assert results["after-fast"]["timestamp_end"] < results["slow"]["timestamp_end"]
+
+    def test_longest_critical_path_starts_first(self, tmp_path):
+        steps = [
+            kernel(),
+            make_step("short-1"),
+            make_step("short-2"),
+            make_step("chain-head", deps=[]),
+            make_step("chain-tail", deps=["chain-head"]),
+        ]
+        durations = {"short-1": 1, "short-2": 2, "chain-head": 1, "chain-tail": 5}
+        runner, report = run(steps, tmp_path, workers=1, durations=durations)
+        assert runner.start_order == ["kernel", "chain-head", "chain-tail", "short-2", "short-1"]
+        assert report["schedule"]["critical_path"] == ["kernel", "chain-head", "chain-tail"]
+
+    def test_kernel_failure_aborts(self, tmp_path):
+        steps = [kernel(exit_code=1), make_step("a"), make_step("b")]
+        runner, report = run(steps, tmp_path)
+        assert runner.start_order == ["kernel"]
+        assert len(report["waves"]) == 1
+        assert runner.kernel_failed == ["kernel"]
+
+    def test_unchanged_steps_served_from_cache(self, repo, tmp_path):
+        steps = [
+            kernel(),
+            make_step("lint", 0.05, inputs=["src"]),
+            make_step("flaky", exit_code=1, inputs=[]),
+            make_step("smoke"),
+        ]
+        run(steps, tmp_path, use_cache=True, repo_root=repo)
+        runner, report = run(steps, tmp_path, use_cache=True, repo_root=repo)
+
+        assert runner.start_order == ["kernel", "flaky", "smoke"]
+        results = results_by_id(report)
+        assert results["lint"]["cached"] is True
+        assert results["lint"]["cached_duration_ms"] >= 50
+        assert report["cache"]["hits"] == 1
+        assert report["cache"]["uncacheable"] == 2
+        assert report["summary"]["cached"] == 1
+        assert report["summary"]["failed"] == 1
+
+        (repo / "src" / "a.py").write_text("changed\n")
+        runner, _ = run(steps, tmp_path, use_cache=True, repo_root=repo)
+        assert "lint" in runner.start_order
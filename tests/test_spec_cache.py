@@ -0,0 +1,203 @@
+"""
+Tests for the shared hot-reloading spec cache.
+
+Covers:
+- SpecCache: mtime/size validation, missing higher-priority files,
+  derived entries with dependencies, invalidate_path, LRU eviction, stats
+- swarm.spec.loader *_cached functions: object identity on hit, reload on
+  edit, JSON created over a YAML fallback
+- swarm.prompts.compiler: compiled prompts rebuilt when a fragment changes
+- swarm.spec.manager.SpecManager: writes visible on the next read
+
+Prompt compilation time is measured by swarm/tools/runtime_bench.py
+(spec_cache), not here.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from swarm.prompts.compiler import compile_prompt_with_metadata
+from swarm.spec.cache import SpecCache, get_spec_cache, reset_spec_cache
+from swarm.spec.loader import load_station_cached
+from swarm.spec.manager import SpecManager
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_spec_cache()
+    yield
+    reset_spec_cache()
+
+
+def touch_later(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to stat."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSpecCache:
+    def test_hit_until_file_changes(self, tmp_path):
+        target = tmp_path / "a.txt"
+        target.write_text("one")
+        cache = SpecCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return target.read_text()
+
+        assert cache.get("ns", "a", [target], load) == "one"
+        assert cache.get("ns", "a", [target], load) == "one"
+        assert len(calls) == 1
+
+        target.write_text("two")
+        touch_later(target)
+        assert cache.get("ns", "a", [target], load) == "two"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+    def test_creating_higher_priority_file_invalidates(self, tmp_path):
+        primary, fallback = tmp_path / "a.json", tmp_path / "a.yaml"
+        fallback.write_text("yaml")
+
+        def load():
+            return (primary if primary.exists() else fallback).read_text()
+
+        cache = SpecCache()
+        assert cache.get("ns", "a", [primary, fallback], load) == "yaml"
+        primary.write_text("json")
+        assert cache.get("ns", "a", [primary, fallback], load) == "json"
+
+    def test_derived_entry_tracks_dependencies(self, tmp_path):
+        fragment = tmp_path / "fragment.md"
+        prompt = tmp_path / "prompt.md"
+        fragment.write_text("rules")
+        prompt.write_text("prompt")
+        cache = SpecCache()
+
+        def build():
+            return prompt.read_text() + "+" + fragment.read_text(), [prompt, fragment]
+
+        assert cache.get_derived("compiled", "p", build) == "prompt+rules"
+        fragment.write_text("new rules")
+        touch_later(fragment)
+        assert cache.get_derived("compiled", "p", build) == "prompt+new rules"
+
+    def test_invalidate_path_drops_dependents(self, tmp_path):
+        fragment = tmp_path / "fragment.md"
+        fragment.write_text("x")
+        cache = SpecCache()
+        cache.get("fragment", "f", [fragment], lambda: "x")
+        cache.get_derived("compiled", "p", lambda: ("x!", [fragment]))
+        cache.get("other", "o", [tmp_path / "other"], lambda: "o")
+
+        assert cache.invalidate_path(fragment) == 2
+        assert cache.stats().entries_by_namespace == {"other": 1}
+
+    def test_lru_eviction(self, tmp_path):
+        cache = SpecCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.get("ns", key, [], lambda: key)
+        cache.get("ns", "a", [], lambda: "reloaded")  # a is now most recent
+        cache.get("ns", "c", [], lambda: "c")
+
+        assert cache.get("ns", "a", [], lambda: "reloaded") == "a"
+        assert cache.get("ns", "b", [], lambda: "reloaded") == "reloaded"
+        stats = cache.stats().to_dict()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 2
+
+    def test_disabled_and_errors_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SWARM_SPEC_CACHE_SIZE", "0")
+        reset_spec_cache()
+        cache = get_spec_cache()
+        assert cache.get("ns", "a", [], lambda: 1) == 1
+        assert cache.get("ns", "a", [], lambda: 2) == 2
+
+        def broken():
+            raise ValueError("bad spec")
+
+        cache = SpecCache()
+        with pytest.raises(ValueError):
+            cache.get("ns", "a", [], broken)
+        assert cache.get("ns", "a", [], lambda: 3) == 3
+
+
+# -----------------------------------------------------------------------------
+# Integration
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def spec_repo(tmp_path):
+    stations = tmp_path / "swarm" / "spec" / "stations"
+    stations.mkdir(parents=True)
+    shutil.copy(REPO_ROOT / "swarm" / "spec" / "stations" / "adr-author.yaml", stations)
+    return tmp_path
+
+
+class TestLoaderHotReload:
+    def test_station_reloaded_after_edit(self, spec_repo):
+        station_file = spec_repo / "swarm" / "spec" / "stations" / "adr-author.yaml"
+        first = load_station_cached("adr-author", str(spec_repo))
+        assert load_station_cached("adr-author", str(spec_repo)) is first
+
+        station_file.write_text(station_file.read_text().replace("title: ADR Author", "title: ADR Writer"))
+        touch_later(station_file)
+        assert load_station_cached("adr-author", spec_repo).title == "ADR Writer"
+
+        load_station_cached.cache_clear()
+        assert get_spec_cache().stats().entries_by_namespace.get("station") is None
+
+    def test_json_store_takes_over_yaml(self, spec_repo):
+        assert load_station_cached("adr-author", spec_repo).title == "ADR Author"
+        json_dir = spec_repo / "swarm" / "specs" / "stations"
+        json_dir.mkdir(parents=True)
+        (json_dir / "adr-author.json").write_text(
+            json.dumps({"id": "adr-author", "version": 3, "title": "From JSON", "category": "design"})
+        )
+        assert load_station_cached("adr-author", spec_repo).title == "From JSON"
+
+
+class TestPromptCompilerHotReload:
+    def test_compiled_prompt_follows_fragment_edits(self, tmp_path):
+        fragments = tmp_path / "swarm" / "prompts" / "fragments"
+        fragments.mkdir(parents=True)
+        (fragments / "rules.md").write_text("Rule one.")
+        prompt = tmp_path / "step.md"
+        prompt.write_text("# Step\n\n{{rules}}\n")
+
+        first = compile_prompt_with_metadata(str(prompt), tmp_path)
+        assert "Rule one." in first.content
+        assert compile_prompt_with_metadata(str(prompt), tmp_path) is first
+
+        (fragments / "rules.md").write_text("Rule two, revised.")
+        touch_later(fragments / "rules.md")
+        assert "Rule two, revised." in compile_prompt_with_metadata(str(prompt), tmp_path).content
+
+
+class TestSpecManagerWrites:
+    def test_write_visible_on_next_read(self, tmp_path):
+        templates = tmp_path / "swarm" / "specs" / "templates"
+        templates.mkdir(parents=True)
+        path = templates / "writer.json"
+        path.write_text(json.dumps({"id": "writer", "title": "Writer"}))
+        manager = SpecManager(repo_root=tmp_path, backup_on_write=False)
+
+        data, etag = manager.get_template("writer")
+        data["title"] = "mutated by caller"  # callers get a private copy
+        assert manager.get_template("writer") == ({"id": "writer", "title": "Writer"}, etag)
+
+        # Same size, same mtime tick: only explicit invalidation can catch it
+        before = path.stat()
+        manager._atomic_write(path, json.dumps({"id": "writer", "title": "Wrote!"}), create_backup=False)
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        new_data, new_etag = manager.get_template("writer")
+        assert new_data["title"] == "Wrote!"
+        assert new_etag != etag
@@ -0,0 +1,210 @@
+"""Tests for resumable SSE streams (Last-Event-ID + seq offset index).
+
+These tests verify that:
+1. resume_offset() finds the first unseen line with and without an index
+2. A stale, corrupt or foreign index never skips unseen events
+3. EventWriter maintains the sparse index as it commits
+4. SSE events from events.jsonl carry their seq as id, and a reconnect with
+   Last-Event-ID only replays events after that seq
+
+Resume latency is measured by swarm/tools/runtime_bench.py (sse_resume), not here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime.event_index import (
+    INDEX_INTERVAL_EVENTS,
+    append_index_entries,
+    index_path_for,
+    read_index,
+    resume_offset,
+)
+from swarm.runtime.event_writer import EventWriter
+
+
+def write_events(path: Path, count: int, interval: int = INDEX_INTERVAL_EVENTS) -> None:
+    """Write `count` events with seq 1..count through an indexing EventWriter."""
+    writer = EventWriter(path, index_path=index_path_for(path), index_interval=interval)
+    try:
+        for seq in range(1, count + 1):
+            writer.write(json.dumps({"seq": seq, "event": "tick", "pad": "x" * (seq % 7)}), seq=seq)
+    finally:
+        writer.close()
+
+
+def seqs_from(path: Path, offset: int) -> list:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return [json.loads(line).get("seq") for line in f if line.strip()]
+
+
+class TestResumeOffset:
+    """Seeking past a known seq in events.jsonl."""
+
+    @pytest.mark.parametrize("with_index", [True, False])
+    def test_resumes_after_seq(self, tmp_path, with_index):
+        path = tmp_path / "events.jsonl"
+        write_events(path, 50, interval=8)
+        if not with_index:
+            index_path_for(path).unlink()
+
+        for after in (0, 1, 7, 8, 9, 33, 49, 50, 99):
+            assert seqs_from(path, resume_offset(path, after)) == list(range(after + 1, 51))
+
+    def test_missing_file(self, tmp_path):
+        assert resume_offset(tmp_path / "events.jsonl", 10) == 0
+
+    def test_lines_without_seq_are_replayed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"seq": 1}\n{"event": "legacy"}\n{"seq": 2}\n{"seq": 3}\n')
+        with open(path, "rb") as f:
+            f.seek(resume_offset(path, 1))
+            assert [json.loads(line) for line in f] == [
+                {"event": "legacy"},
+                {"seq": 2},
+                {"seq": 3},
+            ]
+
+    def test_partial_trailing_line_is_not_skipped(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"seq": 1}\n{"seq": 2')
+        assert resume_offset(path, 5) == len('{"seq": 1}\n')
+
+    def test_stale_and_corrupt_index_entries_are_ignored(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_events(path, 40, interval=8)
+        index = index_path_for(path)
+        entries = read_index(index)
+
+        # Point the closest entry at the wrong line, add garbage and an
+        # out-of-order entry
+        bad = [(seq, offset + 3) if seq == 33 else (seq, offset) for seq, offset in entries]
+        index.write_text(
+            "".join(f"{seq} {offset}\n" for seq, offset in bad) + "not an entry\n1 0\n"
+        )
+        assert read_index(index)[-1][0] == 33
+        assert seqs_from(path, resume_offset(path, 35)) == list(range(36, 41))
+
+    def test_index_from_replaced_file(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_events(path, 40, interval=8)
+        path.write_text('{"seq": 1}\n{"seq": 2}\n')  # index now describes another file
+        assert seqs_from(path, resume_offset(path, 1)) == [2]
+        assert seqs_from(path, resume_offset(path, 30)) == []
+
+
+class TestIndexMaintenance:
+    """EventWriter keeps the sidecar index in step with events.jsonl."""
+
+    def test_entries_every_interval(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_events(path, 20, interval=5)
+        entries = read_index(index_path_for(path))
+        assert [seq for seq, _ in entries] == [1, 6, 11, 16]
+        with open(path, "rb") as f:
+            for seq, offset in entries:
+                f.seek(offset)
+                assert json.loads(f.readline())["seq"] == seq
+
+    def test_continues_after_reopen_and_resets_for_new_file(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        write_events(path, 7, interval=5)
+        writer = EventWriter(path, index_path=index_path_for(path), index_interval=5)
+        for seq in range(8, 13):
+            writer.write(json.dumps({"seq": seq}), seq=seq)
+        writer.close()
+        assert [seq for seq, _ in read_index(index_path_for(path))] == [1, 6, 11]
+
+        path.unlink()
+        write_events(path, 3, interval=5)
+        assert read_index(index_path_for(path)) == [(1, 0)]
+
+    def test_append_index_entries_ignores_empty(self, tmp_path):
+        index = tmp_path / "events.jsonl.idx"
+        append_index_entries(index, [])
+        assert not index.exists()
+
+
+class TestSSEResume:
+    """generate_run_events() ids and Last-Event-ID handling."""
+
+    def _collect(self, run_id: str, runs_root: Path, last_event_id=None):
+        from swarm.api.routes.events import generate_run_events
+
+        async def run():
+            chunks = []
+            async for chunk in generate_run_events(
+                run_id, runs_root, heartbeat_interval=30.0, last_event_id=last_event_id
+            ):
+                chunks.append(chunk)
+            return chunks
+
+        return asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+    def _parse(self, chunk: str) -> dict:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        fields["data"] = json.loads(fields["data"])
+        return fields
+
+    def _make_run(self, runs_root: Path, run_id: str, steps: int) -> None:
+        from swarm.api.routes.events import write_event_sync
+
+        for i in range(steps):
+            write_event_sync(run_id, runs_root, "step:completed", {"step_id": f"s{i}"})
+        (runs_root / run_id / "run_state.json").write_text(json.dumps({"status": "succeeded"}))
+
+    def test_ids_are_seqs(self, tmp_path):
+        self._make_run(tmp_path, "run-ids", 3)
+        parsed = [self._parse(c) for c in self._collect("run-ids", tmp_path)]
+
+        assert "id" not in parsed[0]  # connected
+        steps = [p for p in parsed if p["event"] == "step:completed"]
+        assert [p["id"] for p in steps] == ["1", "2", "3"]
+        assert [p["data"]["seq"] for p in steps] == [1, 2, 3]
+        assert "id" not in parsed[-1]  # run:completed
+
+    def test_reconnect_replays_only_unseen_events(self, tmp_path):
+        self._make_run(tmp_path, "run-resume", 300)
+        parsed = [self._parse(c) for c in self._collect("run-resume", tmp_path, "250")]
+
+        assert parsed[0]["data"]["resumed_after_seq"] == 250
+        ids = [int(p["id"]) for p in parsed if "id" in p]
+        assert ids == list(range(251, 301))
+
+    @pytest.mark.parametrize("header", ["", "abc", "-3"])
+    def test_invalid_last_event_id_replays_everything(self, tmp_path, header):
+        run_id = f"run-bad-id{header}"
+        self._make_run(tmp_path, run_id, 2)
+        parsed = [self._parse(c) for c in self._collect(run_id, tmp_path, header)]
+        assert "resumed_after_seq" not in parsed[0]["data"]
+        assert [p["id"] for p in parsed if "id" in p] == ["1", "2"]
+
+    def test_write_event_shares_seq_with_run_events(self, tmp_path):
+        from datetime import datetime, timezone
+
+        from swarm.api.routes.events import write_event_sync
+        from swarm.runtime import storage
+        from swarm.runtime.types import RunEvent
+
+        run_id = "run-mixed"
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=datetime.now(timezone.utc).replace(tzinfo=None),
+                kind="run_start",
+                flow_key="build",
+            ),
+            runs_dir=tmp_path,
+        )
+        write_event_sync(run_id, tmp_path, "step:started", {"step_id": "s1"})
+        storage.flush_events(run_id, tmp_path)
+
+        lines = (tmp_path / run_id / "events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == [1, 2]
@@ -0,0 +1,270 @@
+"""
+Tests for indexed, paginated transcript reading.
+
+Covers:
+- write_transcript() writes the transcript and its line index
+- Message kind classification
+- Cursor pagination, has_more, and kind filters
+- Legacy (unindexed), stale and malformed transcripts
+- Raw NDJSON streaming
+- Engine transcripts gain an index
+
+Page latency on large transcripts is measured by swarm/tools/runtime_bench.py
+(transcript_page), not here.
+"""
+
+import json
+
+import pytest
+
+from swarm.runtime import transcript_io
+from swarm.runtime.engines import StepContext
+from swarm.runtime.engines.claude.stubs import run_worker_stub
+from swarm.runtime.transcript_io import (
+    INDEX_MAGIC,
+    build_index,
+    index_path_for,
+    iter_transcript_lines,
+    load_index,
+    message_kind,
+    read_transcript_page,
+    reset_transcript_index_cache,
+    write_transcript,
+)
+from swarm.runtime.types import RunSpec
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    reset_transcript_index_cache()
+    yield
+    reset_transcript_index_cache()
+
+
+def sample_messages(count: int):
+    """Alternating assistant text and tool calls, with a tool result after each call."""
+    messages = []
+    for i in range(count):
+        if i % 3 == 0:
+            messages.append({"role": "assistant", "content": f"thinking {i}"})
+        elif i % 3 == 1:
+            messages.append({"type": "tool_use", "name": "Read", "input": {"path": f"f{i}.py"}})
+        else:
+            messages.append({"type": "tool_result", "content": f"result {i}"})
+    return messages
+
+
+class TestWriteTranscript:
+    def test_writes_jsonl_and_index(self, tmp_path):
+        path = tmp_path / "llm" / "1-agent-claude.jsonl"
+        messages = sample_messages(5)
+        write_transcript(path, messages)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == messages
+
+        header, *entries = index_path_for(path).read_text(encoding="utf-8").splitlines()
+        assert header == f"{INDEX_MAGIC} {path.stat().st_size}"
+        assert [entry.split()[2] for entry in entries] == [
+            "assistant", "tool_call", "tool_result", "assistant", "tool_call",
+        ]
+
+    def test_message_kind(self):
+        assert message_kind({"role": "user", "content": "hi"}) == "user"
+        assert message_kind({"type": "message", "role": "assistant"}) == "assistant"
+        assert message_kind({"type": "tool_use"}) == "tool_call"
+        assert message_kind({"type": "function_call"}) == "tool_call"
+        assert message_kind({"type": "error", "message": "boom"}) == "error"
+        assert message_kind({"content": "no role"}) == "message"
+        assert message_kind({"type": "tool use result"}) == "tool_use_result"
+        assert message_kind({"type": ""}) == "message"
+        assert message_kind(["not", "an", "object"]) == "other"
+
+
+class TestReadTranscriptPage:
+    def test_pages_by_cursor(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        messages = sample_messages(10)
+        write_transcript(path, messages)
+
+        page = read_transcript_page(path, after=0, limit=4)
+        assert page.messages == messages[:4]
+        assert page.numbers == [1, 2, 3, 4]
+        assert page.total == 10 and page.has_more and page.next_after == 4
+
+        page = read_transcript_page(path, after=page.next_after, limit=6)
+        assert page.messages == messages[4:]
+        assert not page.has_more and page.next_after == 10
+
+        page = read_transcript_page(path, after=10, limit=5)
+        assert page.messages == [] and page.next_after == 10 and not page.has_more
+
+    def test_no_limit_returns_everything(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        messages = sample_messages(7)
+        write_transcript(path, messages)
+        page = read_transcript_page(path)
+        assert page.messages == messages and not page.has_more
+
+    def test_kind_filter_keeps_global_numbers(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, sample_messages(10))
+
+        page = read_transcript_page(path, limit=2, kinds={"tool_call"})
+        assert page.numbers == [2, 5] and page.has_more
+        assert all(m["type"] == "tool_use" for m in page.messages)
+
+        page = read_transcript_page(path, after=page.next_after, limit=2, kinds={"tool_call"})
+        assert page.numbers == [8] and not page.has_more
+
+    def test_filter_reads_only_selected_lines(self, tmp_path, monkeypatch):
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, sample_messages(30))
+        loads = []
+        real_loads = json.loads
+        monkeypatch.setattr(
+            transcript_io.json, "loads", lambda s, *a, **k: loads.append(s) or real_loads(s)
+        )
+        page = read_transcript_page(path, limit=3, kinds={"assistant"})
+        assert len(page.messages) == 3
+        assert len(loads) == 3
+
+
+class TestIndexRecovery:
+    def test_legacy_transcript_is_indexed_on_read(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        messages = sample_messages(6)
+        path.write_text("".join(json.dumps(m) + "\n" for m in messages), encoding="utf-8")
+        assert not index_path_for(path).exists()
+
+        assert read_transcript_page(path, after=2, limit=2).messages == messages[2:4]
+        assert index_path_for(path).exists()
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, sample_messages(3))
+        # Rewritten without going through write_transcript
+        messages = sample_messages(5)
+        path.write_text("".join(json.dumps(m) + "\n" for m in messages), encoding="utf-8")
+        reset_transcript_index_cache()
+
+        page = read_transcript_page(path)
+        assert page.messages == messages and page.total == 5
+
+    def test_index_with_unusual_kinds_is_reused(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, [{"type": "tool use result"}, 7])
+        reset_transcript_index_cache()
+        assert transcript_io._read_index_file(path, path.stat().st_size).kinds == (
+            "tool_use_result",
+            "other",
+        )
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        messages = sample_messages(4)
+        write_transcript(path, messages)
+        index_path_for(path).write_text("garbage\n", encoding="utf-8")
+        reset_transcript_index_cache()
+        assert read_transcript_page(path).messages == messages
+
+    def test_malformed_lines_are_skipped(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(
+            '{"role": "user", "content": "a"}\n'
+            "not json\n"
+            "\n"
+            '["not", "a", "dict"]\n'
+            '{"role": "assistant", "content": "b"}\n',
+            encoding="utf-8",
+        )
+        page = read_transcript_page(path)
+        # Any JSON value is a message, as the unindexed endpoint returned it
+        assert page.messages == [
+            {"role": "user", "content": "a"},
+            ["not", "a", "dict"],
+            {"role": "assistant", "content": "b"},
+        ]
+        assert page.numbers == [1, 2, 3]
+        assert read_transcript_page(path, kinds={"other"}).messages == [["not", "a", "dict"]]
+
+    def test_final_line_without_newline_is_returned(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(
+            '{"role": "user", "content": "a"}\n{"role": "assistant", "content": "b"}',
+            encoding="utf-8",
+        )
+        page = read_transcript_page(path)
+        assert [m["content"] for m in page.messages] == ["a", "b"]
+        assert index_path_for(path).exists()
+
+        streamed = b"".join(iter_transcript_lines(path))
+        assert streamed == path.read_bytes() + b"\n"
+        assert b"".join(iter_transcript_lines(path, kinds={"assistant"})).endswith(b"}\n")
+
+    def test_partial_last_line_is_not_persisted(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text('{"role": "user", "content": "a"}\n{"role": "assi', encoding="utf-8")
+        index = build_index(path)
+        assert len(index) == 1
+        assert not index_path_for(path).exists()
+
+    def test_cache_follows_file_changes(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, sample_messages(2))
+        assert len(load_index(path)) == 2
+        write_transcript(path, sample_messages(4))
+        assert len(load_index(path)) == 4
+
+    def test_missing_transcript_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_transcript_page(tmp_path / "missing.jsonl")
+
+
+class TestIterTranscriptLines:
+    def test_streams_raw_bytes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(transcript_io, "STREAM_CHUNK_BYTES", 64)
+        path = tmp_path / "t.jsonl"
+        write_transcript(path, sample_messages(20))
+        assert b"".join(iter_transcript_lines(path)) == path.read_bytes()
+
+    def test_after_and_kind_filter(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        messages = sample_messages(9)
+        write_transcript(path, messages)
+
+        lines = path.read_bytes().splitlines(keepends=True)
+        assert b"".join(iter_transcript_lines(path, after=6)) == b"".join(lines[6:])
+
+        streamed = [json.loads(line) for line in iter_transcript_lines(path, kinds={"tool_result"})]
+        assert streamed == [m for m in messages if m.get("type") == "tool_result"]
+
+    def test_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(
+            '{"role": "user", "content": "a"}\nbroken\n{"role": "user", "content": "b"}\n',
+            encoding="utf-8",
+        )
+        streamed = [json.loads(line) for line in iter_transcript_lines(path)]
+        assert [m["content"] for m in streamed] == ["a", "b"]
+
+
+def test_stub_engine_transcript_is_indexed(tmp_path):
+    ctx = StepContext(
+        repo_root=tmp_path,
+        run_id="test-run",
+        flow_key="build",
+        step_id="test-step",
+        step_index=1,
+        total_steps=1,
+        spec=RunSpec(flow_keys=["build"]),
+        flow_title="Build Flow",
+        step_role="Implement feature",
+        step_agents=("code-implementer",),
+    )
+    run_worker_stub(ctx, "claude-step")
+
+    transcript = ctx.run_base / "llm" / "test-step-code-implementer-claude.jsonl"
+    assert index_path_for(transcript).exists()
+    page = read_transcript_page(transcript, kinds={"assistant"})
+    assert page.messages and all(m["role"] == "assistant" for m in page.messages)
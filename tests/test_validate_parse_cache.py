@@ -0,0 +1,220 @@
+"""
+Tests for the validate_swarm.py parse cache and parallel validator groups.
+
+Covers:
+- ParseCache: hits while mtime/size are unchanged, cached parse errors,
+  fingerprint invalidation, recently modified files not persisted
+- validate_swarm.py CLI: warm runs are served from .swarm/cache/validate.pickle,
+  edits are picked up, output matches --no-cache and --jobs 1
+
+Cold vs warm validation time is measured by swarm/tools/runtime_bench.py
+(validate_cache), not here.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from swarm.validator import ParseCache
+from swarm.validator import parse_cache as parse_cache_module
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Old enough to be outside the racy window
+OLD_MTIME = time.time() - 3600
+
+
+def age(root: Path) -> None:
+    """Backdate every file so the parse cache persists it."""
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.utime(path, (OLD_MTIME, OLD_MTIME))
+
+
+class TestParseCache:
+    def test_hit_until_file_changes(self, tmp_path):
+        target = tmp_path / "a.md"
+        target.write_text("one")
+        age(tmp_path)
+        calls = []
+
+        def parser(p):
+            calls.append(p)
+            return p.read_text().upper()
+
+        cache = ParseCache(tmp_path / "cache.pickle", fingerprint="v1")
+        assert cache.get("upper", target, parser) == "ONE"
+        cache.save()
+
+        warm = ParseCache(tmp_path / "cache.pickle", fingerprint="v1")
+        assert warm.get("upper", target, parser) == "ONE"
+        assert (warm.hits, warm.misses, len(calls)) == (1, 0, 1)
+
+        target.write_text("three")
+        assert warm.get("upper", target, parser) == "THREE"
+        assert warm.misses == 1
+
+    def test_namespaces_and_fingerprint(self, tmp_path):
+        target = tmp_path / "a.md"
+        target.write_text("x")
+        age(tmp_path)
+        cache = ParseCache(tmp_path / "cache.pickle", fingerprint="v1")
+        cache.get("first", target, lambda p: 1)
+        assert cache.get("second", target, lambda p: 2) == 2
+        cache.save()
+
+        assert ParseCache(tmp_path / "cache.pickle", fingerprint="v1").get("first", target, lambda p: 9) == 1
+        assert ParseCache(tmp_path / "cache.pickle", fingerprint="v2").get("first", target, lambda p: 9) == 9
+
+    def test_parse_errors_are_cached(self, tmp_path):
+        target = tmp_path / "bad.md"
+        target.write_text("---")
+        age(tmp_path)
+
+        def parser(p):
+            raise ValueError("unclosed frontmatter")
+
+        cache = ParseCache(tmp_path / "cache.pickle")
+        with pytest.raises(ValueError, match="unclosed"):
+            cache.get("fm", target, parser)
+        cache.save()
+
+        warm = ParseCache(tmp_path / "cache.pickle")
+        with pytest.raises(ValueError, match="unclosed"):
+            warm.get("fm", target, lambda p: {})
+        assert warm.hits == 1
+
+    def test_recent_files_not_persisted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(parse_cache_module, "RACY_WINDOW_S", 3600 * 2)
+        target = tmp_path / "a.md"
+        target.write_text("x")
+        cache = ParseCache(tmp_path / "cache.pickle")
+        cache.get("ns", target, lambda p: 1)
+        assert cache.get("ns", target, lambda p: 2) == 1  # still cached in memory
+        cache.save()
+        assert not (tmp_path / "cache.pickle").exists()
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        (tmp_path / "cache.pickle").write_bytes(b"not a pickle")
+        target = tmp_path / "a.md"
+        target.write_text("x")
+        assert ParseCache(tmp_path / "cache.pickle").get("ns", target, lambda p: 5) == 5
+
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+
+
+def make_repo(root: Path, n_agents: int = 3) -> Path:
+    """Minimal swarm repo with n valid agents, configs and one flow."""
+    (root / "swarm" / "tools").mkdir(parents=True)
+    shutil.copy(REPO_ROOT / "swarm" / "tools" / "validate_swarm.py", root / "swarm" / "tools")
+    shutil.copy(REPO_ROOT / "swarm" / "__init__.py", root / "swarm")
+    shutil.copytree(
+        REPO_ROOT / "swarm" / "validator",
+        root / "swarm" / "validator",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+
+    agents = [f"agent-{i:03d}" for i in range(n_agents)]
+    rows = "\n".join(f"| {a} | build | implementation | green | project/user | Agent {a} |" for a in agents)
+    (root / "swarm" / "AGENTS.md").write_text(
+        "# Agent Registry\n\n"
+        "| Key | Flows | Role Family | Color | Source | Short Role |\n"
+        "|-----|-------|-------------|-------|--------|------------|\n"
+        f"{rows}\n"
+    )
+
+    agents_dir = root / ".claude" / "agents"
+    config_dir = root / "swarm" / "config" / "agents"
+    agents_dir.mkdir(parents=True)
+    config_dir.mkdir(parents=True)
+    body = "\n".join(f"Guidance line {i} for this agent." for i in range(40))
+    for a in agents:
+        (agents_dir / f"{a}.md").write_text(
+            f"---\nname: {a}\ndescription: Test agent {a}\ncolor: green\nmodel: inherit\n---\n\n"
+            f"## Inputs\n\n- RUN_BASE/build/\n\n## Outputs\n\n- RUN_BASE/build/out.md\n\n"
+            f"## Behavior\n\n{body}\n"
+        )
+        (config_dir / f"{a}.yaml").write_text(
+            f"key: {a}\nflows:\n  - build\ncategory: implementation\ncolor: green\nsource: project/user\n"
+        )
+
+    flows_config = root / "swarm" / "config" / "flows"
+    flows_config.mkdir(parents=True)
+    steps = "\n".join(f"  - id: step-{i}\n    agents:\n      - {a}\n    role: Run {a}" for i, a in enumerate(agents))
+    (flows_config / "build.yaml").write_text(f"key: build\ntitle: Build\ndescription: Build flow\nsteps:\n{steps}\n")
+
+    specs = root / "swarm" / "flows"
+    specs.mkdir(parents=True)
+    refs = "\n".join(f"- Agent: `{a}`" for a in agents)
+    (specs / "flow-build.md").write_text(
+        f"# Flow: Build\n\n<!-- FLOW AUTOGEN START -->\n{refs}\n<!-- FLOW AUTOGEN END -->\n"
+    )
+    age(root)
+    return root
+
+
+def validate(repo: Path, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "swarm/tools/validate_swarm.py", *flags],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def cache_counts(stderr: str):
+    line = next(line for line in stderr.splitlines() if "Parse cache:" in line)
+    words = line.split()
+    return int(words[-4]), int(words[-2])
+
+
+class TestValidatorCLI:
+    def test_warm_run_served_from_cache(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        cold = validate(repo, "--debug")
+        assert cold.returncode == 0, cold.stderr
+        assert (repo / ".swarm" / "cache" / "validate.pickle").is_file()
+
+        warm = validate(repo, "--debug")
+        assert warm.returncode == 0, warm.stderr
+        hits, misses = cache_counts(warm.stderr)
+        assert misses == 0
+        # AGENTS.md + 3 agent configs + 3 frontmatters + flow config + flow spec
+        assert hits >= 9
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        validate(repo)
+        (repo / ".claude" / "agents" / "agent-001.md").write_text(
+            "---\nname: agent-001\ndescription: Broken\ncolor: green\nmodel: gpt\n---\n"
+        )
+        result = validate(repo, "--debug")
+        assert result.returncode == 1
+        assert "invalid model value 'gpt'" in result.stderr
+        _, misses = cache_counts(result.stderr)
+        assert misses == 2  # frontmatter + microloop scan of the edited file
+
+    def test_output_matches_uncached_sequential_run(self, tmp_path):
+        repo = make_repo(tmp_path / "repo")
+        (repo / "swarm" / "config" / "agents" / "agent-002.yaml").write_text(
+            "key: agent-002\ncategory: critic\ncolor: red\nsource: project/user\n"
+        )
+        (repo / "swarm" / "flows" / "flow-build.md").write_text("- Agent: `agent-0001`\n")
+        age(repo)
+
+        validate(repo, "--report", "json")
+        warm = validate(repo, "--report", "json")
+        baseline = validate(repo, "--report", "json", "--no-cache", "--jobs", "1")
+        assert warm.returncode == baseline.returncode == 1
+
+        strip = lambda out: [line for line in out.splitlines() if '"timestamp"' not in line]  # noqa: E731
+        assert strip(warm.stdout) == strip(baseline.stdout)